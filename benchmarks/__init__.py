@@ -0,0 +1,7 @@
+"""
+Benchmarks for the Azure DevOps MCP server.
+
+These are run on demand rather than as part of the test suite, e.g.
+``python -m benchmarks.startup``. Results are written as JSON so runs can be
+compared against a stored baseline.
+"""
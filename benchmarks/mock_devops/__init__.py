@@ -0,0 +1,19 @@
+"""
+Local stand-in for the Azure DevOps REST API.
+
+Serves the endpoints the server's tools call from a synthetic dataset, with
+configurable latency, batch limits, payload sizes and throttling, so tools
+can be benchmarked end to end without network access::
+
+    with MockAzureDevOps(MockSettings(work_items=2000)) as service:
+        os.environ["AZURE_DEVOPS_ORGANIZATION_URL"] = service.url
+        ...
+        print(service.stats.snapshot())
+
+It can also run standalone with ``python -m benchmarks.mock_devops``.
+"""
+
+from benchmarks.mock_devops.dataset import Dataset, MockSettings
+from benchmarks.mock_devops.server import MockAzureDevOps
+
+__all__ = ["Dataset", "MockAzureDevOps", "MockSettings"]
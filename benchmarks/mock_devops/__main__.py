@@ -0,0 +1,58 @@
+"""
+Run the mock Azure DevOps service from the command line.
+
+Usage::
+
+    python -m benchmarks.mock_devops --port 8080 --work-items 2000 \\
+        --latency-ms 40 --throttle-rate 0.01
+"""
+
+import argparse
+import dataclasses
+import sys
+from typing import List, Optional
+
+from benchmarks.mock_devops.dataset import MockSettings
+from benchmarks.mock_devops.server import MockAzureDevOps
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Serve the mock service until interrupted."""
+    parser = argparse.ArgumentParser(
+        description="Serve a synthetic Azure DevOps organization"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    # Every setting is exposed as an option, e.g. --work-items 2000
+    for field in dataclasses.fields(MockSettings):
+        option = "--" + field.name.replace("_", "-")
+        field_type = field.type if field.type in (int, float) else str
+        parser.add_argument(
+            option,
+            dest=field.name,
+            type=field_type,
+            default=field.default,
+            help=f"default: {field.default}",
+        )
+    args = parser.parse_args(argv)
+
+    settings = MockSettings(
+        **{
+            field.name: getattr(args, field.name)
+            for field in dataclasses.fields(MockSettings)
+        }
+    )
+    service = MockAzureDevOps(settings, host=args.host, port=args.port)
+    print(f"Serving {settings.work_items} work items at {service.url}")
+    print(f"Set AZURE_DEVOPS_ORGANIZATION_URL={service.url}")
+    try:
+        service.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
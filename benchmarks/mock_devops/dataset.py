@@ -0,0 +1,573 @@
+"""
+Synthetic Azure DevOps dataset served by the mock service.
+
+All data is generated from a seed so benchmark runs are repeatable. Work
+items, comments and updates are stored in the shape of the REST API's JSON
+responses.
+"""
+
+import random
+import threading
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+# Agile process; the only process the dataset uses
+PROCESS_ID = "adcc42ab-9882-485e-a3ed-7678f01f66bc"
+PROCESS_NAME = "Agile"
+
+_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_ITERATION_DAYS = 14
+
+WORK_ITEM_TYPES = {
+    "Epic": ("Microsoft.VSTS.WorkItemTypes.Epic", "FF7B00"),
+    "Feature": ("Microsoft.VSTS.WorkItemTypes.Feature", "773B93"),
+    "User Story": ("Microsoft.VSTS.WorkItemTypes.UserStory", "009CCC"),
+    "Bug": ("Microsoft.VSTS.WorkItemTypes.Bug", "CC293D"),
+    "Task": ("Microsoft.VSTS.WorkItemTypes.Task", "F2CB1D"),
+}
+_TYPE_WEIGHTS = [1, 3, 10, 6, 12]
+
+STATES = [
+    ("New", "Proposed", "b2b2b2"),
+    ("Active", "InProgress", "007acc"),
+    ("Resolved", "Resolved", "ff9d00"),
+    ("Closed", "Completed", "339933"),
+]
+
+# (reference name, name, type, required)
+FIELDS = [
+    ("System.Id", "ID", "integer", False),
+    ("System.Title", "Title", "string", True),
+    ("System.Description", "Description", "html", False),
+    ("System.State", "State", "string", True),
+    ("System.Reason", "Reason", "string", False),
+    ("System.AssignedTo", "Assigned To", "identity", False),
+    ("System.AreaPath", "Area Path", "treePath", True),
+    ("System.IterationPath", "Iteration Path", "treePath", True),
+    ("System.Tags", "Tags", "plainText", False),
+    ("Microsoft.VSTS.Common.Priority", "Priority", "integer", False),
+    (
+        "Microsoft.VSTS.Scheduling.StoryPoints",
+        "Story Points",
+        "double",
+        False,
+    ),
+    (
+        "Microsoft.VSTS.Common.AcceptanceCriteria",
+        "Acceptance Criteria",
+        "html",
+        False,
+    ),
+]
+
+_TAGS = ["backend", "frontend", "performance", "security", "tech-debt"]
+_WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua"
+).split()
+
+
+@dataclass
+class MockSettings:
+    """Size and behavior of the mock service."""
+
+    organization: str = "mock"
+    projects: int = 2
+    teams_per_project: int = 3
+    members_per_team: int = 5
+    iterations: int = 6
+    work_items: int = 500
+    links_per_item: int = 2
+    comments_per_item: int = 2
+    description_chars: int = 2000
+    seed: int = 0
+    # Behavior
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    max_batch_ids: int = 200
+    result_limit: int = 20000
+    throttle_rate: float = 0.0
+    retry_after: int = 1
+    pat: Optional[str] = None
+
+
+def format_date(moment: datetime) -> str:
+    """Format a datetime the way the REST API does."""
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.") + (
+        f"{moment.microsecond // 1000:03d}Z"
+    )
+
+
+def parse_date(value: str) -> Optional[datetime]:
+    """Parse an ISO 8601 date, returning None if it is not one."""
+    try:
+        moment = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment
+
+
+def _identity(user_id: int) -> Dict[str, Any]:
+    return {
+        "id": str(uuid.UUID(int=user_id + 1)),
+        "displayName": f"User {user_id}",
+        "uniqueName": f"user{user_id}@example.com",
+        "descriptor": f"aad.user{user_id}",
+    }
+
+
+class Dataset:
+    """
+    In-memory organization with projects, teams and work items.
+
+    Mutating methods are guarded by a lock because the mock service handles
+    requests on several threads.
+    """
+
+    def __init__(self, settings: MockSettings, base_url: str):
+        """
+        Generate the dataset.
+
+        Args:
+            settings: Dataset size and seed
+            base_url: Organization URL used in resource links
+        """
+        self.settings = settings
+        self.base_url = base_url.rstrip("/")
+        self.lock = threading.RLock()
+        self._random = random.Random(settings.seed)
+        self.users = [
+            _identity(index)
+            for index in range(
+                max(settings.teams_per_project * settings.members_per_team, 1)
+            )
+        ]
+        self.projects: List[Dict[str, Any]] = []
+        self.teams: List[Dict[str, Any]] = []
+        self.iterations: Dict[str, List[Dict[str, Any]]] = {}
+        self.work_items: Dict[int, Dict[str, Any]] = {}
+        self.updates: Dict[int, List[Dict[str, Any]]] = {}
+        self.comments: Dict[int, List[Dict[str, Any]]] = {}
+        self.attachments: Dict[str, int] = {}
+        self._next_comment_id = 1
+        self._generate_projects()
+        self._generate_work_items()
+
+    # Generation
+
+    def _generate_projects(self) -> None:
+        settings = self.settings
+        for project_index in range(settings.projects):
+            name = f"Project {project_index + 1}"
+            project_id = str(uuid.UUID(int=(project_index + 1) << 64))
+            self.projects.append(
+                {
+                    "id": project_id,
+                    "name": name,
+                    "description": f"Synthetic project {project_index + 1}",
+                    "url": f"{self.base_url}/_apis/projects/{project_id}",
+                    "state": "wellFormed",
+                    "revision": 1,
+                    "visibility": "private",
+                    "lastUpdateTime": format_date(_EPOCH),
+                }
+            )
+            self.iterations[name] = self._generate_iterations(name)
+            for team_index in range(settings.teams_per_project):
+                team_name = (
+                    f"{name} Team"
+                    if team_index == 0
+                    else f"{name} Team {team_index + 1}"
+                )
+                team_id = str(
+                    uuid.UUID(int=((project_index + 1) << 64) + team_index + 1)
+                )
+                first = team_index * settings.members_per_team
+                self.teams.append(
+                    {
+                        "id": team_id,
+                        "name": team_name,
+                        "description": f"Synthetic team of {name}",
+                        "url": (
+                            f"{self.base_url}/_apis/projects/{project_id}"
+                            f"/teams/{team_id}"
+                        ),
+                        "projectName": name,
+                        "projectId": project_id,
+                        "areaPath": (
+                            name if team_index == 0 else f"{name}\\{team_name}"
+                        ),
+                        "members": [
+                            self.users[index % len(self.users)]
+                            for index in range(
+                                first, first + settings.members_per_team
+                            )
+                        ],
+                    }
+                )
+
+    def _generate_iterations(self, project: str) -> List[Dict[str, Any]]:
+        # Iterations are laid out around today, with one current sprint
+        today = datetime.now(timezone.utc).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        count = max(self.settings.iterations, 1)
+        first_start = today - timedelta(days=_ITERATION_DAYS * (count // 2))
+        iterations = []
+        for index in range(count):
+            start = first_start + timedelta(days=_ITERATION_DAYS * index)
+            finish = start + timedelta(days=_ITERATION_DAYS - 1)
+            if finish < today:
+                time_frame = "past"
+            elif start > today:
+                time_frame = "future"
+            else:
+                time_frame = "current"
+            iteration_id = str(
+                uuid.uuid5(uuid.NAMESPACE_URL, project + str(index))
+            )
+            iterations.append(
+                {
+                    "id": iteration_id,
+                    "name": f"Sprint {index + 1}",
+                    "path": f"{project}\\Sprint {index + 1}",
+                    "attributes": {
+                        "startDate": format_date(start),
+                        "finishDate": format_date(finish),
+                        "timeFrame": time_frame,
+                    },
+                    "url": f"{self.base_url}/_apis/work/iterations/"
+                    f"{iteration_id}",
+                }
+            )
+        return iterations
+
+    def _description(self) -> str:
+        target = self.settings.description_chars
+        if target <= 0:
+            return ""
+        words = []
+        length = len("<div><p></p></div>")
+        while length < target:
+            word = self._random.choice(_WORDS)
+            words.append(word)
+            length += len(word) + 1
+        text = " ".join(words)[: max(target - 18, 0)]
+        return f"<div><p>{text}</p></div>"
+
+    def _generate_work_items(self) -> None:
+        settings = self.settings
+        if not self.projects:
+            return
+        type_names = list(WORK_ITEM_TYPES)
+        for item_id in range(1, settings.work_items + 1):
+            project = self.projects[(item_id - 1) % len(self.projects)]["name"]
+            work_item_type = self._random.choices(
+                type_names, weights=_TYPE_WEIGHTS
+            )[0]
+            created = _EPOCH + timedelta(hours=item_id)
+            changed = created + timedelta(
+                hours=self._random.randint(0, 24 * 90)
+            )
+            state = self._random.choice(STATES)[0]
+            author = self._random.choice(self.users)
+            fields = {
+                "System.Id": item_id,
+                "System.Rev": 2,
+                "System.TeamProject": project,
+                "System.AreaPath": project,
+                "System.IterationPath": self._random.choice(
+                    self.iterations[project]
+                )["path"],
+                "System.WorkItemType": work_item_type,
+                "System.State": state,
+                "System.Reason": f"Moved to {state}",
+                "System.Title": f"{work_item_type} {item_id}: "
+                + " ".join(self._random.sample(_WORDS, 4)),
+                "System.Description": self._description(),
+                "System.AssignedTo": self._random.choice(self.users),
+                "System.CreatedDate": format_date(created),
+                "System.CreatedBy": author,
+                "System.ChangedDate": format_date(changed),
+                "System.ChangedBy": author,
+                "System.Tags": "; ".join(
+                    sorted(self._random.sample(_TAGS, 2))
+                ),
+                "Microsoft.VSTS.Common.Priority": self._random.randint(1, 4),
+            }
+            if work_item_type == "User Story":
+                fields["Microsoft.VSTS.Scheduling.StoryPoints"] = float(
+                    self._random.choice([1, 2, 3, 5, 8])
+                )
+            relations = [
+                self.relation(
+                    "System.LinkTypes.Related",
+                    (item_id + offset - 1) % settings.work_items + 1,
+                )
+                for offset in range(1, settings.links_per_item + 1)
+                if settings.work_items > 1
+            ]
+            self.work_items[item_id] = {
+                "id": item_id,
+                "rev": 2,
+                "fields": fields,
+                "relations": relations,
+            }
+            self.updates[item_id] = [
+                {
+                    "id": 1,
+                    "rev": 1,
+                    "workItemId": item_id,
+                    "revisedBy": author,
+                    "revisedDate": format_date(created),
+                    "fields": {
+                        "System.State": {"newValue": "New"},
+                        "System.Title": {"newValue": fields["System.Title"]},
+                        "System.ChangedDate": {
+                            "newValue": format_date(created)
+                        },
+                    },
+                },
+                {
+                    "id": 2,
+                    "rev": 2,
+                    "workItemId": item_id,
+                    "revisedBy": author,
+                    "revisedDate": format_date(changed),
+                    "fields": {
+                        "System.State": {"oldValue": "New", "newValue": state},
+                        "System.ChangedDate": {
+                            "oldValue": format_date(created),
+                            "newValue": format_date(changed),
+                        },
+                    },
+                },
+            ]
+            self.comments[item_id] = [
+                self._comment(
+                    item_id,
+                    f"<p>Comment {index + 1} on {item_id}</p>",
+                    author,
+                    changed,
+                )
+                for index in range(settings.comments_per_item)
+            ]
+
+    # Helpers
+
+    def work_item_url(self, item_id: int) -> str:
+        """Get the API URL of a work item."""
+        return f"{self.base_url}/_apis/wit/workItems/{item_id}"
+
+    def relation(self, rel: str, target_id: int) -> Dict[str, Any]:
+        """Build a work item link to another work item."""
+        return {
+            "rel": rel,
+            "url": self.work_item_url(target_id),
+            "attributes": {"isLocked": False, "name": rel.split(".")[-1]},
+        }
+
+    def _comment(
+        self,
+        item_id: int,
+        text: str,
+        author: Dict[str, Any],
+        created: datetime,
+    ) -> Dict[str, Any]:
+        comment_id = self._next_comment_id
+        self._next_comment_id += 1
+        return {
+            "id": comment_id,
+            "workItemId": item_id,
+            "version": 1,
+            "text": text,
+            "createdBy": author,
+            "createdDate": format_date(created),
+            "modifiedBy": author,
+            "modifiedDate": format_date(created),
+            "url": f"{self.work_item_url(item_id)}/comments/{comment_id}",
+        }
+
+    def find_project(self, name_or_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a project by name or ID, ignoring case."""
+        key = name_or_id.lower()
+        for project in self.projects:
+            if key in (project["id"].lower(), project["name"].lower()):
+                return project
+        return None
+
+    def find_team(
+        self, project: str, name_or_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Look up a team of a project by name or ID, ignoring case."""
+        found = self.find_project(project)
+        if found is None:
+            return None
+        key = name_or_id.lower()
+        for team in self.teams:
+            if team["projectId"] == found["id"] and key in (
+                team["id"].lower(),
+                team["name"].lower(),
+            ):
+                return team
+        return None
+
+    def default_user(self) -> Dict[str, Any]:
+        """Get the identity requests are made as."""
+        return self.users[0]
+
+    # Mutations
+
+    def apply_patch(
+        self,
+        item: Dict[str, Any],
+        operations: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Apply JSON patch operations to a work item and record the update.
+
+        Args:
+            item: Work item to change in place
+            operations: JSON patch operations from the request
+
+        Returns:
+            The update record
+
+        Raises:
+            ValueError: If an operation is invalid
+        """
+        field_changes: Dict[str, Dict[str, Any]] = {}
+        added, removed = [], []
+        for operation in operations:
+            op = str(operation.get("op", "")).lower()
+            path = str(operation.get("path", ""))
+            value = operation.get("value")
+            if op == "test":
+                continue
+            if path.startswith("/fields/"):
+                name = path[len("/fields/") :]
+                old_value = item["fields"].get(name)
+                if op in ("add", "replace"):
+                    item["fields"][name] = value
+                elif op == "remove":
+                    item["fields"].pop(name, None)
+                else:
+                    raise ValueError(f"Unsupported operation '{op}'")
+                field_changes[name] = {
+                    "oldValue": old_value,
+                    "newValue": item["fields"].get(name),
+                }
+            elif path == "/relations/-" and op == "add":
+                relation = dict(value or {})
+                relation.setdefault("attributes", {})
+                item["relations"].append(relation)
+                added.append(relation)
+            elif path.startswith("/relations/") and op == "remove":
+                try:
+                    index = int(path[len("/relations/") :])
+                    removed.append(item["relations"].pop(index))
+                except (ValueError, IndexError):
+                    raise ValueError(
+                        f"Invalid relation index in path '{path}'"
+                    ) from None
+            else:
+                raise ValueError(f"Unsupported patch path '{path}'")
+
+        now = datetime.now(timezone.utc)
+        old_changed = item["fields"].get("System.ChangedDate")
+        item["rev"] += 1
+        item["fields"]["System.Rev"] = item["rev"]
+        item["fields"]["System.ChangedDate"] = format_date(now)
+        item["fields"]["System.ChangedBy"] = self.default_user()
+        field_changes["System.ChangedDate"] = {
+            "oldValue": old_changed,
+            "newValue": item["fields"]["System.ChangedDate"],
+        }
+        update: Dict[str, Any] = {
+            "id": len(self.updates.get(item["id"], [])) + 1,
+            "rev": item["rev"],
+            "workItemId": item["id"],
+            "revisedBy": self.default_user(),
+            "revisedDate": format_date(now),
+            "fields": field_changes,
+        }
+        if added or removed:
+            update["relations"] = {"added": added, "removed": removed}
+        self.updates.setdefault(item["id"], []).append(update)
+        return update
+
+    def create_work_item(
+        self,
+        project: str,
+        work_item_type: str,
+        operations: List[Dict[str, Any]],
+        validate_only: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Create a work item from JSON patch operations.
+
+        Args:
+            project: Project name
+            work_item_type: Work item type name
+            operations: JSON patch operations from the request
+            validate_only: Validate without saving
+
+        Returns:
+            The created work item
+
+        Raises:
+            ValueError: If the operations are invalid or omit the title
+        """
+        with self.lock:
+            item_id = max(self.work_items, default=0) + 1
+            now = format_date(datetime.now(timezone.utc))
+            item = {
+                "id": item_id,
+                "rev": 0,
+                "fields": {
+                    "System.Id": item_id,
+                    "System.TeamProject": project,
+                    "System.AreaPath": project,
+                    "System.IterationPath": project,
+                    "System.WorkItemType": work_item_type,
+                    "System.State": "New",
+                    "System.Reason": "New",
+                    "System.CreatedDate": now,
+                    "System.CreatedBy": self.default_user(),
+                },
+                "relations": [],
+            }
+            self.apply_patch(item, operations)
+            if not item["fields"].get("System.Title"):
+                raise ValueError(
+                    "TF401320: Rule Error for field Title. Error code: "
+                    "Required, InvalidEmpty."
+                )
+            if validate_only:
+                self.updates.pop(item_id, None)
+                return item
+            self.work_items[item_id] = item
+            return item
+
+    def add_comment(self, item_id: int, text: str) -> Dict[str, Any]:
+        """Add a comment to a work item."""
+        with self.lock:
+            comment = self._comment(
+                item_id,
+                text,
+                self.default_user(),
+                datetime.now(timezone.utc),
+            )
+            self.comments.setdefault(item_id, []).append(comment)
+            return comment
+
+    def add_attachment(self, size: int) -> str:
+        """Store an uploaded attachment's size and return its ID."""
+        attachment_id = str(uuid.UUID(int=self._random.getrandbits(128)))
+        with self.lock:
+            self.attachments[attachment_id] = size
+        return attachment_id
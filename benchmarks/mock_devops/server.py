@@ -0,0 +1,1272 @@
+"""
+HTTP front end of the mock Azure DevOps service.
+
+Implements the REST endpoints the server's tools call, including the
+resource area and OPTIONS discovery requests the Azure DevOps SDK makes
+before its first call. Every request is counted so benchmarks can report
+upstream round trips and bytes transferred.
+"""
+
+import base64
+import json
+import random
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from benchmarks.mock_devops.dataset import (
+    FIELDS,
+    PROCESS_ID,
+    PROCESS_NAME,
+    STATES,
+    WORK_ITEM_TYPES,
+    Dataset,
+    MockSettings,
+    format_date,
+)
+from benchmarks.mock_devops.wiql import WiqlError, evaluate, parse_query
+
+# (location ID, area, resource name, route template, resource version)
+LOCATIONS = [
+    (
+        "e81700f7-3be2-46de-8624-2eb35882fcaa",
+        "Location",
+        "ResourceAreas",
+        "_apis/{resource}/{areaId}",
+        1,
+    ),
+    (
+        "603fe2ac-9723-48b9-88ad-09305aa6c6e1",
+        "core",
+        "projects",
+        "_apis/projects/{*projectId}",
+        4,
+    ),
+    (
+        "7a4d9ee9-3433-4347-b47a-7a80f1cf307e",
+        "core",
+        "teams",
+        "_apis/teams",
+        3,
+    ),
+    (
+        "d30a3dd1-f8ba-442a-b86a-bd0c0c383e59",
+        "core",
+        "teams",
+        "_apis/projects/{projectId}/teams/{*teamId}",
+        3,
+    ),
+    (
+        "294c494c-2600-4d7e-b76c-3dd50c3c95be",
+        "core",
+        "members",
+        "_apis/projects/{projectId}/teams/{teamId}/members",
+        2,
+    ),
+    (
+        "1a9c53f7-f243-4447-b110-35ef023636e4",
+        "wit",
+        "wiql",
+        "{project}/{team}/_apis/wit/wiql/{id}",
+        2,
+    ),
+    (
+        "72c7ddf8-2cdc-4f60-90cd-ab71c14a399b",
+        "wit",
+        "workItems",
+        "{project}/_apis/wit/workItems/{id}",
+        3,
+    ),
+    (
+        "62d3d110-0047-428c-ad3c-4fe872c91c74",
+        "wit",
+        "workItems",
+        "{project}/_apis/wit/workItems/${type}",
+        3,
+    ),
+    (
+        "908509b6-4248-4475-a1cd-829139ba419f",
+        "wit",
+        "workItemsBatch",
+        "{project}/_apis/wit/workItemsBatch",
+        1,
+    ),
+    (
+        "6570bf97-d02c-4a91-8d93-3abe9895b1a9",
+        "wit",
+        "updates",
+        "{project}/_apis/wit/workItems/{id}/updates/{updateNumber}",
+        3,
+    ),
+    (
+        "608aac0a-32e1-4493-a863-b9cf4566d257",
+        "wit",
+        "comments",
+        "{project}/_apis/wit/workItems/{workItemId}/comments/{commentId}",
+        4,
+    ),
+    (
+        "e07b5fa4-1499-494d-a496-64b860fd64ff",
+        "wit",
+        "attachments",
+        "{project}/_apis/wit/attachments/{id}",
+        3,
+    ),
+    (
+        "5a172953-1b41-49d3-840a-33f79c3ce89f",
+        "wit",
+        "classificationNodes",
+        "{project}/_apis/wit/classificationNodes/{structureGroup}/{*path}",
+        2,
+    ),
+    (
+        "7c8d7a76-4a09-43e8-b5df-bd792f4ac6aa",
+        "wit",
+        "workItemTypes",
+        "{project}/_apis/wit/workItemTypes/{type}",
+        2,
+    ),
+    (
+        "bd293ce5-3d25-4192-8e67-e8092e879efb",
+        "wit",
+        "workItemTypesField",
+        "{project}/_apis/wit/workItemTypes/{type}/fields/{field}",
+        3,
+    ),
+    (
+        "6a90345f-a676-4969-afce-8e163e1d5642",
+        "wit",
+        "templates",
+        "{project}/{team}/_apis/wit/templates",
+        1,
+    ),
+    (
+        "fb10264a-8836-48a0-8033-1b0ccd2748d5",
+        "wit",
+        "templates",
+        "{project}/{team}/_apis/wit/templates/{templateId}",
+        1,
+    ),
+    (
+        "07ced576-58ed-49e6-9c1e-5cb53ab8bf2a",
+        "work",
+        "teamfieldvalues",
+        "{project}/{team}/_apis/work/teamsettings/teamfieldvalues",
+        1,
+    ),
+    (
+        "c9175577-28a1-4b06-9197-8636af9f64ad",
+        "work",
+        "iterations",
+        "{project}/{team}/_apis/work/teamsettings/iterations/{id}",
+        1,
+    ),
+    (
+        "02cc6a73-5cfb-427d-8c8e-b49fb086e8af",
+        "processes",
+        "processes",
+        "_apis/work/processes/{processTypeId}",
+        2,
+    ),
+    (
+        "e2e9d1a6-432d-4062-8870-bfcb8c324ad7",
+        "processes",
+        "workItemTypes",
+        "_apis/work/processes/{processId}/workItemTypes/{witRefName}",
+        2,
+    ),
+    (
+        "bc0ad8dc-e3f3-46b0-b06c-5bf861793196",
+        "processes",
+        "fields",
+        "_apis/work/processes/{processId}/workItemTypes/{witRefName}"
+        "/fields/{fieldRefName}",
+        2,
+    ),
+    (
+        "28010c54-d0c0-4c89-a5b0-1c9e188b9fb7",
+        "IMS",
+        "Identities",
+        "_apis/identities/{identityId}",
+        2,
+    ),
+]
+
+# Resource areas of the SDK clients the server uses
+RESOURCE_AREAS = {
+    "79134c72-4a58-4b42-976c-04e7115f32bf": "core",
+    "5264459e-e5e0-4bd8-b118-0985e68a4ec5": "wit",
+    "1d4f49f9-02b9-4e26-b826-2cdb6195f2a9": "work",
+    "8a3d49b8-91f0-46ef-b33d-dda338c25db3": "IMS",
+}
+
+# Templates served for every team
+TEMPLATES = [
+    {
+        "id": "7d1f8d5e-9f0b-4c1e-9a51-3d2b7f0c1a01",
+        "name": "Bug report",
+        "description": "Bug with repro steps",
+        "workItemTypeName": "Bug",
+        "fields": {
+            "System.Title": "[Bug] ",
+            "Microsoft.VSTS.Common.Priority": 2,
+            "System.Tags": "triage",
+        },
+    },
+    {
+        "id": "7d1f8d5e-9f0b-4c1e-9a51-3d2b7f0c1a02",
+        "name": "Spike",
+        "description": "Time boxed investigation",
+        "workItemTypeName": "User Story",
+        "fields": {
+            "System.Title": "Spike: ",
+            "Microsoft.VSTS.Scheduling.StoryPoints": 3,
+        },
+    },
+]
+
+# Sentinel matching any path segment in ROUTES
+_ANY = None
+
+# (method, path after _apis, handler name). Segments are matched case
+# insensitively; "$" matches a segment starting with "$".
+ROUTES = [
+    ("OPTIONS", (), "options"),
+    ("GET", ("resourceareas",), "resource_areas"),
+    ("GET", ("resourceareas", _ANY), "resource_area"),
+    ("GET", ("projects",), "projects"),
+    ("GET", ("projects", _ANY), "project"),
+    ("GET", ("projects", _ANY, "teams"), "project_teams"),
+    ("GET", ("projects", _ANY, "teams", _ANY, "members"), "team_members"),
+    ("GET", ("teams",), "all_teams"),
+    ("POST", ("wit", "wiql"), "wiql"),
+    ("GET", ("wit", "workitems"), "work_items"),
+    ("POST", ("wit", "workitemsbatch"), "work_items_batch"),
+    ("POST", ("wit", "workitems", "$"), "create_work_item"),
+    ("GET", ("wit", "workitems", _ANY), "work_item"),
+    ("PATCH", ("wit", "workitems", _ANY), "update_work_item"),
+    ("GET", ("wit", "workitems", _ANY, "updates"), "updates"),
+    ("GET", ("wit", "workitems", _ANY, "comments"), "comments"),
+    ("POST", ("wit", "workitems", _ANY, "comments"), "add_comment"),
+    ("POST", ("wit", "attachments"), "create_attachment"),
+    ("GET", ("wit", "classificationnodes", _ANY), "classification_nodes"),
+    ("GET", ("wit", "workitemtypes"), "work_item_types"),
+    ("GET", ("wit", "workitemtypes", _ANY), "work_item_type"),
+    (
+        "GET",
+        ("wit", "workitemtypes", _ANY, "fields"),
+        "work_item_type_fields",
+    ),
+    ("GET", ("wit", "templates"), "templates"),
+    ("GET", ("wit", "templates", _ANY), "template"),
+    (
+        "GET",
+        ("work", "teamsettings", "teamfieldvalues"),
+        "team_field_values",
+    ),
+    ("GET", ("work", "teamsettings", "iterations"), "iterations"),
+    ("GET", ("work", "processes"), "processes"),
+    ("GET", ("work", "processes", _ANY), "process"),
+    (
+        "GET",
+        ("work", "processes", _ANY, "workitemtypes"),
+        "process_work_item_types",
+    ),
+    (
+        "GET",
+        ("work", "processes", _ANY, "workitemtypes", _ANY, "fields"),
+        "process_fields",
+    ),
+    (
+        "GET",
+        ("work", "processes", _ANY, "workitemtypes", _ANY, "fields", _ANY),
+        "process_field",
+    ),
+    ("GET", ("identities",), "identities"),
+]
+
+# Routes the SDK uses for discovery rather than for tool calls
+DISCOVERY_ROUTES = frozenset({"options", "resource_areas", "resource_area"})
+
+
+class ApiError(Exception):
+    """An error response in the shape of the REST API's errors."""
+
+    def __init__(self, status: int, message: str, type_key: str = ""):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.type_key = type_key or "VssServiceException"
+
+    def body(self) -> Dict[str, Any]:
+        return {
+            "$id": "1",
+            "innerException": None,
+            "message": self.message,
+            "typeName": f"{self.type_key}, Microsoft.VisualStudio.Services",
+            "typeKey": self.type_key,
+            "errorCode": 0,
+            "eventId": 3000,
+        }
+
+
+def _collection(values: List[Any]) -> Dict[str, Any]:
+    return {"count": len(values), "value": values}
+
+
+def _match_route(
+    method: str, segments: List[str]
+) -> Optional[Tuple[str, List[str]]]:
+    lowered = [segment.lower() for segment in segments]
+    for route_method, pattern, name in ROUTES:
+        if route_method != method or len(pattern) != len(segments):
+            continue
+        params = []
+        for expected, actual, original in zip(pattern, lowered, segments):
+            if expected is _ANY:
+                params.append(original)
+            elif expected == "$":
+                if not actual.startswith("$"):
+                    break
+                params.append(original[1:])
+            elif expected != actual:
+                break
+        else:
+            return name, params
+    return None
+
+
+class MockStats:
+    """Thread-safe request counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.discovery_requests = 0
+            self.throttled = 0
+            self.errors = 0
+            self.bytes_in = 0
+            self.bytes_out = 0
+            self.routes: Counter = Counter()
+
+    def record(
+        self,
+        route: str,
+        status: int,
+        bytes_in: int,
+        bytes_out: int,
+    ) -> None:
+        with self._lock:
+            if route in DISCOVERY_ROUTES:
+                self.discovery_requests += 1
+            else:
+                self.requests += 1
+            if status == 429:
+                self.throttled += 1
+            elif status >= 400:
+                self.errors += 1
+            self.bytes_in += bytes_in
+            self.bytes_out += bytes_out
+            self.routes[route] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "discovery_requests": self.discovery_requests,
+                "throttled": self.throttled,
+                "errors": self.errors,
+                "bytes_in": self.bytes_in,
+                "bytes_out": self.bytes_out,
+                "routes": dict(self.routes),
+            }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler dispatching to the ``handle_*`` methods."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY a
+    # reused keep-alive connection waits for the client's delayed ACK
+    disable_nagle_algorithm = True
+    server: "_MockHTTPServer"
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def do_OPTIONS(self):
+        self._dispatch("OPTIONS")
+
+    # Plumbing
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0].strip(), 16)
+                if size == 0:
+                    self.rfile.readline()
+                    break
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+            return b"".join(chunks)
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _send_json(
+        self,
+        status: int,
+        payload: Any,
+        headers: Optional[Dict[str, str]] = None,
+        before_send: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        body = json.dumps(payload).encode("utf-8")
+        if before_send:
+            before_send(len(body))
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        return len(body)
+
+    def _dispatch(self, method: str) -> None:
+        mock = self.server.mock
+        settings = mock.settings
+        body = self._read_body()
+        url = urlsplit(self.path)
+        self.query = {
+            key.lower(): value for key, value in parse_qsl(url.query)
+        }
+        segments = [unquote(part) for part in url.path.split("/") if part]
+
+        if segments[:1] == ["_mock"]:
+            self._handle_control(method, segments[1:])
+            return
+
+        route = "unknown"
+        headers: Dict[str, str] = {}
+        try:
+            # Path is /{organization}/[{project}/[{team}/]]_apis/...
+            lowered = [segment.lower() for segment in segments]
+            if len(segments) < 2 or "_apis" not in lowered:
+                raise ApiError(404, f"Unknown path '{url.path}'")
+            apis = lowered.index("_apis")
+            self.scope = segments[1:apis]
+            matched = _match_route(method, segments[apis + 1 :])
+            if matched is None:
+                raise ApiError(
+                    404,
+                    f"The mock service does not implement {method} {url.path}",
+                )
+            route, params = matched
+
+            if settings.latency_ms or settings.jitter_ms:
+                time.sleep(
+                    (
+                        settings.latency_ms
+                        + mock.random.uniform(0, settings.jitter_ms)
+                    )
+                    / 1000
+                )
+            self._check_auth(settings)
+            if settings.throttle_rate and (
+                mock.random.random() < settings.throttle_rate
+            ):
+                headers = {
+                    "Retry-After": str(settings.retry_after),
+                    "X-RateLimit-Resource": "ATCPU",
+                    "X-RateLimit-Delay": str(settings.retry_after),
+                }
+                raise ApiError(
+                    429,
+                    "TF400733: The request has been throttled because of "
+                    "exceeding usage limits.",
+                    "RequestBlockedException",
+                )
+
+            self.body = body
+            status, payload, extra = getattr(self, f"handle_{route}")(*params)
+            headers.update(extra or {})
+        except ApiError as error:
+            status, payload = error.status, error.body()
+        except (ValueError, KeyError) as error:
+            status, payload = 400, ApiError(400, str(error)).body()
+
+        # Counted before the response is written so a client that reads the
+        # stats right after its call returns sees the request
+        self._send_json(
+            status,
+            payload,
+            headers,
+            lambda sent: mock.stats.record(route, status, len(body), sent),
+        )
+
+    def _check_auth(self, settings: MockSettings) -> None:
+        if settings.pat is None:
+            return
+        expected = base64.b64encode(f":{settings.pat}".encode()).decode()
+        if self.headers.get("Authorization") != f"Basic {expected}":
+            raise ApiError(401, "Access denied", "UnauthorizedRequest")
+
+    def _handle_control(self, method: str, segments: List[str]) -> None:
+        mock = self.server.mock
+        if method == "GET" and segments == ["stats"]:
+            self._send_json(200, mock.stats.snapshot())
+        elif method == "POST" and segments == ["reset"]:
+            mock.stats.reset()
+            self._send_json(200, {"reset": True})
+        else:
+            self._send_json(404, {"message": "Unknown control endpoint"})
+
+    def _json_body(self) -> Any:
+        if not self.body:
+            return None
+        try:
+            return json.loads(self.body)
+        except json.JSONDecodeError:
+            raise ApiError(400, "Request body is not valid JSON") from None
+
+    def _project(self) -> Optional[Dict[str, Any]]:
+        if not self.scope:
+            return None
+        project = self.server.mock.dataset.find_project(self.scope[0])
+        if project is None:
+            raise ApiError(
+                404,
+                f"TF200016: The following project does not exist: "
+                f"{self.scope[0]}.",
+                "ProjectDoesNotExistWithNameException",
+            )
+        return project
+
+    def _team(self) -> Dict[str, Any]:
+        project = self._project()
+        if project is None:
+            raise ApiError(400, "A project is required")
+        team_name = self.scope[1] if len(self.scope) > 1 else None
+        team = None
+        if team_name:
+            team = self.server.mock.dataset.find_team(
+                project["name"], team_name
+            )
+        else:
+            team = self.server.mock.dataset.find_team(
+                project["name"], f"{project['name']} Team"
+            )
+        if team is None:
+            raise ApiError(
+                404,
+                f"The team with id {team_name} does not exist.",
+                "TeamNotFoundException",
+            )
+        return team
+
+    def _page(self, values: List[Any]) -> List[Any]:
+        skip = int(self.query.get("$skip") or 0)
+        top = self.query.get("$top")
+        end = skip + int(top) if top else None
+        return values[skip:end]
+
+    def _serialize_work_item(
+        self,
+        item: Dict[str, Any],
+        fields: Optional[List[str]] = None,
+        expand: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        dataset = self.server.mock.dataset
+        if fields:
+            wanted = {field.lower() for field in fields}
+            values = {
+                name: value
+                for name, value in item["fields"].items()
+                if name.lower() in wanted
+            }
+        else:
+            values = dict(item["fields"])
+        result = {
+            "id": item["id"],
+            "rev": item["rev"],
+            "fields": values,
+            "url": dataset.work_item_url(item["id"]),
+        }
+        if (expand or "").lower() in ("relations", "all"):
+            result["relations"] = list(item["relations"])
+        return result
+
+    def _get_work_item(self, item_id: str) -> Dict[str, Any]:
+        item = self.server.mock.dataset.work_items.get(int(item_id))
+        if item is None:
+            raise ApiError(
+                404,
+                f"TF401232: Work item {item_id} does not exist, or you do "
+                "not have permissions to read it.",
+                "WorkItemUnauthorizedAccessException",
+            )
+        return item
+
+    def _fetch_work_items(
+        self,
+        ids: List[int],
+        fields: Optional[List[str]],
+        expand: Optional[str],
+        error_policy: Optional[str],
+    ) -> List[Optional[Dict[str, Any]]]:
+        limit = self.server.mock.settings.max_batch_ids
+        if len(ids) > limit:
+            raise ApiError(
+                400,
+                f"VS403474: The maximum number of work items that can be "
+                f"requested at once is {limit}.",
+                "WorkItemTrackingMaxIdsExceededException",
+            )
+        dataset = self.server.mock.dataset
+        results = []
+        for item_id in ids:
+            item = dataset.work_items.get(item_id)
+            if item is None:
+                if (error_policy or "").lower() == "omit":
+                    results.append(None)
+                    continue
+                self._get_work_item(str(item_id))
+            results.append(self._serialize_work_item(item, fields, expand))
+        return results
+
+    # Discovery
+
+    def handle_options(self):
+        values = [
+            {
+                "id": location_id,
+                "area": area,
+                "resourceName": resource,
+                "routeTemplate": template,
+                "resourceVersion": version,
+                "minVersion": 1.0,
+                "maxVersion": 7.1,
+                "releasedVersion": "7.0",
+            }
+            for location_id, area, resource, template, version in LOCATIONS
+        ]
+        return 200, _collection(values), None
+
+    def handle_resource_areas(self):
+        base_url = self.server.mock.url + "/"
+        values = [
+            {"id": area_id, "name": name, "locationUrl": base_url}
+            for area_id, name in RESOURCE_AREAS.items()
+        ]
+        return 200, _collection(values), None
+
+    def handle_resource_area(self, area_id):
+        name = RESOURCE_AREAS.get(area_id.lower())
+        if name is None:
+            raise ApiError(404, f"Resource area {area_id} not found")
+        base_url = self.server.mock.url + "/"
+        return (
+            200,
+            {"id": area_id, "name": name, "locationUrl": base_url},
+            None,
+        )
+
+    # Core
+
+    def handle_projects(self):
+        projects = self.server.mock.dataset.projects
+        skip = int(
+            self.query.get("continuationtoken") or self.query.get("$skip") or 0
+        )
+        top = int(self.query.get("$top") or 100)
+        page = projects[skip : skip + top]
+        headers = {}
+        if skip + top < len(projects):
+            headers["x-ms-continuationtoken"] = str(skip + top)
+        return 200, _collection(page), headers
+
+    def handle_project(self, name_or_id):
+        self.scope = [name_or_id]
+        result = dict(self._project())
+        if self.query.get("includecapabilities", "").lower() == "true":
+            result["capabilities"] = {
+                "processTemplate": {
+                    "templateName": PROCESS_NAME,
+                    "templateTypeId": PROCESS_ID,
+                },
+                "versioncontrol": {"sourceControlType": "Git"},
+            }
+        return 200, result, None
+
+    @staticmethod
+    def _public_team(team: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            key: value
+            for key, value in team.items()
+            if key not in ("members", "areaPath")
+        }
+
+    def handle_all_teams(self):
+        teams = [
+            self._public_team(team) for team in self.server.mock.dataset.teams
+        ]
+        return 200, _collection(self._page(teams)), None
+
+    def handle_project_teams(self, project):
+        self.scope = [project]
+        found = self._project()
+        teams = [
+            self._public_team(team)
+            for team in self.server.mock.dataset.teams
+            if team["projectId"] == found["id"]
+        ]
+        return 200, _collection(self._page(teams)), None
+
+    def handle_team_members(self, project, team):
+        self.scope = [project, team]
+        found = self._team()
+        members = [
+            {"identity": identity, "isTeamAdmin": index == 0}
+            for index, identity in enumerate(found["members"])
+        ]
+        return 200, _collection(self._page(members)), None
+
+    # Work item tracking
+
+    def handle_wiql(self):
+        mock = self.server.mock
+        request = self._json_body() or {}
+        query = request.get("query") or ""
+        project = self._project()
+        try:
+            source, _, _ = parse_query(query)
+            with mock.dataset.lock:
+                items = list(mock.dataset.work_items.values())
+            ids = evaluate(
+                query,
+                items,
+                {
+                    "project": project["name"] if project else None,
+                    "me": mock.dataset.default_user()["uniqueName"],
+                },
+            )
+        except WiqlError as error:
+            raise ApiError(
+                400,
+                f"TF51005: The query references a field or syntax that is "
+                f"not supported. {error}",
+                "QueryException",
+            ) from None
+
+        top = self.query.get("$top")
+        top = int(top) if top else None
+        limit = mock.settings.result_limit
+        if len(ids) > limit and (top is None or top > limit):
+            raise ApiError(
+                400,
+                f"VS402337: The number of work items returned exceeds the "
+                f"size limit of {limit}. Change the query to return fewer "
+                "items.",
+                "WorkItemTrackingQueryResultSizeLimitExceededException",
+            )
+        if top is not None:
+            ids = ids[:top]
+
+        as_of = format_date(datetime.now(timezone.utc))
+        result = {
+            "asOf": as_of,
+            "columns": [
+                {"referenceName": "System.Id", "name": "ID"},
+            ],
+            "queryResultType": "workItem",
+            "queryType": "flat",
+        }
+        references = [
+            {"id": item_id, "url": mock.dataset.work_item_url(item_id)}
+            for item_id in ids
+        ]
+        if source.lower() == "workitemlinks":
+            result["queryResultType"] = "workItemLink"
+            result["queryType"] = "oneHop"
+            relations = []
+            for item_id in ids:
+                relations.append(
+                    {"rel": None, "source": None, "target": {"id": item_id}}
+                )
+                item = mock.dataset.work_items[item_id]
+                for relation in item["relations"]:
+                    target = relation["url"].rsplit("/", 1)[-1]
+                    if target.isdigit():
+                        relations.append(
+                            {
+                                "rel": relation["rel"],
+                                "source": {"id": item_id},
+                                "target": {"id": int(target)},
+                            }
+                        )
+            result["workItemRelations"] = relations
+        else:
+            result["workItems"] = references
+        return 200, result, None
+
+    def handle_work_items(self):
+        ids_param = self.query.get("ids") or ""
+        ids = [int(value) for value in ids_param.split(",") if value.strip()]
+        fields = self.query.get("fields")
+        results = self._fetch_work_items(
+            ids,
+            fields.split(",") if fields else None,
+            self.query.get("$expand"),
+            self.query.get("errorpolicy"),
+        )
+        return 200, _collection(results), None
+
+    def handle_work_items_batch(self):
+        request = self._json_body() or {}
+        results = self._fetch_work_items(
+            [int(value) for value in request.get("ids") or []],
+            request.get("fields"),
+            request.get("$expand"),
+            request.get("errorPolicy"),
+        )
+        return 200, _collection(results), None
+
+    def handle_work_item(self, item_id):
+        item = self._get_work_item(item_id)
+        fields = self.query.get("fields")
+        return (
+            200,
+            self._serialize_work_item(
+                item,
+                fields.split(",") if fields else None,
+                self.query.get("$expand"),
+            ),
+            None,
+        )
+
+    def handle_create_work_item(self, work_item_type):
+        project = self._project()
+        if project is None:
+            raise ApiError(400, "A project is required")
+        if work_item_type.lower() not in {
+            name.lower() for name in WORK_ITEM_TYPES
+        }:
+            raise ApiError(
+                404,
+                f"TF201036: Work item type {work_item_type} does not exist.",
+                "WorkItemTypeNotFoundException",
+            )
+        item = self.server.mock.dataset.create_work_item(
+            project["name"],
+            work_item_type,
+            self._json_body() or [],
+            self.query.get("validateonly", "").lower() == "true",
+        )
+        return 200, self._serialize_work_item(item, expand="all"), None
+
+    def handle_update_work_item(self, item_id):
+        dataset = self.server.mock.dataset
+        operations = self._json_body() or []
+        with dataset.lock:
+            item = self._get_work_item(item_id)
+            if self.query.get("validateonly", "").lower() != "true":
+                dataset.apply_patch(item, operations)
+        return 200, self._serialize_work_item(item, expand="all"), None
+
+    def handle_updates(self, item_id):
+        self._get_work_item(item_id)
+        updates = self.server.mock.dataset.updates.get(int(item_id), [])
+        return 200, _collection(self._page(updates)), None
+
+    def handle_comments(self, item_id):
+        self._get_work_item(item_id)
+        comments = self.server.mock.dataset.comments.get(int(item_id), [])
+        top = self.query.get("$top")
+        page = comments[: int(top)] if top else comments
+        return (
+            200,
+            {
+                "totalCount": len(comments),
+                "count": len(page),
+                "comments": page,
+            },
+            None,
+        )
+
+    def handle_add_comment(self, item_id):
+        self._get_work_item(item_id)
+        request = self._json_body() or {}
+        text = request.get("text")
+        if not text:
+            raise ApiError(400, "Comment text is required")
+        return (
+            200,
+            self.server.mock.dataset.add_comment(int(item_id), text),
+            None,
+        )
+
+    def handle_create_attachment(self):
+        file_name = self.query.get("filename") or "attachment"
+        attachment_id = self.server.mock.dataset.add_attachment(len(self.body))
+        url = (
+            f"{self.server.mock.url}/_apis/wit/attachments/{attachment_id}"
+            f"?fileName={file_name}"
+        )
+        return 200, {"id": attachment_id, "url": url}, None
+
+    @staticmethod
+    def _work_item_type(name: str) -> Dict[str, Any]:
+        reference_name, color = WORK_ITEM_TYPES[name]
+        return {
+            "name": name,
+            "referenceName": reference_name,
+            "description": f"Tracks a {name.lower()}",
+            "color": color,
+            "icon": {"id": f"icon_{name.lower().replace(' ', '_')}"},
+            "isDisabled": False,
+            "states": [
+                {"name": state, "category": category, "color": state_color}
+                for state, category, state_color in STATES
+            ],
+            "fields": [
+                {
+                    "referenceName": reference,
+                    "name": field_name,
+                    "alwaysRequired": required,
+                }
+                for reference, field_name, _, required in FIELDS
+            ],
+        }
+
+    def handle_work_item_types(self):
+        self._project()
+        types = [self._work_item_type(name) for name in WORK_ITEM_TYPES]
+        return 200, _collection(types), None
+
+    def handle_work_item_type(self, name):
+        self._project()
+        for type_name in WORK_ITEM_TYPES:
+            if type_name.lower() == name.lower():
+                return 200, self._work_item_type(type_name), None
+        raise ApiError(
+            404,
+            f"TF201036: Work item type {name} does not exist.",
+            "WorkItemTypeNotFoundException",
+        )
+
+    def handle_work_item_type_fields(self, name):
+        _, type_result, _ = self.handle_work_item_type(name)
+        allowed = {
+            "System.State": [state for state, _, _ in STATES],
+            "Microsoft.VSTS.Common.Priority": [1, 2, 3, 4],
+        }
+        fields = [
+            dict(field, allowedValues=allowed.get(field["referenceName"], []))
+            for field in type_result["fields"]
+        ]
+        return 200, _collection(fields), None
+
+    def handle_classification_nodes(self, structure_group):
+        project = self._project()
+        if project is None:
+            raise ApiError(400, "A project is required")
+        name = project["name"]
+        group = structure_group.lower()
+        if group == "areas":
+            structure, label = "area", "Area"
+            leaves = sorted(
+                team["areaPath"].split("\\", 1)[1]
+                for team in self.server.mock.dataset.teams
+                if team["projectName"] == name and "\\" in team["areaPath"]
+            )
+        elif group == "iterations":
+            structure, label = "iteration", "Iteration"
+            leaves = [
+                iteration["name"]
+                for iteration in self.server.mock.dataset.iterations[name]
+            ]
+        else:
+            raise ApiError(400, f"Unknown structure group '{structure_group}'")
+        depth = int(self.query.get("$depth") or 0)
+
+        def node(path: List[str], children: List[str]) -> Dict[str, Any]:
+            result: Dict[str, Any] = {
+                "id": len(path),
+                "name": path[-1],
+                "structureType": structure,
+                "hasChildren": bool(children),
+                "path": "\\" + "\\".join([path[0], label, *path[1:]]),
+            }
+            if children and depth > len(path) - 1:
+                result["children"] = [
+                    node([*path, child], []) for child in children
+                ]
+            return result
+
+        return 200, node([name], leaves), None
+
+    def handle_templates(self):
+        self._team()
+        type_name = (self.query.get("workitemtypename") or "").lower()
+        templates = [
+            {key: value for key, value in template.items() if key != "fields"}
+            for template in TEMPLATES
+            if not type_name
+            or template["workItemTypeName"].lower() == type_name
+        ]
+        return 200, _collection(templates), None
+
+    def handle_template(self, template_id):
+        self._team()
+        for template in TEMPLATES:
+            if template["id"] == template_id.lower():
+                return 200, template, None
+        raise ApiError(
+            404,
+            f"Template {template_id} does not exist.",
+            "WorkItemTemplateNotFoundException",
+        )
+
+    # Work
+
+    def handle_team_field_values(self):
+        team = self._team()
+        return (
+            200,
+            {
+                "defaultValue": team["areaPath"],
+                "field": {
+                    "referenceName": "System.AreaPath",
+                    "url": f"{self.server.mock.url}/_apis/wit/fields/"
+                    "System.AreaPath",
+                },
+                "values": [
+                    {"value": team["areaPath"], "includeChildren": True}
+                ],
+            },
+            None,
+        )
+
+    def handle_iterations(self):
+        team = self._team()
+        iterations = self.server.mock.dataset.iterations[team["projectName"]]
+        timeframe = (self.query.get("$timeframe") or "").lower()
+        if timeframe:
+            iterations = [
+                iteration
+                for iteration in iterations
+                if iteration["attributes"]["timeFrame"] == timeframe
+            ]
+        return 200, _collection(iterations), None
+
+    # Process
+
+    @staticmethod
+    def _process() -> Dict[str, Any]:
+        return {
+            "typeId": PROCESS_ID,
+            "name": PROCESS_NAME,
+            "referenceName": PROCESS_NAME,
+            "description": "This template is flexible and will work great "
+            "for most teams using Agile planning methods.",
+            "customizationType": "system",
+            "isDefault": True,
+            "isEnabled": True,
+            "parentProcessTypeId": "00000000-0000-0000-0000-000000000000",
+        }
+
+    def _check_process(self, process_id: str) -> None:
+        if process_id.lower() != PROCESS_ID:
+            raise ApiError(
+                404,
+                f"VS402362: The process {process_id} does not exist.",
+                "ProcessNotFoundByTypeIdException",
+            )
+
+    def _process_type(self, reference_name: str) -> str:
+        for name, (reference, _) in WORK_ITEM_TYPES.items():
+            if reference.lower() == reference_name.lower():
+                return name
+        raise ApiError(
+            404,
+            f"VS402805: Work item type {reference_name} does not exist.",
+            "WorkItemTypeNotFoundException",
+        )
+
+    @staticmethod
+    def _process_field(reference, name, field_type, required):
+        return {
+            "referenceName": reference,
+            "name": name,
+            "type": field_type,
+            "required": required,
+            "readOnly": reference == "System.Id",
+            "customization": "system",
+            "description": f"The {name.lower()} of the work item",
+            "defaultValue": None,
+        }
+
+    def handle_processes(self):
+        return 200, _collection([self._process()]), None
+
+    def handle_process(self, process_id):
+        self._check_process(process_id)
+        return 200, self._process(), None
+
+    def handle_process_work_item_types(self, process_id):
+        self._check_process(process_id)
+        types = []
+        for name, (reference, color) in WORK_ITEM_TYPES.items():
+            types.append(
+                {
+                    "referenceName": reference,
+                    "name": name,
+                    "description": f"Tracks a {name.lower()}",
+                    "color": color,
+                    "icon": f"icon_{name.lower().replace(' ', '_')}",
+                    "isDisabled": False,
+                    "customization": "system",
+                }
+            )
+        if self.query.get("$expand", "").lower() == "states":
+            for work_item_type in types:
+                work_item_type["states"] = [
+                    {"name": state, "stateCategory": category, "color": color}
+                    for state, category, color in STATES
+                ]
+        return 200, _collection(types), None
+
+    def handle_process_fields(self, process_id, reference_name):
+        self._check_process(process_id)
+        self._process_type(reference_name)
+        fields = [self._process_field(*field) for field in FIELDS]
+        return 200, _collection(fields), None
+
+    def handle_process_field(self, process_id, reference_name, field_name):
+        self._check_process(process_id)
+        self._process_type(reference_name)
+        for field in FIELDS:
+            if field[0].lower() == field_name.lower():
+                return 200, self._process_field(*field), None
+        raise ApiError(
+            404,
+            f"TF51535: Cannot find field {field_name}.",
+            "WorkItemTrackingFieldDefinitionNotFoundException",
+        )
+
+    # Identities
+
+    def handle_identities(self):
+        if self.query.get("searchfilter", "").lower() != "general":
+            raise ApiError(400, "Only the General search filter is supported")
+        key = self.query.get("filtervalue", "").strip().lower()
+        # Display names match by prefix, account names exactly
+        identities = [
+            {
+                "id": user["id"],
+                "descriptor": user["descriptor"],
+                "providerDisplayName": user["displayName"],
+                "isActive": True,
+                "properties": {
+                    "Account": {
+                        "$type": "System.String",
+                        "$value": user["uniqueName"],
+                    }
+                },
+            }
+            for user in self.server.mock.dataset.users
+            if key
+            and (
+                user["displayName"].lower().startswith(key)
+                or user["uniqueName"].lower() == key
+            )
+        ]
+        return 200, _collection(identities), None
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, mock: "MockAzureDevOps"):
+        super().__init__(address, _Handler)
+        self.mock = mock
+
+
+class MockAzureDevOps:
+    """
+    Stand-in Azure DevOps organization served over HTTP.
+
+    Use as a context manager, or call ``start`` and ``stop``. Point
+    ``AZURE_DEVOPS_ORGANIZATION_URL`` at ``url`` to run the server's tools
+    against it.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[MockSettings] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Create the service and its dataset.
+
+        Args:
+            settings: Dataset size and service behavior
+            host: Interface to listen on
+            port: Port to listen on; 0 picks a free port
+        """
+        self.settings = settings or MockSettings()
+        self.random = random.Random(self.settings.seed)
+        self.stats = MockStats()
+        self._httpd = _MockHTTPServer((host, port), self)
+        self._thread: Optional[threading.Thread] = None
+        self.dataset = Dataset(self.settings, self.url)
+
+    @property
+    def url(self) -> str:
+        """Organization URL of the service."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/{self.settings.organization}"
+
+    def start(self) -> "MockAzureDevOps":
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MockAzureDevOps":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
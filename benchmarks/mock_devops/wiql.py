@@ -0,0 +1,385 @@
+"""
+Minimal WIQL evaluation for the mock service.
+
+Supports the subset of WIQL the server's tools send: flat and link queries
+with AND/OR/NOT, parentheses, the comparison operators, ``IN``,
+``CONTAINS``, ``UNDER`` and ``EVER``, the ``@project``, ``@me`` and
+``@today`` macros and ``ORDER BY``. Conditions on other macros always
+match.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.mock_devops.dataset import parse_date
+
+_TOKEN_PATTERN = re.compile(
+    r"""
+    \s*(?:
+        (?P<field>\[[^\]]+\])
+      | (?P<string>'(?:[^']|'')*'|"(?:[^"]|"")*")
+      | (?P<number>-?\d+(?:\.\d+)?)
+      | (?P<operator><>|!=|>=|<=|=|<|>)
+      | (?P<macro>@\w+(?:\s*[-+]\s*\d+)?)
+      | (?P<punct>[(),])
+      | (?P<word>[A-Za-z_][\w.]*)
+    )
+    """,
+    re.VERBOSE,
+)
+
+_QUERY_PATTERN = re.compile(
+    r"^\s*select\s+.*?\s+from\s+(?P<source>\w+)"
+    r"(?:\s+where\s+(?P<where>.*?))?"
+    r"(?:\s+order\s+by\s+(?P<order>.*?))?"
+    r"(?:\s+asof\s+.*?)?"
+    r"(?:\s+mode\s*\(.*?\))?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+Predicate = Callable[[Dict[str, Any]], bool]
+
+
+class WiqlError(ValueError):
+    """Raised when a query cannot be parsed."""
+
+
+def _tokenize(text: str) -> List[Tuple[str, str]]:
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN_PATTERN.match(text, position)
+        if not match or match.end() == position:
+            raise WiqlError(f"Unexpected text near '{text[position:]}'")
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+    return tokens
+
+
+def _literal(kind: str, value: str) -> Any:
+    if kind == "string":
+        quote = value[0]
+        return value[1:-1].replace(quote * 2, quote)
+    if kind == "number":
+        return float(value) if "." in value else int(value)
+    return value
+
+
+def _field_value(item: Dict[str, Any], field: str) -> Any:
+    fields = item["fields"]
+    lowered = field.lower()
+    for name, value in fields.items():
+        if name.lower() == lowered:
+            return value
+    if lowered == "system.id":
+        return item["id"]
+    return None
+
+
+def _as_text(value: Any) -> str:
+    if isinstance(value, dict):
+        return value.get("uniqueName") or value.get("displayName") or ""
+    return "" if value is None else str(value)
+
+
+def _identity_names(value: Any) -> List[str]:
+    if isinstance(value, dict):
+        names = [value.get("displayName"), value.get("uniqueName")]
+        if value.get("displayName") and value.get("uniqueName"):
+            names.append(f"{value['displayName']} <{value['uniqueName']}>")
+        return [name.lower() for name in names if name]
+    return [_as_text(value).lower()]
+
+
+def _compare(left: Any, operator: str, right: Any) -> bool:
+    if left is None:
+        return operator in ("<>", "!=") and right not in (None, "")
+    if isinstance(right, datetime):
+        left = parse_date(_as_text(left))
+        if left is None:
+            return False
+    elif isinstance(right, (int, float)) and not isinstance(right, bool):
+        try:
+            left = float(left)
+        except (TypeError, ValueError):
+            return False
+    else:
+        names = _identity_names(left)
+        right = _as_text(right).lower()
+        if operator == "=":
+            return right in names
+        if operator in ("<>", "!="):
+            return right not in names
+        left = names[0]
+
+    if operator == "=":
+        return left == right
+    if operator in ("<>", "!="):
+        return left != right
+    if operator == ">":
+        return left > right
+    if operator == ">=":
+        return left >= right
+    if operator == "<":
+        return left < right
+    if operator == "<=":
+        return left <= right
+    return False
+
+
+class _Parser:
+    """Recursive descent parser producing a predicate over work items."""
+
+    def __init__(self, tokens, context: Dict[str, Any]):
+        self.tokens = tokens
+        self.position = 0
+        self.context = context
+
+    def _peek(self) -> Optional[Tuple[str, str]]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None
+
+    def _next(self) -> Tuple[str, str]:
+        token = self._peek()
+        if token is None:
+            raise WiqlError("Unexpected end of query")
+        self.position += 1
+        return token
+
+    def _accept_word(self, *words: str) -> bool:
+        token = self._peek()
+        if token and token[0] == "word" and token[1].lower() in words:
+            self.position += 1
+            return True
+        return False
+
+    def parse(self) -> Predicate:
+        predicate = self._expression()
+        if self._peek() is not None:
+            raise WiqlError(f"Unexpected token '{self._peek()[1]}'")
+        return predicate
+
+    def _expression(self) -> Predicate:
+        terms = [self._term()]
+        while self._accept_word("or"):
+            terms.append(self._term())
+        if len(terms) == 1:
+            return terms[0]
+        return lambda item: any(term(item) for term in terms)
+
+    def _term(self) -> Predicate:
+        factors = [self._factor()]
+        while self._accept_word("and"):
+            factors.append(self._factor())
+        if len(factors) == 1:
+            return factors[0]
+        return lambda item: all(factor(item) for factor in factors)
+
+    def _factor(self) -> Predicate:
+        if self._accept_word("not"):
+            inner = self._factor()
+            return lambda item: not inner(item)
+        token = self._peek()
+        if token == ("punct", "("):
+            self.position += 1
+            inner = self._expression()
+            if self._next() != ("punct", ")"):
+                raise WiqlError("Expected ')'")
+            return inner
+        return self._comparison()
+
+    def _value(self) -> Any:
+        kind, value = self._next()
+        if kind == "field":
+            field = value[1:-1]
+            return ("field", field)
+        if kind == "macro":
+            return self._macro(value)
+        if kind == "string":
+            text = _literal(kind, value)
+            if _DATE_PATTERN.match(text):
+                return parse_date(text) or text
+            return text
+        if kind == "number":
+            return _literal(kind, value)
+        raise WiqlError(f"Expected a value, found '{value}'")
+
+    def _macro(self, macro: str) -> Any:
+        name, _, offset = re.sub(r"\s+", "", macro).partition("-")
+        sign = -1
+        if not offset and "+" in name:
+            name, _, offset = name.partition("+")
+            sign = 1
+        name = name.lower()
+        if name == "@project":
+            return self.context.get("project") or _ANY
+        if name == "@me":
+            return self.context.get("me") or _ANY
+        if name == "@today":
+            today = datetime.now(timezone.utc).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            return today + timedelta(days=sign * int(offset or 0))
+        return _ANY
+
+    def _comparison(self) -> Predicate:
+        kind, field = self._next()
+        if kind != "field":
+            raise WiqlError(f"Expected a field, found '{field}'")
+        field = field[1:-1]
+        negate = self._accept_word("not")
+        token = self._next()
+
+        if token[0] == "word":
+            keyword = token[1].lower()
+            if keyword == "in":
+                if self._next() != ("punct", "("):
+                    raise WiqlError("Expected '(' after IN")
+                values = [self._value()]
+                while self._peek() == ("punct", ","):
+                    self.position += 1
+                    values.append(self._value())
+                if self._next() != ("punct", ")"):
+                    raise WiqlError("Expected ')'")
+                return self._negate(
+                    lambda item: any(
+                        _compare(_field_value(item, field), "=", value)
+                        for value in values
+                    ),
+                    negate,
+                )
+            value = self._value()
+            if value is _ANY:
+                return lambda item: True
+            if keyword == "contains":
+                needle = _as_text(value).lower()
+                return self._negate(
+                    lambda item: (
+                        needle in _as_text(_field_value(item, field)).lower()
+                    ),
+                    negate,
+                )
+            if keyword == "under":
+                root = _as_text(value).lower()
+                return self._negate(
+                    lambda item: (
+                        lambda path: (
+                            path == root or path.startswith(root + "\\")
+                        )
+                    )(_as_text(_field_value(item, field)).lower()),
+                    negate,
+                )
+            if keyword == "ever":
+                return self._negate(
+                    lambda item: _compare(
+                        _field_value(item, field), "=", value
+                    ),
+                    negate,
+                )
+            raise WiqlError(f"Unsupported operator '{token[1]}'")
+
+        if token[0] != "operator":
+            raise WiqlError(f"Expected an operator, found '{token[1]}'")
+        operator = token[1]
+        value = self._value()
+        if value is _ANY:
+            return lambda item: True
+        if isinstance(value, tuple) and value[0] == "field":
+            other = value[1]
+            return self._negate(
+                lambda item: _compare(
+                    _field_value(item, field),
+                    operator,
+                    _field_value(item, other),
+                ),
+                negate,
+            )
+        return self._negate(
+            lambda item: _compare(_field_value(item, field), operator, value),
+            negate,
+        )
+
+    @staticmethod
+    def _negate(predicate: Predicate, negate: bool) -> Predicate:
+        if not negate:
+            return predicate
+        return lambda item: not predicate(item)
+
+
+# Marker for macros the mock does not resolve
+_ANY = object()
+
+
+def _sort_key(value: Any) -> Tuple[int, Any]:
+    if value is None:
+        return (2, "")
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (0, value)
+    return (1, _as_text(value).lower())
+
+
+def parse_query(query: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    Split a WIQL query into its source, WHERE and ORDER BY clauses.
+
+    Args:
+        query: The WIQL query
+
+    Returns:
+        Tuple of (source, where clause, order by clause)
+
+    Raises:
+        WiqlError: If the query is not a SELECT statement
+    """
+    match = _QUERY_PATTERN.match(query)
+    if not match:
+        raise WiqlError("Expected a SELECT ... FROM ... statement")
+    return match.group("source"), match.group("where"), match.group("order")
+
+
+def evaluate(
+    query: str,
+    work_items: List[Dict[str, Any]],
+    context: Optional[Dict[str, Any]] = None,
+) -> List[int]:
+    """
+    Evaluate a flat WIQL query against work items.
+
+    For link queries the conditions are applied to the source work items.
+
+    Args:
+        query: The WIQL query
+        work_items: Work items in the REST API's JSON shape
+        context: Values of the @project and @me macros
+
+    Returns:
+        IDs of the matching work items in query order
+
+    Raises:
+        WiqlError: If the query cannot be parsed
+    """
+    _, where, order = parse_query(query)
+    where = re.sub(r"\[(source|target)\]\.", "", where or "", flags=re.I)
+    predicate: Predicate = lambda item: True  # noqa: E731
+    if where.strip():
+        predicate = _Parser(_tokenize(where), context or {}).parse()
+
+    matches = [item for item in work_items if predicate(item)]
+    matches.sort(key=lambda item: item["id"])
+    for clause in reversed((order or "").split(",")):
+        clause = re.sub(r"\[(source|target)\]\.", "", clause, flags=re.I)
+        match = re.match(r"\s*\[([^\]]+)\]\s*(asc|desc)?\s*$", clause, re.I)
+        if not match:
+            continue
+        field, direction = match.group(1), (match.group(2) or "asc").lower()
+        matches.sort(
+            key=lambda item: _sort_key(_field_value(item, field)),
+            reverse=direction == "desc",
+        )
+    return [item["id"] for item in matches]
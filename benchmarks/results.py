@@ -0,0 +1,157 @@
+"""
+Result handling shared by the benchmarks.
+
+Benchmark runs are stored as JSON documents with the environment they ran
+in, so a run can be compared against a baseline from an earlier commit.
+"""
+
+import json
+import math
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Get a percentile of a list of values using nearest-rank.
+
+    Args:
+        values: Sample values
+        pct: Percentile between 0 and 100
+
+    Returns:
+        The percentile value, or 0.0 for an empty list
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize(samples: Iterable[float]) -> Dict[str, Any]:
+    """
+    Summarize timing samples.
+
+    Args:
+        samples: Timings in milliseconds
+
+    Returns:
+        Dictionary with the samples and their min, p50, p95, p99, max and
+        mean
+    """
+    values = [round(value, 3) for value in samples]
+    return {
+        "samples": values,
+        "min": min(values, default=0.0),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": max(values, default=0.0),
+        "mean": round(sum(values) / len(values), 3) if values else 0.0,
+    }
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def environment() -> Dict[str, Any]:
+    """
+    Describe the environment a benchmark ran in.
+
+    Returns:
+        Dictionary with the timestamp, git revision, Python and platform
+    """
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_revision": _git_revision(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+    }
+
+
+def write_results(
+    name: str, data: Dict[str, Any], output: Optional[Path] = None
+) -> Path:
+    """
+    Write benchmark results as JSON.
+
+    Args:
+        name: Benchmark name, used in the default file name
+        data: Results to store
+        output: Optional output path. Defaults to a timestamped file in
+            benchmarks/results.
+
+    Returns:
+        Path of the written file
+    """
+    if output is None:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        output = RESULTS_DIR / f"{name}-{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    return output
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    """
+    Load benchmark results written by ``write_results``.
+
+    Args:
+        path: Path of the JSON file
+
+    Returns:
+        The stored results
+    """
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def compare(
+    metrics: Dict[str, Tuple[float, float]], max_regression: float
+) -> Tuple[List[str], bool]:
+    """
+    Compare current metrics against a baseline.
+
+    Args:
+        metrics: Mapping of metric name to (baseline, current) values,
+            where lower is better
+        max_regression: Allowed increase in percent before a metric counts
+            as regressed
+
+    Returns:
+        Tuple of report lines and whether any metric regressed
+    """
+    lines = [f"{'metric':<40} {'baseline':>12} {'current':>12} {'change':>9}"]
+    regressed = False
+    for name, (baseline, current) in metrics.items():
+        if baseline:
+            change = (current - baseline) / baseline * 100
+        else:
+            change = 0.0 if not current else math.inf
+        flag = ""
+        if change > max_regression:
+            flag = "  REGRESSED"
+            regressed = True
+        lines.append(
+            f"{name:<40} {baseline:>12.1f} {current:>12.1f} "
+            f"{change:>+8.1f}%{flag}"
+        )
+    return lines, regressed
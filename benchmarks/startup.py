@@ -0,0 +1,313 @@
+"""
+Startup and import-time benchmark.
+
+Launches ``mcp_azure_devops.server:main`` over stdio with a scripted MCP
+client and measures the time from spawning the process until the
+``initialize`` and ``tools/list`` requests have been answered. Cold runs use
+an empty bytecode cache so every module is compiled; warm runs reuse a
+primed one. A ``python -X importtime`` breakdown of the server module is
+recorded alongside.
+
+Usage::
+
+    python -m benchmarks.startup --runs 10
+    python -m benchmarks.startup --baseline benchmarks/results/base.json
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import anyio
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+from benchmarks.results import (
+    compare,
+    environment,
+    load_results,
+    summarize,
+    write_results,
+)
+
+SERVER_MODULE = "mcp_azure_devops.server"
+SERVER_COMMAND = "from mcp_azure_devops.server import main; main()"
+
+# The server never contacts Azure DevOps during the handshake, but the
+# credentials must look configured.
+_DUMMY_ENV = {
+    "AZURE_DEVOPS_PAT": "benchmark",
+    "AZURE_DEVOPS_ORGANIZATION_URL": "http://127.0.0.1:9/benchmark",
+}
+
+_IMPORTTIME_PATTERN = re.compile(
+    r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)\s*$"
+)
+
+
+def _server_env(pycache_prefix: str) -> Dict[str, str]:
+    env = dict(os.environ)
+    env.update(_DUMMY_ENV)
+    env["PYTHONPYCACHEPREFIX"] = pycache_prefix
+    return env
+
+
+async def _handshake(env: Dict[str, str]) -> Dict[str, float]:
+    """
+    Spawn the server and time the MCP handshake.
+
+    Args:
+        env: Environment for the server process
+
+    Returns:
+        Milliseconds from spawn to the initialize and tools/list responses,
+        and the number of tools listed
+    """
+    params = StdioServerParameters(
+        command=sys.executable, args=["-c", SERVER_COMMAND], env=env
+    )
+    with open(os.devnull, "w") as devnull:
+        start = time.perf_counter()
+        async with stdio_client(params, errlog=devnull) as streams:
+            async with ClientSession(*streams) as session:
+                await session.initialize()
+                initialized = time.perf_counter()
+                tools = await session.list_tools()
+                ready = time.perf_counter()
+    return {
+        "initialize_ms": (initialized - start) * 1000,
+        "ready_ms": (ready - start) * 1000,
+        "tools": len(tools.tools),
+    }
+
+
+def measure_startup(runs: int, cold: bool) -> Dict[str, Any]:
+    """
+    Measure time-to-ready over several server launches.
+
+    Args:
+        runs: Number of launches
+        cold: Whether each launch starts with an empty bytecode cache
+
+    Returns:
+        Summaries of the initialize and ready timings
+    """
+    initialize, ready, tools = [], [], 0
+    with tempfile.TemporaryDirectory() as shared_prefix:
+        if not cold:
+            # Prime the cache so measured runs only load bytecode
+            anyio.run(_handshake, _server_env(shared_prefix))
+        for _ in range(runs):
+            if cold:
+                with tempfile.TemporaryDirectory() as prefix:
+                    result = anyio.run(_handshake, _server_env(prefix))
+            else:
+                result = anyio.run(_handshake, _server_env(shared_prefix))
+            initialize.append(result["initialize_ms"])
+            ready.append(result["ready_ms"])
+            tools = result["tools"]
+    return {
+        "initialize_ms": summarize(initialize),
+        "ready_ms": summarize(ready),
+        "tools": tools,
+    }
+
+
+def parse_importtime(output: str) -> List[Dict[str, Any]]:
+    """
+    Parse the stderr output of ``python -X importtime``.
+
+    Args:
+        output: Captured stderr
+
+    Returns:
+        One entry per imported module with its self and cumulative time in
+        milliseconds and its nesting depth
+    """
+    entries = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_PATTERN.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        entries.append(
+            {
+                "module": module,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+                "depth": (len(indent) - 1) // 2,
+            }
+        )
+    return entries
+
+
+def measure_imports(runs: int, top: int) -> Dict[str, Any]:
+    """
+    Break down the import time of the server module.
+
+    Each module's time is the median over all runs, taken with a warm
+    bytecode cache.
+
+    Args:
+        runs: Number of importtime runs
+        top: Number of slowest modules to keep
+
+    Returns:
+        Total import time, self time summed per top-level package and the
+        modules with the highest self time
+    """
+    self_times: Dict[str, List[float]] = defaultdict(list)
+    package_times: Dict[str, List[float]] = defaultdict(list)
+    totals = []
+    with tempfile.TemporaryDirectory() as prefix:
+        env = _server_env(prefix)
+        for run in range(runs + 1):
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    "-X",
+                    "importtime",
+                    "-c",
+                    f"import {SERVER_MODULE}",
+                ],
+                capture_output=True,
+                text=True,
+                env=env,
+                check=True,
+            )
+            if run == 0:
+                # The first run only primes the bytecode cache
+                continue
+            packages: Dict[str, float] = defaultdict(float)
+            for entry in parse_importtime(result.stderr):
+                self_times[entry["module"]].append(entry["self_ms"])
+                package = entry["module"].split(".")[0]
+                packages[package] += entry["self_ms"]
+                if entry["module"] == SERVER_MODULE:
+                    totals.append(entry["cumulative_ms"])
+            for package, value in packages.items():
+                package_times[package].append(value)
+
+    slowest = sorted(
+        (
+            (module, statistics.median(values))
+            for module, values in self_times.items()
+        ),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:top]
+    by_package = sorted(
+        (
+            (package, statistics.median(values))
+            for package, values in package_times.items()
+        ),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    return {
+        "total_ms": summarize(totals),
+        "packages_ms": {name: round(value, 3) for name, value in by_package},
+        "slowest_modules_ms": {
+            name: round(value, 3) for name, value in slowest
+        },
+    }
+
+
+def _comparable_metrics(
+    baseline: Dict[str, Any], current: Dict[str, Any]
+) -> Dict[str, tuple]:
+    metrics = {}
+    for mode in ("cold", "warm"):
+        for key in ("initialize_ms", "ready_ms"):
+            try:
+                metrics[f"{mode}.{key}.p50"] = (
+                    baseline["startup"][mode][key]["p50"],
+                    current["startup"][mode][key]["p50"],
+                )
+            except KeyError:
+                continue
+    try:
+        metrics["imports.total_ms.p50"] = (
+            baseline["imports"]["total_ms"]["p50"],
+            current["imports"]["total_ms"]["p50"],
+        )
+    except KeyError:
+        pass
+    return metrics
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the startup benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--runs", type=int, default=5, help="launches per mode (default: 5)"
+    )
+    parser.add_argument(
+        "--import-runs",
+        type=int,
+        default=5,
+        help="importtime runs (default: 5)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=25,
+        help="slowest modules to record (default: 25)",
+    )
+    parser.add_argument(
+        "--output", type=Path, help="where to write the JSON results"
+    )
+    parser.add_argument(
+        "--baseline", type=Path, help="results of an earlier run to compare"
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=10.0,
+        help="allowed slowdown against the baseline in percent (default: 10)",
+    )
+    args = parser.parse_args(argv)
+
+    results = {
+        "benchmark": "startup",
+        "environment": environment(),
+        "startup": {
+            "cold": measure_startup(args.runs, cold=True),
+            "warm": measure_startup(args.runs, cold=False),
+        },
+        "imports": measure_imports(args.import_runs, args.top),
+    }
+    path = write_results("startup", results, args.output)
+
+    for mode in ("cold", "warm"):
+        ready = results["startup"][mode]["ready_ms"]
+        print(
+            f"{mode:>4} ready: p50 {ready['p50']:.1f} ms, "
+            f"p95 {ready['p95']:.1f} ms"
+        )
+    print(f"imports: p50 {results['imports']['total_ms']['p50']:.1f} ms")
+    for name, value in results["imports"]["packages_ms"].items():
+        print(f"  {name:<30} {value:>8.1f} ms")
+    print(f"Results written to {path}")
+
+    if args.baseline:
+        lines, regressed = compare(
+            _comparable_metrics(load_results(args.baseline), results),
+            args.max_regression,
+        )
+        print("\n".join(lines))
+        if regressed:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,448 @@
+"""
+End-to-end per-tool benchmark.
+
+Drives every tool registered on the MCP server through an in-memory MCP
+client session against the local mock Azure DevOps service, across
+scenarios that vary the number of work items and links per work item. For
+each tool it records p50/p95/p99 latency, upstream HTTP calls, bytes sent
+and received, and the size of the tool's response.
+
+Upstream call counts are deterministic, so they are checked against the
+committed baseline in ``benchmarks/baselines/tool_calls.json``. The run fails
+if a tool makes more calls than the baseline allows, if a tool returns an
+error, or if a registered tool has no benchmark case.
+
+Usage::
+
+    python -m benchmarks.tools --iterations 5
+    python -m benchmarks.tools --items 10 200 --links 0 --tools get_work_item
+    python -m benchmarks.tools --update-baseline
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import anyio
+
+from benchmarks.mock_devops import MockAzureDevOps, MockSettings
+from benchmarks.mock_devops.dataset import PROCESS_ID
+from benchmarks.mock_devops.server import TEMPLATES
+from benchmarks.results import environment, summarize, write_results
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "tool_calls.json"
+
+DEFAULT_ITEMS = [10, 200, 2000]
+DEFAULT_LINKS = [0, 10, 50]
+
+PROJECT = "Project 1"
+TEAM = "Project 1 Team"
+
+_CURSOR_PATTERN = re.compile(r'cursor "([^"]+)"')
+
+# Arguments of a tool call, or a coroutine function producing them from an
+# MCP session (for tools that need state from an earlier call)
+CaseArgs = Any
+
+
+class Scenario:
+    """Dataset shape a group of tool calls runs against."""
+
+    def __init__(self, items: int, links: int):
+        self.items = items
+        self.links = links
+
+    @property
+    def name(self) -> str:
+        return f"items={self.items},links={self.links}"
+
+
+def _text(result) -> str:
+    return "".join(
+        getattr(content, "text", "") for content in result.content or []
+    )
+
+
+def tool_cases(scenario: Scenario, attachment: str) -> Dict[str, CaseArgs]:
+    """
+    Get the arguments each tool is benchmarked with.
+
+    Args:
+        scenario: Scenario the calls run in
+        attachment: Path of a file to attach
+
+    Returns:
+        Mapping of tool name to its arguments
+    """
+    all_ids = list(range(1, scenario.items + 1))
+    query = (
+        "SELECT [System.Id] FROM WorkItems "
+        f"WHERE [System.TeamProject] = '{PROJECT}' ORDER BY [System.Id]"
+    )
+    team_context = {"project": PROJECT, "team": TEAM}
+
+    async def continue_args(session) -> Dict[str, Any]:
+        first_page = await session.call_tool(
+            "get_work_item", {"id": all_ids, "max_items": 5}
+        )
+        match = _CURSOR_PATTERN.search(_text(first_page))
+        return {"cursor": match.group(1) if match else "", "max_items": 5}
+
+    return {
+        "query_work_items": {"query": query, "top": scenario.items},
+        "query_work_items_changed_since": {
+            "query": query,
+            "watermark": "2024-03-01T00:00:00Z",
+        },
+        "get_work_item": {"id": all_ids},
+        "continue_work_items": continue_args,
+        "get_work_item_basic": {"id": 1},
+        "get_work_item_details": {"id": 1},
+        "get_work_item_history": {"id": 1},
+        "get_work_item_comments": {"id": 1, "project": PROJECT},
+        "add_work_item_comment": {
+            "id": 1,
+            "text": "Benchmark **comment**",
+            "project": PROJECT,
+        },
+        "create_work_item": {
+            "title": "Benchmark item",
+            "project": PROJECT,
+            "work_item_type": "Task",
+            "description": "Created by the tool benchmark",
+            "state": "Active",
+            "assigned_to": "User 1",
+            "parent_id": 1,
+            "related_ids": [2] if scenario.items > 1 else None,
+            "priority": 2,
+            "tags": "benchmark",
+        },
+        "create_work_item_from_template": {
+            "team_context": team_context,
+            "template_id": TEMPLATES[0]["id"],
+            "overrides": {"title": "[Bug] Benchmark item"},
+            "parent_id": 1,
+        },
+        "update_work_item": {
+            "id": 1,
+            "state": "Active",
+            "title": "Updated by the tool benchmark",
+            "priority": 1,
+        },
+        "add_parent_child_link": {
+            "parent_id": 1,
+            "child_id": scenario.items,
+            "project": PROJECT,
+        },
+        "get_work_item_types": {"project": PROJECT},
+        "get_work_item_type": {"project": PROJECT, "type_name": "Bug"},
+        "get_work_item_type_fields": {
+            "project": PROJECT,
+            "type_name": "Bug",
+        },
+        "get_work_item_type_field": {
+            "project": PROJECT,
+            "type_name": "Bug",
+            "field_name": "System.Title",
+        },
+        "get_work_item_templates": {
+            "team_context": team_context,
+            "work_item_type": "Bug",
+        },
+        "get_work_item_template": {
+            "team_context": team_context,
+            "template_id": TEMPLATES[0]["id"],
+        },
+        "get_classification_paths": {
+            "project": PROJECT,
+            "structure": "iteration",
+        },
+        "get_project_process_id": {"project": PROJECT},
+        "get_process_details": {"process_id": PROCESS_ID},
+        "list_processes": {},
+        "add_work_item_attachment": {
+            "id": 1,
+            "file_path": attachment,
+            "project": PROJECT,
+        },
+        "get_work_item_attachments": {"id": 1, "project": PROJECT},
+        "get_projects": {},
+        "get_all_teams": {},
+        "get_team_members": {"project_id": PROJECT, "team_id": TEAM},
+        "get_project_members": {"project": PROJECT},
+        "get_team_area_paths": {
+            "project_name_or_id": PROJECT,
+            "team_name_or_id": TEAM,
+        },
+        "get_team_iterations": {
+            "project_name_or_id": PROJECT,
+            "team_name_or_id": TEAM,
+            "current": True,
+        },
+        "get_organization_inventory": {"projects": [PROJECT]},
+        "get_server_metrics": {},
+    }
+
+
+async def _run_scenario(
+    scenario: Scenario,
+    iterations: int,
+    selected: Optional[List[str]],
+    settings: Dict[str, Any],
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Benchmark the tools against one mock dataset.
+
+    Args:
+        scenario: Dataset shape
+        iterations: Measured calls per tool
+        selected: Optional names of the tools to run
+        settings: Extra mock service settings
+
+    Returns:
+        Tuple of per-tool results and the names of registered tools that
+        have no benchmark case
+    """
+    from mcp.shared.memory import (
+        create_connected_server_and_client_session as client_session,
+    )
+
+    from mcp_azure_devops.features.work_items.cache import clear_caches
+    from mcp_azure_devops.server import mcp
+
+    mock_settings = MockSettings(
+        projects=1,
+        work_items=scenario.items,
+        links_per_item=scenario.links,
+        **settings,
+    )
+    results: Dict[str, Any] = {}
+    with tempfile.NamedTemporaryFile(suffix=".txt") as attachment:
+        attachment.write(b"benchmark attachment\n" * 3000)
+        attachment.flush()
+        cases = tool_cases(scenario, attachment.name)
+
+        with MockAzureDevOps(mock_settings) as service:
+            os.environ["AZURE_DEVOPS_ORGANIZATION_URL"] = service.url
+            os.environ["AZURE_DEVOPS_PAT"] = "benchmark"
+            async with client_session(mcp._mcp_server) as session:
+                await session.initialize()
+                registered = [
+                    tool.name for tool in (await session.list_tools()).tools
+                ]
+                missing = [name for name in registered if name not in cases]
+
+                for name in registered:
+                    if name not in cases or (
+                        selected and name not in selected
+                    ):
+                        continue
+                    results[name] = await _run_tool(
+                        session,
+                        service,
+                        name,
+                        cases[name],
+                        iterations,
+                        clear_caches,
+                    )
+    return results, missing
+
+
+async def _run_tool(
+    session,
+    service: MockAzureDevOps,
+    name: str,
+    case: CaseArgs,
+    iterations: int,
+    clear_caches: Callable[[], None],
+) -> Dict[str, Any]:
+    """
+    Call one tool repeatedly and account for its upstream traffic.
+
+    Query result caches are cleared before every call so each call pays
+    for its own round trips.
+    """
+    latencies, calls, bytes_in, bytes_out, sizes = [], [], [], [], []
+    errors = []
+    # One unmeasured call warms connection pools and SDK discovery
+    for iteration in range(iterations + 1):
+        arguments = await case(session) if callable(case) else case
+        clear_caches()
+        before = service.stats.snapshot()
+        start = time.perf_counter()
+        result = await session.call_tool(name, arguments)
+        elapsed = (time.perf_counter() - start) * 1000
+        after = service.stats.snapshot()
+
+        text = _text(result)
+        if result.isError or text.startswith("Error"):
+            errors.append(text[:200])
+        if iteration == 0:
+            continue
+        latencies.append(elapsed)
+        calls.append(after["requests"] - before["requests"])
+        bytes_in.append(after["bytes_in"] - before["bytes_in"])
+        bytes_out.append(after["bytes_out"] - before["bytes_out"])
+        sizes.append(len(text))
+
+    return {
+        "latency_ms": summarize(latencies),
+        "upstream_calls": max(calls, default=0),
+        "bytes_sent": max(bytes_in, default=0),
+        "bytes_received": max(bytes_out, default=0),
+        "response_chars": max(sizes, default=0),
+        "errors": errors,
+    }
+
+
+def check_calls(
+    results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, int]]
+) -> List[str]:
+    """
+    Find tools whose upstream call count exceeds the baseline.
+
+    Args:
+        results: Per-scenario, per-tool benchmark results
+        baseline: Per-scenario, per-tool allowed call counts
+
+    Returns:
+        Descriptions of the regressions
+    """
+    regressions = []
+    for scenario, tools in results.items():
+        for name, result in tools.items():
+            allowed = baseline.get(scenario, {}).get(name)
+            if allowed is not None and result["upstream_calls"] > allowed:
+                regressions.append(
+                    f"{scenario} {name}: {result['upstream_calls']} upstream "
+                    f"calls, baseline {allowed}"
+                )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the per-tool benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--items",
+        type=int,
+        nargs="+",
+        default=DEFAULT_ITEMS,
+        help="work item counts (default: 10 200 2000)",
+    )
+    parser.add_argument(
+        "--links",
+        type=int,
+        nargs="+",
+        default=DEFAULT_LINKS,
+        help="links per work item (default: 0 10 50)",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=5,
+        help="measured calls per tool (default: 5)",
+    )
+    parser.add_argument(
+        "--tools", nargs="+", help="only benchmark these tools"
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0.0,
+        help="simulated upstream latency per request (default: 0)",
+    )
+    parser.add_argument(
+        "--output", type=Path, help="where to write the JSON results"
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=BASELINE_PATH,
+        help="allowed upstream call counts",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="write the measured call counts to the baseline",
+    )
+    args = parser.parse_args(argv)
+    # The server logs every request at INFO, which drowns the report
+    logging.getLogger("mcp").setLevel(logging.WARNING)
+
+    scenarios = [
+        Scenario(items, links) for items in args.items for links in args.links
+    ]
+    results: Dict[str, Dict[str, Any]] = {}
+    missing: List[str] = []
+    for scenario in scenarios:
+        results[scenario.name], missing = anyio.run(
+            _run_scenario,
+            scenario,
+            args.iterations,
+            args.tools,
+            {"latency_ms": args.latency_ms},
+        )
+        for name, result in results[scenario.name].items():
+            latency = result["latency_ms"]
+            print(
+                f"{scenario.name:<20} {name:<32} "
+                f"p50 {latency['p50']:>8.1f} ms  "
+                f"p99 {latency['p99']:>8.1f} ms  "
+                f"calls {result['upstream_calls']:>3}  "
+                f"recv {result['bytes_received']:>9}  "
+                f"resp {result['response_chars']:>8}"
+            )
+
+    path = write_results(
+        "tools",
+        {
+            "benchmark": "tools",
+            "environment": environment(),
+            "scenarios": results,
+        },
+        args.output,
+    )
+    print(f"Results written to {path}")
+
+    failures = [f"No benchmark case for tool '{name}'" for name in missing]
+    for scenario, tools in results.items():
+        for name, result in tools.items():
+            for error in result["errors"][:1]:
+                failures.append(f"{scenario} {name} failed: {error}")
+
+    if args.update_baseline:
+        baseline = {}
+        if args.baseline.exists():
+            baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        for scenario, tools in results.items():
+            baseline.setdefault(scenario, {}).update(
+                {
+                    name: result["upstream_calls"]
+                    for name, result in tools.items()
+                }
+            )
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(
+            json.dumps(baseline, indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+        print(f"Baseline written to {args.baseline}")
+    elif args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        failures.extend(check_calls(results, baseline))
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,11 @@
 # Azure DevOps MCP features package
-from mcp_azure_devops.features import projects, teams, work_items
+from mcp_azure_devops.features import (
+    diagnostics,
+    inventory,
+    projects,
+    teams,
+    work_items,
+)
 
 
 def register_all(mcp):
@@ -12,3 +18,5 @@ def register_all(mcp):
     work_items.register(mcp)
     projects.register(mcp)
     teams.register(mcp)
+    inventory.register(mcp)
+    diagnostics.register(mcp)
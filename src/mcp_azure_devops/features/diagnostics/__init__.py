@@ -0,0 +1,12 @@
+# Diagnostics feature package for Azure DevOps MCP
+from mcp_azure_devops.features.diagnostics import tools
+
+
+def register(mcp):
+    """
+    Register all diagnostics components with the MCP server.
+
+    Args:
+        mcp: The FastMCP server instance
+    """
+    tools.register_tools(mcp)
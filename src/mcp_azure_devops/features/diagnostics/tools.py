@@ -0,0 +1,86 @@
+"""
+Diagnostics tools for the Azure DevOps MCP server.
+
+This module provides MCP tools for inspecting the server itself.
+"""
+
+import os
+
+from mcp_azure_devops.utils.azure_client import serves_http
+from mcp_azure_devops.utils.metrics import format_metrics, get_registry
+
+
+def _metrics_tool_enabled() -> bool:
+    """
+    Check whether callers may read and reset the server metrics.
+
+    The metrics cover every organization and caller the server works for,
+    so a server shared over HTTP only exposes them when its operator sets
+    AZURE_DEVOPS_METRICS_TOOL to "true". Stdio servers expose them unless
+    it is set to "false".
+
+    Returns:
+        True if get_server_metrics may answer
+    """
+    setting = os.environ.get("AZURE_DEVOPS_METRICS_TOOL", "").strip().lower()
+    if setting:
+        return setting in ("1", "true", "yes", "on")
+    return not serves_http()
+
+
+def _get_server_metrics_impl(reset: bool = False) -> str:
+    """
+    Implementation of server metrics retrieval.
+
+    Args:
+        reset: Whether to clear the metrics after reading them
+
+    Returns:
+        Formatted string containing the metrics
+    """
+    if not _metrics_tool_enabled():
+        return (
+            "Error: Server metrics are disabled on this server; the "
+            "operator can set AZURE_DEVOPS_METRICS_TOOL=true to allow them"
+        )
+    registry = get_registry()
+    result = format_metrics(registry.snapshot())
+    if reset:
+        registry.reset()
+        result += "\n\nMetrics have been reset."
+    return result
+
+
+def register_tools(mcp) -> None:
+    """
+    Register diagnostics tools with the MCP server.
+
+    Args:
+        mcp: The FastMCP server instance
+    """
+
+    @mcp.tool()
+    def get_server_metrics(reset: bool = False) -> str:
+        """
+        Shows how this server's tools and Azure DevOps requests performed
+        since it started or since the metrics were last reset.
+
+        Use this tool when you need to:
+        - Find out which tools are slow
+        - See how many Azure DevOps requests each tool makes
+        - Check which tools or Azure DevOps endpoints are failing
+        - Measure request and response payload sizes
+
+        Servers shared over HTTP only answer when their operator allows
+        it, as the metrics cover every caller.
+
+        Args:
+            reset: Clear the metrics after reading them, to measure a
+                fresh period
+
+        Returns:
+            Markdown tables of per-tool calls, errors, p50/p95/p99 latency,
+            upstream calls per call and bytes, per-endpoint Azure DevOps
+            request statistics, and error counts by exception type
+        """
+        return _get_server_metrics_impl(reset)
@@ -0,0 +1,12 @@
+# Inventory feature package for Azure DevOps MCP
+from mcp_azure_devops.features.inventory import tools
+
+
+def register(mcp):
+    """
+    Register all inventory components with the MCP server.
+
+    Args:
+        mcp: The FastMCP server instance
+    """
+    tools.register_tools(mcp)
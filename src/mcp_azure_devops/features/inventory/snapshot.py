@@ -0,0 +1,274 @@
+"""
+Organization inventory snapshots.
+
+An inventory crawls the projects of an organization, their teams with
+area paths and iterations, and the work item types and fields of the
+processes the projects use. Requests run on a bounded thread pool and go
+through the shared team, iteration and process metadata caches, and each
+process is described once however many projects use it.
+"""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from mcp_azure_devops.features.projects.catalog import (
+    ProjectCatalog,
+    get_project_catalog,
+    get_project_process,
+)
+from mcp_azure_devops.features.teams.catalog import get_team_catalog
+from mcp_azure_devops.features.teams.iterations import get_iteration_index
+from mcp_azure_devops.features.work_items.metadata import (
+    get_process_work_item_types,
+    get_work_item_type_fields,
+)
+from mcp_azure_devops.utils.azure_client import get_client_organization
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.core import CoreClient
+    from azure.devops.v7_1.work import WorkClient
+    from azure.devops.v7_1.work_item_tracking_process import (
+        WorkItemTrackingProcessClient,
+    )
+
+# How far a crawl goes; each level includes the ones before it
+INVENTORY_DEPTHS = ("projects", "teams", "types", "fields")
+
+# Requests made at once while crawling
+INVENTORY_WORKERS = 8
+
+
+def _parallel(
+    fn: Callable[[Any], Any], items: List[Any]
+) -> List[Tuple[Any, Optional[str]]]:
+    """
+    Apply ``fn`` to every item on the crawl's thread pool.
+
+    Args:
+        fn: Function to apply
+        items: Items to apply it to
+
+    Returns:
+        (result, error) pairs in the order of ``items``; one failing item
+        does not stop the others
+    """
+    # Run in the caller's context so the requests are attributed to the
+    # calling tool
+    context = contextvars.copy_context()
+
+    def run(item: Any) -> Tuple[Any, Optional[str]]:
+        try:
+            return context.copy().run(fn, item), None
+        except Exception as e:
+            return None, str(e)
+
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=INVENTORY_WORKERS) as executor:
+        return list(executor.map(run, items))
+
+
+def _day(value: Any) -> Optional[str]:
+    if isinstance(value, (date, datetime)):
+        return (
+            value.date() if isinstance(value, datetime) else value
+        ).isoformat()
+    return str(value) if value else None
+
+
+def _select_projects(
+    catalog: ProjectCatalog, names: Optional[List[str]]
+) -> Tuple[List[Any], List[str]]:
+    """Pick the projects named by name or ID, reporting unknown names."""
+    if not names:
+        return catalog.projects, []
+    selected, missing, seen = [], [], set()
+    for name in names:
+        project = catalog.find(name)
+        if project is None:
+            missing.append(name)
+        elif project.id not in seen:
+            seen.add(project.id)
+            selected.append(project)
+    return selected, missing
+
+
+def _team_snapshot(
+    work_client: "WorkClient", project_id: str, team: Any
+) -> Dict[str, Any]:
+    from azure.devops.v7_1.work.models import TeamContext
+
+    field_values = work_client.get_team_field_values(
+        TeamContext(project=project_id, team=team.id)
+    )
+    iterations = get_iteration_index(work_client, project_id, team.id)
+    return {
+        "name": team.name,
+        "id": team.id,
+        "default_area_path": getattr(field_values, "default_value", None),
+        "area_paths": [
+            {
+                "path": value.value,
+                "include_children": bool(value.include_children),
+            }
+            for value in getattr(field_values, "values", None) or []
+        ],
+        "iterations": [
+            {
+                "path": iteration.path,
+                "start": _day(
+                    getattr(iteration.attributes, "start_date", None)
+                ),
+                "finish": _day(
+                    getattr(iteration.attributes, "finish_date", None)
+                ),
+            }
+            for iteration in iterations.iterations
+        ],
+    }
+
+
+def build_inventory(
+    core_client: "CoreClient",
+    work_client: "WorkClient",
+    process_client: "WorkItemTrackingProcessClient",
+    projects: Optional[List[str]] = None,
+    depth: str = "fields",
+) -> Dict[str, Any]:
+    """
+    Crawl an organization into one snapshot.
+
+    Args:
+        core_client: Core client
+        work_client: Work client
+        process_client: Work item tracking process client
+        projects: Names or IDs of the projects to include; all by default
+        depth: "projects", "teams", "types" or "fields"
+
+    Returns:
+        Snapshot with "projects", "processes" and any "errors"
+
+    Raises:
+        ValueError: If the depth is unknown
+    """
+    if depth not in INVENTORY_DEPTHS:
+        raise ValueError(
+            f"Unknown inventory depth '{depth}'; expected one of "
+            + ", ".join(INVENTORY_DEPTHS)
+        )
+    level = INVENTORY_DEPTHS.index(depth)
+    errors: List[str] = []
+
+    selected, missing = _select_projects(
+        get_project_catalog(core_client), projects
+    )
+    errors.extend(f"Project '{name}' not found" for name in missing)
+
+    templates = _parallel(
+        lambda project: get_project_process(core_client, project.id),
+        selected,
+    )
+    project_entries = []
+    processes: Dict[str, Dict[str, Any]] = {}
+    for project, (template, error) in zip(selected, templates):
+        entry: Dict[str, Any] = {"name": project.name, "id": project.id}
+        if project.description:
+            entry["description"] = project.description
+        if error:
+            errors.append(f"Project '{project.name}': {error}")
+        template = template or {}
+        process_id = template.get("templateTypeId")
+        entry["process_id"] = process_id
+        if process_id:
+            process = processes.setdefault(
+                process_id,
+                {
+                    "id": process_id,
+                    "name": template.get("templateName"),
+                    "projects": [],
+                },
+            )
+            process["projects"].append(project.name)
+        project_entries.append(entry)
+
+    if level >= INVENTORY_DEPTHS.index("teams"):
+        catalog = get_team_catalog(core_client)
+        team_jobs = [
+            (entry, team)
+            for entry in project_entries
+            for team in catalog.in_project(entry["id"])
+        ]
+        for entry in project_entries:
+            entry["teams"] = []
+        results = _parallel(
+            lambda job: _team_snapshot(work_client, job[0]["id"], job[1]),
+            team_jobs,
+        )
+        for (entry, team), (snapshot, error) in zip(team_jobs, results):
+            if error:
+                errors.append(
+                    f"Team '{team.name}' of '{entry['name']}': {error}"
+                )
+                snapshot = {"name": team.name, "id": team.id}
+            entry["teams"].append(snapshot)
+
+    if level >= INVENTORY_DEPTHS.index("types"):
+        process_list = list(processes.values())
+        results = _parallel(
+            lambda process: get_process_work_item_types(
+                process_client, process["id"]
+            ),
+            process_list,
+        )
+        type_jobs = []
+        for process, (types, error) in zip(process_list, results):
+            if error:
+                errors.append(f"Process '{process['name']}': {error}")
+            process["work_item_types"] = []
+            for wit in types or []:
+                wit_entry: Dict[str, Any] = {
+                    "name": wit.name,
+                    "reference_name": wit.reference_name,
+                }
+                states = getattr(wit, "states", None)
+                if states:
+                    wit_entry["states"] = [state.name for state in states]
+                process["work_item_types"].append(wit_entry)
+                type_jobs.append((process, wit_entry))
+
+        if level >= INVENTORY_DEPTHS.index("fields"):
+            results = _parallel(
+                lambda job: get_work_item_type_fields(
+                    process_client, job[0]["id"], job[1]["reference_name"]
+                ),
+                type_jobs,
+            )
+            for (process, wit_entry), (fields, error) in zip(
+                type_jobs, results
+            ):
+                if error:
+                    errors.append(
+                        f"Fields of '{wit_entry['name']}' in "
+                        f"'{process['name']}': {error}"
+                    )
+                wit_entry["fields"] = [
+                    {
+                        "name": field.name,
+                        "reference_name": field.reference_name,
+                        "type": getattr(field, "type", None),
+                        "required": bool(getattr(field, "required", False)),
+                    }
+                    for field in fields or []
+                ]
+
+    snapshot: Dict[str, Any] = {
+        "organization": get_client_organization(core_client),
+        "depth": depth,
+        "projects": project_entries,
+        "processes": list(processes.values()),
+    }
+    if errors:
+        snapshot["errors"] = errors
+    return snapshot
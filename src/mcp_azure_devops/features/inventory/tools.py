@@ -0,0 +1,199 @@
+"""
+Inventory tools for Azure DevOps.
+
+This module provides an MCP tool that describes an organization's
+projects, teams and processes in a single call.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+
+from mcp_azure_devops.features.inventory.snapshot import build_inventory
+from mcp_azure_devops.features.teams.common import (
+    AzureDevOpsClientError,
+    get_core_client,
+    get_work_client,
+)
+from mcp_azure_devops.utils.azure_client import (
+    get_work_item_tracking_process_client,
+    serves_http,
+)
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.core import CoreClient
+    from azure.devops.v7_1.work import WorkClient
+    from azure.devops.v7_1.work_item_tracking_process import (
+        WorkItemTrackingProcessClient,
+    )
+
+
+def _inventory_path(output_path: str) -> Path:
+    """
+    Resolve the file an inventory is written to.
+
+    Files are written inside AZURE_DEVOPS_INVENTORY_DIR. Without it, a
+    stdio server writes inside its working directory, while a server shared
+    over HTTP writes no files, as its callers are remote.
+
+    Args:
+        output_path: Path relative to the inventory directory
+
+    Returns:
+        The resolved path
+
+    Raises:
+        ValueError: If writing files is disabled or the path leaves the
+            inventory directory
+    """
+    directory = os.environ.get("AZURE_DEVOPS_INVENTORY_DIR", "").strip()
+    if not directory:
+        if serves_http():
+            raise ValueError(
+                "Writing inventories to files is disabled on this server; "
+                "set AZURE_DEVOPS_INVENTORY_DIR to allow it"
+            )
+        directory = os.getcwd()
+    if Path(output_path).anchor:
+        raise ValueError(
+            f"output_path '{output_path}' must be relative to the "
+            "inventory directory"
+        )
+    root = Path(directory).expanduser().resolve()
+    # Resolved first, so neither ".." nor symlinks lead outside
+    path = (root / output_path).resolve()
+    if path == root or not path.is_relative_to(root):
+        raise ValueError(
+            f"output_path '{output_path}' is outside the inventory directory"
+        )
+    return path
+
+
+def _get_organization_inventory_impl(
+    core_client: "CoreClient",
+    work_client: "WorkClient",
+    process_client: "WorkItemTrackingProcessClient",
+    projects: Optional[List[str]] = None,
+    depth: str = "fields",
+    output_path: Optional[str] = None,
+) -> str:
+    """
+    Implementation of organization inventory retrieval.
+
+    Args:
+        core_client: Core client
+        work_client: Work client
+        process_client: Work item tracking process client
+        projects: Names or IDs of the projects to include
+        depth: "projects", "teams", "types" or "fields"
+        output_path: File to write the snapshot to instead of returning
+            it, relative to the inventory directory
+
+    Returns:
+        The snapshot as JSON, or a summary of the file written
+    """
+    try:
+        snapshot = build_inventory(
+            core_client, work_client, process_client, projects, depth
+        )
+    except ValueError as e:
+        return f"Error: {str(e)}"
+    except Exception as e:
+        return f"Error building organization inventory: {str(e)}"
+
+    text = json.dumps(snapshot, indent=2, default=str)
+    if not output_path:
+        return text
+
+    try:
+        path = _inventory_path(output_path)
+    except ValueError as e:
+        return f"Error: {str(e)}"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text + "\n", encoding="utf-8")
+    except OSError as e:
+        return f"Error writing organization inventory: {str(e)}"
+
+    teams = sum(len(p.get("teams", [])) for p in snapshot["projects"])
+    types = sum(
+        len(p.get("work_item_types", [])) for p in snapshot["processes"]
+    )
+    result = [
+        f"Wrote the inventory of {snapshot['organization']} to {path}",
+        f"Projects: {len(snapshot['projects'])}",
+        f"Teams: {teams}",
+        f"Processes: {len(snapshot['processes'])}",
+        f"Work item types: {types}",
+    ]
+    errors = snapshot.get("errors", [])
+    if errors:
+        result.append(f"Errors: {len(errors)} (listed in the file)")
+    return "\n".join(result)
+
+
+def register_tools(mcp) -> None:
+    """
+    Register inventory tools with the MCP server.
+
+    Args:
+        mcp: The FastMCP server instance
+    """
+
+    @mcp.tool()
+    def get_organization_inventory(
+        projects: Optional[List[str]] = None,
+        depth: str = "fields",
+        output_path: Optional[str] = None,
+        organization: Optional[str] = None,
+    ) -> str:
+        """
+        Describes an organization's projects, teams and processes in one
+        call.
+
+        Use this tool when you need to:
+        - Learn the conventions of an organization before creating or
+          organizing work items
+        - See every team's area paths and iterations at once
+        - Find the work item types, states and fields each process defines
+
+        Projects are crawled in parallel and each process is described once,
+        however many projects use it. Prefer this over calling the project,
+        team and type tools one by one.
+
+        Args:
+            projects: Optional names or IDs of the projects to include;
+                defaults to every project
+            depth: How much to include: "projects" (projects and their
+                processes), "teams" (adds teams with area paths and
+                iterations), "types" (adds work item types and states) or
+                "fields" (adds each type's fields)
+            output_path: Optional file to write the snapshot to, relative
+                to the directory the server is configured to write
+                inventories to; only a summary is returned then
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
+
+        Returns:
+            JSON snapshot with "projects", "processes" and any "errors", or
+            a summary of the file written
+        """
+        try:
+            core_client = get_core_client(organization)
+            work_client = get_work_client(organization)
+            process_client = get_work_item_tracking_process_client(
+                organization
+            )
+            return _get_organization_inventory_impl(
+                core_client,
+                work_client,
+                process_client,
+                projects,
+                depth,
+                output_path,
+            )
+        except AzureDevOpsClientError as e:
+            return f"Error: {str(e)}"
+        except Exception as e:
+            return f"Error building organization inventory: {str(e)}"
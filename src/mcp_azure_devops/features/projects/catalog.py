@@ -0,0 +1,196 @@
+"""
+Project catalog for Azure DevOps projects features.
+
+Listing projects is paged with a continuation token, which for projects
+is the number of projects already returned. The first listing follows it
+through every page (concurrently once the first page shows there are
+more) and keeps the result as a catalog indexed by project ID and name.
+
+Project details, whose capabilities name the process a project uses, are
+fetched once per project and cached alongside, so tools needing a
+project's process do not ask for the project again on every call.
+
+Both are keyed by organization URL and by tenant, since which projects a
+listing returns depends on the permissions of the PAT it ran with.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from mcp_azure_devops.features.teams.catalog import fetch_pages
+from mcp_azure_devops.utils.azure_client import (
+    get_client_organization,
+    get_client_tenant,
+)
+from mcp_azure_devops.utils.cache import TTLCache
+from mcp_azure_devops.utils.tracing import record_cache_lookup
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.core import CoreClient
+    from azure.devops.v7_1.core.models import (
+        TeamProject,
+        TeamProjectReference,
+    )
+
+# Projects requested per page when building a catalog
+PROJECT_PAGE_SIZE = 100
+
+# Projects change rarely; a new project shows up once the catalog expires
+PROJECT_CATALOG_TTL = 10 * 60
+
+_catalogs = TTLCache(ttl=PROJECT_CATALOG_TTL, max_entries=64)
+_details = TTLCache(ttl=PROJECT_CATALOG_TTL, max_entries=1024)
+
+
+def _key(value: Optional[str]) -> str:
+    return value.strip().casefold() if isinstance(value, str) else ""
+
+
+class ProjectCatalog:
+    """Every project visible to a listing, indexed by ID and name."""
+
+    def __init__(self, projects: List["TeamProjectReference"]):
+        """
+        Create a catalog.
+
+        Args:
+            projects: Projects in listing order
+        """
+        self.projects = projects
+        self._by_id: Dict[str, "TeamProjectReference"] = {}
+        self._by_name: Dict[str, "TeamProjectReference"] = {}
+        for project in projects:
+            self._by_id[_key(project.id)] = project
+            self._by_name[_key(project.name)] = project
+
+    def find(self, project: str) -> Optional["TeamProjectReference"]:
+        """
+        Look up a project by ID or name, regardless of case.
+
+        Args:
+            project: Project name or ID
+
+        Returns:
+            The project, or None if it is unknown
+        """
+        return self._by_id.get(_key(project)) or self._by_name.get(
+            _key(project)
+        )
+
+    def id_of(self, project: str) -> Optional[str]:
+        """Get the ID of a project given by name or ID."""
+        found = self.find(project)
+        return found.id if found else None
+
+    def name_of(self, project: str) -> Optional[str]:
+        """Get the name of a project given by name or ID."""
+        found = self.find(project)
+        return found.name if found else None
+
+
+def _fetch_projects(
+    core_client: "CoreClient",
+    state_filter: Optional[str],
+    page_size: int = PROJECT_PAGE_SIZE,
+) -> List["TeamProjectReference"]:
+    """
+    Fetch every page of the project listing.
+
+    Args:
+        core_client: Core client
+        state_filter: Project state to list; Azure DevOps lists
+            well-formed projects by default
+        page_size: Projects requested per page
+
+    Returns:
+        Projects in listing order, without duplicates
+    """
+    projects = fetch_pages(
+        lambda fetched: core_client.get_projects(
+            state_filter=state_filter,
+            top=page_size,
+            continuation_token=fetched or None,
+        ),
+        page_size,
+    )
+    # Projects created while paging shift later pages
+    unique: Dict[str, "TeamProjectReference"] = {}
+    for project in projects:
+        unique.setdefault(project.id, project)
+    return list(unique.values())
+
+
+def _client_key(client: Any) -> tuple:
+    return (get_client_organization(client), get_client_tenant(client))
+
+
+def get_project_catalog(
+    core_client: "CoreClient", state_filter: Optional[str] = None
+) -> ProjectCatalog:
+    """
+    Get the project catalog, fetching it if it is not cached.
+
+    Args:
+        core_client: Core client
+        state_filter: Project state to list, e.g. "WellFormed"
+
+    Returns:
+        The project catalog
+    """
+    key = (*_client_key(core_client), _key(state_filter))
+    catalog = _catalogs.get(key)
+    record_cache_lookup("projects", catalog is not None)
+    if catalog is None:
+        catalog = ProjectCatalog(_fetch_projects(core_client, state_filter))
+        _catalogs.set(key, catalog)
+    return catalog
+
+
+def get_project_details(
+    core_client: "CoreClient", project: str
+) -> "TeamProject":
+    """
+    Get a project with its capabilities, fetching it if it is not cached.
+
+    Args:
+        core_client: Core client
+        project: Project name or ID
+
+    Returns:
+        The project, including its capabilities
+    """
+    client_key = _client_key(core_client)
+    # A catalog, if one is cached, tells names and IDs of one project apart
+    catalog = _catalogs.get((*client_key, ""))
+    project_id = catalog.id_of(project) if catalog else None
+    key = (*client_key, _key(project_id or project))
+    details = _details.get(key)
+    record_cache_lookup("project_details", details is not None)
+    if details is None:
+        details = core_client.get_project(project, include_capabilities=True)
+        _details.set((*client_key, _key(details.id)), details)
+        _details.set((*client_key, _key(details.name)), details)
+    return details
+
+
+def get_project_process(
+    core_client: "CoreClient", project: str
+) -> Dict[str, str]:
+    """
+    Get the process template a project uses.
+
+    Args:
+        core_client: Core client
+        project: Project name or ID
+
+    Returns:
+        The project's "processTemplate" capability, with "templateTypeId"
+        and "templateName", or an empty dict if it is not reported
+    """
+    capabilities = get_project_details(core_client, project).capabilities
+    return (capabilities or {}).get("processTemplate") or {}
+
+
+def clear_project_catalogs() -> None:
+    """Drop every cached project catalog and project."""
+    _catalogs.clear()
+    _details.clear()
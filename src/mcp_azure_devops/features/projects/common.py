@@ -4,10 +4,13 @@ Common utilities for Azure DevOps projects features.
 This module provides shared functionality used by both tools and resources.
 """
 
-from azure.devops.v7_1.core import CoreClient
+from typing import TYPE_CHECKING, Optional
 
 from mcp_azure_devops.utils.azure_client import get_connection
 
+if TYPE_CHECKING:
+    from azure.devops.v7_1.core import CoreClient
+
 
 class AzureDevOpsClientError(Exception):
     """Exception raised for errors in Azure DevOps client operations."""
@@ -15,10 +18,14 @@ class AzureDevOpsClientError(Exception):
     pass
 
 
-def get_core_client() -> CoreClient:
+def get_core_client(organization: Optional[str] = None) -> "CoreClient":
     """
     Get the core client for Azure DevOps.
 
+    Args:
+        organization: Organization name or URL; defaults to
+            AZURE_DEVOPS_ORGANIZATION_URL
+
     Returns:
         CoreClient instance
 
@@ -26,12 +33,15 @@ def get_core_client() -> CoreClient:
         AzureDevOpsClientError: If connection or client creation fails
     """
     # Get connection to Azure DevOps
-    connection = get_connection()
+    try:
+        connection = get_connection(organization)
+    except ValueError as e:
+        raise AzureDevOpsClientError(str(e)) from e
 
     if not connection:
         raise AzureDevOpsClientError(
             "Azure DevOps PAT or organization URL not found in "
-            "environment variables."
+            "environment variables or request headers."
         )
 
     # Get the core client
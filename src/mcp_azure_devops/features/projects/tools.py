@@ -4,18 +4,20 @@ Project tools for Azure DevOps.
 This module provides MCP tools for working with Azure DevOps projects.
 """
 
-from typing import Optional
-
-from azure.devops.v7_1.core import CoreClient
-from azure.devops.v7_1.core.models import TeamProjectReference
+from typing import TYPE_CHECKING, Optional
 
+from mcp_azure_devops.features.projects.catalog import get_project_catalog
 from mcp_azure_devops.features.projects.common import (
     AzureDevOpsClientError,
     get_core_client,
 )
 
+if TYPE_CHECKING:
+    from azure.devops.v7_1.core import CoreClient
+    from azure.devops.v7_1.core.models import TeamProjectReference
+
 
-def _format_project(project: TeamProjectReference) -> str:
+def _format_project(project: "TeamProjectReference") -> str:
     """
     Format project information.
 
@@ -53,13 +55,16 @@ def _format_project(project: TeamProjectReference) -> str:
 
 
 def _get_projects_impl(
-    core_client: CoreClient,
+    core_client: "CoreClient",
     state_filter: Optional[str] = None,
     top: Optional[int] = None,
 ) -> str:
     """
     Implementation of projects retrieval.
 
+    Every page of the listing is fetched once and cached, so ``top`` only
+    limits what is shown.
+
     Args:
         core_client: Core client
         state_filter: Filter on team projects in a specific state
@@ -69,16 +74,20 @@ def _get_projects_impl(
         Formatted string containing project information
     """
     try:
-        projects = core_client.get_projects(state_filter=state_filter, top=top)
+        projects = get_project_catalog(core_client, state_filter).projects
 
         if not projects:
             return "No projects found."
 
+        shown = projects[:top] if top is not None and top >= 0 else projects
         formatted_projects = []
-        for project in projects:
+        for project in shown:
             formatted_projects.append(_format_project(project))
 
-        return "\n\n".join(formatted_projects)
+        result = "\n\n".join(formatted_projects)
+        if len(shown) < len(projects):
+            result += f"\n\nShowing {len(shown)} of {len(projects)} projects."
+        return result
 
     except Exception as e:
         return f"Error retrieving projects: {str(e)}"
@@ -94,7 +103,9 @@ def register_tools(mcp) -> None:
 
     @mcp.tool()
     def get_projects(
-        state_filter: Optional[str] = None, top: Optional[int] = None
+        state_filter: Optional[str] = None,
+        top: Optional[int] = None,
+        organization: Optional[str] = None,
     ) -> str:
         """
         Retrieves all projects accessible to the authenticated user
@@ -110,6 +121,8 @@ def register_tools(mcp) -> None:
             state_filter: Filter on team projects in a specific state
                 (e.g., "WellFormed", "Deleting")
             top: Maximum number of projects to return
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             Formatted string containing project information including names,
@@ -117,7 +130,7 @@ def register_tools(mcp) -> None:
             markdown with each project clearly separated
         """
         try:
-            core_client = get_core_client()
+            core_client = get_core_client(organization)
             return _get_projects_impl(core_client, state_filter, top)
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
@@ -0,0 +1,254 @@
+"""
+Team catalog for Azure DevOps teams features.
+
+Listing teams is paged on the server, so the first listing fetches every
+page (concurrently once the first page shows there are more) and keeps the
+result as a catalog indexed by team ID, project and team name. Later
+listings and team name lookups are answered from the catalog until it
+expires.
+
+Catalogs are keyed by organization URL and by tenant, since which teams a
+listing returns depends on the permissions of the PAT it ran with.
+"""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from mcp_azure_devops.utils.azure_client import (
+    get_client_organization,
+    get_client_tenant,
+)
+from mcp_azure_devops.utils.cache import TTLCache
+from mcp_azure_devops.utils.tracing import record_cache_lookup
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.core import CoreClient
+    from azure.devops.v7_1.core.models import WebApiTeam
+
+# Teams requested per page when building a catalog
+TEAM_PAGE_SIZE = 100
+
+# Pages fetched at once after the first page
+TEAM_PAGE_WORKERS = 4
+
+# Teams change rarely; a new team shows up once the catalog expires
+TEAM_CATALOG_TTL = 10 * 60
+
+_catalogs = TTLCache(ttl=TEAM_CATALOG_TTL, max_entries=64)
+
+
+def _key(value: Optional[str]) -> str:
+    return value.strip().casefold() if isinstance(value, str) else ""
+
+
+def _project_keys(team: "WebApiTeam") -> Tuple[str, str]:
+    return (
+        _key(getattr(team, "project_name", None)),
+        _key(getattr(team, "project_id", None)),
+    )
+
+
+class TeamCatalog:
+    """Every team visible to a listing, indexed for lookups."""
+
+    def __init__(self, teams: List["WebApiTeam"]):
+        """
+        Create a catalog.
+
+        Args:
+            teams: Teams in listing order
+        """
+        self.teams = teams
+        self._by_id: Dict[str, "WebApiTeam"] = {}
+        self._by_project: Dict[str, List["WebApiTeam"]] = {}
+        self._by_name: Dict[str, List["WebApiTeam"]] = {}
+        for team in teams:
+            self._by_id[_key(team.id)] = team
+            self._by_name.setdefault(_key(team.name), []).append(team)
+            for project in set(_project_keys(team)) - {""}:
+                self._by_project.setdefault(project, []).append(team)
+
+    def in_project(self, project: str) -> List["WebApiTeam"]:
+        """
+        Get the teams of a project.
+
+        Args:
+            project: Project name or ID
+
+        Returns:
+            Teams of the project in listing order
+        """
+        return list(self._by_project.get(_key(project), []))
+
+    def find(
+        self, team: str, project: Optional[str] = None
+    ) -> Optional["WebApiTeam"]:
+        """
+        Look up a team by name or ID.
+
+        Args:
+            team: Team name or ID
+            project: Project name or ID the team belongs to; needed to
+                tell apart teams of the same name in different projects
+
+        Returns:
+            The team, or None if it is unknown or the name is ambiguous
+        """
+        found = self._by_id.get(_key(team))
+        if found is None:
+            candidates = self._by_name.get(_key(team), [])
+            if project:
+                project_key = _key(project)
+                candidates = [
+                    candidate
+                    for candidate in candidates
+                    if project_key in _project_keys(candidate)
+                ]
+            if len(candidates) != 1:
+                return None
+            found = candidates[0]
+        elif project and _key(project) not in _project_keys(found):
+            return None
+        return found
+
+
+def fetch_pages(
+    fetch_page: Callable[[int], Optional[List[Any]]],
+    page_size: int,
+    workers: int = TEAM_PAGE_WORKERS,
+) -> List[Any]:
+    """
+    Fetch every page of a listing paged with top and skip.
+
+    These listings do not report how many values there are, so after a
+    full first page the following pages are fetched in concurrent waves
+    until a page comes back short.
+
+    Args:
+        fetch_page: Fetches the page starting at the given skip
+        page_size: Values requested per page
+        workers: Pages fetched at once
+
+    Returns:
+        Values in listing order
+    """
+    pages = [fetch_page(0) or []]
+    if len(pages[0]) >= page_size:
+        # Fetch in the caller's context so the requests are attributed to
+        # the calling tool
+        context = contextvars.copy_context()
+
+        def fetch_in_context(skip: int) -> Optional[List[Any]]:
+            return context.copy().run(fetch_page, skip)
+
+        skip = page_size
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while len(pages[-1]) >= page_size:
+                wave = range(skip, skip + workers * page_size, page_size)
+                skip += workers * page_size
+                # map() yields in submission order, keeping pages in order
+                for page in executor.map(fetch_in_context, wave):
+                    pages.append(page or [])
+                    if len(pages[-1]) < page_size:
+                        break
+    return [value for page in pages for value in page]
+
+
+def _fetch_teams(
+    core_client: "CoreClient",
+    mine: bool,
+    page_size: int = TEAM_PAGE_SIZE,
+    workers: int = TEAM_PAGE_WORKERS,
+) -> List["WebApiTeam"]:
+    """
+    Fetch every page of the team listing.
+
+    Args:
+        core_client: Core client
+        mine: Whether to list only teams the user is a member of
+        page_size: Teams requested per page
+        workers: Pages fetched at once
+
+    Returns:
+        Teams in listing order, without duplicates
+    """
+    teams = fetch_pages(
+        lambda skip: core_client.get_all_teams(
+            mine=mine, top=page_size, skip=skip
+        ),
+        page_size,
+        workers,
+    )
+    # Teams created while paging shift later pages
+    unique: Dict[str, "WebApiTeam"] = {}
+    for team in teams:
+        unique.setdefault(team.id, team)
+    return list(unique.values())
+
+
+def _catalog_key(client, mine: bool) -> Tuple[str, str, bool]:
+    return (get_client_organization(client), get_client_tenant(client), mine)
+
+
+def get_team_catalog(
+    core_client: "CoreClient", mine: Optional[bool] = None
+) -> TeamCatalog:
+    """
+    Get the team catalog, fetching it if it is not cached.
+
+    Args:
+        core_client: Core client
+        mine: Whether to list only teams the user is a member of
+
+    Returns:
+        The team catalog
+    """
+    key = _catalog_key(core_client, bool(mine))
+    catalog = _catalogs.get(key)
+    record_cache_lookup("teams", catalog is not None)
+    if catalog is None:
+        catalog = TeamCatalog(_fetch_teams(core_client, bool(mine)))
+        _catalogs.set(key, catalog)
+    return catalog
+
+
+def get_cached_team_catalog(client) -> Optional[TeamCatalog]:
+    """
+    Get the cached catalog of all teams without fetching it.
+
+    Args:
+        client: Any client of the organization and tenant
+
+    Returns:
+        The team catalog, or None if none is cached
+    """
+    return _catalogs.get(_catalog_key(client, False))
+
+
+def resolve_team(client, project: str, team: str) -> Tuple[str, str]:
+    """
+    Resolve a project and team to their IDs using the cached catalog.
+
+    Names are matched regardless of case. Values the catalog does not know
+    are returned unchanged for Azure DevOps to resolve.
+
+    Args:
+        client: Any client of the organization and tenant
+        project: Project name or ID
+        team: Team name or ID
+
+    Returns:
+        Project and team to address the team by
+    """
+    catalog = get_cached_team_catalog(client)
+    found = catalog.find(team, project) if catalog else None
+    project_id = getattr(found, "project_id", None)
+    if found is None or not project_id or not found.id:
+        return project, team
+    return project_id, found.id
+
+
+def clear_team_catalogs() -> None:
+    """Drop every cached team catalog."""
+    _catalogs.clear()
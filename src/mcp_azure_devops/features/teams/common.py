@@ -4,11 +4,14 @@ Common utilities for Azure DevOps teams features.
 This module provides shared functionality used by both tools and resources.
 """
 
-from azure.devops.v7_1.core import CoreClient
-from azure.devops.v7_1.work import WorkClient
+from typing import TYPE_CHECKING, Optional
 
 from mcp_azure_devops.utils.azure_client import get_connection
 
+if TYPE_CHECKING:
+    from azure.devops.v7_1.core import CoreClient
+    from azure.devops.v7_1.work import WorkClient
+
 
 class AzureDevOpsClientError(Exception):
     """Exception raised for errors in Azure DevOps client operations."""
@@ -16,10 +19,14 @@ class AzureDevOpsClientError(Exception):
     pass
 
 
-def get_core_client() -> CoreClient:
+def get_core_client(organization: Optional[str] = None) -> "CoreClient":
     """
     Get the core client for Azure DevOps.
 
+    Args:
+        organization: Organization name or URL; defaults to
+            AZURE_DEVOPS_ORGANIZATION_URL
+
     Returns:
         CoreClient instance
 
@@ -27,12 +34,15 @@ def get_core_client() -> CoreClient:
         AzureDevOpsClientError: If connection or client creation fails
     """
     # Get connection to Azure DevOps
-    connection = get_connection()
+    try:
+        connection = get_connection(organization)
+    except ValueError as e:
+        raise AzureDevOpsClientError(str(e)) from e
 
     if not connection:
         raise AzureDevOpsClientError(
             "Azure DevOps PAT or organization URL not found in "
-            "environment variables."
+            "environment variables or request headers."
         )
 
     # Get the core client
@@ -44,10 +54,14 @@ def get_core_client() -> CoreClient:
     return core_client
 
 
-def get_work_client() -> WorkClient:
+def get_work_client(organization: Optional[str] = None) -> "WorkClient":
     """
     Get the work client for Azure DevOps.
 
+    Args:
+        organization: Organization name or URL; defaults to
+            AZURE_DEVOPS_ORGANIZATION_URL
+
     Returns:
         WorkClient instance
 
@@ -55,12 +69,15 @@ def get_work_client() -> WorkClient:
         AzureDevOpsClientError: If connection or client creation fails
     """
     # Get connection to Azure DevOps
-    connection = get_connection()
+    try:
+        connection = get_connection(organization)
+    except ValueError as e:
+        raise AzureDevOpsClientError(str(e)) from e
 
     if not connection:
         raise AzureDevOpsClientError(
             "Azure DevOps PAT or organization URL not found in "
-            "environment variables."
+            "environment variables or request headers."
         )
 
     # Get the work client
@@ -0,0 +1,271 @@
+"""
+Iteration index for Azure DevOps teams features.
+
+A team's iterations change at sprint boundaries, not between tool calls, so
+the full iteration list of a team is cached together with its start and
+finish dates. The current, next and previous iterations are worked out
+locally, and a cached index expires at the next boundary so that the
+current iteration never goes stale.
+
+Iteration dates are whole days stored as midnight UTC; the index compares
+them with the UTC date.
+
+Shortcuts such as ``@current`` or ``@CurrentIteration + 1`` name an
+iteration relative to the current one and are resolved through the index.
+"""
+
+import re
+from datetime import date, datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+
+from mcp_azure_devops.utils.azure_client import (
+    get_client_organization,
+    get_client_tenant,
+)
+from mcp_azure_devops.utils.cache import TTLCache
+from mcp_azure_devops.utils.tracing import record_cache_lookup
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work import WorkClient
+    from azure.devops.v7_1.work.models import TeamSettingsIteration
+
+# Longest an index is kept, so that edited or added iterations show up
+ITERATION_INDEX_TTL = 60 * 60
+
+_indexes = TTLCache(ttl=ITERATION_INDEX_TTL, max_entries=256)
+
+# @current, @next, @previous and the WIQL form @CurrentIteration +/- N,
+# each optionally naming a team: @current('Team') or
+# @CurrentIteration('[Project]\Team')
+_SHORTCUT_PATTERN = re.compile(
+    r"^@(?:(?P<relative>current|next|previous)"
+    r"|currentiteration(?:\s*(?P<sign>[+-])\s*(?P<offset>\d+))?)"
+    r"\s*(?:\(\s*'(?P<team>[^']*)'\s*\))?$",
+    re.IGNORECASE,
+)
+_RELATIVE_OFFSETS = {"current": 0, "next": 1, "previous": -1}
+
+
+def _day(value: Any) -> Optional[date]:
+    """Get the calendar day of an iteration date."""
+    if isinstance(value, datetime):
+        if value.tzinfo:
+            value = value.astimezone(timezone.utc)
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        try:
+            return _day(datetime.fromisoformat(value))
+        except ValueError:
+            return None
+    return None
+
+
+def _dates(
+    iteration: "TeamSettingsIteration",
+) -> Tuple[Optional[date], Optional[date]]:
+    attributes = getattr(iteration, "attributes", None)
+    return (
+        _day(getattr(attributes, "start_date", None)),
+        _day(getattr(attributes, "finish_date", None)),
+    )
+
+
+def _today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+class IterationIndex:
+    """A team's iterations, ordered by start date."""
+
+    def __init__(self, iterations: List["TeamSettingsIteration"]):
+        """
+        Create an index.
+
+        Args:
+            iterations: The team's iterations in any order
+        """
+        self.iterations = iterations
+        # Only dated iterations can be current, next or previous
+        self._dated = sorted(
+            (
+                (start, finish, iteration)
+                for iteration in iterations
+                for start, finish in [_dates(iteration)]
+                if start and finish
+            ),
+            key=lambda entry: (entry[0], entry[1]),
+        )
+
+    def _position(self, today: date) -> Tuple[int, bool]:
+        """
+        Find where today falls among the dated iterations.
+
+        Returns:
+            Index of the current iteration and True, or index of the next
+            iteration and False when today falls between iterations
+        """
+        for position, (start, finish, _) in enumerate(self._dated):
+            if start <= today <= finish:
+                return position, True
+            if start > today:
+                return position, False
+        return len(self._dated), False
+
+    def relative(
+        self, offset: int, today: Optional[date] = None
+    ) -> Optional["TeamSettingsIteration"]:
+        """
+        Get the iteration ``offset`` iterations away from the current one.
+
+        Args:
+            offset: 0 for the current iteration, 1 for the next, -1 for the
+                previous and so on
+            today: Day to evaluate at; defaults to today in UTC
+
+        Returns:
+            The iteration, or None if there is none at that offset
+        """
+        position, is_current = self._position(today or _today())
+        if not is_current:
+            if offset == 0:
+                return None
+            # Between iterations the next one is one step ahead
+            if offset > 0:
+                offset -= 1
+        target = position + offset
+        if 0 <= target < len(self._dated):
+            return self._dated[target][2]
+        return None
+
+    def current(
+        self, today: Optional[date] = None
+    ) -> Optional["TeamSettingsIteration"]:
+        """Get the iteration running today, if any."""
+        return self.relative(0, today)
+
+    def seconds_valid(self, now: Optional[datetime] = None) -> float:
+        """
+        Get how long the current iteration stays current.
+
+        Args:
+            now: Time to evaluate at; defaults to now
+
+        Returns:
+            Seconds until the next iteration boundary, at most
+            ITERATION_INDEX_TTL
+        """
+        now = now or datetime.now(timezone.utc)
+        today = now.date()
+        position, is_current = self._position(today)
+        boundaries = []
+        if is_current:
+            boundaries.append(self._dated[position][1] + timedelta(days=1))
+            position += 1
+        if position < len(self._dated):
+            boundaries.append(self._dated[position][0])
+        if not boundaries:
+            return ITERATION_INDEX_TTL
+        boundary = datetime.combine(
+            min(boundaries), datetime.min.time(), tzinfo=timezone.utc
+        )
+        return min((boundary - now).total_seconds(), ITERATION_INDEX_TTL)
+
+
+def get_iteration_index(
+    work_client: "WorkClient", project: str, team: Optional[str] = None
+) -> IterationIndex:
+    """
+    Get a team's iteration index, fetching it if it is not cached.
+
+    Args:
+        work_client: Work client
+        project: Project name or ID
+        team: Team name or ID; defaults to the project's default team
+
+    Returns:
+        The team's iteration index
+    """
+    from azure.devops.v7_1.work.models import TeamContext
+
+    key = (
+        get_client_organization(work_client),
+        get_client_tenant(work_client),
+        project.strip().casefold(),
+        (team or "").strip().casefold(),
+    )
+    index = _indexes.get(key)
+    record_cache_lookup("iterations", index is not None)
+    if index is None:
+        index = IterationIndex(
+            work_client.get_team_iterations(
+                team_context=TeamContext(project=project, team=team)
+            )
+            or []
+        )
+        _indexes.set(key, index, ttl=index.seconds_valid())
+    return index
+
+
+def is_iteration_shortcut(value: Any) -> bool:
+    """Check whether a value is an iteration shortcut such as @current."""
+    return isinstance(value, str) and bool(
+        _SHORTCUT_PATTERN.match(value.strip())
+    )
+
+
+def resolve_iteration_shortcut(
+    work_client: "WorkClient",
+    project: str,
+    shortcut: str,
+    team: Optional[str] = None,
+) -> str:
+    """
+    Resolve an iteration shortcut to an iteration path.
+
+    Supported shortcuts are @current, @next, @previous and
+    @CurrentIteration +/- N, optionally followed by a team in parentheses,
+    e.g. @current('Web Team'). Without a team the given team, or else the
+    project's default team, is used.
+
+    Args:
+        work_client: Work client
+        project: Project name or ID
+        shortcut: The shortcut
+        team: Optional team name or ID for shortcuts naming no team
+
+    Returns:
+        Path of the iteration the shortcut names
+
+    Raises:
+        ValueError: If the shortcut is malformed or names no iteration
+    """
+    match = _SHORTCUT_PATTERN.match(shortcut.strip())
+    if not match:
+        raise ValueError(f"Unknown iteration shortcut '{shortcut}'")
+    if match.group("relative"):
+        offset = _RELATIVE_OFFSETS[match.group("relative").lower()]
+    else:
+        offset = int(match.group("offset") or 0)
+        if match.group("sign") == "-":
+            offset = -offset
+
+    if match.group("team"):
+        # WIQL names teams as [Project]\Team
+        team = match.group("team").rsplit("\\", 1)[-1].strip() or None
+
+    iteration = get_iteration_index(work_client, project, team).relative(
+        offset
+    )
+    if iteration is None or not iteration.path:
+        owner = f"team {team}" if team else f"the default team of {project}"
+        raise ValueError(
+            f"No iteration matches {shortcut.strip()} for {owner}"
+        )
+    return iteration.path
+
+
+def clear_iteration_indexes() -> None:
+    """Drop every cached iteration index."""
+    _indexes.clear()
@@ -0,0 +1,156 @@
+"""
+Project-wide team membership for Azure DevOps teams features.
+
+The members of every team in a project are fetched concurrently and merged
+into one table with an entry per identity, listing the teams it belongs
+to. Tables are cached per organization, tenant and project, since team
+rosters change far less often than agents ask about them.
+"""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from mcp_azure_devops.features.teams.catalog import (
+    TEAM_PAGE_SIZE,
+    fetch_pages,
+    get_cached_team_catalog,
+)
+from mcp_azure_devops.utils.azure_client import (
+    get_client_organization,
+    get_client_tenant,
+)
+from mcp_azure_devops.utils.cache import TTLCache
+from mcp_azure_devops.utils.tracing import record_cache_lookup
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.core import CoreClient
+    from azure.devops.v7_1.core.models import WebApiTeam
+
+# Members requested per page of a team roster
+MEMBER_PAGE_SIZE = 100
+
+# Team rosters fetched at once
+MEMBER_WORKERS = 8
+
+PROJECT_MEMBERS_TTL = 10 * 60
+
+_project_members = TTLCache(ttl=PROJECT_MEMBERS_TTL, max_entries=64)
+
+
+class ProjectMember:
+    """An identity and the teams of a project it belongs to."""
+
+    def __init__(self, identity: Any):
+        self.identity = identity
+        # (team name, is team administrator) pairs
+        self.teams: List[Tuple[str, bool]] = []
+
+
+def _project_teams(
+    core_client: "CoreClient", project: str
+) -> List["WebApiTeam"]:
+    """
+    List the teams of a project, from the team catalog if it is cached.
+
+    Args:
+        core_client: Core client
+        project: Project name or ID
+
+    Returns:
+        Teams of the project
+    """
+    catalog = get_cached_team_catalog(core_client)
+    teams = catalog.in_project(project) if catalog else []
+    if teams:
+        return teams
+    return fetch_pages(
+        lambda skip: core_client.get_teams(
+            project_id=project, top=TEAM_PAGE_SIZE, skip=skip
+        ),
+        TEAM_PAGE_SIZE,
+    )
+
+
+def _team_roster(
+    core_client: "CoreClient", project: str, team: "WebApiTeam"
+) -> List[Any]:
+    """Fetch every member of a team."""
+    return fetch_pages(
+        lambda skip: core_client.get_team_members_with_extended_properties(
+            project_id=project,
+            team_id=team.id,
+            top=MEMBER_PAGE_SIZE,
+            skip=skip,
+        ),
+        MEMBER_PAGE_SIZE,
+        workers=1,
+    )
+
+
+def get_project_members(
+    core_client: "CoreClient", project: str
+) -> Tuple[List["WebApiTeam"], List[ProjectMember]]:
+    """
+    Get the members of every team of a project, one entry per identity.
+
+    Args:
+        core_client: Core client
+        project: Project name or ID
+
+    Returns:
+        The teams of the project and their members, ordered by display name
+    """
+    key = (
+        get_client_organization(core_client),
+        get_client_tenant(core_client),
+        project.strip().casefold(),
+    )
+    cached = _project_members.get(key)
+    record_cache_lookup("project_members", cached is not None)
+    if cached is not None:
+        return cached
+
+    teams = _project_teams(core_client, project)
+
+    # Fetch rosters in the caller's context so the requests are attributed
+    # to the calling tool
+    context = contextvars.copy_context()
+
+    def roster_in_context(team: "WebApiTeam") -> List[Any]:
+        return context.copy().run(_team_roster, core_client, project, team)
+
+    members: Dict[str, ProjectMember] = {}
+    with ThreadPoolExecutor(max_workers=MEMBER_WORKERS) as executor:
+        for team, roster in zip(teams, executor.map(roster_in_context, teams)):
+            team_name = team.name or team.id
+            if not team_name:
+                continue
+            for team_member in roster:
+                identity = team_member.identity
+                if identity is None:
+                    continue
+                member = members.setdefault(
+                    identity.id, ProjectMember(identity)
+                )
+                member.teams.append(
+                    (team_name, bool(team_member.is_team_admin))
+                )
+
+    result = (
+        teams,
+        sorted(
+            members.values(),
+            key=lambda member: (
+                (member.identity.display_name or "").casefold(),
+                member.identity.id,
+            ),
+        ),
+    )
+    _project_members.set(key, result)
+    return result
+
+
+def clear_project_members() -> None:
+    """Drop every cached project membership table."""
+    _project_members.clear()
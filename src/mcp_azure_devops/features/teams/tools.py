@@ -4,20 +4,26 @@ Team tools for Azure DevOps.
 This module provides MCP tools for working with Azure DevOps teams.
 """
 
-from typing import Optional
-
-from azure.devops.v7_1.core import CoreClient
-from azure.devops.v7_1.core.models import WebApiTeam
-from azure.devops.v7_1.work.models import TeamContext
+from typing import TYPE_CHECKING, Optional
 
+from mcp_azure_devops.features.teams.catalog import (
+    get_team_catalog,
+    resolve_team,
+)
 from mcp_azure_devops.features.teams.common import (
     AzureDevOpsClientError,
     get_core_client,
     get_work_client,
 )
+from mcp_azure_devops.features.teams.iterations import get_iteration_index
+from mcp_azure_devops.features.teams.members import get_project_members
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.core import CoreClient
+    from azure.devops.v7_1.core.models import WebApiTeam
 
 
-def _format_team(team: WebApiTeam) -> str:
+def _format_team(team: "WebApiTeam") -> str:
     """
     Format team information.
 
@@ -164,15 +170,20 @@ def _format_team_iteration(iteration) -> str:
 
 
 def _get_all_teams_impl(
-    core_client: CoreClient,
+    core_client: "CoreClient",
     user_is_member_of: Optional[bool] = None,
     top: Optional[int] = None,
     skip: Optional[int] = None,
     expand_identity: Optional[bool] = None,
+    project: Optional[str] = None,
 ) -> str:
     """
     Implementation of teams retrieval.
 
+    Teams are listed from the cached team catalog, which holds every page
+    of the listing, so top and skip select from all teams without further
+    requests.
+
     Args:
         core_client: Core client
         user_is_member_of: If true, then return all teams requesting user is
@@ -180,24 +191,35 @@ def _get_all_teams_impl(
                           access.
         top: Maximum number of teams to return
         skip: Number of teams to skip
+        project: Only return teams of this project name or ID
 
     Returns:
         Formatted string containing team information
     """
     try:
-        # Call the SDK function - note we're mapping user_is_member_of to mine
-        # param
-        teams = core_client.get_all_teams(
-            mine=user_is_member_of, top=top, skip=skip
-        )
+        # Note we're mapping user_is_member_of to the SDK's mine param
+        catalog = get_team_catalog(core_client, user_is_member_of)
+        teams = catalog.in_project(project) if project else catalog.teams
 
-        if not teams:
+        start = max(skip or 0, 0)
+        end = start + top if top is not None else None
+        page = teams[start:end]
+
+        if not page:
+            if project:
+                return f"No teams found in project {project}."
             return "No teams found."
 
         formatted_teams = []
-        for team in teams:
+        for team in page:
             formatted_teams.append(_format_team(team))
 
+        if start + len(page) < len(teams):
+            formatted_teams.append(
+                f"Showing teams {start + 1}-{start + len(page)} of "
+                f"{len(teams)}; use skip to see more."
+            )
+
         return "\n\n".join(formatted_teams)
 
     except Exception as e:
@@ -205,7 +227,7 @@ def _get_all_teams_impl(
 
 
 def _get_team_members_impl(
-    core_client: CoreClient,
+    core_client: "CoreClient",
     project_id: str,
     team_id: str,
     top: Optional[int] = None,
@@ -226,6 +248,7 @@ def _get_team_members_impl(
         Formatted string containing team members information
     """
     try:
+        project_id, team_id = resolve_team(core_client, project_id, team_id)
         team_members = core_client.get_team_members_with_extended_properties(
             project_id=project_id, team_id=team_id, top=top, skip=skip
         )
@@ -245,6 +268,55 @@ def _get_team_members_impl(
         return f"Error retrieving team members: {str(e)}"
 
 
+def _table_cell(value) -> str:
+    """Make a value safe to place in a markdown table cell."""
+    return str(value or "").replace("|", "\\|")
+
+
+def _get_project_members_impl(core_client: "CoreClient", project: str) -> str:
+    """
+    Implementation of project-wide team membership retrieval.
+
+    Args:
+        core_client: Core client
+        project: The name or ID (GUID) of the team project
+
+    Returns:
+        Formatted string with a table of the project's team members
+    """
+    try:
+        teams, members = get_project_members(core_client, project)
+
+        if not teams:
+            return f"No teams found in project {project}."
+        if not members:
+            return f"No members found for the teams in project {project}."
+
+        result = [
+            f"# Members of project {project}",
+            f"{len(members)} members across {len(teams)} teams",
+            "",
+            "| Member | Email/Username | ID | Teams |",
+            "| ---- | ---- | ---- | ---- |",
+        ]
+        for member in members:
+            identity = member.identity
+            teams_text = ", ".join(
+                f"{name} (admin)" if is_admin else name
+                for name, is_admin in member.teams
+            )
+            result.append(
+                f"| {_table_cell(identity.display_name or identity.id)} "
+                f"| {_table_cell(identity.unique_name)} "
+                f"| {_table_cell(identity.id)} "
+                f"| {_table_cell(teams_text)} |"
+            )
+        return "\n".join(result)
+
+    except Exception as e:
+        return f"Error retrieving project members: {str(e)}"
+
+
 def _get_team_area_paths_impl(
     work_client, project_name_or_id: str, team_name_or_id: str
 ) -> str:
@@ -259,11 +331,15 @@ def _get_team_area_paths_impl(
     Returns:
         Formatted string containing team area path information
     """
+    from azure.devops.v7_1.work.models import TeamContext
+
     try:
-        # Create a TeamContext object
-        team_context = TeamContext(
-            project=project_name_or_id, team=team_name_or_id
+        # Create a TeamContext object, addressing the team by ID when the
+        # team catalog knows it
+        project, team = resolve_team(
+            work_client, project_name_or_id, team_name_or_id
         )
+        team_context = TeamContext(project=project, team=team)
 
         # Get the team field values
         team_field_values = work_client.get_team_field_values(team_context)
@@ -299,18 +375,21 @@ def _get_team_iterations_impl(
         Formatted string containing team iteration information
     """
     try:
-        # Create a TeamContext object
-        team_context = TeamContext(
-            project=project_name_or_id, team=team_name_or_id
+        # Address the team by ID when the team catalog knows it
+        project, team = resolve_team(
+            work_client, project_name_or_id, team_name_or_id
         )
 
-        # Set timeframe parameter if current is True
-        timeframe = "Current" if current else None
-
-        # Get the team iterations
-        team_iterations = work_client.get_team_iterations(
-            team_context=team_context, timeframe=timeframe
-        )
+        # The current iteration is worked out from the cached index
+        index = get_iteration_index(work_client, project, team)
+        if current:
+            team_iterations = [
+                iteration
+                for iteration in [index.current()]
+                if iteration is not None
+            ]
+        else:
+            team_iterations = index.iterations
 
         if not team_iterations:
             return (
@@ -341,6 +420,8 @@ def register_tools(mcp) -> None:
         user_is_member_of: Optional[bool] = None,
         top: Optional[int] = None,
         skip: Optional[int] = None,
+        project: Optional[str] = None,
+        organization: Optional[str] = None,
     ) -> str:
         """
         Retrieves all teams in the Azure DevOps organization.
@@ -355,8 +436,11 @@ def register_tools(mcp) -> None:
             user_is_member_of: If true, return only teams where the current
                 user is a member. Otherwise return all teams the user
                 has read access to.
-            top: Maximum number of teams to return
+            top: Maximum number of teams to return; all teams by default
             skip: Number of teams to skip
+            project: Only return teams of this project name or ID
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             Formatted string containing team information including names,
@@ -364,9 +448,9 @@ def register_tools(mcp) -> None:
             markdown with each team clearly separated
         """
         try:
-            core_client = get_core_client()
+            core_client = get_core_client(organization)
             return _get_all_teams_impl(
-                core_client, user_is_member_of, top, skip
+                core_client, user_is_member_of, top, skip, project=project
             )
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
@@ -377,6 +461,7 @@ def register_tools(mcp) -> None:
         team_id: str,
         top: Optional[int] = None,
         skip: Optional[int] = None,
+        organization: Optional[str] = None,
     ) -> str:
         """
         Retrieves the membership roster for a specific team.
@@ -393,6 +478,8 @@ def register_tools(mcp) -> None:
             team_id: The name or ID (GUID) of the team
             top: Maximum number of members to return
             skip: Number of members to skip
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             Formatted string containing team members information including
@@ -400,16 +487,47 @@ def register_tools(mcp) -> None:
             as markdown with each member clearly separated
         """
         try:
-            core_client = get_core_client()
+            core_client = get_core_client(organization)
             return _get_team_members_impl(
                 core_client, project_id, team_id, top, skip
             )
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
 
+    @mcp.tool()
+    def get_project_members(
+        project: str,
+        organization: Optional[str] = None,
+    ) -> str:
+        """
+        Retrieves the members of every team in a project in one table.
+
+        Use this tool when you need to:
+        - See who is on which team across a whole project
+        - Find every team a person belongs to
+        - Count the distinct people working in a project
+
+        Args:
+            project: The name or ID (GUID) of the team project
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
+
+        Returns:
+            Markdown table with one row per person, listing their display
+            name, email, ID and teams (marking where they are a team
+            administrator)
+        """
+        try:
+            core_client = get_core_client(organization)
+            return _get_project_members_impl(core_client, project)
+        except AzureDevOpsClientError as e:
+            return f"Error: {str(e)}"
+
     @mcp.tool()
     def get_team_area_paths(
-        project_name_or_id: str, team_name_or_id: str
+        project_name_or_id: str,
+        team_name_or_id: str,
+        organization: Optional[str] = None,
     ) -> str:
         """
         Retrieves the area paths assigned to a specific team.
@@ -427,6 +545,8 @@ def register_tools(mcp) -> None:
         Args:
             project_name_or_id: The name or ID of the team project
             team_name_or_id: The name or ID of the team
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             Formatted string containing team area path information including
@@ -434,7 +554,7 @@ def register_tools(mcp) -> None:
             paths that include sub-areas
         """
         try:
-            work_client = get_work_client()
+            work_client = get_work_client(organization)
             return _get_team_area_paths_impl(
                 work_client, project_name_or_id, team_name_or_id
             )
@@ -446,6 +566,7 @@ def register_tools(mcp) -> None:
         project_name_or_id: str,
         team_name_or_id: str,
         current: Optional[bool] = None,
+        organization: Optional[str] = None,
     ) -> str:
         """
         Retrieves the iterations (sprints) assigned to a specific team.
@@ -464,6 +585,8 @@ def register_tools(mcp) -> None:
             project_name_or_id: The name or ID of the team project
             team_name_or_id: The name or ID of the team
             current: If True, return only the current iteration
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             Formatted string containing team iteration information including
@@ -471,7 +594,7 @@ def register_tools(mcp) -> None:
             formatted as markdown
         """
         try:
-            work_client = get_work_client()
+            work_client = get_work_client(organization)
             return _get_team_iterations_impl(
                 work_client, project_name_or_id, team_name_or_id, current
             )
@@ -0,0 +1,232 @@
+"""
+Caches for Azure DevOps work item features.
+
+This module keeps recently executed WIQL query results so that agents
+repeating the same query do not pay for another round trip, and the result
+snapshots that delta queries compare against. Entries are keyed by
+organization URL, since work item IDs and queries are only meaningful
+within one organization, and by tenant, since what a query returns depends
+on the permissions of the PAT it ran with.
+"""
+
+import os
+import re
+import time
+from typing import Iterable, Optional
+
+from mcp_azure_devops.utils.cache import TTLCache
+from mcp_azure_devops.utils.tracing import record_cache_lookup
+
+DEFAULT_QUERY_CACHE_TTL = 60
+
+# Macros whose value changes when the user's day (or sprint) rolls over.
+# Time zone offsets are whole quarter hours, so in UTC every such boundary
+# falls on a quarter hour.
+_DATE_MACROS_PATTERN = re.compile(
+    r"@(today|startofday|startofweek|startofmonth|startofyear|"
+    r"currentiteration)\b"
+)
+_MACRO_PERIOD_SECONDS = 15 * 60
+
+_query_cache = TTLCache(ttl=DEFAULT_QUERY_CACHE_TTL, max_entries=256)
+
+# Pollers come back within minutes; keep snapshots long enough to survive
+# a quiet night without holding on to abandoned ones forever.
+QUERY_SNAPSHOT_TTL = 24 * 60 * 60
+_snapshot_cache = TTLCache(ttl=QUERY_SNAPSHOT_TTL, max_entries=128)
+
+
+def _get_query_cache_ttl() -> float:
+    """
+    Get the lifetime of cached query results.
+
+    Configured through AZURE_DEVOPS_QUERY_CACHE_TTL (seconds); 0 disables
+    the cache.
+
+    Returns:
+        Time to live in seconds
+    """
+    value = os.environ.get("AZURE_DEVOPS_QUERY_CACHE_TTL", "")
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        return DEFAULT_QUERY_CACHE_TTL
+
+
+def normalize_wiql(query: str) -> str:
+    """
+    Normalize a WIQL query for use as a cache key.
+
+    Whitespace outside string literals is collapsed and the text is case
+    folded, since WIQL keywords, field names and string comparisons are all
+    case-insensitive.
+
+    Args:
+        query: The WIQL query string
+
+    Returns:
+        Normalized query text
+    """
+    parts = []
+    quote = None
+    pending_space = False
+    for char in query.strip():
+        if quote:
+            parts.append(char)
+            if char == quote:
+                quote = None
+        elif char.isspace():
+            pending_space = True
+        else:
+            if pending_space:
+                parts.append(" ")
+                pending_space = False
+            parts.append(char)
+            if char in ("'", '"'):
+                quote = char
+    return "".join(parts).casefold()
+
+
+def _query_ttl(normalized: str, now: Optional[float] = None) -> float:
+    """
+    Get the lifetime of a cached query result.
+
+    Results of queries that use date or iteration macros never outlive the
+    period the macro currently resolves to.
+
+    Args:
+        normalized: Normalized query text
+        now: Current UNIX time, defaults to the system clock
+
+    Returns:
+        Time to live in seconds
+    """
+    ttl = _get_query_cache_ttl()
+    if _DATE_MACROS_PATTERN.search(normalized):
+        current = time.time() if now is None else now
+        until_boundary = _MACRO_PERIOD_SECONDS - (
+            current % _MACRO_PERIOD_SECONDS
+        )
+        ttl = min(ttl, until_boundary)
+    return ttl
+
+
+def get_cached_query_ids(
+    query: str, top: int, organization: str = "", tenant: str = ""
+) -> Optional[list[int]]:
+    """
+    Get the cached result of a WIQL query.
+
+    Args:
+        query: The WIQL query string
+        top: Maximum number of results the query was run with
+        organization: URL of the organization the query ran against
+        tenant: Identifier of the credentials the query ran with
+
+    Returns:
+        Copy of the cached work item IDs, or None on a miss
+    """
+    ids = _query_cache.get((organization, tenant, normalize_wiql(query), top))
+    record_cache_lookup("query", ids is not None)
+    return list(ids) if ids is not None else None
+
+
+def cache_query_ids(
+    query: str,
+    top: int,
+    ids: list[int],
+    organization: str = "",
+    tenant: str = "",
+) -> None:
+    """
+    Cache the result of a WIQL query.
+
+    Args:
+        query: The WIQL query string
+        top: Maximum number of results the query was run with
+        ids: Work item IDs returned by the query
+        organization: URL of the organization the query ran against
+        tenant: Identifier of the credentials the query ran with
+    """
+    normalized = normalize_wiql(query)
+    _query_cache.set(
+        (organization, tenant, normalized, top),
+        tuple(ids),
+        ttl=_query_ttl(normalized),
+    )
+
+
+def invalidate_work_items(
+    ids: Optional[Iterable[int]] = None, organization: Optional[str] = None
+) -> None:
+    """
+    Drop cached query results affected by a write.
+
+    Args:
+        ids: IDs of the work items that were changed. When omitted, for
+            example after creating a work item that any query could match,
+            every cached result is dropped.
+        organization: URL of the organization the write went to; when
+            omitted, results of every organization are checked. Results
+            of every tenant are checked, as all of them see the change.
+    """
+    changed = None if ids is None else {int(item_id) for item_id in ids}
+    for key, cached_ids in _query_cache.items():
+        # Keys are (organization, tenant, query, top) tuples
+        if organization is not None and (
+            not isinstance(key, tuple) or key[0] != organization
+        ):
+            continue
+        if changed is None or changed.intersection(cached_ids):
+            _query_cache.pop(key)
+
+
+def get_query_snapshot(
+    query: str, watermark: str, organization: str = "", tenant: str = ""
+) -> Optional[frozenset]:
+    """
+    Get the IDs a query matched when a delta watermark was issued.
+
+    Args:
+        query: The WIQL query string
+        watermark: Watermark returned together with the snapshot
+        organization: URL of the organization the query ran against
+        tenant: Identifier of the credentials the query ran with
+
+    Returns:
+        The matching IDs, or None if no snapshot is known
+    """
+    snapshot = _snapshot_cache.get(
+        (organization, tenant, normalize_wiql(query), watermark)
+    )
+    record_cache_lookup("snapshot", snapshot is not None)
+    return snapshot
+
+
+def save_query_snapshot(
+    query: str,
+    watermark: str,
+    ids: Iterable[int],
+    organization: str = "",
+    tenant: str = "",
+) -> None:
+    """
+    Remember the IDs a query matched at a delta watermark.
+
+    Args:
+        query: The WIQL query string
+        watermark: Watermark handed to the client
+        ids: IDs matching the query at that watermark
+        organization: URL of the organization the query ran against
+        tenant: Identifier of the credentials the query ran with
+    """
+    _snapshot_cache.set(
+        (organization, tenant, normalize_wiql(query), watermark),
+        frozenset(ids),
+    )
+
+
+def clear_caches() -> None:
+    """Remove every cached work item result."""
+    _query_cache.clear()
+    _snapshot_cache.clear()
@@ -0,0 +1,230 @@
+"""
+Classification trees for Azure DevOps work item features.
+
+The area and iteration trees of a project are fetched once, to the full
+depth Azure DevOps allows, and held as a trie of path segments. Paths can
+then be validated, expanded from a prefix and enumerated under a node
+without further requests, so bad area or iteration paths are caught
+before a work item is sent. Trees are keyed by organization URL, tenant
+and project, and refreshed after CLASSIFICATION_TREE_TTL.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from mcp_azure_devops.utils.azure_client import (
+    get_client_organization,
+    get_client_tenant,
+)
+from mcp_azure_devops.utils.cache import TTLCache
+from mcp_azure_devops.utils.tracing import record_cache_lookup
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+
+# Structure names accepted by the tools, mapped to the API's groups
+STRUCTURE_GROUPS = {"area": "areas", "iteration": "iterations"}
+
+# Area and iteration paths are at most 14 levels deep
+CLASSIFICATION_DEPTH = 14
+
+CLASSIFICATION_TREE_TTL = 10 * 60
+
+_trees = TTLCache(ttl=CLASSIFICATION_TREE_TTL, max_entries=128)
+
+
+def _segments(path: str) -> List[str]:
+    return [
+        segment.strip()
+        for segment in path.strip().strip("\\").split("\\")
+        if segment.strip()
+    ]
+
+
+class _TreeNode:
+    __slots__ = ("name", "path", "children")
+
+    def __init__(self, name: str, path: str):
+        self.name = name
+        self.path = path
+        self.children: Dict[str, "_TreeNode"] = {}
+
+
+class ClassificationTree:
+    """An area or iteration tree, held as a trie of path segments."""
+
+    def __init__(self, root: Any):
+        """
+        Create a tree.
+
+        Args:
+            root: Root WorkItemClassificationNode with its children
+        """
+        self.root = self._build(root, None)
+
+    def _build(self, node: Any, parent: Optional[str]) -> _TreeNode:
+        path = node.name if parent is None else f"{parent}\\{node.name}"
+        tree_node = _TreeNode(node.name, path)
+        for child in node.children or []:
+            tree_node.children[child.name.casefold()] = self._build(
+                child, path
+            )
+        return tree_node
+
+    def _find(self, path: str) -> Optional[_TreeNode]:
+        segments = _segments(path)
+        if not segments or segments[0].casefold() != self.root.name.casefold():
+            return None
+        node = self.root
+        for segment in segments[1:]:
+            node = node.children.get(segment.casefold())
+            if node is None:
+                return None
+        return node
+
+    def canonical(self, path: str) -> Optional[str]:
+        """
+        Look up a path regardless of case.
+
+        Args:
+            path: Area or iteration path, e.g. "Project\\Team\\Web"
+
+        Returns:
+            The path as spelled in the tree, or None if it does not exist
+        """
+        node = self._find(path)
+        return node.path if node else None
+
+    def under(self, path: Optional[str] = None) -> List[str]:
+        """
+        Enumerate a node and every node below it, as WIQL UNDER does.
+
+        Args:
+            path: Path of the node; defaults to the root
+
+        Returns:
+            Paths in depth-first order, or an empty list if the path does
+            not exist
+        """
+        start = self._find(path) if path else self.root
+        if start is None:
+            return []
+        paths = []
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            paths.append(node.path)
+            stack.extend(
+                sorted(
+                    node.children.values(),
+                    key=lambda child: child.name.casefold(),
+                    reverse=True,
+                )
+            )
+        return paths
+
+    def expand(self, prefix: str) -> List[str]:
+        """
+        Enumerate the paths starting with a prefix.
+
+        The last segment of the prefix may be partial, so "Project\\We"
+        expands to "Project\\Web" and everything under it.
+
+        Args:
+            prefix: Path prefix
+
+        Returns:
+            Matching paths in depth-first order
+        """
+        segments = _segments(prefix)
+        if not segments:
+            return self.under()
+        if prefix.rstrip().endswith("\\"):
+            return self.under(prefix)
+        parent = "\\".join(segments[:-1])
+        partial = segments[-1].casefold()
+        if not parent:
+            candidates = [self.root]
+        else:
+            node = self._find(parent)
+            candidates = list(node.children.values()) if node else []
+        paths = []
+        for candidate in sorted(
+            candidates, key=lambda child: child.name.casefold()
+        ):
+            if candidate.name.casefold().startswith(partial):
+                paths.extend(self.under(candidate.path))
+        return paths
+
+    def suggestions(self, path: str, limit: int = 5) -> List[str]:
+        """
+        Suggest existing paths near one that does not exist.
+
+        Args:
+            path: The path that was not found
+            limit: Maximum number of suggestions
+
+        Returns:
+            Paths completing the last segment of ``path``, or else the
+            paths below its deepest existing ancestor
+        """
+        matches = self.expand(path)
+        if matches:
+            return matches[:limit]
+        segments = _segments(path)[:-1]
+        while segments:
+            below = self.under("\\".join(segments))
+            if below:
+                return (below[1:] or below)[:limit]
+            segments = segments[:-1]
+        return self.under()[:limit]
+
+
+def get_classification_tree(
+    wit_client: "WorkItemTrackingClient",
+    project: str,
+    structure: str,
+    refresh: bool = False,
+) -> ClassificationTree:
+    """
+    Get the area or iteration tree of a project, fetching it if needed.
+
+    Args:
+        wit_client: Work item tracking client
+        project: Project name or ID
+        structure: "area" or "iteration"
+        refresh: Fetch the tree again even if it is cached, e.g. when a
+            path may have been added since
+
+    Returns:
+        The classification tree
+
+    Raises:
+        ValueError: If the structure is unknown
+    """
+    group = STRUCTURE_GROUPS.get(structure.strip().lower())
+    if group is None:
+        raise ValueError(
+            f"Unknown classification structure '{structure}'; expected "
+            + " or ".join(STRUCTURE_GROUPS)
+        )
+    key = (
+        get_client_organization(wit_client),
+        get_client_tenant(wit_client),
+        project.strip().casefold(),
+        group,
+    )
+    tree = None if refresh else _trees.get(key)
+    record_cache_lookup("classification", tree is not None)
+    if tree is None:
+        tree = ClassificationTree(
+            wit_client.get_classification_node(
+                project, group, depth=CLASSIFICATION_DEPTH
+            )
+        )
+        _trees.set(key, tree)
+    return tree
+
+
+def clear_classification_trees() -> None:
+    """Drop every cached classification tree."""
+    _trees.clear()
@@ -4,10 +4,14 @@ Common utilities for Azure DevOps work item features.
 This module provides shared functionality used by both tools and resources.
 """
 
-from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Optional
 
 from mcp_azure_devops.utils.azure_client import get_connection
 
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+
 
 class AzureDevOpsClientError(Exception):
     """Exception raised for errors in Azure DevOps client operations."""
@@ -15,10 +19,16 @@ class AzureDevOpsClientError(Exception):
     pass
 
 
-def get_work_item_client() -> WorkItemTrackingClient:
+def get_work_item_client(
+    organization: Optional[str] = None,
+) -> "WorkItemTrackingClient":
     """
     Get the work item tracking client.
 
+    Args:
+        organization: Organization name or URL; defaults to
+            AZURE_DEVOPS_ORGANIZATION_URL
+
     Returns:
         WorkItemTrackingClient instance
 
@@ -26,12 +36,15 @@ def get_work_item_client() -> WorkItemTrackingClient:
         AzureDevOpsClientError: If connection or client creation fails
     """
     # Get connection to Azure DevOps
-    connection = get_connection()
+    try:
+        connection = get_connection(organization)
+    except ValueError as e:
+        raise AzureDevOpsClientError(str(e)) from e
 
     if not connection:
         raise AzureDevOpsClientError(
             "Azure DevOps PAT or organization URL not found in "
-            "environment variables."
+            "environment variables or request headers."
         )
 
     # Get the work item tracking client
@@ -43,3 +56,43 @@ def get_work_item_client() -> WorkItemTrackingClient:
         )
 
     return wit_client
+
+
+def parse_watermark(watermark: str) -> datetime:
+    """
+    Parse a delta query watermark.
+
+    Args:
+        watermark: ISO 8601 timestamp, as returned by a previous delta query
+
+    Returns:
+        Timezone-aware datetime; naive timestamps are taken as UTC
+
+    Raises:
+        ValueError: If the watermark is not a valid timestamp
+    """
+    value = watermark.strip()
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def format_watermark(moment: datetime) -> str:
+    """
+    Format a datetime as a delta query watermark.
+
+    Args:
+        moment: Point in time to format
+
+    Returns:
+        ISO 8601 UTC timestamp with millisecond precision
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    utc = moment.astimezone(timezone.utc)
+    return (
+        utc.strftime("%Y-%m-%dT%H:%M:%S.") + f"{utc.microsecond // 1000:03d}Z"
+    )
@@ -4,7 +4,79 @@ Formatting utilities for Azure DevOps work items.
 This module provides functions to format work items for display.
 """
 
-from azure.devops.v7_1.work_item_tracking.models import WorkItem
+import os
+from typing import TYPE_CHECKING
+
+from mcp_azure_devops.utils.cache import TTLCache
+from mcp_azure_devops.utils.html_text import html_to_text
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking.models import WorkItem
+
+# Fields that Azure DevOps stores as HTML
+HTML_FIELDS = frozenset(
+    {
+        "System.Description",
+        "System.History",
+        "Microsoft.VSTS.Common.AcceptanceCriteria",
+        "Microsoft.VSTS.TCM.ReproSteps",
+        "Microsoft.VSTS.TCM.SystemInfo",
+        "Microsoft.VSTS.CMMI.Symptom",
+        "Microsoft.VSTS.CMMI.ProposedFix",
+        "Microsoft.VSTS.Common.Resolution",
+    }
+)
+
+# Default cap on the converted text of a single HTML field
+DEFAULT_HTML_FIELD_MAX_CHARS = 4000
+
+# A field's content never changes for a given revision, so conversions are
+# memoized by (work item, revision, field, cap). Work items are identified by
+# their URL, which includes the organization, where it is known.
+_html_field_cache = TTLCache(ttl=60 * 60, max_entries=4096)
+
+
+def _get_html_field_max_chars() -> int:
+    """
+    Get the per-field character cap for converted HTML fields.
+
+    Configured through AZURE_DEVOPS_HTML_FIELD_MAX_CHARS; 0 disables the cap.
+
+    Returns:
+        Maximum number of characters, or 0 for no limit
+    """
+    value = os.environ.get("AZURE_DEVOPS_HTML_FIELD_MAX_CHARS", "")
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        return DEFAULT_HTML_FIELD_MAX_CHARS
+
+
+def _format_html_field(
+    work_item: "WorkItem", field_name: str, field_value: str
+) -> str:
+    """
+    Reduce an HTML field to compact text.
+
+    Args:
+        work_item: Work item the field belongs to
+        field_name: Reference name of the field
+        field_value: Raw HTML value of the field
+
+    Returns:
+        Compact text representation of the field
+    """
+    max_chars = _get_html_field_max_chars()
+    item_id = getattr(work_item, "id", None)
+    rev = getattr(work_item, "rev", None)
+    if not isinstance(item_id, int) or not isinstance(rev, int):
+        return html_to_text(field_value, max_chars)
+
+    url = getattr(work_item, "url", None)
+    return _html_field_cache.get_or_set(
+        (url if isinstance(url, str) else item_id, rev, field_name, max_chars),
+        lambda: html_to_text(field_value, max_chars),
+    )
 
 
 def _format_field_value(field_value) -> str:
@@ -96,7 +168,7 @@ def _format_build_info(fields: dict) -> list[str]:
     return build_info
 
 
-def format_work_item(work_item: WorkItem, detailed: bool = True) -> str:
+def format_work_item(work_item: "WorkItem", detailed: bool = True) -> str:
     """
     Format work item information for display.
 
@@ -118,7 +190,12 @@ def format_work_item(work_item: WorkItem, detailed: bool = True) -> str:
         # List all fields alphabetically for consistent output
         for field_name in sorted(fields.keys()):
             field_value = fields[field_name]
-            formatted_value = _format_field_value(field_value)
+            if field_name in HTML_FIELDS and isinstance(field_value, str):
+                formatted_value = _format_html_field(
+                    work_item, field_name, field_value
+                )
+            else:
+                formatted_value = _format_field_value(field_value)
             details.append(f"- **{field_name}**: {formatted_value}")
     else:
         # Basic information only
@@ -0,0 +1,256 @@
+"""
+Identity resolution for Azure DevOps work item features.
+
+Identity fields such as System.AssignedTo accept a display name or an
+email address, which the server has to resolve on every write and which
+fails when a display name is shared by several people. Values are resolved
+once through the identities API to the unambiguous "Display Name <email>"
+form, but only when exactly one person has that display name or email;
+people the search finds by a partial match are suggested, never assigned.
+Resolutions are cached per organization URL and tenant, and values
+matching nobody exactly for a shorter time so a newly added user is found
+soon after.
+Values are deduplicated and looked up concurrently, so assigning many work
+items to a few people costs one lookup per person. @Me, which templates
+use to assign work items to whoever applies them, is resolved to the
+identity the request is made with.
+"""
+
+import contextvars
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from mcp_azure_devops.utils.azure_client import (
+    get_client_organization,
+    get_client_tenant,
+)
+from mcp_azure_devops.utils.cache import TTLCache
+from mcp_azure_devops.utils.tracing import record_cache_lookup
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.identity import IdentityClient
+
+IDENTITY_TTL = 60 * 60
+
+# Values matching nobody are retried sooner, in case the user was added
+IDENTITY_MISS_TTL = 5 * 60
+
+# Lookups made at once when resolving several values
+IDENTITY_WORKERS = 8
+
+# Candidates shown in a problem before the list is cut short
+MAX_LISTED_IDENTITIES = 5
+
+_identities = TTLCache(ttl=IDENTITY_TTL, max_entries=4096)
+
+_MISSING = object()
+
+# Names the identity the request is made with
+CURRENT_USER = "@me"
+
+# "Display Name <user@example.com>" already names exactly one identity
+_UNIQUE_FORM = re.compile(r"<[^<>\s]+@[^<>\s]+>\s*$")
+
+
+def _key(value: str) -> str:
+    return value.strip().casefold()
+
+
+def _account(identity: Any) -> Optional[str]:
+    properties = getattr(identity, "properties", None) or {}
+    for name in ("Account", "Mail"):
+        value = properties.get(name)
+        if isinstance(value, dict):
+            value = value.get("$value")
+        if isinstance(value, str) and "@" in value:
+            return value
+    return None
+
+
+def _display_name(identity: Any) -> Optional[str]:
+    return getattr(identity, "custom_display_name", None) or getattr(
+        identity, "provider_display_name", None
+    )
+
+
+def _lookup(
+    identity_client: "IdentityClient", value: str
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Search the identities matching a display name or email address.
+
+    Args:
+        identity_client: Identity client
+        value: Display name or email address
+
+    Returns:
+        Tuple containing (exact, partial): the identities whose display
+        name or email is the value, and the others the search found, each
+        as "Display Name <email>"
+    """
+    identities = identity_client.read_identities(
+        search_filter="General", filter_value=value.strip()
+    )
+    key = _key(value)
+    exact: Dict[str, None] = {}
+    partial: Dict[str, None] = {}
+    for identity in identities or []:
+        account = _account(identity)
+        if account is None or getattr(identity, "is_active", True) is False:
+            continue
+        name = _display_name(identity) or account
+        # Only an exact match is safe to assign; the search also returns
+        # people whose names merely start with the value
+        found = exact if key in (_key(name), _key(account)) else partial
+        found[f"{name} <{account}>"] = None
+    return tuple(exact), tuple(partial)
+
+
+def _cached_lookup(
+    identity_client: "IdentityClient", value: str
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    key = (
+        get_client_organization(identity_client),
+        get_client_tenant(identity_client),
+        _key(value),
+    )
+    matches = _identities.get(key, _MISSING)
+    record_cache_lookup("identities", matches is not _MISSING)
+    if matches is _MISSING:
+        matches = _lookup(identity_client, value)
+        _identities.set(
+            key, matches, ttl=None if matches[0] else IDENTITY_MISS_TTL
+        )
+    return matches
+
+
+def _current_user(identity_client: "IdentityClient", value: str) -> str:
+    key = (
+        get_client_organization(identity_client),
+        get_client_tenant(identity_client),
+        CURRENT_USER,
+    )
+    user = _identities.get(key)
+    record_cache_lookup("identities", user is not None)
+    if user is None:
+        try:
+            me = identity_client.get_self()
+        except Exception:
+            # Left to the server, like any value whose lookup failed
+            return value
+        account = getattr(me, "account_name", None)
+        if not isinstance(account, str) or "@" not in account:
+            return value
+        user = f"{getattr(me, 'display_name', None) or account} <{account}>"
+        _identities.set(key, user)
+    return user
+
+
+def _listed(candidates: Tuple[str, ...]) -> str:
+    listed = ", ".join(candidates[:MAX_LISTED_IDENTITIES])
+    if len(candidates) > MAX_LISTED_IDENTITIES:
+        listed += f" and {len(candidates) - MAX_LISTED_IDENTITIES} more"
+    return listed
+
+
+def _problem(
+    value: str, exact: Tuple[str, ...], partial: Tuple[str, ...]
+) -> str:
+    if exact:
+        return f"'{value}' matches several identities: {_listed(exact)}"
+    if partial:
+        return (
+            f"No identity matches '{value}' exactly; did you mean "
+            f"{_listed(partial)}?"
+        )
+    return f"No identity matches '{value}'"
+
+
+def resolve_identities(
+    identity_client: "IdentityClient", values: List[str]
+) -> Dict[str, str]:
+    """
+    Resolve display names and email addresses to unique identities.
+
+    Args:
+        identity_client: Identity client
+        values: Display names, email addresses or @Me, possibly repeated
+
+    Returns:
+        Each value mapped to "Display Name <email>"; values already in that
+        form, and values whose lookup failed, map to themselves so the
+        server resolves them
+
+    Raises:
+        ValueError: If values match nobody exactly or several people,
+            listing every such value with the people it may mean
+    """
+    resolved: Dict[str, str] = {}
+    pending: Dict[str, str] = {}
+    for value in values:
+        if not value.strip() or _UNIQUE_FORM.search(value):
+            resolved[value] = value
+        elif _key(value) == CURRENT_USER:
+            resolved[value] = _current_user(identity_client, value)
+        else:
+            pending.setdefault(_key(value), value)
+
+    # Run in the caller's context so the lookups are attributed to the
+    # calling tool
+    context = contextvars.copy_context()
+
+    def run(value: str) -> Optional[Tuple[Tuple[str, ...], ...]]:
+        try:
+            return context.copy().run(_cached_lookup, identity_client, value)
+        except Exception:
+            return None
+
+    lookups = list(pending.values())
+    if len(lookups) == 1:
+        results = [run(lookups[0])]
+    elif lookups:
+        with ThreadPoolExecutor(
+            max_workers=min(IDENTITY_WORKERS, len(lookups))
+        ) as executor:
+            results = list(executor.map(run, lookups))
+    else:
+        results = []
+
+    by_key: Dict[str, str] = {}
+    problems = []
+    for value, matches in zip(lookups, results):
+        if matches is None:
+            by_key[_key(value)] = value
+        elif len(matches[0]) == 1:
+            by_key[_key(value)] = matches[0][0]
+        else:
+            problems.append(_problem(value, *matches))
+    if problems:
+        raise ValueError("\n".join(problems))
+
+    for value in values:
+        resolved.setdefault(value, by_key.get(_key(value), value))
+    return resolved
+
+
+def resolve_identity(identity_client: "IdentityClient", value: str) -> str:
+    """
+    Resolve a display name or email address to a unique identity.
+
+    Args:
+        identity_client: Identity client
+        value: Display name or email address
+
+    Returns:
+        The identity as "Display Name <email>"
+
+    Raises:
+        ValueError: If the value matches nobody exactly or several people
+    """
+    return resolve_identities(identity_client, [value])[value]
+
+
+def clear_identities() -> None:
+    """Drop every cached identity, including cached misses."""
+    _identities.clear()
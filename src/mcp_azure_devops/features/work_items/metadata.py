@@ -0,0 +1,200 @@
+"""
+Process metadata caches for Azure DevOps work item features.
+
+Work item types and their fields are defined by the process a project
+uses, change only when the process is edited and are shared by every
+project on that process. They are cached per organization, tenant and
+process so that tools, and crawls visiting many projects, fetch each
+definition once. The allowed values of picklist fields, which the process
+API does not list with the fields, are cached per project and work item
+type. The project and type of existing work items, needed to validate
+updates that do not name them, are cached per work item for a shorter
+time since a work item can be moved or change type.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from mcp_azure_devops.utils.azure_client import (
+    get_client_organization,
+    get_client_tenant,
+)
+from mcp_azure_devops.utils.cache import TTLCache
+from mcp_azure_devops.utils.tracing import record_cache_lookup
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+    from azure.devops.v7_1.work_item_tracking_process import (
+        WorkItemTrackingProcessClient,
+    )
+
+PROCESS_METADATA_TTL = 30 * 60
+WORK_ITEM_TYPE_TTL = 10 * 60
+
+_metadata = TTLCache(ttl=PROCESS_METADATA_TTL, max_entries=1024)
+_work_item_types = TTLCache(ttl=WORK_ITEM_TYPE_TTL, max_entries=4096)
+
+_MISSING = object()
+
+
+def _cached(client: Any, kind: str, key: tuple, fetch) -> Any:
+    full_key = (
+        get_client_organization(client),
+        get_client_tenant(client),
+        kind,
+        *key,
+    )
+    value = _metadata.get(full_key, _MISSING)
+    record_cache_lookup("process_metadata", value is not _MISSING)
+    if value is _MISSING:
+        value = fetch()
+        _metadata.set(full_key, value)
+    return value
+
+
+def get_process_work_item_types(
+    process_client: "WorkItemTrackingProcessClient", process_id: str
+) -> List[Any]:
+    """
+    Get the work item types of a process, with their states.
+
+    Args:
+        process_client: Work item tracking process client
+        process_id: Process type ID
+
+    Returns:
+        The process's work item types
+    """
+    return _cached(
+        process_client,
+        "types",
+        (process_id.lower(),),
+        lambda: (
+            process_client.get_process_work_item_types(
+                process_id, expand="states"
+            )
+            or []
+        ),
+    )
+
+
+def get_work_item_type_fields(
+    process_client: "WorkItemTrackingProcessClient",
+    process_id: str,
+    wit_ref_name: str,
+) -> List[Any]:
+    """
+    Get the fields of a work item type in a process.
+
+    Args:
+        process_client: Work item tracking process client
+        process_id: Process type ID
+        wit_ref_name: Reference name of the work item type
+
+    Returns:
+        The work item type's fields
+    """
+    return _cached(
+        process_client,
+        "fields",
+        (process_id.lower(), wit_ref_name.lower()),
+        lambda: (
+            process_client.get_all_work_item_type_fields(
+                process_id, wit_ref_name
+            )
+            or []
+        ),
+    )
+
+
+def get_work_item_type_allowed_values(
+    wit_client: "WorkItemTrackingClient", project: str, work_item_type: str
+) -> Dict[str, List[Any]]:
+    """
+    Get the allowed values of a work item type's fields in a project.
+
+    Args:
+        wit_client: Work item tracking client
+        project: Project name or ID
+        work_item_type: Work item type name
+
+    Returns:
+        Allowed values keyed by lowercase field reference name, for the
+        fields that restrict their values
+    """
+
+    def fetch() -> Dict[str, List[Any]]:
+        fields = wit_client.get_work_item_type_fields_with_references(
+            project, work_item_type, expand="allowedValues"
+        )
+        return {
+            field.reference_name.lower(): list(field.allowed_values)
+            for field in fields or []
+            if field.allowed_values
+        }
+
+    return _cached(
+        wit_client,
+        "allowed",
+        (project.strip().casefold(), work_item_type.strip().casefold()),
+        fetch,
+    )
+
+
+def _work_item_key(wit_client: Any, work_item_id: int) -> tuple:
+    return (
+        get_client_organization(wit_client),
+        get_client_tenant(wit_client),
+        int(work_item_id),
+    )
+
+
+def get_work_item_project_and_type(
+    wit_client: "WorkItemTrackingClient", work_item_id: int
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Get the project and work item type of an existing work item.
+
+    Args:
+        wit_client: Work item tracking client
+        work_item_id: The work item ID
+
+    Returns:
+        Tuple containing (project, work_item_type), either None if the
+        work item does not report it
+    """
+    key = _work_item_key(wit_client, work_item_id)
+    cached = _work_item_types.get(key)
+    record_cache_lookup("work_item_types", cached is not None)
+    if cached is None:
+        work_item = wit_client.get_work_item(
+            int(work_item_id),
+            fields=["System.TeamProject", "System.WorkItemType"],
+        )
+        fields = getattr(work_item, "fields", None) or {}
+        project = fields.get("System.TeamProject")
+        work_item_type = fields.get("System.WorkItemType")
+        cached = (
+            project if isinstance(project, str) else None,
+            work_item_type if isinstance(work_item_type, str) else None,
+        )
+        _work_item_types.set(key, cached)
+    return cached
+
+
+def forget_work_item_type(
+    wit_client: "WorkItemTrackingClient", work_item_id: int
+) -> None:
+    """
+    Drop the cached project and type of a work item that was changed.
+
+    Args:
+        wit_client: Work item tracking client
+        work_item_id: The work item ID
+    """
+    _work_item_types.pop(_work_item_key(wit_client, work_item_id), None)
+
+
+def clear_process_metadata() -> None:
+    """Drop all cached process metadata and work item types."""
+    _metadata.clear()
+    _work_item_types.clear()
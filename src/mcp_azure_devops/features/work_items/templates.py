@@ -0,0 +1,140 @@
+"""
+Work item template caches for Azure DevOps work item features.
+
+Templates belong to a team and change only when someone edits them, so
+template listings and template details are cached per organization URL,
+tenant and team context. Creating a work item from a template then needs
+no request beyond the create itself once the template is warm.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from mcp_azure_devops.utils.azure_client import (
+    get_client_organization,
+    get_client_tenant,
+)
+from mcp_azure_devops.utils.cache import TTLCache
+from mcp_azure_devops.utils.tracing import record_cache_lookup
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+    from azure.devops.v7_1.work_item_tracking.models import (
+        WorkItemTemplate,
+        WorkItemTemplateReference,
+    )
+
+WORK_ITEM_TEMPLATE_TTL = 10 * 60
+
+_templates = TTLCache(ttl=WORK_ITEM_TEMPLATE_TTL, max_entries=512)
+
+_MISSING = object()
+
+
+def _key(value: Any) -> str:
+    return value.strip().casefold() if isinstance(value, str) else ""
+
+
+def create_team_context(team_context: Dict[str, Any]):
+    """
+    Create a TeamContext object from a dictionary.
+
+    Args:
+        team_context: Dictionary with project, project_id, team and
+            team_id keys
+
+    Returns:
+        TeamContext instance
+    """
+    from azure.devops.v7_1.work_item_tracking.models import TeamContext
+
+    return TeamContext(
+        project=team_context.get("project"),
+        project_id=team_context.get("project_id"),
+        team=team_context.get("team"),
+        team_id=team_context.get("team_id"),
+    )
+
+
+def _cached(
+    wit_client: "WorkItemTrackingClient",
+    team_context: Dict[str, Any],
+    key: tuple,
+    fetch,
+) -> Any:
+    full_key = (
+        get_client_organization(wit_client),
+        get_client_tenant(wit_client),
+        _key(team_context.get("project") or team_context.get("project_id")),
+        _key(team_context.get("team") or team_context.get("team_id")),
+        *key,
+    )
+    value = _templates.get(full_key, _MISSING)
+    record_cache_lookup("templates", value is not _MISSING)
+    if value is _MISSING:
+        value = fetch()
+        # A missing template may be created at any time; only cache hits
+        if value is not None:
+            _templates.set(full_key, value)
+    return value
+
+
+def get_templates(
+    wit_client: "WorkItemTrackingClient",
+    team_context: Dict[str, Any],
+    work_item_type: Optional[str] = None,
+) -> List["WorkItemTemplateReference"]:
+    """
+    Get a team's templates, fetching them if they are not cached.
+
+    Args:
+        wit_client: Work item tracking client
+        team_context: Dictionary with project, project_id, team and
+            team_id keys
+        work_item_type: Optional work item type name to filter by
+
+    Returns:
+        The team's templates
+    """
+    return _cached(
+        wit_client,
+        team_context,
+        ("list", _key(work_item_type)),
+        lambda: (
+            wit_client.get_templates(
+                create_team_context(team_context), work_item_type
+            )
+            or []
+        ),
+    )
+
+
+def get_template(
+    wit_client: "WorkItemTrackingClient",
+    team_context: Dict[str, Any],
+    template_id: str,
+) -> Optional["WorkItemTemplate"]:
+    """
+    Get a template with its field values, fetching it if it is not cached.
+
+    Args:
+        wit_client: Work item tracking client
+        team_context: Dictionary with project, project_id, team and
+            team_id keys
+        template_id: The ID of the template
+
+    Returns:
+        The template, or None if it does not exist
+    """
+    return _cached(
+        wit_client,
+        team_context,
+        ("template", _key(template_id)),
+        lambda: wit_client.get_template(
+            create_team_context(team_context), template_id
+        ),
+    )
+
+
+def clear_templates() -> None:
+    """Drop every cached template."""
+    _templates.clear()
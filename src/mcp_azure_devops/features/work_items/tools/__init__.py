@@ -4,8 +4,10 @@ Work item tools for Azure DevOps.
 
 from mcp_azure_devops.features.work_items.tools import (
     attachments,
+    classification,
     comments,
     create,
+    history,
     process,
     query,
     read,
@@ -23,9 +25,11 @@ def register_tools(mcp) -> None:
     """
     query.register_tools(mcp)
     read.register_tools(mcp)
+    history.register_tools(mcp)
     comments.register_tools(mcp)
     create.register_tools(mcp)
     types.register_tools(mcp)
     templates.register_tools(mcp)
     process.register_tools(mcp)
     attachments.register_tools(mcp)
+    classification.register_tools(mcp)
@@ -7,20 +7,23 @@ This module provides MCP tools for uploading and attaching files to work items.
 import os
 import re
 from io import BytesIO
-from typing import Dict, List, Optional, Tuple
-
-from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
+from mcp_azure_devops.features.work_items.cache import invalidate_work_items
 from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
     get_work_item_client,
 )
 from mcp_azure_devops.features.work_items.formatting import format_work_item
+from mcp_azure_devops.utils.azure_client import get_client_organization
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
 
 
 def _upload_attachment_impl(
     file_path: str,
-    wit_client: WorkItemTrackingClient,
+    wit_client: "WorkItemTrackingClient",
     project: Optional[str] = None,
 ) -> Tuple[str, str]:
     """
@@ -66,7 +69,7 @@ def _update_work_item_with_attachment_impl(
     attachment_url: str,
     attachment_name: str,
     comment: Optional[str],
-    wit_client: WorkItemTrackingClient,
+    wit_client: "WorkItemTrackingClient",
 ) -> str:
     """
     Update a work item with an attachment.
@@ -104,6 +107,7 @@ def _update_work_item_with_attachment_impl(
         updated_work_item = wit_client.update_work_item(
             document=document, id=item_id
         )
+        invalidate_work_items([item_id], get_client_organization(wit_client))
 
         return format_work_item(updated_work_item)
     except Exception as e:
@@ -112,7 +116,7 @@ def _update_work_item_with_attachment_impl(
 
 def _get_work_item_attachments_impl(
     item_id: int,
-    wit_client: WorkItemTrackingClient,
+    wit_client: "WorkItemTrackingClient",
     project: Optional[str] = None,
 ) -> List[Dict[str, str]]:
     """
@@ -194,6 +198,7 @@ def register_tools(mcp) -> None:
         file_path: str,
         comment: Optional[str] = None,
         project: Optional[str] = None,
+        organization: Optional[str] = None,
     ) -> str:
         """
         Adds a file attachment to a work item.
@@ -215,13 +220,15 @@ def register_tools(mcp) -> None:
             file_path: Full path to the file on the local system
             comment: Optional comment explaining the attachment
             project: Optional project name
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             Formatted string containing the updated work item with attachment
             information and a link to download the file
         """
         try:
-            wit_client = get_work_item_client()
+            wit_client = get_work_item_client(organization)
 
             # Upload the attachment
             attachment_url, attachment_name = _upload_attachment_impl(
@@ -240,7 +247,9 @@ def register_tools(mcp) -> None:
 
     @mcp.tool()
     def get_work_item_attachments(
-        id: int, project: Optional[str] = None
+        id: int,
+        project: Optional[str] = None,
+        organization: Optional[str] = None,
     ) -> str:
         """
         Retrieves all attachments from a work item, including embedded images.
@@ -256,6 +265,8 @@ def register_tools(mcp) -> None:
                 This should be a positive integer representing the unique
                 identifier of the work item in Azure DevOps.
             project: Optional project name
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             Formatted string containing all attachment information,
@@ -263,7 +274,7 @@ def register_tools(mcp) -> None:
             embedded images), formatted as markdown
         """
         try:
-            wit_client = get_work_item_client()
+            wit_client = get_work_item_client(organization)
 
             # Get attachments
             attachments = _get_work_item_attachments_impl(
@@ -0,0 +1,122 @@
+"""
+Classification operations for Azure DevOps.
+
+This module provides MCP tools for browsing the area and iteration trees
+of a project.
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+from mcp_azure_devops.features.work_items.classification import (
+    get_classification_tree,
+)
+from mcp_azure_devops.features.work_items.common import (
+    AzureDevOpsClientError,
+    get_work_item_client,
+)
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+
+# Paths listed at most in one response
+MAX_LISTED_PATHS = 1000
+
+
+def _get_classification_paths_impl(
+    wit_client: "WorkItemTrackingClient",
+    project: str,
+    structure: str = "area",
+    under: Optional[str] = None,
+    prefix: Optional[str] = None,
+) -> str:
+    """
+    Implementation of classification path listing.
+
+    Args:
+        wit_client: Work item tracking client
+        project: The project name or ID
+        structure: "area" or "iteration"
+        under: Only list this path and the paths below it
+        prefix: Only list paths starting with this prefix
+
+    Returns:
+        Formatted string listing the paths
+    """
+    try:
+        tree = get_classification_tree(wit_client, project, structure)
+    except ValueError as e:
+        return f"Error: {str(e)}"
+    except Exception as e:
+        return f"Error retrieving {structure} paths: {str(e)}"
+
+    if under:
+        paths = tree.under(under)
+        if not paths:
+            return (
+                f"Error: {structure.capitalize()} path '{under}' does not "
+                f"exist in project {project}."
+            )
+    elif prefix:
+        paths = tree.expand(prefix)
+        if not paths:
+            return (
+                f"No {structure} paths in project {project} start with "
+                f"'{prefix}'."
+            )
+    else:
+        paths = tree.under()
+
+    result = [f"# {structure.capitalize()} Paths: {tree.root.name}"]
+    result.extend(f"- {path}" for path in paths[:MAX_LISTED_PATHS])
+    if len(paths) > MAX_LISTED_PATHS:
+        result.append(
+            f"\n{len(paths) - MAX_LISTED_PATHS} more paths not shown; narrow "
+            "the listing with under or prefix."
+        )
+    return "\n".join(result)
+
+
+def register_tools(mcp) -> None:
+    """
+    Register classification tools with the MCP server.
+
+    Args:
+        mcp: The FastMCP server instance
+    """
+
+    @mcp.tool()
+    def get_classification_paths(
+        project: str,
+        structure: str = "area",
+        under: Optional[str] = None,
+        prefix: Optional[str] = None,
+        organization: Optional[str] = None,
+    ) -> str:
+        """
+        Lists the area or iteration paths defined in a project.
+
+        Use this tool when you need to:
+        - Find valid area or iteration paths before creating work items
+        - See every area or sprint below a given node
+        - Complete a partially known path
+
+        Args:
+            project: The project name or ID
+            structure: "area" for area paths or "iteration" for iteration
+                paths
+            under: Optional path; list only it and the paths below it
+            prefix: Optional path prefix whose last segment may be
+                partial, e.g. "Project\\Web" matches "Project\\Website"
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
+
+        Returns:
+            Markdown list of full paths, in tree order
+        """
+        try:
+            wit_client = get_work_item_client(organization)
+            return _get_classification_paths_impl(
+                wit_client, project, structure, under, prefix
+            )
+        except AzureDevOpsClientError as e:
+            return f"Error: {str(e)}"
@@ -4,10 +4,7 @@ Comment operations for Azure DevOps work items.
 This module provides MCP tools for retrieving and adding work item comments.
 """
 
-from typing import Optional
-
-from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
-from azure.devops.v7_1.work_item_tracking.models import CommentCreate
+from typing import TYPE_CHECKING, Optional
 
 from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
@@ -17,6 +14,9 @@ from mcp_azure_devops.features.work_items.tools.utils import (
     sanitize_description_html,
 )
 
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+
 
 def _format_comment(comment) -> str:
     """
@@ -51,7 +51,7 @@ def _format_comment(comment) -> str:
 
 
 def _get_project_for_work_item(
-    item_id: int, wit_client: WorkItemTrackingClient
+    item_id: int, wit_client: "WorkItemTrackingClient"
 ) -> Optional[str]:
     """
     Get the project name for a work item.
@@ -66,7 +66,10 @@ def _get_project_for_work_item(
         Project name or None if not found
     """
     try:
-        work_item = wit_client.get_work_item(item_id)
+        # Only the project is needed, not the whole work item
+        work_item = wit_client.get_work_item(
+            item_id, fields=["System.TeamProject"]
+        )
         if work_item and work_item.fields:
             return work_item.fields.get("System.TeamProject")
     except Exception:
@@ -77,7 +80,7 @@ def _get_project_for_work_item(
 
 def _get_work_item_comments_impl(
     item_id: int,
-    wit_client: WorkItemTrackingClient,
+    wit_client: "WorkItemTrackingClient",
     project: Optional[str] = None,
 ) -> str:
     """
@@ -117,7 +120,7 @@ def _get_work_item_comments_impl(
 def _add_work_item_comment_impl(
     item_id: int,
     text: str,
-    wit_client: WorkItemTrackingClient,
+    wit_client: "WorkItemTrackingClient",
     project: Optional[str] = None,
 ) -> str:
     """
@@ -144,6 +147,8 @@ def _add_work_item_comment_impl(
     # Process comment content for HTML conversion
     text_html = sanitize_description_html(text)
 
+    from azure.devops.v7_1.work_item_tracking.models import CommentCreate
+
     # Create comment request
     comment_request = CommentCreate(text=text_html)
 
@@ -164,7 +169,11 @@ def register_tools(mcp) -> None:
     """
 
     @mcp.tool()
-    def get_work_item_comments(id: int, project: Optional[str] = None) -> str:
+    def get_work_item_comments(
+        id: int,
+        project: Optional[str] = None,
+        organization: Optional[str] = None,
+    ) -> str:
         """
         Retrieves all comments associated with a specific work item.
 
@@ -180,6 +189,8 @@ def register_tools(mcp) -> None:
                 identifier of the work item in Azure DevOps.
             project: Optional project name. If not provided, will be
                 determined from the work item.
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             Formatted string containing all comments on the work item,
@@ -187,14 +198,17 @@ def register_tools(mcp) -> None:
             chronologically and formatted as markdown
         """
         try:
-            wit_client = get_work_item_client()
+            wit_client = get_work_item_client(organization)
             return _get_work_item_comments_impl(id, wit_client, project)
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
 
     @mcp.tool()
     def add_work_item_comment(
-        id: int, text: str, project: Optional[str] = None
+        id: int,
+        text: str,
+        project: Optional[str] = None,
+        organization: Optional[str] = None,
     ) -> str:
         """
         Adds a new comment to a work item.
@@ -217,13 +231,15 @@ def register_tools(mcp) -> None:
             text: The text of the comment. You can provide content in HTML, Markdown, or plain text format. HTML content is preserved as-is, Markdown is automatically converted to HTML, and plain text has line breaks converted to HTML break tags for proper display in Azure DevOps.
             project: Optional project name. If not provided, will be
                 determined from the work item.
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             Formatted string containing confirmation and the added comment with
             author information and timestamp
         """
         try:
-            wit_client = get_work_item_client()
+            wit_client = get_work_item_client(organization)
             return _add_work_item_comment_impl(id, text, wit_client, project)
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
@@ -5,19 +5,43 @@ This module provides MCP tools for creating work items.
 """
 
 import os
-from typing import Any, Dict, Optional
-
-from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
-from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
+from mcp_azure_devops.features.teams.common import get_work_client
+from mcp_azure_devops.features.teams.iterations import (
+    is_iteration_shortcut,
+    resolve_iteration_shortcut,
+)
+from mcp_azure_devops.features.work_items.cache import invalidate_work_items
+from mcp_azure_devops.features.work_items.classification import (
+    get_classification_tree,
+)
 from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
     get_work_item_client,
 )
 from mcp_azure_devops.features.work_items.formatting import format_work_item
+from mcp_azure_devops.features.work_items.identities import resolve_identity
+from mcp_azure_devops.features.work_items.metadata import (
+    forget_work_item_type,
+    get_work_item_project_and_type,
+)
+from mcp_azure_devops.features.work_items.templates import get_template
 from mcp_azure_devops.features.work_items.tools.utils import (
     sanitize_description_html,
 )
+from mcp_azure_devops.features.work_items.validation import (
+    find_field_problems,
+)
+from mcp_azure_devops.utils.azure_client import (
+    get_client_organization,
+    get_core_client,
+    get_identity_client,
+    get_work_item_tracking_process_client,
+)
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
 
 
 def _build_field_document(
@@ -33,6 +57,8 @@ def _build_field_document(
     Returns:
         List of JsonPatchOperation objects
     """
+    from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation
+
     document = []
 
     for field_name, field_value in fields.items():
@@ -50,13 +76,21 @@ def _build_field_document(
     return document
 
 
-def _get_organization_url() -> str:
+def _get_organization_url(wit_client: Any = None) -> str:
     """
-    Get the Azure DevOps organization URL from environment variables.
+    Get the URL of the organization work items are linked in.
+
+    Args:
+        wit_client: Optional client whose organization is used, so links
+            made for another organization point into it
 
     Returns:
-        Organization URL string
+        Organization URL string; from AZURE_DEVOPS_ORGANIZATION_URL if the
+        client does not name one
     """
+    base_url = getattr(getattr(wit_client, "config", None), "base_url", None)
+    if isinstance(base_url, str) and base_url:
+        return base_url.rstrip("/")
     return os.environ.get("AZURE_DEVOPS_ORGANIZATION_URL", "").rstrip("/")
 
 
@@ -74,6 +108,7 @@ def _build_link_document(target_id: int, link_type: str, org_url: str) -> list:
     Returns:
         List of JsonPatchOperation objects
     """
+    from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation
 
     return [
         JsonPatchOperation(
@@ -91,7 +126,7 @@ def _create_work_item_impl(
     fields: Dict[str, Any],
     project: str,
     work_item_type: str,
-    wit_client: WorkItemTrackingClient,
+    wit_client: "WorkItemTrackingClient",
     parent_id: Optional[int] = None,
     acceptance_criteria: Optional[str] = None,
     related_ids: Optional[list[int]] = None,
@@ -123,6 +158,8 @@ def _create_work_item_impl(
     new_work_item = wit_client.create_work_item(
         document=document, project=project, type=work_item_type
     )
+    # A new work item may match any cached query
+    invalidate_work_items(organization=get_client_organization(wit_client))
 
     # If acceptance criteria is provided, add it in a separate update
     if acceptance_criteria:
@@ -142,7 +179,7 @@ def _create_work_item_impl(
 
     # If parent_id is provided, establish parent-child relationship
     try:
-        org_url = _get_organization_url()
+        org_url = _get_organization_url(wit_client)
         # Parent link
         if parent_id:
             parent_id = int(parent_id)  # Ensure integer conversion
@@ -190,10 +227,92 @@ def _create_work_item_impl(
     return format_work_item(new_work_item)
 
 
+def _create_work_item_from_template_impl(
+    team_context: Dict[str, Any],
+    template_id: str,
+    wit_client: "WorkItemTrackingClient",
+    overrides: Optional[Dict[str, Any]] = None,
+    parent_id: Optional[int] = None,
+    organization: Optional[str] = None,
+) -> str:
+    """
+    Implementation of creating a work item from a template.
+
+    The template's field values, the overrides and the parent link go into
+    one create request; the template itself comes from the cache once it
+    has been fetched.
+
+    Args:
+        team_context: Dictionary with project, project_id, team and
+            team_id keys of the team owning the template
+        template_id: The ID of the template
+        wit_client: Work item tracking client
+        overrides: Optional field name/value pairs replacing or adding to
+            the template's values
+        parent_id: Optional ID of parent work item for hierarchy
+        organization: Optional Azure DevOps organization name
+
+    Returns:
+        Formatted string containing the created work item details
+    """
+    template = get_template(wit_client, team_context, template_id)
+    if not template:
+        return f"Template with ID '{template_id}' not found."
+
+    project = team_context.get("project") or team_context.get("project_id")
+    if not project:
+        return "Error: team_context must include project or project_id"
+
+    fields = dict(template.fields or {})
+    for field_name, field_value in (overrides or {}).items():
+        fields[_ensure_system_prefix(field_name)] = field_value
+
+    if not fields.get("System.Title"):
+        return "Error: Title is required for work item creation"
+
+    description = fields.get("System.Description")
+    if isinstance(description, str) and description:
+        fields["System.Description"] = sanitize_description_html(description)
+
+    # Shortcuts in a team's template are relative to that team
+    _resolve_iteration_path(
+        fields,
+        project,
+        organization,
+        team_context.get("team") or team_context.get("team_id"),
+    )
+    _preflight_check(
+        fields,
+        project,
+        template.work_item_type_name,
+        wit_client,
+        organization,
+    )
+
+    document = _build_field_document(fields)
+    if parent_id:
+        document.extend(
+            _build_link_document(
+                target_id=int(parent_id),
+                link_type="System.LinkTypes.Hierarchy-Reverse",
+                org_url=_get_organization_url(wit_client),
+            )
+        )
+
+    new_work_item = wit_client.create_work_item(
+        document=document,
+        project=project,
+        type=template.work_item_type_name,
+    )
+    # A new work item may match any cached query
+    invalidate_work_items(organization=get_client_organization(wit_client))
+    return format_work_item(new_work_item)
+
+
 def _update_work_item_impl(
     id: int,
     fields: Dict[str, Any],
-    wit_client: WorkItemTrackingClient,
+    wit_client: "WorkItemTrackingClient",
     project: Optional[str] = None,
     acceptance_criteria: Optional[str] = None,
     related_ids: Optional[list[int]] = None,
@@ -225,7 +344,28 @@ def _update_work_item_impl(
     Returns:
         Formatted string containing the updated work item details
     """
+    from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation
+
     document = _build_field_document(fields, "replace")
+    affected_ids = [
+        id,
+        *(related_ids or []),
+        *(remove_related_ids or []),
+        *(tested_by_ids or []),
+        *(remove_tested_by_ids or []),
+    ]
+
+    def update(patch):
+        # Invalidate after each write the server accepts: a rejected update
+        # leaves the cache valid, and writes made before a later failure
+        # are not left stale
+        updated = wit_client.update_work_item(
+            document=patch, id=id, project=project
+        )
+        invalidate_work_items(
+            affected_ids, get_client_organization(wit_client)
+        )
+        return updated
 
     # If acceptance criteria is provided, add it to the document
     if acceptance_criteria:
@@ -240,16 +380,16 @@ def _update_work_item_impl(
 
     # Update the work item only if there are fields to update
     if document:
-        updated_work_item = wit_client.update_work_item(
-            document=document, id=id, project=project
-        )
+        updated_work_item = update(document)
+        if "System.TeamProject" in fields or "System.WorkItemType" in fields:
+            forget_work_item_type(wit_client, id)
     else:
         # If only relationships are being modified, we need to get the work item first
         updated_work_item = wit_client.get_work_item(id, project=project)
 
     # Handle related links (add)
     if related_ids:
-        org_url = _get_organization_url()
+        org_url = _get_organization_url(wit_client)
         for related_id in related_ids:
             related_id = int(related_id)  # Ensure integer conversion
             related_document = _build_link_document(
@@ -257,12 +397,10 @@ def _update_work_item_impl(
                 link_type="System.LinkTypes.Related",
                 org_url=org_url,
             )
-            updated_work_item = wit_client.update_work_item(
-                document=related_document, id=id, project=project
-            )
+            updated_work_item = update(related_document)
     # Handle related links (remove)
     if remove_related_ids:
-        org_url = _get_organization_url()
+        org_url = _get_organization_url(wit_client)
         for related_id in remove_related_ids:
             related_id = int(related_id)  # Ensure integer conversion
             remove_document = [
@@ -271,12 +409,10 @@ def _update_work_item_impl(
                     path=f"/relations/{_find_relation_index(updated_work_item, related_id, org_url)}",
                 )
             ]
-            updated_work_item = wit_client.update_work_item(
-                document=remove_document, id=id, project=project
-            )
+            updated_work_item = update(remove_document)
     # Handle tested by links (add)
     if tested_by_ids:
-        org_url = _get_organization_url()
+        org_url = _get_organization_url(wit_client)
         for tested_by_id in tested_by_ids:
             tested_by_id = int(tested_by_id)  # Ensure integer conversion
             tested_by_document = _build_link_document(
@@ -284,12 +420,10 @@ def _update_work_item_impl(
                 link_type="Microsoft.VSTS.Common.TestedBy-Forward",
                 org_url=org_url,
             )
-            updated_work_item = wit_client.update_work_item(
-                document=tested_by_document, id=id, project=project
-            )
+            updated_work_item = update(tested_by_document)
     # Handle tested by links (remove)
     if remove_tested_by_ids:
-        org_url = _get_organization_url()
+        org_url = _get_organization_url(wit_client)
         for tested_by_id in remove_tested_by_ids:
             tested_by_id = int(tested_by_id)  # Ensure integer conversion
             remove_document = [
@@ -298,17 +432,19 @@ def _update_work_item_impl(
                     path=f"/relations/{_find_tested_by_relation_index(updated_work_item, tested_by_id, org_url)}",
                 )
             ]
-            updated_work_item = wit_client.update_work_item(
-                document=remove_document, id=id, project=project
-            )
+            updated_work_item = update(remove_document)
     return format_work_item(updated_work_item)
 
 
-# Helper to find the index of a related link
+# Helper to find the index of a related link; organization URLs are not
+# case sensitive
 def _find_relation_index(work_item, related_id, org_url):
     url = f"{org_url}/_apis/wit/workItems/{related_id}"
     for idx, rel in enumerate(getattr(work_item, "relations", []) or []):
-        if rel.rel == "System.LinkTypes.Related" and rel.url == url:
+        if (
+            rel.rel == "System.LinkTypes.Related"
+            and (rel.url or "").casefold() == url.casefold()
+        ):
             return idx
     raise Exception(f"Related link to work item {related_id} not found.")
 
@@ -317,7 +453,10 @@ def _find_relation_index(work_item, related_id, org_url):
 def _find_tested_by_relation_index(work_item, tested_by_id, org_url):
     url = f"{org_url}/_apis/wit/workItems/{tested_by_id}"
     for idx, rel in enumerate(getattr(work_item, "relations", []) or []):
-        if rel.rel == "Microsoft.VSTS.Common.TestedBy-Forward" and rel.url == url:
+        if (
+            rel.rel == "Microsoft.VSTS.Common.TestedBy-Forward"
+            and (rel.url or "").casefold() == url.casefold()
+        ):
             return idx
     raise Exception(f"TestedBy link to work item {tested_by_id} not found.")
 
@@ -326,7 +465,7 @@ def _add_link_to_work_item_impl(
     source_id: int,
     target_id: int,
     link_type: str,
-    wit_client: WorkItemTrackingClient,
+    wit_client: "WorkItemTrackingClient",
     project: Optional[str] = None,
 ) -> str:
     """
@@ -347,7 +486,7 @@ def _add_link_to_work_item_impl(
         Formatted string containing the updated work item details
     """
     # Get organization URL from environment
-    org_url = _get_organization_url()
+    org_url = _get_organization_url(wit_client)
 
     # Ensure IDs are integers
     source_id = int(source_id)
@@ -360,6 +499,9 @@ def _add_link_to_work_item_impl(
     updated_work_item = wit_client.update_work_item(
         document=link_document, id=source_id, project=project
     )
+    invalidate_work_items(
+        [source_id, target_id], get_client_organization(wit_client)
+    )
 
     return format_work_item(updated_work_item)
 
@@ -383,7 +525,8 @@ def _prepare_standard_fields(
         title: The title of the work item
         description: Optional description of the work item
         state: Optional initial state for the work item
-        assigned_to: Optional user email to assign the work item to
+        assigned_to: Optional display name or email of the user to
+            assign the work item to
         iteration_path: Optional iteration path for the work item
         area_path: Optional area path for the work item
         story_points: Optional story points value
@@ -427,6 +570,203 @@ def _prepare_standard_fields(
     return fields
 
 
+def _resolve_iteration_path(
+    fields: Dict[str, Any],
+    project: Optional[str],
+    organization: Optional[str] = None,
+    team: Optional[str] = None,
+) -> None:
+    """
+    Replace an iteration shortcut such as @current with its iteration path.
+
+    Shortcuts are resolved through the cached iteration index of the team,
+    so they cost no requests once the index is warm.
+
+    Args:
+        fields: Dictionary of field name/value pairs, updated in place
+        project: The project name or ID the shortcut is relative to
+        organization: Optional Azure DevOps organization name
+        team: Optional team name or ID the shortcut is relative to;
+            defaults to the project's default team
+
+    Raises:
+        ValueError: If there is no project or the shortcut names no
+            iteration
+    """
+    value = fields.get("System.IterationPath")
+    if not isinstance(value, str) or not is_iteration_shortcut(value):
+        return
+    if not project:
+        raise ValueError(
+            f"A project is required to resolve iteration path '{value}'"
+        )
+    fields["System.IterationPath"] = resolve_iteration_shortcut(
+        get_work_client(organization), project, value, team
+    )
+
+
+def _validate_classification_paths(
+    fields: Dict[str, Any],
+    project: Optional[str],
+    wit_client: "WorkItemTrackingClient",
+) -> None:
+    """
+    Check area and iteration paths against the project's cached trees.
+
+    Valid paths are rewritten with the spelling used in the tree. A path
+    missing from a cached tree is looked up again in a freshly fetched
+    tree, as the node may have been added since. Paths are left to the
+    server when there is no project or the tree cannot be fetched.
+
+    Args:
+        fields: Dictionary of field name/value pairs, updated in place
+        project: The project name or ID
+        wit_client: Work item tracking client
+
+    Raises:
+        ValueError: If a path does not exist, listing every bad path
+    """
+    if not project:
+        return
+    problems = []
+    for field, structure in (
+        ("System.AreaPath", "area"),
+        ("System.IterationPath", "iteration"),
+    ):
+        path = fields.get(field)
+        if not isinstance(path, str) or not path.strip():
+            continue
+        try:
+            tree = get_classification_tree(wit_client, project, structure)
+            canonical = tree.canonical(path)
+            if canonical is None:
+                tree = get_classification_tree(
+                    wit_client, project, structure, refresh=True
+                )
+                canonical = tree.canonical(path)
+        except Exception:
+            continue
+        if canonical is not None:
+            fields[field] = canonical
+            continue
+        problem = f"{structure.capitalize()} path '{path}' does not exist"
+        suggestions = tree.suggestions(path)
+        if suggestions:
+            problem += "; did you mean " + ", ".join(suggestions)
+        problems.append(problem)
+    if problems:
+        raise ValueError("\n".join(problems))
+
+
+def _update_target(
+    id: int,
+    fields: Dict[str, Any],
+    project: Optional[str],
+    work_item_type: Optional[str],
+    wit_client: "WorkItemTrackingClient",
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Find the project and work item type an update is validated against.
+
+    Whatever the caller did not name is read from the work item itself,
+    through a per work item cache. A type or project set by the update
+    takes precedence, since the values must suit the item it becomes.
+
+    Args:
+        id: The ID of the work item to update
+        fields: Dictionary of field name/value pairs to update
+        project: Optional project name or ID given by the caller
+        work_item_type: Optional work item type name given by the caller
+        wit_client: Work item tracking client
+
+    Returns:
+        Tuple containing (project, work_item_type), either None if it
+        cannot be found, in which case the server checks the values
+    """
+    new_project = fields.get("System.TeamProject")
+    new_type = fields.get("System.WorkItemType")
+    project = new_project if isinstance(new_project, str) else project
+    work_item_type = new_type if isinstance(new_type, str) else work_item_type
+    if not fields or (project and work_item_type):
+        return project, work_item_type
+    try:
+        item_project, item_type = get_work_item_project_and_type(
+            wit_client, id
+        )
+    except Exception:
+        # A missing work item is reported by the update itself
+        return project, work_item_type
+    return project or item_project, work_item_type or item_type
+
+
+def _preflight_check(
+    fields: Dict[str, Any],
+    project: Optional[str],
+    work_item_type: Optional[str],
+    wit_client: "WorkItemTrackingClient",
+    organization: Optional[str] = None,
+    creating: bool = True,
+) -> None:
+    """
+    Check fields against cached metadata before a write is sent.
+
+    Area and iteration paths are checked against the project's trees, the
+    assignee is resolved to a unique identity and, when the work item type
+    is known, values are checked against its process metadata.
+
+    Args:
+        fields: Dictionary of field name/value pairs, updated in place with
+            canonical spellings
+        project: The project name or ID
+        work_item_type: Optional work item type name
+        wit_client: Work item tracking client
+        organization: Optional Azure DevOps organization name
+        creating: Whether the fields create a work item
+
+    Raises:
+        ValueError: Listing every problem found
+    """
+    problems = []
+    try:
+        _validate_classification_paths(fields, project, wit_client)
+    except ValueError as e:
+        problems.append(str(e))
+    assigned_to = fields.get("System.AssignedTo")
+    if isinstance(assigned_to, str) and assigned_to.strip():
+        try:
+            fields["System.AssignedTo"] = resolve_identity(
+                get_identity_client(organization), assigned_to
+            )
+        except ValueError as e:
+            problems.append(str(e))
+        except Exception:
+            # Without the identities API the server resolves the name
+            pass
+    if project and work_item_type:
+        try:
+            core_client = get_core_client(organization)
+            process_client = get_work_item_tracking_process_client(
+                organization
+            )
+        except Exception:
+            # Without the metadata clients the server checks the values
+            core_client = process_client = None
+        if core_client and process_client:
+            problems.extend(
+                find_field_problems(
+                    fields,
+                    project,
+                    work_item_type,
+                    wit_client,
+                    core_client,
+                    process_client,
+                    creating=creating,
+                )
+            )
+    if problems:
+        raise ValueError("\n".join(problems))
+
+
 def _ensure_system_prefix(field_name: str) -> str:
     """
     Ensure field names have appropriate prefix.
@@ -491,6 +831,7 @@ def register_tools(mcp) -> None:
         tags: Optional[str] = None,
         acceptance_criteria: Optional[str] = None,
         tested_by_ids: Optional[list[int]] = None,
+        organization: Optional[str] = None,
     ) -> str:
         """
         Creates a new work item in Azure DevOps.
@@ -514,15 +855,21 @@ def register_tools(mcp) -> None:
                 to set
             description: Optional description of the work item. You can provide content in HTML, Markdown, or plain text format. HTML content is preserved as-is, Markdown is automatically converted to HTML, and plain text has line breaks converted to HTML break tags for proper display in Azure DevOps.
             state: Optional initial state for the work item
-            assigned_to: Optional user email to assign the work item to
+            assigned_to: Optional display name or email of the user to
+                assign the work item to; resolved to a unique identity
             parent_id: Optional ID of parent work item for hierarchy
-            iteration_path: Optional iteration path for the work item
+            iteration_path: Optional iteration path for the work item, or
+                @current, @next, @previous or @CurrentIteration +/- N for a
+                sprint of the project's default team; @current('Team')
+                uses another team's sprints
             area_path: Optional area path for the work item
             story_points: Optional story points value
             priority: Optional priority value
             tags: Optional tags as comma-separated string
             acceptance_criteria: Optional acceptance criteria. You can provide content in HTML, Markdown, or plain text format. HTML content is preserved as-is, Markdown is automatically converted to HTML, and plain text has line breaks converted to HTML break tags for proper display in Azure DevOps.
             tested_by_ids: Optional list of test case work item IDs to link (integers). Example: [502199, 502200].
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             Formatted string containing the created work item details including
@@ -530,7 +877,7 @@ def register_tools(mcp) -> None:
             as markdown
         """
         try:
-            wit_client = get_work_item_client()
+            wit_client = get_work_item_client(organization)
 
             # Process description if provided
             if description:
@@ -558,6 +905,11 @@ def register_tools(mcp) -> None:
             if not all_fields.get("System.Title"):
                 return "Error: Title is required for work item creation"
 
+            _resolve_iteration_path(all_fields, project, organization)
+            _preflight_check(
+                all_fields, project, work_item_type, wit_client, organization
+            )
+
             return _create_work_item_impl(
                 fields=all_fields,
                 project=project,
@@ -574,6 +926,64 @@ def register_tools(mcp) -> None:
         except Exception as e:
             return f"Error creating work item: {str(e)}"
 
+    @mcp.tool()
+    def create_work_item_from_template(
+        team_context: dict,
+        template_id: str,
+        overrides: Optional[Dict[str, Any]] = None,
+        parent_id: Optional[int] = None,
+        organization: Optional[str] = None,
+    ) -> str:
+        """
+        Creates a new work item from a team's work item template.
+
+        Use this tool when you need to:
+        - Create a work item pre-filled the way the team's template says
+        - Change or add a few fields on top of a template's values
+        - Avoid copying template fields into create_work_item by hand
+
+        The template's fields and the overrides are merged into a single
+        create request, with overrides taking precedence; the work item
+        type is the template's. @Me is assigned to the calling user and
+        iteration shortcuts such as @CurrentIteration are relative to the
+        template's team.
+
+        IMPORTANT: The work item will be created immediately and visible to all
+        users with access to the team's project.
+
+        Args:
+            team_context: Dictionary containing team information with keys:
+                project: Project name (Optional if project_id is provided)
+                project_id: Project ID (Optional if project is provided)
+                team: Team name (Optional if team_id is provided)
+                team_id: Team ID (Optional if team is provided)
+            template_id: The ID of the template (see get_work_item_templates)
+            overrides: Optional dictionary of field name/value pairs, e.g.
+                {"title": "Login fails", "System.Tags": "auth"}; short names
+                such as title, state or priority are accepted, and
+                iteration_path may be a shortcut such as @current
+            parent_id: Optional ID of parent work item for hierarchy
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
+
+        Returns:
+            Formatted string containing the created work item details
+        """
+        try:
+            wit_client = get_work_item_client(organization)
+            return _create_work_item_from_template_impl(
+                team_context,
+                template_id,
+                wit_client,
+                overrides,
+                parent_id,
+                organization,
+            )
+        except AzureDevOpsClientError as e:
+            return f"Error: {str(e)}"
+        except Exception as e:
+            return f"Error creating work item: {str(e)}"
+
     @mcp.tool()
     def update_work_item(
         id: int,
@@ -593,6 +1003,8 @@ def register_tools(mcp) -> None:
         remove_related_ids: Optional[list[int]] = None,
         tested_by_ids: Optional[list[int]] = None,
         remove_tested_by_ids: Optional[list[int]] = None,
+        work_item_type: Optional[str] = None,
+        organization: Optional[str] = None,
     ) -> str:
         """
         Modifies an existing work item's fields and properties.
@@ -617,8 +1029,10 @@ def register_tools(mcp) -> None:
             title: Optional new title for the work item
             description: Optional new description. You can provide content in HTML, Markdown, or plain text format. HTML content is preserved as-is, Markdown is automatically converted to HTML, and plain text has line breaks converted to HTML break tags for proper display in Azure DevOps.
             state: Optional new state
-            assigned_to: Optional user email to assign to
-            iteration_path: Optional new iteration path
+            assigned_to: Optional display name or email of the user to
+                assign to; resolved to a unique identity
+            iteration_path: Optional new iteration path, or an iteration
+                shortcut such as @current or @next (requires project)
             area_path: Optional new area path
             story_points: Optional new story points value
             priority: Optional new priority value
@@ -633,13 +1047,19 @@ def register_tools(mcp) -> None:
                           Creates a TestedBy-Forward link from this work item to the test case.
             remove_tested_by_ids: Optional list of test case work item IDs to unlink (integers). Example: [502199, 502200]
                                  Each ID should be a positive integer representing test case work items in Azure DevOps.
+            work_item_type: Optional type of the work item, e.g. "Bug";
+                with project, the new values are checked against the
+                type's required fields, allowed values, field types and
+                states before the update is sent
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             Formatted string containing the updated work item details with
             all current field values, formatted as markdown
         """
         try:
-            wit_client = get_work_item_client()
+            wit_client = get_work_item_client(organization)
 
             # Process description if provided
             if description:
@@ -675,6 +1095,17 @@ def register_tools(mcp) -> None:
             ):
                 return "Error: At least one field or relationship must be specified for update"
 
+            _resolve_iteration_path(all_fields, project, organization)
+            _preflight_check(
+                all_fields,
+                *_update_target(
+                    id, all_fields, project, work_item_type, wit_client
+                ),
+                wit_client,
+                organization,
+                creating=False,
+            )
+
             return _update_work_item_impl(
                 id=id,
                 fields=all_fields,
@@ -697,6 +1128,7 @@ def register_tools(mcp) -> None:
         parent_id: int,
         child_id: int,
         project: Optional[str] = None,
+        organization: Optional[str] = None,
     ) -> str:
         """
         Adds a parent-child relationship between two work items.
@@ -716,13 +1148,15 @@ def register_tools(mcp) -> None:
             parent_id: ID of the parent work item
             child_id: ID of the child work item
             project: Optional project name or ID
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             Formatted string containing the updated child work item details
             showing the new parent relationship, formatted as markdown
         """
         try:
-            wit_client = get_work_item_client()
+            wit_client = get_work_item_client(organization)
 
             # Ensure IDs are integers
             parent_id = int(parent_id)
@@ -0,0 +1,292 @@
+"""
+History operations for Azure DevOps work items.
+
+This module provides MCP tools for reading the revision history of work
+items as compact change records.
+"""
+
+from collections import deque
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from mcp_azure_devops.features.work_items.common import (
+    AzureDevOpsClientError,
+    get_work_item_client,
+    parse_watermark,
+)
+from mcp_azure_devops.features.work_items.formatting import (
+    HTML_FIELDS,
+    _format_field_value,
+)
+from mcp_azure_devops.utils.html_text import html_to_text
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+    from azure.devops.v7_1.work_item_tracking.models import WorkItemUpdate
+
+# The updates endpoint returns at most 200 updates per request.
+UPDATES_PAGE_SIZE = 200
+
+# Maximum length of a single old or new value in a change record
+MAX_VALUE_CHARS = 200
+
+# Bookkeeping fields that change on every revision
+_NOISE_FIELDS = frozenset(
+    {
+        "System.Rev",
+        "System.ChangedDate",
+        "System.ChangedBy",
+        "System.AuthorizedDate",
+        "System.AuthorizedAs",
+        "System.RevisedDate",
+        "System.PersonId",
+        "System.Watermark",
+    }
+)
+
+
+def _iter_updates(
+    item_id: int,
+    wit_client: "WorkItemTrackingClient",
+    project: Optional[str] = None,
+    page_size: int = UPDATES_PAGE_SIZE,
+) -> Iterator["WorkItemUpdate"]:
+    """
+    Lazily page through the updates of a work item, oldest first.
+
+    Only one page is held in memory at a time.
+
+    Args:
+        item_id: The work item ID
+        wit_client: Work item tracking client
+        project: Optional project name or ID
+        page_size: Number of updates requested per call
+
+    Yields:
+        Work item updates
+    """
+    skip = 0
+    while True:
+        page = wit_client.get_updates(
+            item_id, project=project, top=page_size, skip=skip
+        )
+        if not page:
+            return
+        yield from page
+        if len(page) < page_size:
+            return
+        skip += len(page)
+
+
+def _update_changed_date(update: "WorkItemUpdate") -> Optional[datetime]:
+    """
+    Get the time a work item update was made.
+
+    Args:
+        update: Work item update
+
+    Returns:
+        The change time, or None if the update does not carry one
+    """
+    changed = (update.fields or {}).get("System.ChangedDate")
+    value = getattr(changed, "new_value", None)
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            return parse_watermark(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _format_history_value(field_name: str, value) -> str:
+    """
+    Format an old or new field value for a change record.
+
+    Args:
+        field_name: Reference name of the field
+        value: Raw field value
+
+    Returns:
+        Short single-line representation of the value
+    """
+    if value is None or value == "":
+        return "(empty)"
+    if field_name in HTML_FIELDS and isinstance(value, str):
+        text = html_to_text(value, MAX_VALUE_CHARS)
+    else:
+        text = _format_field_value(value)
+    text = " ".join(text.split())
+    if len(text) > MAX_VALUE_CHARS:
+        text = text[:MAX_VALUE_CHARS].rstrip() + " …"
+    return text
+
+
+def _format_update(
+    update: "WorkItemUpdate", fields: Optional[set[str]] = None
+) -> Optional[str]:
+    """
+    Format a work item update as a compact change record.
+
+    Args:
+        update: Work item update
+        fields: Optional field reference names to include. When omitted,
+            every field except revision bookkeeping is included.
+
+    Returns:
+        The change record, or None if nothing of interest changed
+    """
+    changes = []
+    for field_name, change in sorted((update.fields or {}).items()):
+        if fields is not None:
+            if field_name not in fields:
+                continue
+        elif field_name in _NOISE_FIELDS:
+            continue
+        old_value = getattr(change, "old_value", None)
+        new_value = getattr(change, "new_value", None)
+        changes.append(
+            f"  - {field_name}: "
+            f"{_format_history_value(field_name, old_value)} → "
+            f"{_format_history_value(field_name, new_value)}"
+        )
+
+    relations = update.relations
+    if relations is not None and fields is None:
+        for label, links in (
+            ("added", relations.added),
+            ("removed", relations.removed),
+            ("updated", relations.updated),
+        ):
+            for link in links or []:
+                changes.append(f"  - Link {label}: {link.rel} {link.url}")
+
+    if not changes:
+        return None
+
+    changed_date = _update_changed_date(update)
+    when = changed_date.isoformat() if changed_date else "unknown date"
+    author = "Unknown"
+    if update.revised_by is not None:
+        author = (
+            getattr(update.revised_by, "display_name", None)
+            or getattr(update.revised_by, "unique_name", None)
+            or author
+        )
+    return "\n".join([f"- Rev {update.rev} · {when} · {author}", *changes])
+
+
+def _get_work_item_history_impl(
+    item_id: int,
+    wit_client: "WorkItemTrackingClient",
+    since: Optional[str] = None,
+    fields: Optional[list[str]] = None,
+    project: Optional[str] = None,
+    max_records: int = 100,
+) -> str:
+    """
+    Implementation of work item history retrieval.
+
+    Updates are streamed page by page and only the last ``max_records``
+    change records are kept, so memory stays bounded for work items with
+    thousands of revisions.
+
+    Args:
+        item_id: The work item ID
+        wit_client: Work item tracking client
+        since: Optional ISO 8601 timestamp; earlier changes are skipped
+        fields: Optional field reference names to report changes for
+        project: Optional project name or ID
+        max_records: Maximum number of change records to return
+
+    Returns:
+        Formatted string containing the change records, oldest first
+    """
+    since_date = None
+    if since:
+        try:
+            since_date = parse_watermark(since)
+        except ValueError:
+            return f"Error: Invalid 'since' timestamp '{since}'."
+
+    field_filter = set(fields) if fields else None
+    records: deque[str] = deque(maxlen=max_records)
+    skipped = 0
+    for update in _iter_updates(item_id, wit_client, project):
+        if since_date is not None:
+            changed_date = _update_changed_date(update)
+            if changed_date is None or changed_date <= since_date:
+                continue
+        record = _format_update(update, field_filter)
+        if record is None:
+            continue
+        if len(records) == max_records:
+            skipped += 1
+        records.append(record)
+
+    if not records:
+        scope = f" since {since}" if since else ""
+        return f"No matching changes found for work item {item_id}{scope}."
+
+    header = [f"# History of Work Item {item_id}"]
+    if skipped:
+        header.append(
+            f"Showing the latest {len(records)} changes; {skipped} earlier "
+            "changes omitted. Use 'since' to narrow the range."
+        )
+    return "\n".join(header) + "\n\n" + "\n".join(records)
+
+
+def register_tools(mcp) -> None:
+    """
+    Register work item history tools with the MCP server.
+
+    Args:
+        mcp: The FastMCP server instance
+    """
+
+    @mcp.tool()
+    def get_work_item_history(
+        id: int,
+        since: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+        project: Optional[str] = None,
+        max_records: Optional[int] = None,
+        organization: Optional[str] = None,
+    ) -> str:
+        """
+        Retrieves the change history of a work item as compact records.
+
+        Use this tool when you need to:
+        - Find out when a work item moved to a particular state
+        - See who changed an estimate, assignee or other field
+        - Review how a work item evolved over time
+        - Audit link changes on a work item
+
+        Args:
+            id: The work item ID (integer). Example: 502199
+            since: Optional ISO 8601 timestamp; only changes made after it
+                are returned. Example: "2024-05-01T00:00:00Z"
+            fields: Optional list of field reference names to report, e.g.
+                ["System.State", "Microsoft.VSTS.Scheduling.StoryPoints"].
+                When omitted, all field and link changes are reported.
+            project: Optional project name or ID
+            max_records: Maximum number of change records (default: 100);
+                the most recent changes are kept
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
+
+        Returns:
+            One record per revision with its number, date and author,
+            followed by each changed field as "old → new", oldest first
+        """
+        try:
+            wit_client = get_work_item_client(organization)
+            return _get_work_item_history_impl(
+                id, wit_client, since, fields, project, max_records or 100
+            )
+        except AzureDevOpsClientError as e:
+            return f"Error: {str(e)}"
+        except Exception as e:
+            return f"Error retrieving history for work item {id}: {str(e)}"
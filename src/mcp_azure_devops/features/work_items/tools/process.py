@@ -4,6 +4,9 @@ Process operations for Azure DevOps.
 This module provides MCP tools for retrieving process information.
 """
 
+from typing import Optional
+
+from mcp_azure_devops.features.projects.catalog import get_project_details
 from mcp_azure_devops.utils.azure_client import (
     get_core_client,
     get_work_item_tracking_process_client,
@@ -19,15 +22,15 @@ def _format_table(headers, rows):
     return "\n".join(result)
 
 
-def _get_project_process_id_impl(project: str) -> str:
+def _get_project_process_id_impl(
+    project: str, organization: Optional[str] = None
+) -> str:
     """Implementation of project process ID retrieval."""
     try:
         # Get project details with process information
-        core_client = get_core_client()
-        project_details = core_client.get_project(
-            project, include_capabilities=True
-        )
-        process_template = project_details.capabilities.get(
+        core_client = get_core_client(organization)
+        project_details = get_project_details(core_client, project)
+        process_template = (project_details.capabilities or {}).get(
             "processTemplate", {}
         )
 
@@ -46,10 +49,12 @@ def _get_project_process_id_impl(project: str) -> str:
         return f"Error retrieving process ID for project '{project}': {str(e)}"
 
 
-def _get_process_details_impl(process_id: str) -> str:
+def _get_process_details_impl(
+    process_id: str, organization: Optional[str] = None
+) -> str:
     """Implementation of process details retrieval."""
     try:
-        process_client = get_work_item_tracking_process_client()
+        process_client = get_work_item_tracking_process_client(organization)
         process = process_client.get_process_by_its_id(process_id)
 
         if not process:
@@ -97,10 +102,10 @@ def _get_process_details_impl(process_id: str) -> str:
         )
 
 
-def _list_processes_impl() -> str:
+def _list_processes_impl(organization: Optional[str] = None) -> str:
     """Implementation of processes list retrieval."""
     try:
-        process_client = get_work_item_tracking_process_client()
+        process_client = get_work_item_tracking_process_client(organization)
         processes = process_client.get_list_of_processes()
 
         if not processes:
@@ -111,9 +116,12 @@ def _list_processes_impl() -> str:
         headers = ["Name", "ID", "Reference Name", "Description", "Is Default"]
         rows = []
         for process in processes:
+            # ProcessInfo carries is_default directly; older models nest it
+            # under properties
+            properties = getattr(process, "properties", None)
             is_default = (
                 "Yes"
-                if getattr(process.properties, "is_default", False)
+                if getattr(properties or process, "is_default", False)
                 else "No"
             )
             row = (
@@ -139,7 +147,9 @@ def register_tools(mcp) -> None:
     """
 
     @mcp.tool()
-    def get_project_process_id(project: str) -> str:
+    def get_project_process_id(
+        project: str, organization: Optional[str] = None
+    ) -> str:
         """
         Gets the process ID associated with a project.
 
@@ -150,17 +160,21 @@ def register_tools(mcp) -> None:
 
         Args:
             project: Project ID or project name
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             Formatted information about the process including name and ID
         """
         try:
-            return _get_project_process_id_impl(project)
+            return _get_project_process_id_impl(project, organization)
         except Exception as e:
             return f"Error: {str(e)}"
 
     @mcp.tool()
-    def get_process_details(process_id: str) -> str:
+    def get_process_details(
+        process_id: str, organization: Optional[str] = None
+    ) -> str:
         """
         Gets detailed information about a specific process.
 
@@ -171,18 +185,20 @@ def register_tools(mcp) -> None:
 
         Args:
             process_id: The ID of the process
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             Detailed information about the process including properties and
             available work item types
         """
         try:
-            return _get_process_details_impl(process_id)
+            return _get_process_details_impl(process_id, organization)
         except Exception as e:
             return f"Error: {str(e)}"
 
     @mcp.tool()
-    def list_processes() -> str:
+    def list_processes(organization: Optional[str] = None) -> str:
         """
         Lists all available processes in the organization.
 
@@ -191,11 +207,15 @@ def register_tools(mcp) -> None:
         - Find process IDs for project creation or configuration
         - Check which process is set as the default
 
+        Args:
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
+
         Returns:
             A formatted table of all processes with names, IDs, and
             descriptions
         """
         try:
-            return _list_processes_impl()
+            return _list_processes_impl(organization)
         except Exception as e:
             return f"Error: {str(e)}"
@@ -4,20 +4,265 @@ Query operations for Azure DevOps work items.
 This module provides MCP tools for querying work items.
 """
 
-from typing import Optional
-
-from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
-from azure.devops.v7_1.work_item_tracking.models import Wiql
+import contextvars
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Optional
 
+from mcp_azure_devops.features.work_items.cache import (
+    cache_query_ids,
+    get_cached_query_ids,
+    get_query_snapshot,
+    save_query_snapshot,
+)
 from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
+    format_watermark,
     get_work_item_client,
+    parse_watermark,
+)
+from mcp_azure_devops.features.work_items.tools.read import (
+    _format_page,
+    _render_work_items,
+    cursor_owner,
+)
+from mcp_azure_devops.utils.azure_client import (
+    get_client_organization,
+    get_client_tenant,
+)
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+
+# The service refuses WIQL queries that match more than 20,000 work items.
+WIQL_RESULT_LIMIT = 20000
+# Number of partitioned queries run at the same time
+PARTITION_WORKERS = 8
+
+_WHERE_PATTERN = re.compile(r"\bwhere\b", re.IGNORECASE)
+_TAIL_PATTERN = re.compile(r"\b(order\s+by|asof|mode\s*\()", re.IGNORECASE)
+_ORDER_PATTERN = re.compile(
+    r"\border\s+by\s+(.*?)(?=\basof\b|\bmode\s*\(|$)",
+    re.IGNORECASE | re.DOTALL,
 )
-from mcp_azure_devops.features.work_items.formatting import format_work_item
+_ID_ORDER_PATTERN = re.compile(
+    r"\[?system\.id\]?(?:\s+(asc|desc))?", re.IGNORECASE
+)
+
+
+def _mask_literals(query: str) -> str:
+    """
+    Blank out string literals so keywords inside them are not matched.
+
+    Args:
+        query: The WIQL query string
+
+    Returns:
+        Query of the same length with literal contents replaced
+    """
+    masked = []
+    quote = None
+    for char in query:
+        if quote:
+            masked.append(char if char == quote else "_")
+            if char == quote:
+                quote = None
+        else:
+            masked.append(char)
+            if char in ("'", '"'):
+                quote = char
+    return "".join(masked)
+
+
+def _add_wiql_condition(query: str, condition: str) -> str:
+    """
+    Restrict a flat WIQL query with an additional condition.
+
+    Args:
+        query: The WIQL query string
+        condition: WIQL condition that must hold in addition to the query's
+            own WHERE clause
+
+    Returns:
+        The restricted query
+    """
+    masked = _mask_literals(query)
+    tail = _TAIL_PATTERN.search(masked)
+    end = tail.start() if tail else len(query)
+    where = _WHERE_PATTERN.search(masked, 0, end)
+
+    head, rest = query[:end].rstrip(), query[end:]
+    if where:
+        clause_start = where.end()
+        return (
+            f"{head[:clause_start]} ({head[clause_start:].strip()}) "
+            f"AND {condition} {rest}"
+        ).rstrip()
+    return f"{head} WHERE {condition} {rest}".rstrip()
+
+
+def _is_result_limit_error(error: Exception) -> bool:
+    """
+    Check whether a WIQL failure was caused by the result size limit.
+
+    Args:
+        error: Exception raised by query_by_wiql
+
+    Returns:
+        True if the query matched too many work items
+    """
+    message = str(error)
+    return "VS402337" in message or (
+        str(WIQL_RESULT_LIMIT) in message.replace(",", "")
+        and "exceed" in message.lower()
+    )
+
+
+def _run_wiql(
+    query: str, top: Optional[int], wit_client: "WorkItemTrackingClient"
+) -> list[int]:
+    """
+    Run a WIQL query and return the matching IDs.
+
+    Args:
+        query: The WIQL query string
+        top: Maximum number of results to return
+        wit_client: Work item tracking client
+
+    Returns:
+        Work item IDs in query order
+    """
+    from azure.devops.v7_1.work_item_tracking.models import Wiql
+
+    wiql_results = wit_client.query_by_wiql(Wiql(query=query), top=top)
+    return [int(res.id) for res in wiql_results.work_items or []]
+
+
+def _partition_order(query: str) -> bool:
+    """
+    Find the ID order in which partition results must be merged.
+
+    Args:
+        query: The flat WIQL query string
+
+    Returns:
+        True if the query orders by descending System.Id, False if it has
+        no ORDER BY clause or orders by ascending System.Id
+
+    Raises:
+        ValueError: If the query orders by other fields, which cannot be
+            merged across partitions
+    """
+    order = _ORDER_PATTERN.search(_mask_literals(query))
+    if not order:
+        return False
+    clause = order.group(1).strip()
+    by_id = _ID_ORDER_PATTERN.fullmatch(clause)
+    if not by_id:
+        raise ValueError(
+            f"The query matches more than {WIQL_RESULT_LIMIT} work items, "
+            f"so it is split into System.Id ranges, but its ORDER BY "
+            f"{clause} cannot be applied across those ranges. Narrow the "
+            "query, or order it by [System.Id] only."
+        )
+    return (by_id.group(1) or "").lower() == "desc"
+
+
+def _query_ids_partitioned(
+    query: str, top: int, wit_client: "WorkItemTrackingClient"
+) -> list[int]:
+    """
+    Run a WIQL query that exceeds the result limit in System.Id partitions.
+
+    No ID range wider than the result limit can exceed it, so the query is
+    split into such ranges up to the highest ID in the organization. The
+    ranges are queried concurrently, a batch at a time, in the query's ID
+    order, and no further batch is queried once top results are found.
+
+    Args:
+        query: The flat WIQL query string
+        top: Maximum number of results to return
+        wit_client: Work item tracking client
+
+    Returns:
+        Work item IDs matching the query
+
+    Raises:
+        ValueError: If the query orders by anything but System.Id
+    """
+    descending = _partition_order(query)
+    highest = _run_wiql(
+        "SELECT [System.Id] FROM WorkItems ORDER BY [System.Id] DESC",
+        1,
+        wit_client,
+    )
+    if not highest:
+        return []
+
+    ranges = [
+        (start, start + WIQL_RESULT_LIMIT)
+        for start in range(1, highest[0] + 1, WIQL_RESULT_LIMIT)
+    ]
+    if descending:
+        ranges.reverse()
+
+    def run_partition(bounds: tuple[int, int]) -> list[int]:
+        condition = f"[System.Id] >= {bounds[0]} AND [System.Id] < {bounds[1]}"
+        return _run_wiql(
+            _add_wiql_condition(query, condition),
+            min(top, WIQL_RESULT_LIMIT),
+            wit_client,
+        )
+
+    # Run partitions in the caller's context so their requests are
+    # attributed to the calling tool
+    context = contextvars.copy_context()
+
+    def run_in_context(bounds: tuple[int, int]) -> list[int]:
+        return context.copy().run(run_partition, bounds)
+
+    work_item_ids: list[int] = []
+    with ThreadPoolExecutor(max_workers=PARTITION_WORKERS) as executor:
+        for batch_start in range(0, len(ranges), PARTITION_WORKERS):
+            batch = ranges[batch_start : batch_start + PARTITION_WORKERS]
+            # map() yields in submission order, keeping the merge in ID order
+            for partition_ids in executor.map(run_in_context, batch):
+                work_item_ids.extend(partition_ids)
+            if len(work_item_ids) >= top:
+                break
+    return work_item_ids[:top]
+
+
+def _query_work_item_ids(
+    query: str, top: int, wit_client: "WorkItemTrackingClient"
+) -> list[int]:
+    """
+    Run a WIQL query, partitioning it if it exceeds the result limit.
+
+    Args:
+        query: The WIQL query string
+        top: Maximum number of results to return
+        wit_client: Work item tracking client
+
+    Returns:
+        Work item IDs matching the query
+    """
+    try:
+        return _run_wiql(query, top, wit_client)
+    except Exception as e:
+        is_link_query = "workitemlinks" in query.lower()
+        if is_link_query or not _is_result_limit_error(e):
+            raise
+    return _query_ids_partitioned(query, top, wit_client)
 
 
 def _query_work_items_impl(
-    query: str, top: int, wit_client: WorkItemTrackingClient
+    query: str,
+    top: int,
+    wit_client: "WorkItemTrackingClient",
+    max_items: Optional[int] = None,
+    max_chars: Optional[int] = None,
 ) -> str:
     """
     Implementation of query_work_items that operates with a client.
@@ -26,33 +271,162 @@ def _query_work_items_impl(
         query: The WIQL query string
         top: Maximum number of results to return
         wit_client: Work item tracking client
+        max_items: Maximum number of work items to render in one response
+        max_chars: Maximum size of the response in characters
 
     Returns:
         Formatted string containing work item details
     """
 
-    # Create the WIQL query
-    wiql = Wiql(query=query)
-
-    # Execute the query
-    wiql_results = wit_client.query_by_wiql(wiql, top=top).work_items
+    scope = (
+        get_client_organization(wit_client),
+        get_client_tenant(wit_client),
+    )
+    work_item_ids = get_cached_query_ids(query, top, *scope)
+    if work_item_ids is None:
+        work_item_ids = _query_work_item_ids(query, top, wit_client)
+        cache_query_ids(query, top, work_item_ids, *scope)
 
-    if not wiql_results:
+    if not work_item_ids:
         return "No work items found matching the query."
 
-    # Get the work items from the results
-    work_item_ids = [int(res.id) for res in wiql_results]
-    work_items = wit_client.get_work_items(
-        ids=work_item_ids, expand="all", error_policy="omit"
+    # Get the work items from the results, stopping at the response budget
+    formatted_results, remaining_ids = _render_work_items(
+        work_item_ids,
+        wit_client,
+        max_items=max_items,
+        max_chars=max_chars,
+    )
+
+    return _format_page(
+        formatted_results,
+        remaining_ids,
+        max_items=max_items,
+        max_chars=max_chars,
+        owner=cursor_owner(wit_client),
     )
 
-    # Use the standard formatting for all work items
-    formatted_results = []
-    for work_item in work_items:
-        if work_item:
-            formatted_results.append(format_work_item(work_item))
 
-    return "\n\n".join(formatted_results)
+# Fields returned by delta queries unless the caller asks for others
+DEFAULT_DELTA_FIELDS = [
+    "System.Id",
+    "System.Title",
+    "System.WorkItemType",
+    "System.State",
+    "System.AssignedTo",
+    "System.ChangedDate",
+]
+
+
+def _query_work_items_changed_since_impl(
+    query: str,
+    watermark: Optional[str],
+    wit_client: "WorkItemTrackingClient",
+    fields: Optional[list[str]] = None,
+    max_items: Optional[int] = None,
+    max_chars: Optional[int] = None,
+) -> str:
+    """
+    Implementation of query_work_items_changed_since.
+
+    Args:
+        query: The flat WIQL query string
+        watermark: Watermark of the previous call, or None for a full sync
+        wit_client: Work item tracking client
+        fields: Field reference names to return for changed work items
+        max_items: Maximum number of work items to render in one response
+        max_chars: Maximum size of the response in characters
+
+    Returns:
+        Formatted string with the new watermark, changed and removed IDs and
+        the changed work items
+    """
+    from azure.devops.v7_1.work_item_tracking.models import Wiql
+
+    changed_query = query
+    if watermark:
+        try:
+            since = format_watermark(parse_watermark(watermark))
+        except ValueError:
+            return (
+                f"Error: Invalid watermark '{watermark}'. Use the watermark "
+                "returned by the previous call or an ISO 8601 timestamp."
+            )
+        changed_query = _add_wiql_condition(
+            query, f"[System.ChangedDate] > '{since}'"
+        )
+
+    try:
+        # Time precision makes the ChangedDate comparison exact instead of
+        # rounding it to whole days
+        result = wit_client.query_by_wiql(
+            Wiql(query=changed_query),
+            time_precision=True,
+            top=WIQL_RESULT_LIMIT,
+        )
+    except Exception as e:
+        if _is_result_limit_error(e):
+            return (
+                f"Error: More than {WIQL_RESULT_LIMIT} work items changed. "
+                "Narrow the query or use a more recent watermark."
+            )
+        raise
+
+    as_of = getattr(result, "as_of", None)
+    if not isinstance(as_of, datetime):
+        as_of = datetime.now(timezone.utc)
+    new_watermark = format_watermark(as_of)
+    changed_ids = [int(res.id) for res in result.work_items or []]
+
+    if watermark:
+        current_ids = set(
+            _query_work_item_ids(query, WIQL_RESULT_LIMIT, wit_client)
+        )
+    else:
+        current_ids = set(changed_ids)
+    scope = (
+        get_client_organization(wit_client),
+        get_client_tenant(wit_client),
+    )
+    previous_ids = (
+        get_query_snapshot(query, watermark, *scope) if watermark else None
+    )
+    save_query_snapshot(query, new_watermark, current_ids, *scope)
+
+    header = ["# Work Item Changes"]
+    header.append(f"Since: {watermark or 'beginning'}")
+    header.append(f"New Watermark: {new_watermark}")
+    header.append(f"Changed: {len(changed_ids)}")
+    if previous_ids is not None:
+        removed_ids = sorted(previous_ids - current_ids)
+        header.append(
+            "Removed: " + (", ".join(map(str, removed_ids)) or "none")
+        )
+    elif watermark:
+        header.append(
+            "Removed: unknown (no snapshot for this watermark on the server)"
+        )
+    summary = "\n".join(header)
+
+    if not changed_ids:
+        return summary
+
+    formatted_results, remaining_ids = _render_work_items(
+        changed_ids,
+        wit_client,
+        max_items=max_items,
+        max_chars=max_chars,
+        fields=fields or DEFAULT_DELTA_FIELDS,
+    )
+    page = _format_page(
+        formatted_results,
+        remaining_ids,
+        max_items=max_items,
+        max_chars=max_chars,
+        fields=fields or DEFAULT_DELTA_FIELDS,
+        owner=cursor_owner(wit_client),
+    )
+    return f"{summary}\n\n{page}"
 
 
 def register_tools(mcp) -> None:
@@ -64,7 +438,13 @@ def register_tools(mcp) -> None:
     """
 
     @mcp.tool()
-    def query_work_items(query: str, top: Optional[int] = None) -> str:
+    def query_work_items(
+        query: str,
+        top: Optional[int] = None,
+        max_items: Optional[int] = None,
+        max_chars: Optional[int] = None,
+        organization: Optional[str] = None,
+    ) -> str:
         """
         Searches for work items using Work Item Query Language (WIQL).
 
@@ -82,13 +462,70 @@ def register_tools(mcp) -> None:
             query: The WIQL query string (e.g., "SELECT * FROM workitems
                 WHERE [System.State] = 'Active'")
             top: Maximum number of results to return (default: 30)
+            max_items: Optional maximum number of work items to return at once
+            max_chars: Optional maximum response size in characters
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             Formatted string containing detailed information for each matching
-            work item, with all fields and values formatted as markdown
+            work item, with all fields and values formatted as markdown. When
+            a budget is reached, the response ends with a cursor for
+            continue_work_items
+        """
+        try:
+            wit_client = get_work_item_client(organization)
+            return _query_work_items_impl(
+                query, top or 30, wit_client, max_items, max_chars
+            )
+        except (AzureDevOpsClientError, ValueError) as e:
+            return f"Error: {str(e)}"
+
+    @mcp.tool()
+    def query_work_items_changed_since(
+        query: str,
+        watermark: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+        max_items: Optional[int] = None,
+        max_chars: Optional[int] = None,
+        organization: Optional[str] = None,
+    ) -> str:
+        """
+        Returns only the work items matching a WIQL query that changed since
+        a watermark, plus the IDs that stopped matching it.
+
+        Use this tool when you need to:
+        - Poll a query for changes without downloading every result again
+        - Keep a local copy of a query's work items in sync
+        - Find out which work items left a query (closed, moved, reassigned)
+
+        Start without a watermark to get every matching work item and a
+        first watermark. Pass the returned watermark to the next call to
+        get only what changed in between.
+
+        Args:
+            query: A flat WIQL query (SELECT ... FROM WorkItems WHERE ...)
+            watermark: The "New Watermark" value from the previous call, or
+                an ISO 8601 timestamp. Omit for the initial sync.
+            fields: Optional field reference names to return for changed
+                work items (default: ID, title, type, state, assignee and
+                changed date)
+            max_items: Optional maximum number of work items to return at once
+            max_chars: Optional maximum response size in characters
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
+
+        Returns:
+            Formatted string with the new watermark, the number of changed
+            work items, the IDs removed from the query, and the changed work
+            items with the requested fields
         """
         try:
-            wit_client = get_work_item_client()
-            return _query_work_items_impl(query, top or 30, wit_client)
+            wit_client = get_work_item_client(organization)
+            return _query_work_items_changed_since_impl(
+                query, watermark, wit_client, fields, max_items, max_chars
+            )
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
+        except Exception as e:
+            return f"Error querying changed work items: {str(e)}"
@@ -4,21 +4,183 @@ Read operations for Azure DevOps work items.
 This module provides MCP tools for retrieving work item information.
 """
 
-from typing import Union
-
-from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+from typing import TYPE_CHECKING, Iterator, Optional, Tuple, Union
 
 from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
     get_work_item_client,
 )
 from mcp_azure_devops.features.work_items.formatting import format_work_item
+from mcp_azure_devops.utils.azure_client import (
+    get_client_organization,
+    get_client_tenant,
+)
+from mcp_azure_devops.utils.continuation import load_cursor, save_cursor
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+    from azure.devops.v7_1.work_item_tracking.models import WorkItem
+
+# The work items batch endpoint accepts at most 200 IDs per request.
+WORK_ITEM_BATCH_SIZE = 200
+
+
+def _iter_work_items(
+    item_ids: list[int],
+    wit_client: "WorkItemTrackingClient",
+    batch_size: int = WORK_ITEM_BATCH_SIZE,
+    fields: Optional[list[str]] = None,
+) -> Iterator[Tuple[int, Optional["WorkItem"]]]:
+    """
+    Lazily fetch work items in batches.
+
+    Batches are only requested once the caller has consumed the previous
+    one, so a consumer that stops early never pays for the rest.
+
+    Args:
+        item_ids: Work item IDs to fetch, in display order
+        wit_client: Work item tracking client
+        batch_size: Number of IDs requested per call
+        fields: Optional field reference names to fetch instead of the
+            complete work items
+
+    Yields:
+        Tuples of (position in item_ids, work item or None if omitted)
+    """
+    # The service does not allow expanding relations of projected items
+    projection = {"fields": fields} if fields else {"expand": "all"}
+    for start in range(0, len(item_ids), batch_size):
+        batch = item_ids[start : start + batch_size]
+        work_items = wit_client.get_work_items(
+            ids=batch, error_policy="omit", **projection
+        )
+        # With error_policy="omit" the service returns one entry per
+        # requested ID, using None for the ones that could not be read.
+        for offset, work_item in enumerate(work_items or []):
+            yield start + offset, work_item
+
+
+def cursor_owner(wit_client: "WorkItemTrackingClient") -> str:
+    """
+    Identify who may resume a paged response.
+
+    Args:
+        wit_client: Work item tracking client the response was read with
+
+    Returns:
+        Owner combining the client's organization and tenant
+    """
+    return (
+        f"{get_client_tenant(wit_client)}@"
+        f"{get_client_organization(wit_client)}"
+    )
+
+
+def _render_work_items(
+    item_ids: list[int],
+    wit_client: "WorkItemTrackingClient",
+    detailed: bool = True,
+    max_items: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    fields: Optional[list[str]] = None,
+) -> Tuple[list[str], list[int]]:
+    """
+    Format work items until the response budget is used up.
+
+    At least one work item is always rendered so that paging makes
+    progress even when a single item exceeds ``max_chars``.
+
+    Args:
+        item_ids: Work item IDs to render, in display order
+        wit_client: Work item tracking client
+        detailed: Whether to return detailed information
+        max_items: Maximum number of work items to render
+        max_chars: Maximum total size of the rendered work items
+        fields: Optional field reference names to fetch and render
+
+    Returns:
+        Tuple of (formatted work items, IDs left for the next page)
+    """
+    batch_size = WORK_ITEM_BATCH_SIZE
+    if max_items:
+        batch_size = max(1, min(batch_size, max_items))
+
+    formatted: list[str] = []
+    used_chars = 0
+    for position, work_item in _iter_work_items(
+        item_ids, wit_client, batch_size, fields
+    ):
+        if not work_item:  # Skip None values (failed retrievals)
+            continue
+
+        text = format_work_item(work_item, detailed=detailed)
+        # Account for the blank line joining consecutive items
+        cost = len(text) + (2 if formatted else 0)
+        if max_chars and formatted and used_chars + cost > max_chars:
+            return formatted, item_ids[position:]
+
+        formatted.append(text)
+        used_chars += cost
+        # Stop before the next batch is requested
+        if max_items and len(formatted) >= max_items:
+            return formatted, item_ids[position + 1 :]
+
+    return formatted, []
+
+
+def _format_page(
+    formatted: list[str],
+    remaining_ids: list[int],
+    detailed: bool = True,
+    max_items: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    fields: Optional[list[str]] = None,
+    owner: str = "",
+) -> str:
+    """
+    Join a page of formatted work items and describe how to continue.
+
+    Args:
+        formatted: Formatted work items of this page
+        remaining_ids: IDs that did not fit into this page
+        detailed: Whether the page uses detailed formatting
+        max_items: Item budget to reuse for the next page
+        max_chars: Character budget to reuse for the next page
+        fields: Field projection to reuse for the next page
+        owner: Who may resume from the cursor, see ``cursor_owner``
+
+    Returns:
+        The page text, with a continuation note when items remain
+    """
+    result = "\n\n".join(formatted)
+    if not remaining_ids:
+        return result
+
+    cursor = save_cursor(
+        {
+            "ids": remaining_ids,
+            "detailed": detailed,
+            "max_items": max_items,
+            "max_chars": max_chars,
+            "fields": fields,
+        },
+        owner,
+    )
+    return (
+        f"{result}\n\n---\n"
+        f"Showing {len(formatted)} work items; {len(remaining_ids)} more "
+        f'not shown. Call continue_work_items with cursor "{cursor}" '
+        f"to get the next page."
+    )
 
 
 def _get_work_item_impl(
     item_id: Union[int, list[int]],
-    wit_client: WorkItemTrackingClient,
+    wit_client: "WorkItemTrackingClient",
     detailed: bool = True,
+    max_items: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    fields: Optional[list[str]] = None,
 ) -> str:
     """
     Implementation of work item retrieval.
@@ -28,6 +190,10 @@ def _get_work_item_impl(
                 Examples: 502199 or [502199, 502200, 502201]
         wit_client: Work item tracking client
         detailed: Whether to return detailed information
+        max_items: Maximum number of work items to return in one response
+        max_chars: Maximum size of the response in characters
+        fields: Optional field reference names to return when a list of
+            IDs is given
 
     Returns:
         Formatted string containing work item information
@@ -40,24 +206,25 @@ def _get_work_item_impl(
         else:
             # Handle list of work items
             item_ids = [int(id) for id in item_id]  # Ensure integer conversion
-            work_items = wit_client.get_work_items(
-                ids=item_ids, error_policy="omit", expand="all"
-            )
-
-            if not work_items:
+            if not item_ids:
                 return "No work items found."
 
-            formatted_results = []
-            for work_item in work_items:
-                if work_item:  # Skip None values (failed retrievals)
-                    formatted_results.append(
-                        format_work_item(work_item, detailed=detailed)
-                    )
+            formatted_results, remaining_ids = _render_work_items(
+                item_ids, wit_client, detailed, max_items, max_chars, fields
+            )
 
             if not formatted_results:
                 return "No valid work items found with the provided IDs."
 
-            return "\n\n".join(formatted_results)
+            return _format_page(
+                formatted_results,
+                remaining_ids,
+                detailed,
+                max_items,
+                max_chars,
+                fields,
+                cursor_owner(wit_client),
+            )
     except Exception as e:
         if isinstance(item_id, int):
             return f"Error retrieving work item {item_id}: {str(e)}"
@@ -65,6 +232,41 @@ def _get_work_item_impl(
             return f"Error retrieving work items {item_id}: {str(e)}"
 
 
+def _continue_work_items_impl(
+    cursor: str,
+    wit_client: "WorkItemTrackingClient",
+    max_items: Optional[int] = None,
+    max_chars: Optional[int] = None,
+) -> str:
+    """
+    Implementation of resuming a paged work item response.
+
+    Args:
+        cursor: Continuation cursor from a previous response
+        wit_client: Work item tracking client
+        max_items: Optional item budget overriding the original one
+        max_chars: Optional character budget overriding the original one
+
+    Returns:
+        Formatted string containing the next page of work items
+    """
+    state = load_cursor(cursor, cursor_owner(wit_client))
+    if state is None:
+        return (
+            f"Error: Cursor '{cursor}' is unknown or has expired. "
+            "Run the original request again."
+        )
+
+    return _get_work_item_impl(
+        state["ids"],
+        wit_client,
+        detailed=state["detailed"],
+        max_items=max_items or state["max_items"],
+        max_chars=max_chars or state["max_chars"],
+        fields=state.get("fields"),
+    )
+
+
 def register_tools(mcp) -> None:
     """
     Register work item read tools with the MCP server.
@@ -74,7 +276,12 @@ def register_tools(mcp) -> None:
     """
 
     @mcp.tool()
-    def get_work_item(id: Union[int, list[int]]) -> str:
+    def get_work_item(
+        id: Union[int, list[int]],
+        max_items: Optional[int] = None,
+        max_chars: Optional[int] = None,
+        organization: Optional[str] = None,
+    ) -> str:
         """
         Retrieves detailed information about one or multiple work items.
 
@@ -87,20 +294,72 @@ def register_tools(mcp) -> None:
         Args:
             id: The work item ID (integer) or a list of work item IDs (integers).
                 Examples: 502199 or [502199, 502200, 502201]
+            max_items: Optional maximum number of work items to return at
+                once when a list of IDs is given
+            max_chars: Optional maximum response size in characters when a
+                list of IDs is given
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             Formatted string containing comprehensive information for the
             requested work item(s), including all system and custom fields,
-            formatted as markdown with clear section headings
+            formatted as markdown with clear section headings. When a budget
+            is reached, the response ends with a cursor for
+            continue_work_items
         """
         try:
-            wit_client = get_work_item_client()
-            return _get_work_item_impl(id, wit_client, detailed=True)
+            wit_client = get_work_item_client(organization)
+            return _get_work_item_impl(
+                id,
+                wit_client,
+                detailed=True,
+                max_items=max_items,
+                max_chars=max_chars,
+            )
+        except AzureDevOpsClientError as e:
+            return f"Error: {str(e)}"
+
+    @mcp.tool()
+    def continue_work_items(
+        cursor: str,
+        max_items: Optional[int] = None,
+        max_chars: Optional[int] = None,
+        organization: Optional[str] = None,
+    ) -> str:
+        """
+        Retrieves the next page of a work item response that was cut short.
+
+        Use this tool when you need to:
+        - Read the rest of a large query_work_items result
+        - Continue a get_work_item call for many IDs
+        - Page through results without re-running the original query
+
+        Args:
+            cursor: The cursor printed at the end of the previous response
+            max_items: Optional maximum number of work items for this page;
+                defaults to the budget of the original request
+            max_chars: Optional maximum response size in characters for this
+                page; defaults to the budget of the original request
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
+
+        Returns:
+            Formatted string containing the next work items, ending with a
+            new cursor if more items remain
+        """
+        try:
+            wit_client = get_work_item_client(organization)
+            return _continue_work_items_impl(
+                cursor, wit_client, max_items, max_chars
+            )
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
 
     @mcp.tool()
-    def get_work_item_basic(id: int) -> str:
+    def get_work_item_basic(
+        id: int, organization: Optional[str] = None
+    ) -> str:
         """
         Retrieves basic information about a work item.
 
@@ -113,6 +372,8 @@ def register_tools(mcp) -> None:
             id: The work item ID (integer). Example: 502199
                 This should be a positive integer representing the unique
                 identifier of the work item in Azure DevOps.
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             Formatted string containing basic information for the
@@ -120,13 +381,15 @@ def register_tools(mcp) -> None:
             formatted as markdown
         """
         try:
-            wit_client = get_work_item_client()
+            wit_client = get_work_item_client(organization)
             return _get_work_item_impl(id, wit_client, detailed=False)
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
 
     @mcp.tool()
-    def get_work_item_details(id: int) -> str:
+    def get_work_item_details(
+        id: int, organization: Optional[str] = None
+    ) -> str:
         """
         Retrieves comprehensive information about a work item.
 
@@ -144,6 +407,8 @@ def register_tools(mcp) -> None:
             id: The work item ID (integer). Example: 502199
                 This should be a positive integer representing the unique
                 identifier of the work item in Azure DevOps.
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             Formatted string containing comprehensive information for the
@@ -151,7 +416,7 @@ def register_tools(mcp) -> None:
             formatted as markdown
         """
         try:
-            wit_client = get_work_item_client()
+            wit_client = get_work_item_client(organization)
             return _get_work_item_impl(id, wit_client, detailed=True)
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
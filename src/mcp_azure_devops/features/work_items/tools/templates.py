@@ -4,14 +4,19 @@ Work item templates operations for Azure DevOps.
 This module provides MCP tools for retrieving work item templates.
 """
 
-from typing import Optional
-
-from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+from typing import TYPE_CHECKING, Optional
 
 from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
     get_work_item_client,
 )
+from mcp_azure_devops.features.work_items.templates import (
+    get_template,
+    get_templates,
+)
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
 
 
 def _format_table(headers, rows):
@@ -41,27 +46,14 @@ def _format_work_item_template(template):
     return "\n".join(result)
 
 
-def _create_team_context(team_context_dict):
-    """Create a TeamContext object from a dictionary."""
-    from azure.devops.v7_1.work_item_tracking.models import TeamContext
-
-    return TeamContext(
-        project=team_context_dict.get("project"),
-        project_id=team_context_dict.get("project_id"),
-        team=team_context_dict.get("team"),
-        team_id=team_context_dict.get("team_id"),
-    )
-
-
 def _get_work_item_templates_impl(
     team_context: dict,
     work_item_type: Optional[str],
-    wit_client: WorkItemTrackingClient,
+    wit_client: "WorkItemTrackingClient",
 ) -> str:
     """Implementation of work item templates retrieval."""
     try:
-        team_ctx = _create_team_context(team_context)
-        templates = wit_client.get_templates(team_ctx, work_item_type)
+        templates = get_templates(wit_client, team_context, work_item_type)
 
         team_display = team_context.get("team") or team_context.get("team_id")
 
@@ -100,12 +92,11 @@ def _get_work_item_templates_impl(
 
 
 def _get_work_item_template_impl(
-    team_context: dict, template_id: str, wit_client: WorkItemTrackingClient
+    team_context: dict, template_id: str, wit_client: "WorkItemTrackingClient"
 ) -> str:
     """Implementation of work item template detail retrieval."""
     try:
-        team_ctx = _create_team_context(team_context)
-        template = wit_client.get_template(team_ctx, template_id)
+        template = get_template(wit_client, team_context, template_id)
 
         if not template:
             return f"Template with ID '{template_id}' not found."
@@ -125,7 +116,9 @@ def register_tools(mcp) -> None:
 
     @mcp.tool()
     def get_work_item_templates(
-        team_context: dict, work_item_type: Optional[str]
+        team_context: dict,
+        work_item_type: Optional[str],
+        organization: Optional[str] = None,
     ) -> str:
         """
         Gets a list of all work item templates for a team.
@@ -142,13 +135,15 @@ def register_tools(mcp) -> None:
                 team: Team name (Optional if team_id is provided)
                 team_id: Team ID (Optional if team is provided)
             work_item_type: Optional work item type name to filter templates
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             A formatted table of all templates with names, work item types,
             and descriptions
         """
         try:
-            wit_client = get_work_item_client()
+            wit_client = get_work_item_client(organization)
             return _get_work_item_templates_impl(
                 team_context, work_item_type, wit_client
             )
@@ -156,7 +151,11 @@ def register_tools(mcp) -> None:
             return f"Error: {str(e)}"
 
     @mcp.tool()
-    def get_work_item_template(team_context: dict, template_id: str) -> str:
+    def get_work_item_template(
+        team_context: dict,
+        template_id: str,
+        organization: Optional[str] = None,
+    ) -> str:
         """
         Gets detailed information about a specific work item template.
 
@@ -172,13 +171,15 @@ def register_tools(mcp) -> None:
                 team: Team name (Optional if team_id is provided)
                 team_id: Team ID (Optional if team is provided)
             template_id: The ID of the template
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             Detailed information about the template including default field
             values
         """
         try:
-            wit_client = get_work_item_client()
+            wit_client = get_work_item_client(organization)
             return _get_work_item_template_impl(
                 team_context, template_id, wit_client
             )
@@ -4,17 +4,25 @@ Work item types and fields operations for Azure DevOps.
 This module provides MCP tools for retrieving work item types and fields.
 """
 
-from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
 
+from typing import TYPE_CHECKING, Optional
+
+from mcp_azure_devops.features.projects.catalog import get_project_process
 from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
     get_work_item_client,
 )
+from mcp_azure_devops.features.work_items.metadata import (
+    get_work_item_type_fields,
+)
 from mcp_azure_devops.utils.azure_client import (
     get_core_client,
     get_work_item_tracking_process_client,
 )
 
+if TYPE_CHECKING:
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+
 
 def _format_table(headers, rows):
     """Format data as a markdown table."""
@@ -59,7 +67,7 @@ def _format_work_item_type(wit):
 
 
 def _get_work_item_types_impl(
-    project: str, wit_client: WorkItemTrackingClient
+    project: str, wit_client: "WorkItemTrackingClient"
 ) -> str:
     """Implementation of work item types retrieval."""
     work_item_types = wit_client.get_work_item_types(project)
@@ -82,7 +90,7 @@ def _get_work_item_types_impl(
 
 
 def _get_work_item_type_impl(
-    project: str, type_name: str, wit_client: WorkItemTrackingClient
+    project: str, type_name: str, wit_client: "WorkItemTrackingClient"
 ) -> str:
     """Implementation of work item type detail retrieval."""
     work_item_type = wit_client.get_work_item_type(project, type_name)
@@ -94,7 +102,10 @@ def _get_work_item_type_impl(
 
 
 def _get_work_item_type_fields_impl(
-    project: str, type_name: str, wit_client: WorkItemTrackingClient
+    project: str,
+    type_name: str,
+    wit_client: "WorkItemTrackingClient",
+    organization: Optional[str] = None,
 ) -> str:
     """Implementation of work item type fields retrieval using process API."""
     try:
@@ -108,21 +119,18 @@ def _get_work_item_type_fields_impl(
         wit_ref_name = wit.reference_name
 
         # Get project process info
-        core_client = get_core_client()
-        project_details = core_client.get_project(
-            project, include_capabilities=True
+        core_client = get_core_client(organization)
+        process_id = get_project_process(core_client, project).get(
+            "templateTypeId"
         )
-        process_id = project_details.capabilities.get(
-            "processTemplate", {}
-        ).get("templateTypeId")
 
         if not process_id:
             return f"Could not determine process ID for project {project}"
 
         # Get process client and fields for this work item type
-        process_client = get_work_item_tracking_process_client()
-        fields = process_client.get_all_work_item_type_fields(
-            process_id, wit_ref_name
+        process_client = get_work_item_tracking_process_client(organization)
+        fields = get_work_item_type_fields(
+            process_client, process_id, wit_ref_name
         )
 
         if not fields:
@@ -156,7 +164,8 @@ def _get_work_item_type_field_impl(
     project: str,
     type_name: str,
     field_name: str,
-    wit_client: WorkItemTrackingClient,
+    wit_client: "WorkItemTrackingClient",
+    organization: Optional[str] = None,
 ) -> str:
     """Implementation of work item type field detail retrieval using process
     API."""
@@ -171,25 +180,22 @@ def _get_work_item_type_field_impl(
         wit_ref_name = wit.reference_name
 
         # Get project process info
-        core_client = get_core_client()
-        project_details = core_client.get_project(
-            project, include_capabilities=True
+        core_client = get_core_client(organization)
+        process_id = get_project_process(core_client, project).get(
+            "templateTypeId"
         )
-        process_id = project_details.capabilities.get(
-            "processTemplate", {}
-        ).get("templateTypeId")
 
         if not process_id:
             return f"Could not determine process ID for project {project}"
 
         # Get process client and field details
-        process_client = get_work_item_tracking_process_client()
+        process_client = get_work_item_tracking_process_client(organization)
 
         # Determine if field_name is a display name or reference name
         if "." not in field_name:
             # Get all fields to find the reference name
-            all_fields = process_client.get_all_work_item_type_fields(
-                process_id, wit_ref_name
+            all_fields = get_work_item_type_fields(
+                process_client, process_id, wit_ref_name
             )
             field_ref = next(
                 (
@@ -258,7 +264,9 @@ def register_tools(mcp) -> None:
     """
 
     @mcp.tool()
-    def get_work_item_types(project: str) -> str:
+    def get_work_item_types(
+        project: str, organization: Optional[str] = None
+    ) -> str:
         """
         Gets a list of all work item types in a project.
 
@@ -269,19 +277,23 @@ def register_tools(mcp) -> None:
 
         Args:
             project: Project ID or project name
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             A formatted table of all work item types with names, reference
             names, and descriptions
         """
         try:
-            wit_client = get_work_item_client()
+            wit_client = get_work_item_client(organization)
             return _get_work_item_types_impl(project, wit_client)
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
 
     @mcp.tool()
-    def get_work_item_type(project: str, type_name: str) -> str:
+    def get_work_item_type(
+        project: str, type_name: str, organization: Optional[str] = None
+    ) -> str:
         """
         Gets detailed information about a specific work item type.
 
@@ -293,19 +305,23 @@ def register_tools(mcp) -> None:
         Args:
             project: Project ID or project name
             type_name: The name of the work item type
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             Detailed information about the work item type including states,
             color, icon, and reference name
         """
         try:
-            wit_client = get_work_item_client()
+            wit_client = get_work_item_client(organization)
             return _get_work_item_type_impl(project, type_name, wit_client)
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
 
     @mcp.tool()
-    def get_work_item_type_fields(project: str, type_name: str) -> str:
+    def get_work_item_type_fields(
+        project: str, type_name: str, organization: Optional[str] = None
+    ) -> str:
         """
         Gets a list of all fields for a specific work item type.
 
@@ -317,22 +333,27 @@ def register_tools(mcp) -> None:
         Args:
             project: Project ID or project name
             type_name: The name of the work item type
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             A formatted table of all fields with names, reference names,
             types, and required/read-only status
         """
         try:
-            wit_client = get_work_item_client()
+            wit_client = get_work_item_client(organization)
             return _get_work_item_type_fields_impl(
-                project, type_name, wit_client
+                project, type_name, wit_client, organization
             )
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
 
     @mcp.tool()
     def get_work_item_type_field(
-        project: str, type_name: str, field_name: str
+        project: str,
+        type_name: str,
+        field_name: str,
+        organization: Optional[str] = None,
     ) -> str:
         """
         Gets detailed information about a specific field in a work item type.
@@ -346,15 +367,17 @@ def register_tools(mcp) -> None:
             project: Project ID or project name
             type_name: The name of the work item type
             field_name: The reference name or display name of the field
+            organization: Optional Azure DevOps organization name; defaults
+                to the organization the server is configured for
 
         Returns:
             Detailed information about the field including type, allowed
             values, and constraints
         """
         try:
-            wit_client = get_work_item_client()
+            wit_client = get_work_item_client(organization)
             return _get_work_item_type_field_impl(
-                project, type_name, field_name, wit_client
+                project, type_name, field_name, wit_client, organization
             )
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
@@ -5,13 +5,11 @@ This module provides shared utility functions used across work item tools.
 """
 
 import re
+from importlib.util import find_spec
 from typing import Optional
 
-try:
-    from markdown_it import MarkdownIt
-    MARKDOWN_AVAILABLE = True
-except ImportError:
-    MARKDOWN_AVAILABLE = False
+# markdown-it is imported on first use; only check that it is installed
+MARKDOWN_AVAILABLE = find_spec("markdown_it") is not None
 
 
 def _is_html_content(text: str) -> bool:
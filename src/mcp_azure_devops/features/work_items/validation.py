@@ -0,0 +1,242 @@
+"""
+Pre-flight validation of work item writes.
+
+Field values are checked against the cached process metadata of the work
+item type before a create or update is sent: required fields, allowed
+values of picklists, field value types and state names. Every problem is
+reported at once instead of one server rejection at a time, and values
+that differ from an allowed value only in case are rewritten with the
+spelling Azure DevOps uses. When the metadata cannot be fetched the
+values are left for the server to check.
+"""
+
+import re
+import uuid
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from mcp_azure_devops.features.projects.catalog import get_project_process
+from mcp_azure_devops.features.work_items.metadata import (
+    get_process_work_item_types,
+    get_work_item_type_allowed_values,
+    get_work_item_type_fields,
+)
+
+if TYPE_CHECKING:
+    from azure.devops.v7_1.core import CoreClient
+    from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+    from azure.devops.v7_1.work_item_tracking_process import (
+        WorkItemTrackingProcessClient,
+    )
+
+# Required fields Azure DevOps fills in itself when a work item is created
+_SERVER_DEFAULTED = {
+    "system.state",
+    "system.reason",
+    "system.areapath",
+    "system.iterationpath",
+}
+
+# Allowed values shown in a problem before the list is cut short
+MAX_LISTED_VALUES = 10
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _is_integer(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return True
+    if isinstance(value, float):
+        return value.is_integer()
+    try:
+        int(str(value).strip())
+    except ValueError:
+        return False
+    return True
+
+
+def _is_double(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    try:
+        float(str(value).strip())
+    except ValueError:
+        return False
+    return True
+
+
+def _is_boolean(value: Any) -> bool:
+    return isinstance(value, bool) or str(value).strip().lower() in (
+        "true",
+        "false",
+    )
+
+
+# ISO 8601 as Azure DevOps accepts it, with any number of fraction digits
+# and offsets with or without a colon, which datetime.fromisoformat only
+# parses from Python 3.11
+_DATE_TIME = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:[.,]\d+)?)?)?"
+    r"(?:Z|[+-](\d{2})(?::?(\d{2}))?)?",
+    re.IGNORECASE,
+)
+
+
+def _is_date_time(value: Any) -> bool:
+    if isinstance(value, (date, datetime)):
+        return True
+    match = _DATE_TIME.fullmatch(str(value).strip())
+    if match is None:
+        return False
+    year, month, day, hour, minute, second, offset_hours, offset_minutes = (
+        int(part or 0) for part in match.groups()
+    )
+    try:
+        datetime(year, month, day, hour, minute, second)
+    except ValueError:
+        return False
+    return offset_hours < 24 and offset_minutes < 60
+
+
+def _is_guid(value: Any) -> bool:
+    try:
+        uuid.UUID(str(value).strip())
+    except ValueError:
+        return False
+    return True
+
+
+# Field types whose values can be checked, with what they expect
+_TYPE_CHECKS = {
+    "integer": (_is_integer, "an integer"),
+    "picklistinteger": (_is_integer, "an integer"),
+    "double": (_is_double, "a number"),
+    "picklistdouble": (_is_double, "a number"),
+    "boolean": (_is_boolean, "true or false"),
+    "datetime": (_is_date_time, "an ISO 8601 date and time"),
+    "guid": (_is_guid, "a GUID"),
+}
+
+
+def _choices(values: List[Any]) -> str:
+    listed = ", ".join(str(value) for value in values[:MAX_LISTED_VALUES])
+    if len(values) > MAX_LISTED_VALUES:
+        listed += f" and {len(values) - MAX_LISTED_VALUES} more"
+    return listed
+
+
+def _match(value: Any, allowed: List[Any]) -> Optional[Any]:
+    key = str(value).strip().casefold()
+    for candidate in allowed:
+        if str(candidate).casefold() == key:
+            return candidate
+    return None
+
+
+def find_field_problems(
+    fields: Dict[str, Any],
+    project: str,
+    work_item_type: str,
+    wit_client: "WorkItemTrackingClient",
+    core_client: "CoreClient",
+    process_client: "WorkItemTrackingProcessClient",
+    creating: bool = True,
+) -> List[str]:
+    """
+    Check field values against the work item type's process metadata.
+
+    Args:
+        fields: Dictionary of field name/value pairs, by reference or
+            friendly name, updated in place with the canonical spelling of
+            states and allowed values
+        project: The project name or ID
+        work_item_type: Work item type name, e.g. "Bug"
+        wit_client: Work item tracking client
+        core_client: Core client
+        process_client: Work item tracking process client
+        creating: Whether the fields create a work item, so that every
+            required field must be present, rather than update one
+
+    Returns:
+        One message per problem; empty if the values look valid or the
+        metadata could not be fetched
+    """
+    try:
+        process_id = get_project_process(core_client, project).get(
+            "templateTypeId"
+        )
+        if not process_id:
+            return []
+        types = get_process_work_item_types(process_client, process_id)
+        key = work_item_type.strip().casefold()
+        wit = next(
+            (
+                candidate
+                for candidate in types
+                if key
+                in (
+                    candidate.name.casefold(),
+                    candidate.reference_name.casefold(),
+                )
+            ),
+            None,
+        )
+        if wit is None:
+            return [
+                f"Work item type '{work_item_type}' does not exist in "
+                f"project {project}; expected one of "
+                + _choices([candidate.name for candidate in types])
+            ]
+        definitions = get_work_item_type_fields(
+            process_client, process_id, wit.reference_name
+        )
+        allowed_values = get_work_item_type_allowed_values(
+            wit_client, project, wit.name
+        )
+    except Exception:
+        return []
+
+    given = {name.lower(): name for name in fields}
+    states = [state.name for state in getattr(wit, "states", None) or []]
+    problems = []
+    for definition in definitions:
+        reference = definition.reference_name.lower()
+        label = f"'{definition.name}' ({definition.reference_name})"
+        # Azure DevOps also accepts fields by their friendly name
+        name = given.get(reference) or given.get(definition.name.lower())
+        if name is None or _is_empty(fields[name]):
+            required = (
+                definition.required
+                and not getattr(definition, "read_only", False)
+                and getattr(definition, "default_value", None) is None
+                and reference not in _SERVER_DEFAULTED
+            )
+            if required and (creating or name is not None):
+                problems.append(f"Field {label} is required")
+            continue
+
+        value = fields[name]
+        if reference == "system.state" and states:
+            allowed = states
+        else:
+            allowed = allowed_values.get(reference)
+        if allowed and (definition.type or "").lower() != "identity":
+            match = _match(value, allowed)
+            if match is None:
+                problems.append(
+                    f"Value '{value}' is not allowed for field {label}; "
+                    f"expected one of {_choices(allowed)}"
+                )
+                continue
+            if isinstance(value, str):
+                fields[name] = str(match)
+
+        check = _TYPE_CHECKS.get((definition.type or "").lower())
+        if check and not check[0](value):
+            problems.append(f"Field {label} expects {check[1]}, got '{value}'")
+    return problems
@@ -5,12 +5,27 @@ A simple MCP server that exposes Azure DevOps capabilities.
 """
 
 import argparse
+import functools
+import logging
+import os
 
+import anyio
+import anyio.to_thread
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
 from mcp_azure_devops.features import register_all
 from mcp_azure_devops.utils import register_all_prompts
+from mcp_azure_devops.utils.azure_client import CREDENTIAL_SOURCES
+from mcp_azure_devops.utils.metrics import (
+    instrument_tools,
+    register_metrics_endpoint,
+)
+from mcp_azure_devops.utils.profiling import (
+    PROFILE_MODES,
+    configure_profiling,
+)
+from mcp_azure_devops.utils.tracing import configure_tracing
 
 load_dotenv()
 
@@ -21,18 +36,188 @@ mcp = FastMCP("Azure DevOps")
 register_all(mcp)
 register_all_prompts(mcp)
 
+# Record latency, errors and upstream calls of every tool
+instrument_tools(mcp)
+register_metrics_endpoint(mcp)
+configure_tracing()
+try:
+    configure_profiling()
+except ValueError as e:
+    logging.getLogger(__name__).warning("Profiling disabled: %s", e)
 
-def main():
-    """Entry point for the command-line script."""
+
+TRANSPORTS = ("stdio", "sse", "streamable-http")
+
+# Command-line options exported to the environment, so that HTTP worker
+# processes, which import this module afresh, share the configuration
+_ENVIRONMENT_OPTIONS = {
+    "profile_tools": "AZURE_DEVOPS_PROFILE_TOOLS",
+    "profile_dir": "AZURE_DEVOPS_PROFILE_DIR",
+    "profile_rate": "AZURE_DEVOPS_PROFILE_RATE",
+    "profile_mode": "AZURE_DEVOPS_PROFILE_MODE",
+    "stateless": "FASTMCP_STATELESS_HTTP",
+    "credentials": "AZURE_DEVOPS_CREDENTIALS",
+    "transport": "AZURE_DEVOPS_MCP_TRANSPORT",
+}
+
+
+def _in_worker_thread(fn):
+    async def run(*args, **kwargs):
+        return await anyio.to_thread.run_sync(
+            functools.partial(fn, *args, **kwargs)
+        )
+
+    return functools.wraps(fn)(run)
+
+
+def run_tools_in_threads() -> None:
+    """
+    Run synchronous tools in worker threads.
+
+    Tools block on Azure DevOps requests. Run on the event loop, one slow
+    request would stall every other session the process serves over HTTP.
+    """
+    for tool in mcp._tool_manager.list_tools():
+        if not tool.is_async:
+            tool.fn = _in_worker_thread(tool.fn)
+            tool.is_async = True
+
+
+def create_http_app():
+    """
+    Create the ASGI application of an HTTP worker process.
+
+    Used as the uvicorn application factory when serving with several
+    workers; the transport is taken from AZURE_DEVOPS_MCP_TRANSPORT.
+
+    Returns:
+        Starlette application serving the MCP endpoint
+    """
+    run_tools_in_threads()
+    if os.environ.get("AZURE_DEVOPS_MCP_TRANSPORT") == "sse":
+        return mcp.sse_app()
+    return mcp.streamable_http_app()
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Run the Azure DevOps MCP server"
     )
-    # Add more command-line arguments as needed
+    parser.add_argument(
+        "--transport",
+        choices=TRANSPORTS,
+        default=os.environ.get("AZURE_DEVOPS_MCP_TRANSPORT", "stdio"),
+        help="stdio for a single client, or an HTTP transport that serves "
+        "many clients from one process (default: stdio)",
+    )
+    http = parser.add_argument_group("HTTP transports")
+    http.add_argument(
+        "--host",
+        default=mcp.settings.host,
+        help=f"address to listen on (default: {mcp.settings.host})",
+    )
+    http.add_argument(
+        "--port",
+        type=int,
+        default=mcp.settings.port,
+        help=f"port to listen on (default: {mcp.settings.port})",
+    )
+    http.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="worker processes for streamable-http; more than one implies "
+        "--stateless (default: 1)",
+    )
+    http.add_argument(
+        "--stateless",
+        action="store_true",
+        default=None,
+        help="serve every streamable-http request without a session, so "
+        "any worker can answer it",
+    )
+    http.add_argument(
+        "--credentials",
+        choices=CREDENTIAL_SOURCES,
+        help="where PATs come from: the X-Azure-DevOps-PAT or Basic "
+        "Authorization header of each request, falling back to the "
+        "environment (any, the default over stdio), only request headers "
+        "(request, the default over HTTP), or only the environment "
+        "(environment)",
+    )
+    profiling = parser.add_argument_group(
+        "profiling",
+        "Write a profile of selected tool calls; these options override "
+        "the AZURE_DEVOPS_PROFILE_* environment variables",
+    )
+    profiling.add_argument(
+        "--profile-tools",
+        help='comma separated tool names to profile, or "*" for all',
+    )
+    profiling.add_argument(
+        "--profile-dir", help="directory profiles are written to"
+    )
+    profiling.add_argument(
+        "--profile-rate",
+        type=float,
+        help="fraction of selected tool calls to profile (default: 1)",
+    )
+    profiling.add_argument(
+        "--profile-mode",
+        choices=PROFILE_MODES,
+        help="cProfile (.pstats), stack sampling (.collapsed) or both",
+    )
 
-    parser.parse_args()  # Store args if needed later
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers > 1:
+        if args.transport != "streamable-http":
+            # SSE and stdio sessions live in the memory of one process
+            parser.error("--workers requires --transport streamable-http")
+        args.stateless = True
 
-    # Start the server
-    mcp.run()
+    for option, variable in _ENVIRONMENT_OPTIONS.items():
+        value = getattr(args, option)
+        if value is not None:
+            os.environ[variable] = (
+                str(value).lower() if isinstance(value, bool) else str(value)
+            )
+    try:
+        configure_profiling()
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+
+def main(argv=None):
+    """Entry point for the command-line script."""
+    args = _parse_args(argv)
+
+    if args.transport == "stdio":
+        mcp.run()
+        return
+
+    mcp.settings.host = args.host
+    mcp.settings.port = args.port
+    mcp.settings.stateless_http = bool(args.stateless)
+    if args.workers == 1:
+        run_tools_in_threads()
+        mcp.run(args.transport)
+        return
+
+    import uvicorn
+
+    # Each worker imports this module and builds its own app from the
+    # exported configuration; stateless requests can go to any of them
+    uvicorn.run(
+        "mcp_azure_devops.server:create_http_app",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        log_level=mcp.settings.log_level.lower(),
+    )
 
 
 if __name__ == "__main__":
@@ -2,63 +2,356 @@
 Azure DevOps client utilities.
 
 This module provides helper functions for connecting to Azure DevOps.
+
+Credentials come from the environment, or, when the server is shared over
+HTTP, from the headers of each MCP request, so every user acts with their
+own PAT.
 """
 
+import base64
+import binascii
+import hashlib
 import os
-from typing import Optional, Tuple
+import re
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+from mcp.server.lowlevel.server import request_ctx
+
+from mcp_azure_devops.utils.cache import TTLCache
+from mcp_azure_devops.utils.metrics import instrument_sdk
+
+if TYPE_CHECKING:
+    from azure.devops.connection import Connection
+    from azure.devops.v7_1.core import CoreClient
+    from azure.devops.v7_1.identity import IdentityClient
+    from azure.devops.v7_1.work_item_tracking_process import (
+        WorkItemTrackingProcessClient,
+    )
+
+# Organizations given by name alone are looked up here
+AZURE_DEVOPS_SERVICES_URL = "https://dev.azure.com"
+
+_ORGANIZATION_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+
+# Where PATs are taken from: "any" prefers request headers over the
+# environment, "request" only accepts headers and "environment" ignores them.
+# "any" is the default over stdio and "request" over HTTP.
+CREDENTIAL_SOURCES = ("any", "request", "environment")
 
-from azure.devops.connection import Connection
-from azure.devops.v7_1.core import CoreClient
-from azure.devops.v7_1.work_item_tracking_process import (
-    WorkItemTrackingProcessClient,
+# Transports on which one server is shared by remote clients
+HTTP_TRANSPORTS = ("sse", "streamable-http")
+
+PAT_HEADER = "X-Azure-DevOps-PAT"
+ORGANIZATION_HEADER = "X-Azure-DevOps-Organization"
+
+# One connection, and with it one set of clients and HTTP sessions, per
+# organization and PAT. Connections nobody used for a while are dropped.
+CONNECTION_IDLE_SECONDS = 15 * 60
+MAX_CONNECTIONS = 256
+_connections = TTLCache(
+    ttl=CONNECTION_IDLE_SECONDS, max_entries=MAX_CONNECTIONS
 )
-from msrest.authentication import BasicAuthentication
+_connections_lock = threading.Lock()
+
+# Tenant of each pooled connection's credentials object, shared by every
+# client of the connection
+_tenants: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
+
+
+def _organization_name(organization_url: str) -> str:
+    url = urlsplit(organization_url)
+    path = url.path.rstrip("/")
+    if path:
+        return path.rsplit("/", 1)[-1]
+    # https://{organization}.visualstudio.com
+    return (url.hostname or "").split(".", 1)[0]
+
+
+def _configured_organizations() -> Dict[str, str]:
+    """
+    Get the organizations configured in the environment.
+
+    Returns:
+        Mapping of case-folded organization name to organization URL
+    """
+    urls = [os.environ.get("AZURE_DEVOPS_ORGANIZATION_URL", "")]
+    urls.extend(os.environ.get("AZURE_DEVOPS_ORGANIZATIONS", "").split(","))
+    organizations: Dict[str, str] = {}
+    for url in urls:
+        url = url.strip().rstrip("/")
+        if url:
+            organizations.setdefault(_organization_name(url).casefold(), url)
+    return organizations
+
+
+def get_organization_url(organization: Optional[str] = None) -> Optional[str]:
+    """
+    Resolve the URL of an organization.
+
+    Names are matched against AZURE_DEVOPS_ORGANIZATION_URL and the URLs
+    listed in AZURE_DEVOPS_ORGANIZATIONS, and otherwise taken to be an
+    Azure DevOps Services organization. URLs are only accepted if they are
+    configured, so a PAT is never sent to a host the server was not set up
+    for.
+
+    Args:
+        organization: Organization name or URL; defaults to
+            AZURE_DEVOPS_ORGANIZATION_URL
+
+    Returns:
+        Organization URL, or None if no default organization is configured
+
+    Raises:
+        ValueError: If the organization is not a valid name or a configured
+            URL
+    """
+    if not organization or not organization.strip():
+        return os.environ.get("AZURE_DEVOPS_ORGANIZATION_URL")
+
+    organization = organization.strip().rstrip("/")
+    configured = _configured_organizations()
+    if "://" in organization:
+        if organization.casefold() not in {
+            url.casefold() for url in configured.values()
+        }:
+            raise ValueError(
+                f"Organization URL '{organization}' is not configured; add "
+                "it to AZURE_DEVOPS_ORGANIZATIONS or use the organization "
+                "name"
+            )
+        return organization
+    if not _ORGANIZATION_NAME.match(organization):
+        raise ValueError(f"Invalid organization name '{organization}'")
+    return configured.get(
+        organization.casefold(),
+        f"{AZURE_DEVOPS_SERVICES_URL}/{organization}",
+    )
+
+
+def serves_http() -> bool:
+    """
+    Check whether the server is shared by remote clients over HTTP.
+
+    The transport chosen with --transport is exported to
+    AZURE_DEVOPS_MCP_TRANSPORT.
+
+    Returns:
+        True for the SSE and streamable HTTP transports
+    """
+    transport = os.environ.get("AZURE_DEVOPS_MCP_TRANSPORT", "")
+    return transport.strip().lower() in HTTP_TRANSPORTS
+
+
+def get_credential_source() -> str:
+    """
+    Get where PATs are taken from.
+
+    Configured through AZURE_DEVOPS_CREDENTIALS. Servers shared over HTTP
+    default to "request", so a caller without a PAT of their own is never
+    served with the operator's; stdio servers default to "any".
+
+    Returns:
+        One of CREDENTIAL_SOURCES
+
+    Raises:
+        ValueError: If the setting is invalid
+    """
+    source = os.environ.get("AZURE_DEVOPS_CREDENTIALS", "").strip().lower()
+    if not source:
+        return "request" if serves_http() else "any"
+    if source not in CREDENTIAL_SOURCES:
+        raise ValueError(
+            f"Unknown AZURE_DEVOPS_CREDENTIALS '{source}'; expected one of "
+            + ", ".join(CREDENTIAL_SOURCES)
+        )
+    return source
+
+
+def _request_headers() -> Optional[Mapping[str, str]]:
+    try:
+        context = request_ctx.get()
+    except LookupError:
+        return None
+    # Only set for the HTTP transports
+    return getattr(getattr(context, "request", None), "headers", None)
+
+
+def get_request_credentials() -> Tuple[Optional[str], Optional[str]]:
+    """
+    Get the credentials sent with the MCP request being handled.
 
+    The PAT is read from the X-Azure-DevOps-PAT header, or from the password
+    of a Basic Authorization header as Azure DevOps itself accepts it. The
+    X-Azure-DevOps-Organization header selects the default organization of
+    the request.
 
-def get_credentials() -> Tuple[Optional[str], Optional[str]]:
+    Returns:
+        Tuple containing (pat, organization), each None if not sent
     """
-    Get Azure DevOps credentials from environment variables.
+    headers = _request_headers()
+    if not headers:
+        return None, None
+
+    pat = headers.get(PAT_HEADER)
+    scheme, _, value = headers.get("Authorization", "").partition(" ")
+    if not pat and scheme.lower() == "basic":
+        try:
+            decoded = base64.b64decode(value, validate=True).decode("utf-8")
+        except (binascii.Error, UnicodeDecodeError):
+            decoded = ""
+        pat = decoded.partition(":")[2]
+    return pat or None, headers.get(ORGANIZATION_HEADER) or None
+
+
+def get_credentials(
+    organization: Optional[str] = None,
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Get Azure DevOps credentials for the current request.
+
+    Depending on AZURE_DEVOPS_CREDENTIALS, the PAT and default organization
+    sent with the MCP request are used. Otherwise the PAT of an organization
+    is read from AZURE_DEVOPS_PAT_<NAME>, with the organization name
+    upper-cased and other characters than letters and digits replaced by
+    underscores, and falls back to AZURE_DEVOPS_PAT.
+
+    Args:
+        organization: Organization name or URL; defaults to the request's
+            organization or AZURE_DEVOPS_ORGANIZATION_URL
 
     Returns:
         Tuple containing (pat, organization_url)
+
+    Raises:
+        ValueError: If the organization or the credential source is invalid
     """
-    pat = os.environ.get("AZURE_DEVOPS_PAT")
-    organization_url = os.environ.get("AZURE_DEVOPS_ORGANIZATION_URL")
-    return pat, organization_url
+    source = get_credential_source()
+    request_pat, request_organization = (None, None)
+    if source != "environment":
+        request_pat, request_organization = get_request_credentials()
+    organization_url = get_organization_url(
+        organization or request_organization
+    )
+    if request_pat or source == "request":
+        return request_pat, organization_url
+
+    pat = None
+    if organization_url:
+        name = re.sub(
+            r"[^A-Z0-9]", "_", _organization_name(organization_url).upper()
+        )
+        pat = os.environ.get(f"AZURE_DEVOPS_PAT_{name}")
+    return pat or os.environ.get("AZURE_DEVOPS_PAT"), organization_url
 
 
-def get_connection() -> Optional[Connection]:
+def get_connection(
+    organization: Optional[str] = None,
+) -> Optional["Connection"]:
     """
-    Create a connection to Azure DevOps.
+    Get the connection to an Azure DevOps organization.
+
+    Connections are reused per organization and PAT, so the clients,
+    resource locations and HTTP sessions are set up once, and dropped after
+    CONNECTION_IDLE_SECONDS without use.
+
+    Args:
+        organization: Organization name or URL; defaults to
+            AZURE_DEVOPS_ORGANIZATION_URL
 
     Returns:
         Connection object or None if credentials are missing
+
+    Raises:
+        ValueError: If the organization is invalid
     """
-    pat, organization_url = get_credentials()
+    pat, organization_url = get_credentials(organization)
 
     if not pat or not organization_url:
         return None
 
-    credentials = BasicAuthentication("", pat)
-    return Connection(base_url=organization_url, creds=credentials)
+    # Key on a digest so the pool never holds a second copy of the PAT
+    tenant = hashlib.sha256(pat.encode("utf-8")).hexdigest()
+    key = (organization_url.rstrip("/").casefold(), tenant)
+    with _connections_lock:
+        connection = _connections.get(key)
+        if connection is None:
+            from azure.devops.connection import Connection
+            from msrest.authentication import BasicAuthentication
+
+            instrument_sdk()
+            _connections.prune()
+            credentials = BasicAuthentication("", pat)
+            _tenants[credentials] = tenant
+            connection = Connection(
+                base_url=organization_url, creds=credentials
+            )
+        # Every use restarts the idle timer
+        _connections.set(key, connection)
+    return connection
+
+
+def get_client_organization(client: Any) -> str:
+    """
+    Get the organization URL an SDK client talks to.
+
+    Used to partition caches by organization.
+
+    Args:
+        client: Azure DevOps SDK client
+
+    Returns:
+        Normalized organization URL, or "" if it is not known
+    """
+    url = getattr(client, "normalized_url", None)
+    return url if isinstance(url, str) else ""
+
+
+def get_client_tenant(client: Any) -> str:
+    """
+    Get an identifier of the credentials an SDK client uses.
+
+    Cached results that depend on what the PAT may see, such as query
+    results, are partitioned by tenant so they never reach another user.
+    Organization-wide metadata, such as process definitions, may be shared
+    by keying it on the organization alone.
 
+    Args:
+        client: Azure DevOps SDK client from ``get_connection``
 
-def get_core_client() -> CoreClient:
+    Returns:
+        Digest of the client's PAT, or "" if it is not known
+    """
+    credentials = getattr(getattr(client, "config", None), "credentials", None)
+    try:
+        return _tenants.get(credentials, "")
+    except TypeError:
+        # Not a credentials object from get_connection
+        return ""
+
+
+def get_core_client(organization: Optional[str] = None) -> "CoreClient":
     """
     Get the Core client for Azure DevOps.
 
+    Args:
+        organization: Organization name or URL; defaults to
+            AZURE_DEVOPS_ORGANIZATION_URL
+
     Returns:
         CoreClient instance
 
     Raises:
         Exception: If the client cannot be created
     """
-    connection = get_connection()
+    connection = get_connection(organization)
 
     if not connection:
         raise Exception(
             "Azure DevOps PAT or organization URL not found in "
-            "environment variables."
+            "environment variables or request headers."
         )
 
     core_client = connection.clients.get_core_client()
@@ -69,22 +362,28 @@ def get_core_client() -> CoreClient:
     return core_client
 
 
-def get_work_item_tracking_process_client() -> WorkItemTrackingProcessClient:
+def get_work_item_tracking_process_client(
+    organization: Optional[str] = None,
+) -> "WorkItemTrackingProcessClient":
     """
     Get the Work Item Tracking Process client for Azure DevOps.
 
+    Args:
+        organization: Organization name or URL; defaults to
+            AZURE_DEVOPS_ORGANIZATION_URL
+
     Returns:
         WorkItemTrackingProcessClient instance
 
     Raises:
         Exception: If the client cannot be created
     """
-    connection = get_connection()
+    connection = get_connection(organization)
 
     if not connection:
         raise Exception(
             "Azure DevOps PAT or organization URL not found in "
-            "environment variables."
+            "environment variables or request headers."
         )
 
     process_client = connection.clients.get_work_item_tracking_process_client()
@@ -93,3 +392,35 @@ def get_work_item_tracking_process_client() -> WorkItemTrackingProcessClient:
         raise Exception("Failed to get Work Item Tracking Process client.")
 
     return process_client
+
+
+def get_identity_client(
+    organization: Optional[str] = None,
+) -> "IdentityClient":
+    """
+    Get the Identity client for Azure DevOps.
+
+    Args:
+        organization: Organization name or URL; defaults to
+            AZURE_DEVOPS_ORGANIZATION_URL
+
+    Returns:
+        IdentityClient instance
+
+    Raises:
+        Exception: If the client cannot be created
+    """
+    connection = get_connection(organization)
+
+    if not connection:
+        raise Exception(
+            "Azure DevOps PAT or organization URL not found in "
+            "environment variables or request headers."
+        )
+
+    identity_client = connection.clients.get_identity_client()
+
+    if not identity_client:
+        raise Exception("Failed to get Identity client.")
+
+    return identity_client
@@ -0,0 +1,176 @@
+"""
+In-memory caching utilities.
+
+This module provides a small thread-safe cache with per-entry expiry that
+features use to keep server-side state between tool calls.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterator, Optional, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe least-recently-used mapping whose entries expire.
+
+    Every entry carries its own expiry time, which defaults to the cache's
+    ``ttl`` but can be shortened or extended per ``set`` call. When the
+    cache is full the least recently used entry is evicted.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Create a cache.
+
+        Args:
+            ttl: Default time to live of an entry, in seconds
+            max_entries: Maximum number of entries kept at once
+            clock: Monotonic time source, overridable for tests
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the live value stored under ``key``.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            The cached value or ``default``
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(
+        self, key: Hashable, value: Any, ttl: Optional[float] = None
+    ) -> None:
+        """
+        Store ``value`` under ``key``.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Optional time to live overriding the cache default
+        """
+        lifetime = self.ttl if ttl is None else ttl
+        if lifetime <= 0:
+            self.pop(key)
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + lifetime, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_set(
+        self,
+        key: Hashable,
+        factory: Callable[[], Any],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """
+        Return the cached value for ``key``, computing it on a miss.
+
+        Args:
+            key: Cache key
+            factory: Callable producing the value when it is not cached
+            ttl: Optional time to live overriding the cache default
+
+        Returns:
+            The cached or newly computed value
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value, ttl)
+        return value
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove ``key`` and return its live value.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            The removed value or ``default``
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None or entry[0] <= self._clock():
+                return default
+            return entry[1]
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        """
+        Iterate over a snapshot of the live entries.
+
+        Returns:
+            Iterator of (key, value) pairs
+        """
+        now = self._clock()
+        with self._lock:
+            snapshot = [
+                (key, value)
+                for key, (expires_at, value) in self._entries.items()
+                if expires_at > now
+            ]
+        return iter(snapshot)
+
+    def prune(self) -> int:
+        """
+        Remove expired entries.
+
+        Expired entries are otherwise only dropped when looked up or pushed
+        out by newer ones; pruning frees what they hold right away.
+
+        Returns:
+            Number of entries removed
+        """
+        now = self._clock()
+        with self._lock:
+            expired = [
+                key
+                for key, (expires_at, _) in self._entries.items()
+                if expires_at <= now
+            ]
+            for key in expired:
+                del self._entries[key]
+        return len(expired)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.items())
@@ -0,0 +1,58 @@
+"""
+Continuation cursors for paged tool responses.
+
+Tools that stop rendering when their response budget is reached store the
+state needed to resume here and hand the client an opaque cursor. The state
+stays on the server, so resuming never repeats the original query. A cursor
+can be bound to an owner, so on a shared server it only resumes for the
+credentials it was issued to.
+"""
+
+import secrets
+from typing import Any, Dict, Optional
+
+from mcp_azure_devops.utils.cache import TTLCache
+
+# Cursors are short-lived; an agent normally resumes within seconds.
+CURSOR_TTL_SECONDS = 30 * 60
+MAX_CURSORS = 512
+
+_cursors = TTLCache(ttl=CURSOR_TTL_SECONDS, max_entries=MAX_CURSORS)
+
+
+def save_cursor(state: Dict[str, Any], owner: str = "") -> str:
+    """
+    Store continuation state and return an opaque cursor for it.
+
+    Args:
+        state: Data needed to produce the next page
+        owner: Who may resume from the cursor
+
+    Returns:
+        Cursor string to hand back to the client
+    """
+    cursor = secrets.token_urlsafe(12)
+    _cursors.set(cursor, (owner, dict(state)))
+    return cursor
+
+
+def load_cursor(cursor: str, owner: str = "") -> Optional[Dict[str, Any]]:
+    """
+    Look up the continuation state for a cursor.
+
+    Cursors are not consumed, so retrying a failed resume returns the same
+    page again.
+
+    Args:
+        cursor: Cursor previously returned by ``save_cursor``
+        owner: Who is resuming; must match the owner the cursor was saved
+            for
+
+    Returns:
+        Copy of the stored state, or None if the cursor is unknown, expired
+        or owned by someone else
+    """
+    entry = _cursors.get(cursor)
+    if entry is None or entry[0] != owner:
+        return None
+    return dict(entry[1])
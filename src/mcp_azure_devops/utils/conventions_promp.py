@@ -26,17 +26,12 @@ def register_prompt(mcp: FastMCP) -> None:
 
 Using the available Azure DevOps tools, please:
 
-1. Get an overview of ALL projects (get_projects)
-2. For ALL projects:
-   - Identify teams (get_all_teams)
-   - Get area paths and iterations for each team 
-   (get_team_area_paths, get_team_iterations)
-3. Capture work item configuration for EACH project:
-   - Process ID and details (get_project_process_id, get_process_details)
-   - Work item types (get_work_item_types)
-   - For each work item type, get ALL fields 
-   (get_work_item_type_fields) and clearly identify mandatory fields
-   - Note differences in processes between projects
+1. Get a snapshot of the whole organization in a single call
+   (get_organization_inventory). It lists ALL projects with their
+   process, every team with its area paths and iterations, and the
+   work item types of each process with ALL their fields; mandatory
+   fields have "required": true
+2. From the snapshot, note differences in processes between projects
 
 Create a concise markdown document with these sections:
 
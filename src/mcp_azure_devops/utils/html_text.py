@@ -0,0 +1,229 @@
+"""
+HTML to compact text conversion.
+
+Rich text fields written in the Azure DevOps web UI are stored as HTML with
+inline styles and, frequently, base64 encoded images. This module reduces
+such HTML to compact markdown-like text for display.
+"""
+
+import re
+from html.parser import HTMLParser
+from typing import Optional
+
+# Input is fed to the parser in chunks so conversion can stop early once the
+# output cap is reached.
+_CHUNK_SIZE = 8192
+
+_TAG_PATTERN = re.compile(r"<\s*/?\s*[a-zA-Z][a-zA-Z0-9\-]*\b[^>]*>")
+_BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+_SKIPPED_TAGS = {"head", "script", "style", "title"}
+_BLOCK_TAGS = {
+    "address",
+    "article",
+    "blockquote",
+    "div",
+    "dl",
+    "dt",
+    "dd",
+    "figure",
+    "footer",
+    "form",
+    "header",
+    "hr",
+    "ol",
+    "p",
+    "pre",
+    "section",
+    "table",
+    "tr",
+    "ul",
+}
+_INLINE_MARKERS = {
+    "b": "**",
+    "strong": "**",
+    "i": "*",
+    "em": "*",
+    "code": "`",
+    "s": "~~",
+    "strike": "~~",
+    "del": "~~",
+}
+
+TRUNCATION_MARKER = " … [truncated]"
+
+
+def looks_like_html(text: str) -> bool:
+    """
+    Check whether text contains HTML tags.
+
+    Args:
+        text: Text to check
+
+    Returns:
+        True if at least one opening or closing tag is present
+    """
+    return "<" in text and _TAG_PATTERN.search(text) is not None
+
+
+class _CompactTextParser(HTMLParser):
+    """Streaming parser that renders HTML as compact markdown-like text."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self.length = 0
+        self._skip_depth = 0
+        self._pre_depth = 0
+        self._list_stack: list[Optional[int]] = []
+        self._link_stack: list[tuple[int, Optional[str]]] = []
+        self._in_cell = False
+
+    def _emit(self, text: str) -> None:
+        if text:
+            self.parts.append(text)
+            self.length += len(text)
+
+    def _newline(self, count: int = 1) -> None:
+        # Collapse consecutive line breaks while rendering
+        trailing = 0
+        for part in reversed(self.parts):
+            stripped = part.rstrip("\n")
+            trailing += len(part) - len(stripped)
+            if stripped:
+                break
+        if self.parts and trailing < count:
+            self._emit("\n" * (count - trailing))
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+            return
+        if self._skip_depth:
+            return
+
+        attributes = dict(attrs)
+        if tag == "br":
+            self._emit("\n")
+        elif tag in ("h1", "h2", "h3", "h4", "h5", "h6"):
+            self._newline(2)
+            self._emit("#" * int(tag[1]) + " ")
+        elif tag == "li":
+            self._newline()
+            indent = "  " * max(len(self._list_stack) - 1, 0)
+            number = self._list_stack[-1] if self._list_stack else None
+            if number is not None:
+                self._list_stack[-1] = number + 1
+                self._emit(f"{indent}{number + 1}. ")
+            else:
+                self._emit(f"{indent}- ")
+        elif tag in ("ul", "ol"):
+            self._newline()
+            self._list_stack.append(0 if tag == "ol" else None)
+        elif tag in ("td", "th"):
+            self._emit(" | " if self._in_cell else "| ")
+            self._in_cell = True
+        elif tag == "a":
+            self._link_stack.append((len(self.parts), attributes.get("href")))
+        elif tag == "img":
+            src = attributes.get("src") or ""
+            alt = attributes.get("alt") or "image"
+            if src.startswith("data:"):
+                # Inline base64 data is useless as text and very large
+                self._emit(f"[{alt}]")
+            else:
+                self._emit(f"![{alt}]({src})")
+        elif tag in _INLINE_MARKERS:
+            self._emit(_INLINE_MARKERS[tag])
+        elif tag in _BLOCK_TAGS:
+            if tag == "pre":
+                self._pre_depth += 1
+            self._newline(2 if tag in ("p", "table", "pre") else 1)
+            if tag == "hr":
+                self._emit("---")
+                self._newline()
+
+    def handle_endtag(self, tag):
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth = max(self._skip_depth - 1, 0)
+            return
+        if self._skip_depth:
+            return
+
+        if tag in ("h1", "h2", "h3", "h4", "h5", "h6"):
+            self._newline(2)
+        elif tag in ("ul", "ol"):
+            if self._list_stack:
+                self._list_stack.pop()
+            self._newline()
+        elif tag == "tr":
+            if self._in_cell:
+                self._emit(" |")
+            self._in_cell = False
+            self._newline()
+        elif tag == "a" and self._link_stack:
+            start, href = self._link_stack.pop()
+            label = "".join(self.parts[start:]).strip()
+            if href and not href.startswith("#") and href != label:
+                del self.parts[start:]
+                self.length = sum(len(part) for part in self.parts)
+                self._emit(f"[{label or href}]({href})")
+        elif tag in _INLINE_MARKERS:
+            self._emit(_INLINE_MARKERS[tag])
+        elif tag in _BLOCK_TAGS:
+            if tag == "pre":
+                self._pre_depth = max(self._pre_depth - 1, 0)
+            self._newline(2 if tag in ("p", "table", "pre") else 1)
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        if self._pre_depth:
+            self._emit(data)
+            return
+        text = _WHITESPACE_PATTERN.sub(" ", data)
+        if text == " " and (
+            not self.parts or self.parts[-1].endswith((" ", "\n"))
+        ):
+            return
+        if self.parts and self.parts[-1].endswith("\n"):
+            text = text.lstrip()
+        self._emit(text)
+
+    def text(self) -> str:
+        lines = [line.rstrip() for line in "".join(self.parts).split("\n")]
+        return _BLANK_LINES_PATTERN.sub("\n\n", "\n".join(lines)).strip()
+
+
+def html_to_text(html: str, max_chars: Optional[int] = None) -> str:
+    """
+    Convert HTML to compact markdown-like text.
+
+    Styles, scripts and inline image data are dropped; headings, lists,
+    links, emphasis and tables are kept in a compact markdown form. Text
+    without any HTML tags is returned unchanged.
+
+    Args:
+        html: HTML content to convert
+        max_chars: Optional maximum length of the returned text. Parsing
+            stops as soon as the cap is exceeded.
+
+    Returns:
+        The converted text, ending with a truncation marker if capped
+    """
+    if not html or not looks_like_html(html):
+        text = html or ""
+    else:
+        parser = _CompactTextParser()
+        for start in range(0, len(html), _CHUNK_SIZE):
+            parser.feed(html[start : start + _CHUNK_SIZE])
+            if max_chars and parser.length > max_chars:
+                break
+        else:
+            parser.close()
+        text = parser.text()
+
+    if max_chars and len(text) > max_chars:
+        return text[:max_chars].rstrip() + TRUNCATION_MARKER
+    return text
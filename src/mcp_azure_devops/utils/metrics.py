@@ -0,0 +1,673 @@
+"""
+Runtime metrics for tools and Azure DevOps calls.
+
+Every MCP tool call and every REST call the Azure DevOps SDK makes is timed
+and counted here: latency histograms, errors by type, payload sizes and the
+number of upstream calls each tool makes. The data is rendered as markdown
+for the get_server_metrics tool and in the Prometheus text format for the
+optional HTTP metrics endpoint.
+"""
+
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from mcp_azure_devops.utils import profiling, tracing
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds; tool calls range from cached lookups to
+# partitioned queries over tens of thousands of work items
+DURATION_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+# Tools report failures as text rather than raising
+ERROR_RESPONSE = "ErrorResponse"
+
+# Upstream endpoints called during the current tool call
+_tool_calls: contextvars.ContextVar[Optional[List[str]]] = (
+    contextvars.ContextVar("mcp_azure_devops_tool_calls", default=None)
+)
+# Client, method and location ID of the SDK resource call being sent
+_pending: contextvars.ContextVar[Optional[Tuple[Any, str, str]]] = (
+    contextvars.ContextVar("mcp_azure_devops_pending_call", default=None)
+)
+
+_sdk_lock = threading.Lock()
+_sdk_instrumented = False
+
+# Tool functions wrapped by instrument_tool, so none is wrapped twice
+_instrumented_tools: "weakref.WeakSet[Callable[..., Any]]" = weakref.WeakSet()
+
+
+class Histogram:
+    """Cumulative histogram over fixed bucket upper bounds."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DURATION_BUCKETS):
+        """
+        Create an empty histogram.
+
+        Args:
+            buckets: Ascending upper bounds; an implicit +Inf bucket follows
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        index = len(self.buckets)
+        for position, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = position
+                break
+        self.counts[index] += 1
+        self.min = value if not self.count else min(self.min, value)
+        self.max = max(self.max, value)
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile by interpolating within its bucket.
+
+        The estimate is clamped to the smallest and largest observation,
+        which keeps it exact for a single sample.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated value, or 0 if nothing was observed
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        estimate = self.max
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                if index < len(self.buckets):
+                    lower = self.buckets[index - 1] if index else 0.0
+                    upper = self.buckets[index]
+                    estimate = lower + (upper - lower) * (rank - seen) / count
+                break
+            seen += count
+        return min(max(estimate, self.min), self.max)
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Return (le, cumulative count) pairs including +Inf."""
+        pairs = []
+        total = 0
+        bounds = [f"{bound:g}" for bound in self.buckets] + ["+Inf"]
+        for bound, count in zip(bounds, self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+class _Series:
+    """Aggregated measurements of one tool or endpoint."""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors: Counter = Counter()
+        self.duration = Histogram()
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.upstream_calls = 0
+
+
+class MetricsRegistry:
+    """Thread-safe store of tool and upstream call metrics."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Create an empty registry.
+
+        Args:
+            clock: Monotonic time source, overridable for tests
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        with self._lock:
+            self.started = self._clock()
+            self.tools: Dict[str, _Series] = {}
+            self.endpoints: Dict[str, _Series] = {}
+
+    def record_tool_call(
+        self,
+        tool: str,
+        seconds: float,
+        request_bytes: int,
+        response_bytes: int,
+        upstream_calls: int,
+        error_type: Optional[str] = None,
+    ) -> None:
+        """
+        Record a finished tool call.
+
+        Args:
+            tool: Tool name
+            seconds: Wall time of the call
+            request_bytes: Size of the JSON encoded arguments
+            response_bytes: Size of the response text
+            upstream_calls: Azure DevOps requests made during the call
+            error_type: Exception type name, or ERROR_RESPONSE when the
+                tool reported a failure in its response
+        """
+        with self._lock:
+            series = self.tools.setdefault(tool, _Series())
+            series.calls += 1
+            series.duration.observe(seconds)
+            series.request_bytes += request_bytes
+            series.response_bytes += response_bytes
+            series.upstream_calls += upstream_calls
+            if error_type:
+                series.errors[error_type] += 1
+
+    def record_upstream_call(
+        self,
+        endpoint: str,
+        seconds: float,
+        request_bytes: int,
+        response_bytes: int,
+        error_type: Optional[str] = None,
+    ) -> None:
+        """
+        Record a finished Azure DevOps REST call.
+
+        Args:
+            endpoint: Method and resource, e.g. "GET wit/workItems"
+            seconds: Wall time of the request
+            request_bytes: Size of the request body
+            response_bytes: Size of the response body
+            error_type: Exception type name if the request failed
+        """
+        with self._lock:
+            series = self.endpoints.setdefault(endpoint, _Series())
+            series.calls += 1
+            series.duration.observe(seconds)
+            series.request_bytes += request_bytes
+            series.response_bytes += response_bytes
+            if error_type:
+                series.errors[error_type] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a point-in-time summary of all metrics.
+
+        Returns:
+            Dictionary with uptime_seconds and per-tool and per-endpoint
+            summaries holding calls, errors by type, p50/p95/p99 and mean
+            latency in milliseconds, and byte totals
+        """
+        with self._lock:
+            return {
+                "uptime_seconds": self._clock() - self.started,
+                "tools": {
+                    name: _summarize(series)
+                    for name, series in self.tools.items()
+                },
+                "endpoints": {
+                    name: _summarize(series)
+                    for name, series in self.endpoints.items()
+                },
+            }
+
+    def render_prometheus(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text ending in a newline
+        """
+        lines: List[str] = []
+        with self._lock:
+            _render_family(
+                lines,
+                "mcp_tool",
+                "tool",
+                self.tools,
+                "MCP tool calls",
+                include_upstream=True,
+            )
+            _render_family(
+                lines,
+                "azure_devops_request",
+                "endpoint",
+                self.endpoints,
+                "Azure DevOps REST requests",
+                include_upstream=False,
+            )
+        return "\n".join(lines) + "\n"
+
+
+def _summarize(series: _Series) -> Dict[str, Any]:
+    duration = series.duration
+    calls = series.calls or 1
+    return {
+        "calls": series.calls,
+        "errors": dict(series.errors),
+        "p50_ms": duration.quantile(0.5) * 1000,
+        "p95_ms": duration.quantile(0.95) * 1000,
+        "p99_ms": duration.quantile(0.99) * 1000,
+        "mean_ms": duration.sum / calls * 1000,
+        "request_bytes": series.request_bytes,
+        "response_bytes": series.response_bytes,
+        "upstream_calls": series.upstream_calls,
+    }
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _render_family(
+    lines: List[str],
+    prefix: str,
+    label: str,
+    series_by_name: Dict[str, _Series],
+    description: str,
+    include_upstream: bool,
+) -> None:
+    names = sorted(series_by_name)
+
+    def counter(metric: str, help_text: str, value) -> None:
+        lines.append(f"# HELP {prefix}_{metric} {help_text}")
+        lines.append(f"# TYPE {prefix}_{metric} counter")
+        for name in names:
+            lines.append(
+                f'{prefix}_{metric}{{{label}="{_label(name)}"}} '
+                f"{value(series_by_name[name])}"
+            )
+
+    counter("calls_total", f"{description}.", lambda s: s.calls)
+
+    lines.append(f"# HELP {prefix}_errors_total Failed {description}.")
+    lines.append(f"# TYPE {prefix}_errors_total counter")
+    for name in names:
+        for error_type, count in sorted(series_by_name[name].errors.items()):
+            lines.append(
+                f'{prefix}_errors_total{{{label}="{_label(name)}",'
+                f'error_type="{_label(error_type)}"}} {count}'
+            )
+
+    lines.append(f"# HELP {prefix}_duration_seconds Latency of {description}.")
+    lines.append(f"# TYPE {prefix}_duration_seconds histogram")
+    for name in names:
+        duration = series_by_name[name].duration
+        for bound, count in duration.cumulative():
+            lines.append(
+                f'{prefix}_duration_seconds_bucket{{{label}="{_label(name)}",'
+                f'le="{bound}"}} {count}'
+            )
+        lines.append(
+            f'{prefix}_duration_seconds_sum{{{label}="{_label(name)}"}} '
+            f"{duration.sum:.6f}"
+        )
+        lines.append(
+            f'{prefix}_duration_seconds_count{{{label}="{_label(name)}"}} '
+            f"{duration.count}"
+        )
+
+    counter(
+        "request_bytes_total",
+        f"Request bytes of {description}.",
+        lambda s: s.request_bytes,
+    )
+    counter(
+        "response_bytes_total",
+        f"Response bytes of {description}.",
+        lambda s: s.response_bytes,
+    )
+    if include_upstream:
+        counter(
+            "upstream_calls_total",
+            f"Azure DevOps requests made by {description}.",
+            lambda s: s.upstream_calls,
+        )
+
+
+_registry = MetricsRegistry()
+
+
+def get_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return _registry
+
+
+def _payload_size(payload: Any) -> int:
+    if payload is None:
+        return 0
+    if isinstance(payload, (bytes, bytearray)):
+        return len(payload)
+    if isinstance(payload, str):
+        return len(payload.encode("utf-8"))
+    if isinstance(payload, (dict, list)):
+        return len(json.dumps(payload, default=str).encode("utf-8"))
+    # Streams are sent as they are read and have no size up front
+    return 0
+
+
+def instrument_tool(name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wrap a tool function so each call is recorded, traced and profiled.
+
+    Args:
+        name: Tool name
+        fn: Tool function, synchronous or a coroutine function
+
+    Returns:
+        Wrapper with the same signature
+    """
+
+    def record(kwargs, result, error_type, start, calls, span) -> None:
+        error = None
+        if error_type is None and isinstance(result, str):
+            if result.startswith("Error"):
+                error_type = ERROR_RESPONSE
+                error = result.split("\n", 1)[0]
+        response_bytes = _payload_size(
+            result if isinstance(result, str) else None
+        )
+        _registry.record_tool_call(
+            name,
+            time.perf_counter() - start,
+            _payload_size(kwargs),
+            response_bytes,
+            len(calls),
+            error_type,
+        )
+        tracing.end_tool_span(span, len(calls), response_bytes, error)
+
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            calls: List[str] = []
+            token = _tool_calls.set(calls)
+            start = time.perf_counter()
+            with tracing.tool_span(name, kwargs) as span:
+                try:
+                    with profiling.profile_tool(name):
+                        result = await fn(*args, **kwargs)
+                except Exception as e:
+                    record(kwargs, None, type(e).__name__, start, calls, span)
+                    raise
+                finally:
+                    _tool_calls.reset(token)
+                record(kwargs, result, None, start, calls, span)
+                return result
+
+        _instrumented_tools.add(async_wrapper)
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        calls: List[str] = []
+        token = _tool_calls.set(calls)
+        start = time.perf_counter()
+        with tracing.tool_span(name, kwargs) as span:
+            try:
+                with profiling.profile_tool(name):
+                    result = fn(*args, **kwargs)
+            except Exception as e:
+                record(kwargs, None, type(e).__name__, start, calls, span)
+                raise
+            finally:
+                _tool_calls.reset(token)
+            record(kwargs, result, None, start, calls, span)
+            return result
+
+    _instrumented_tools.add(wrapper)
+    return wrapper
+
+
+def instrument_tools(mcp) -> None:
+    """
+    Record metrics for every tool registered on the server.
+
+    Call after all features are registered; tools added later are not
+    instrumented.
+
+    Args:
+        mcp: The FastMCP server instance
+    """
+    for tool in mcp._tool_manager.list_tools():
+        if tool.fn not in _instrumented_tools:
+            tool.fn = instrument_tool(tool.name, tool.fn)
+
+
+def _endpoint_label(request, pending) -> str:
+    if request.method == "OPTIONS" or pending is None:
+        # Resource location discovery, made before the resource is known
+        return f"{request.method} _apis"
+    client, http_method, location_id = pending
+    # Resolving the location fetched and cached it before the request
+    location = client._get_resource_location(
+        client.normalized_url, location_id
+    )
+    if location is None:
+        return f"{http_method} {location_id}"
+    return f"{http_method} {location.area}/{location.resource_name}"
+
+
+def instrument_sdk() -> None:
+    """
+    Record metrics for every REST call made by the Azure DevOps SDK.
+
+    All SDK clients send through ``Client._send_request``. Resource calls
+    reach it through ``Client._send``, which knows the location being
+    called, so requests are labelled with its API area and resource name.
+    Installing is idempotent and imports the SDK, so it is done when the
+    first connection is created.
+    """
+    global _sdk_instrumented
+    with _sdk_lock:
+        if _sdk_instrumented:
+            return
+        from azure.devops.client import Client
+
+        send = Client._send
+        send_request = Client._send_request
+
+        @functools.wraps(send)
+        def labelled_send(self, http_method, location_id, *args, **kwargs):
+            token = _pending.set((self, http_method, location_id))
+            try:
+                return send(self, http_method, location_id, *args, **kwargs)
+            finally:
+                _pending.reset(token)
+
+        @functools.wraps(send_request)
+        def measured_send_request(self, request, *args, **kwargs):
+            try:
+                endpoint = _endpoint_label(request, _pending.get())
+            except Exception:
+                endpoint = f"{request.method} unknown"
+            calls = _tool_calls.get()
+            if calls is not None:
+                calls.append(endpoint)
+            start = time.perf_counter()
+            response = None
+            error_type = None
+            with tracing.request_span(endpoint, request) as span:
+                try:
+                    response = send_request(self, request, *args, **kwargs)
+                    return response
+                except Exception as e:
+                    error_type = type(e).__name__
+                    raise
+                finally:
+                    request_bytes = _payload_size(kwargs.get("content"))
+                    response_bytes = (
+                        len(response.content) if response is not None else 0
+                    )
+                    _registry.record_upstream_call(
+                        endpoint,
+                        time.perf_counter() - start,
+                        request_bytes,
+                        response_bytes,
+                        error_type,
+                    )
+                    tracing.end_request_span(
+                        span, response, request_bytes, response_bytes
+                    )
+
+        Client._send = labelled_send
+        Client._send_request = measured_send_request
+        _sdk_instrumented = True
+
+
+def format_metrics(snapshot: Dict[str, Any]) -> str:
+    """
+    Format a metrics snapshot as markdown.
+
+    Args:
+        snapshot: Result of ``MetricsRegistry.snapshot``
+
+    Returns:
+        Markdown with a tools table, an endpoints table and error counts
+    """
+    uptime = int(snapshot["uptime_seconds"])
+    result = [
+        "# Server Metrics",
+        f"Uptime: {uptime // 3600}h {uptime % 3600 // 60:02d}m "
+        f"{uptime % 60:02d}s",
+    ]
+
+    tools = snapshot["tools"]
+    result.append("\n## Tools")
+    if tools:
+        result.append(
+            "| Tool | Calls | Errors | p50 ms | p95 ms | p99 ms | "
+            "Upstream calls/call | Request bytes | Response bytes |"
+        )
+        result.append(
+            "| ---- | ---- | ---- | ---- | ---- | ---- | ---- | ---- | ---- |"
+        )
+        for name in sorted(tools):
+            stats = tools[name]
+            result.append(
+                f"| {name} | {stats['calls']} | "
+                f"{sum(stats['errors'].values())} | "
+                f"{stats['p50_ms']:.1f} | {stats['p95_ms']:.1f} | "
+                f"{stats['p99_ms']:.1f} | "
+                f"{stats['upstream_calls'] / max(stats['calls'], 1):.1f} | "
+                f"{stats['request_bytes']} | {stats['response_bytes']} |"
+            )
+    else:
+        result.append("No tool calls recorded yet.")
+
+    endpoints = snapshot["endpoints"]
+    result.append("\n## Azure DevOps Requests")
+    if endpoints:
+        result.append(
+            "| Endpoint | Calls | Errors | p50 ms | p95 ms | p99 ms | "
+            "Sent bytes | Received bytes |"
+        )
+        result.append(
+            "| ---- | ---- | ---- | ---- | ---- | ---- | ---- | ---- |"
+        )
+        for name in sorted(endpoints):
+            stats = endpoints[name]
+            result.append(
+                f"| {name} | {stats['calls']} | "
+                f"{sum(stats['errors'].values())} | "
+                f"{stats['p50_ms']:.1f} | {stats['p95_ms']:.1f} | "
+                f"{stats['p99_ms']:.1f} | "
+                f"{stats['request_bytes']} | {stats['response_bytes']} |"
+            )
+    else:
+        result.append("No Azure DevOps requests recorded yet.")
+
+    errors = [
+        (source, name, error_type, count)
+        for source, group in (("Tool", tools), ("Request", endpoints))
+        for name, stats in sorted(group.items())
+        for error_type, count in sorted(stats["errors"].items())
+    ]
+    if errors:
+        result.append("\n## Errors")
+        result.append("| Source | Name | Error Type | Count |")
+        result.append("| ---- | ---- | ---- | ---- |")
+        for source, name, error_type, count in errors:
+            result.append(f"| {source} | {name} | {error_type} | {count} |")
+
+    return "\n".join(result)
+
+
+def get_metrics_path() -> Optional[str]:
+    """
+    Get the HTTP path the Prometheus endpoint is served on.
+
+    Configured through AZURE_DEVOPS_METRICS_PATH, e.g. "/metrics"; the
+    endpoint is disabled when it is unset.
+
+    Returns:
+        Path starting with "/", or None if disabled
+    """
+    path = os.environ.get("AZURE_DEVOPS_METRICS_PATH", "").strip()
+    if not path:
+        return None
+    return path if path.startswith("/") else f"/{path}"
+
+
+def register_metrics_endpoint(mcp) -> None:
+    """
+    Serve Prometheus metrics when the server runs over HTTP.
+
+    The route is only reachable with the SSE and streamable HTTP
+    transports; it is not registered unless AZURE_DEVOPS_METRICS_PATH is
+    set.
+
+    Args:
+        mcp: The FastMCP server instance
+    """
+    path = get_metrics_path()
+    if path is None:
+        return
+    if not hasattr(mcp, "custom_route"):
+        # Added in the same mcp release as the streamable HTTP transport
+        logger.error(
+            "Metrics endpoint disabled: serving AZURE_DEVOPS_METRICS_PATH "
+            "requires mcp 1.10.0 or later"
+        )
+        return
+
+    @mcp.custom_route(path, methods=["GET"], include_in_schema=False)
+    async def prometheus_metrics(request):
+        from starlette.responses import PlainTextResponse
+
+        return PlainTextResponse(
+            _registry.render_prometheus(),
+            media_type="text/plain; version=0.0.4; charset=utf-8",
+        )
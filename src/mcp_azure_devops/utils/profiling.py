@@ -0,0 +1,236 @@
+"""
+On-demand profiling of tool calls.
+
+Selected tools can be run under cProfile, under a stack sampler, or both,
+with every profiled call written to its own files: ``.pstats`` for
+cProfile (open with ``python -m pstats`` or snakeviz) and ``.collapsed``
+stacks for the sampler (one ``frame;frame;frame count`` line per stack, as
+consumed by flamegraph.pl and speedscope). A sampling rate limits how many
+calls are profiled so profiling can stay on under load.
+
+Profiling is off unless tools are selected, through
+AZURE_DEVOPS_PROFILE_TOOLS or the server's --profile-tools option.
+"""
+
+import contextlib
+import cProfile
+import itertools
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Iterator, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ("deterministic", "sampling", "both")
+DEFAULT_PROFILE_DIR = "profiles"
+DEFAULT_SAMPLE_INTERVAL_MS = 5.0
+
+
+class ProfileSettings:
+    """Which tool calls are profiled and how."""
+
+    def __init__(
+        self,
+        tools: Set[str],
+        directory: Path,
+        rate: float = 1.0,
+        mode: str = "both",
+        interval_ms: float = DEFAULT_SAMPLE_INTERVAL_MS,
+    ):
+        """
+        Create profiling settings.
+
+        Args:
+            tools: Names of the tools to profile; "*" selects every tool
+            directory: Directory profiles are written to
+            rate: Fraction of selected calls that are profiled
+            mode: "deterministic" (cProfile), "sampling" (stack sampler)
+                or "both"
+            interval_ms: Stack sampling interval in milliseconds
+
+        Raises:
+            ValueError: If the mode or rate is invalid
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(
+                f"Unknown profile mode '{mode}'; expected one of "
+                + ", ".join(PROFILE_MODES)
+            )
+        if not 0 <= rate <= 1:
+            raise ValueError("Profile rate must be between 0 and 1")
+        self.tools = tools
+        self.directory = directory
+        self.rate = rate
+        self.mode = mode
+        self.interval_ms = interval_ms
+
+    def selects(self, tool: str) -> bool:
+        """Check whether a call of ``tool`` should be profiled now."""
+        if "*" not in self.tools and tool not in self.tools:
+            return False
+        return self.rate >= 1 or random.random() < self.rate
+
+
+_settings: Optional[ProfileSettings] = None
+_sequence = itertools.count(1)
+
+
+def configure_profiling(
+    tools: Optional[str] = None,
+    directory: Optional[str] = None,
+    rate: Optional[float] = None,
+    mode: Optional[str] = None,
+) -> Optional[ProfileSettings]:
+    """
+    Configure profiling from arguments, falling back to the environment.
+
+    Environment variables: AZURE_DEVOPS_PROFILE_TOOLS (comma separated
+    names or "*"), AZURE_DEVOPS_PROFILE_DIR, AZURE_DEVOPS_PROFILE_RATE,
+    AZURE_DEVOPS_PROFILE_MODE and AZURE_DEVOPS_PROFILE_INTERVAL_MS.
+
+    Args:
+        tools: Comma separated tool names, or "*" for all tools
+        directory: Directory to write profiles to
+        rate: Fraction of selected calls to profile
+        mode: "deterministic", "sampling" or "both"
+
+    Returns:
+        The active settings, or None if profiling is off
+
+    Raises:
+        ValueError: If a setting is invalid
+    """
+    global _settings
+    if tools is None:
+        tools = os.environ.get("AZURE_DEVOPS_PROFILE_TOOLS", "")
+    names = {name.strip() for name in tools.split(",") if name.strip()}
+    if not names:
+        _settings = None
+        return None
+
+    if rate is None:
+        rate = float(os.environ.get("AZURE_DEVOPS_PROFILE_RATE") or 1.0)
+    interval_ms = float(
+        os.environ.get("AZURE_DEVOPS_PROFILE_INTERVAL_MS")
+        or DEFAULT_SAMPLE_INTERVAL_MS
+    )
+    _settings = ProfileSettings(
+        tools=names,
+        directory=Path(
+            directory
+            or os.environ.get("AZURE_DEVOPS_PROFILE_DIR")
+            or DEFAULT_PROFILE_DIR
+        ),
+        rate=rate,
+        mode=(mode or os.environ.get("AZURE_DEVOPS_PROFILE_MODE") or "both")
+        .strip()
+        .lower(),
+        interval_ms=interval_ms,
+    )
+    return _settings
+
+
+class StackSampler:
+    """Samples the call stack of one thread from a background thread."""
+
+    def __init__(self, thread_id: int, interval_ms: float):
+        """
+        Create a sampler.
+
+        Args:
+            thread_id: Identifier of the thread to sample
+            interval_ms: Time between samples in milliseconds
+        """
+        self.thread_id = thread_id
+        self.interval = interval_ms / 1000
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="tool-profiler", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            names = []
+            while frame is not None:
+                module = frame.f_globals.get("__name__", "?")
+                names.append(f"{module}:{frame.f_code.co_name}")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(names))] += 1
+
+    def collapsed(self) -> str:
+        """Render the samples as collapsed stacks."""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.stacks.most_common()
+        )
+
+
+def _profile_path(settings: ProfileSettings, tool: str) -> Path:
+    stamp = time.strftime("%Y%m%dT%H%M%S")
+    return settings.directory / f"{tool}-{stamp}-{next(_sequence):06d}"
+
+
+@contextlib.contextmanager
+def _profile(settings: ProfileSettings, tool: str) -> Iterator[None]:
+    profiler = None
+    if settings.mode in ("deterministic", "both"):
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is active on this interpreter
+            profiler = None
+    sampler = None
+    if settings.mode in ("sampling", "both"):
+        sampler = StackSampler(threading.get_ident(), settings.interval_ms)
+        sampler.start()
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        if sampler is not None:
+            sampler.stop()
+        try:
+            base = _profile_path(settings, tool)
+            settings.directory.mkdir(parents=True, exist_ok=True)
+            if profiler is not None:
+                profiler.dump_stats(f"{base}.pstats")
+            if sampler is not None:
+                Path(f"{base}.collapsed").write_text(
+                    sampler.collapsed(), encoding="utf-8"
+                )
+        except OSError as e:
+            logger.warning("Could not write profile of %s: %s", tool, e)
+
+
+def profile_tool(tool: str) -> "contextlib.AbstractContextManager[None]":
+    """
+    Profile a tool call if profiling selects it.
+
+    Args:
+        tool: Tool name
+
+    Returns:
+        Context manager around the call
+    """
+    settings = _settings
+    if settings is None or not settings.selects(tool):
+        return contextlib.nullcontext()
+    return _profile(settings, tool)
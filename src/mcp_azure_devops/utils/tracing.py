@@ -0,0 +1,312 @@
+"""
+Optional OpenTelemetry tracing of tool calls and Azure DevOps requests.
+
+Each tool call gets a span, and every REST request the Azure DevOps SDK
+makes during the call becomes a child span. Spans carry the endpoint, work
+item IDs, batch size, retry count and cache hits, so a slow tool can be
+told apart from a slow upstream call.
+
+Tracing is off unless AZURE_DEVOPS_TRACING is set and the OpenTelemetry SDK
+is installed (``pip install mcp-azure-devops[tracing]``). While it is off
+the hooks below return immediately.
+"""
+
+import atexit
+import contextlib
+import logging
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRACE_FILE = "mcp-azure-devops-traces.jsonl"
+
+# Work item IDs beyond this many are left off span attributes
+MAX_ID_ATTRIBUTES = 50
+
+# Tool arguments holding work item IDs
+_ID_ARGUMENTS = (
+    "id",
+    "ids",
+    "work_item_id",
+    "parent_id",
+    "child_id",
+    "related_ids",
+)
+
+_tracer: Any = None
+
+
+def tracing_enabled() -> bool:
+    """Check whether spans are being recorded."""
+    return _tracer is not None
+
+
+def _create_exporter(mode: str) -> Any:
+    if mode == "otlp":
+        # Endpoint and headers come from the standard OTEL_EXPORTER_OTLP_*
+        # environment variables
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        return OTLPSpanExporter()
+    if mode == "file":
+        from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+        path = os.environ.get("AZURE_DEVOPS_TRACING_FILE") or (
+            DEFAULT_TRACE_FILE
+        )
+        output = open(path, "a", encoding="utf-8")
+        atexit.register(output.close)
+        return ConsoleSpanExporter(
+            out=output,
+            formatter=lambda span: span.to_json(indent=None) + "\n",
+        )
+    raise ValueError(
+        f"Unknown AZURE_DEVOPS_TRACING exporter '{mode}'; "
+        "expected 'otlp' or 'file'"
+    )
+
+
+def configure_tracing() -> bool:
+    """
+    Start exporting spans if tracing is configured.
+
+    Configured through AZURE_DEVOPS_TRACING: "otlp" exports over OTLP/HTTP
+    to the endpoint in OTEL_EXPORTER_OTLP_ENDPOINT, "file" appends one
+    JSON span per line to AZURE_DEVOPS_TRACING_FILE.
+
+    Returns:
+        True if spans are now recorded
+    """
+    global _tracer
+    mode = os.environ.get("AZURE_DEVOPS_TRACING", "").strip().lower()
+    if not mode or _tracer is not None:
+        return _tracer is not None
+
+    try:
+        from opentelemetry import trace
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+        exporter = _create_exporter(mode)
+    except ImportError as e:
+        logger.warning(
+            "Tracing disabled: OpenTelemetry is not installed (%s). "
+            "Install mcp-azure-devops[tracing].",
+            e,
+        )
+        return False
+    except (OSError, ValueError) as e:
+        logger.warning("Tracing disabled: %s", e)
+        return False
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": "mcp-azure-devops"})
+    )
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    # Flush spans still queued in the batch processor on exit
+    atexit.register(provider.shutdown)
+    _tracer = trace.get_tracer("mcp_azure_devops")
+    return True
+
+
+def _work_item_ids(values: Iterable[Any]) -> List[int]:
+    ids: List[int] = []
+    for value in values:
+        if isinstance(value, bool):
+            continue
+        if isinstance(value, int):
+            ids.append(value)
+        elif isinstance(value, str) and value.strip().isdigit():
+            ids.append(int(value))
+        elif isinstance(value, (list, tuple)):
+            ids.extend(_work_item_ids(value))
+    return ids
+
+
+def _id_attributes(ids: List[int]) -> Dict[str, Any]:
+    if not ids:
+        return {}
+    return {
+        "azure_devops.work_item.ids": ids[:MAX_ID_ATTRIBUTES],
+        "azure_devops.batch_size": len(ids),
+    }
+
+
+def tool_call_attributes(
+    tool: str, arguments: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Get the span attributes describing a tool call.
+
+    Args:
+        tool: Tool name
+        arguments: Tool arguments
+
+    Returns:
+        Attributes with the tool name and any work item IDs it was given
+    """
+    attributes: Dict[str, Any] = {"mcp.tool.name": tool}
+    attributes.update(
+        _id_attributes(
+            _work_item_ids(
+                arguments[name] for name in _ID_ARGUMENTS if name in arguments
+            )
+        )
+    )
+    return attributes
+
+
+def request_attributes(endpoint: str, request: Any) -> Dict[str, Any]:
+    """
+    Get the span attributes describing an Azure DevOps REST request.
+
+    Work item IDs are taken from the ``ids`` query parameter of batch
+    requests and from the path of single work item requests.
+
+    Args:
+        endpoint: Method and resource label of the request
+        request: The SDK's ClientRequest
+
+    Returns:
+        Attributes with the endpoint, method, URL and work item IDs
+    """
+    url = urlsplit(request.url)
+    attributes: Dict[str, Any] = {
+        "azure_devops.endpoint": endpoint,
+        "http.request.method": request.method,
+        "url.full": request.url,
+    }
+    ids = _work_item_ids(
+        part
+        for value in parse_qs(url.query).get("ids", [])
+        for part in value.split(",")
+    )
+    if not ids:
+        segments = url.path.rstrip("/").split("/")
+        for index, segment in enumerate(segments[:-1]):
+            if segment.lower() == "workitems":
+                ids = _work_item_ids([segments[index + 1]])
+    attributes.update(_id_attributes(ids))
+    return attributes
+
+
+@contextlib.contextmanager
+def _span(name: str, kind: str, attributes: Dict[str, Any]) -> Iterator[Any]:
+    from opentelemetry.trace import SpanKind
+
+    with _tracer.start_as_current_span(
+        name, kind=getattr(SpanKind, kind), attributes=attributes
+    ) as span:
+        yield span
+
+
+def tool_span(
+    tool: str, arguments: Dict[str, Any]
+) -> "contextlib.AbstractContextManager[Any]":
+    """
+    Open the span of a tool call.
+
+    Args:
+        tool: Tool name
+        arguments: Tool arguments
+
+    Returns:
+        Context manager yielding the span, or None when tracing is off
+    """
+    if _tracer is None:
+        return contextlib.nullcontext()
+    return _span(
+        f"tools/call {tool}", "SERVER", tool_call_attributes(tool, arguments)
+    )
+
+
+def request_span(
+    endpoint: str, request: Any
+) -> "contextlib.AbstractContextManager[Any]":
+    """
+    Open the span of an Azure DevOps REST request.
+
+    Args:
+        endpoint: Method and resource label of the request
+        request: The SDK's ClientRequest
+
+    Returns:
+        Context manager yielding the span, or None when tracing is off
+    """
+    if _tracer is None:
+        return contextlib.nullcontext()
+    return _span(endpoint, "CLIENT", request_attributes(endpoint, request))
+
+
+def end_tool_span(
+    span: Any,
+    upstream_calls: int,
+    response_bytes: int,
+    error: Optional[str] = None,
+) -> None:
+    """
+    Record the outcome of a tool call on its span.
+
+    Args:
+        span: Span from ``tool_span``, or None
+        upstream_calls: Azure DevOps requests made during the call
+        response_bytes: Size of the response text
+        error: First line of an error response, if the tool failed
+    """
+    if span is None:
+        return
+    span.set_attribute("azure_devops.upstream_calls", upstream_calls)
+    span.set_attribute("mcp.tool.response_bytes", response_bytes)
+    if error:
+        from opentelemetry.trace import Status, StatusCode
+
+        span.set_status(Status(StatusCode.ERROR, error))
+
+
+def end_request_span(
+    span: Any, response: Any, request_bytes: int, response_bytes: int
+) -> None:
+    """
+    Record the outcome of an Azure DevOps REST request on its span.
+
+    Args:
+        span: Span from ``request_span``, or None
+        response: The HTTP response, or None if the request raised
+        request_bytes: Size of the request body
+        response_bytes: Size of the response body
+    """
+    if span is None:
+        return
+    span.set_attribute("http.request.body.size", request_bytes)
+    if response is None:
+        return
+    span.set_attribute("http.response.status_code", response.status_code)
+    span.set_attribute("http.response.body.size", response_bytes)
+    # msrest retries throttled and failed requests inside urllib3
+    retries = getattr(getattr(response, "raw", None), "retries", None)
+    span.set_attribute(
+        "azure_devops.retry_count", len(getattr(retries, "history", ()))
+    )
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """
+    Note a cache hit or miss on the current span.
+
+    Args:
+        cache: Name of the cache, e.g. "query"
+        hit: Whether the lookup found a live entry
+    """
+    if _tracer is None:
+        return
+    from opentelemetry import trace
+
+    trace.get_current_span().set_attribute(
+        f"azure_devops.cache.{cache}", "hit" if hit else "miss"
+    )
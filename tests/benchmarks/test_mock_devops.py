@@ -0,0 +1,126 @@
+"""Tests for the mock Azure DevOps service."""
+
+import pytest
+from azure.devops.connection import Connection
+from azure.devops.exceptions import AzureDevOpsServiceError
+from azure.devops.v7_1.work_item_tracking.models import (
+    JsonPatchOperation,
+    Wiql,
+)
+from msrest.authentication import BasicAuthentication
+
+from benchmarks.mock_devops import MockAzureDevOps, MockSettings
+from benchmarks.mock_devops.wiql import WiqlError, evaluate
+
+
+def _item(item_id, **fields):
+    return {"id": item_id, "fields": {"System.Id": item_id, **fields}}
+
+
+@pytest.fixture(scope="module")
+def service():
+    settings = MockSettings(work_items=300, description_chars=100)
+    with MockAzureDevOps(settings) as mock:
+        yield mock
+
+
+@pytest.fixture
+def wit_client(service):
+    service.settings.throttle_rate = 0.0
+    connection = Connection(
+        base_url=service.url, creds=BasicAuthentication("", "pat")
+    )
+    return connection.clients_v7_1.get_work_item_tracking_client()
+
+
+class TestWiql:
+    ITEMS = [
+        _item(1, **{"System.State": "Active", "System.AreaPath": "P\\A"}),
+        _item(2, **{"System.State": "Closed", "System.AreaPath": "P\\A\\B"}),
+        _item(3, **{"System.State": "Active", "System.AreaPath": "Q"}),
+    ]
+
+    def test_and_or_and_parentheses(self):
+        query = (
+            "SELECT [System.Id] FROM WorkItems WHERE [System.State] = "
+            "'active' AND ([System.Id] = 1 OR [System.Id] >= 3)"
+        )
+        assert evaluate(query, self.ITEMS) == [1, 3]
+
+    def test_under_and_order_by(self):
+        query = (
+            "SELECT [System.Id] FROM WorkItems WHERE [System.AreaPath] "
+            "UNDER 'P\\A' ORDER BY [System.Id] DESC"
+        )
+        assert evaluate(query, self.ITEMS) == [2, 1]
+
+    def test_in_and_not(self):
+        query = (
+            "SELECT [System.Id] FROM WorkItems WHERE [System.Id] IN (1, 2) "
+            "AND NOT [System.State] = 'Closed'"
+        )
+        assert evaluate(query, self.ITEMS) == [1]
+
+    def test_invalid_query_raises(self):
+        with pytest.raises(WiqlError):
+            evaluate("DELETE FROM WorkItems", self.ITEMS)
+
+
+def test_wiql_query_through_sdk(wit_client):
+    """Test that the SDK can query the service after discovery."""
+    result = wit_client.query_by_wiql(
+        Wiql(query="SELECT [System.Id] FROM WorkItems ORDER BY [System.Id]"),
+        top=5,
+    )
+    assert [ref.id for ref in result.work_items] == [1, 2, 3, 4, 5]
+    assert result.as_of is not None
+
+
+def test_batch_limit_is_enforced(wit_client):
+    """Test that requesting more than 200 work items fails like Azure."""
+    items = wit_client.get_work_items(list(range(1, 201)))
+    assert len(items) == 200
+
+    with pytest.raises(AzureDevOpsServiceError, match="VS403474"):
+        wit_client.get_work_items(list(range(1, 202)))
+
+
+def test_create_and_update_round_trip(wit_client):
+    """Test that created work items can be updated and linked."""
+    created = wit_client.create_work_item(
+        [JsonPatchOperation(op="add", path="/fields/System.Title", value="A")],
+        "Project 1",
+        "Task",
+    )
+    target_url = f"{wit_client.config.base_url}/_apis/wit/workItems/1"
+    updated = wit_client.update_work_item(
+        [
+            JsonPatchOperation(
+                op="add",
+                path="/relations/-",
+                value={
+                    "rel": "System.LinkTypes.Related",
+                    "url": target_url,
+                },
+            )
+        ],
+        created.id,
+    )
+
+    assert updated.rev == created.rev + 1
+    assert updated.fields["System.Title"] == "A"
+    assert len(updated.relations) == 1
+    assert len(wit_client.get_updates(created.id)) == 2
+
+
+def test_throttling_and_stats(service, wit_client):
+    """Test that throttled requests return 429 and are counted."""
+    service.stats.reset()
+    service.settings.throttle_rate = 1.0
+
+    with pytest.raises(AzureDevOpsServiceError, match="TF400733"):
+        wit_client.get_work_item(1)
+
+    stats = service.stats.snapshot()
+    assert stats["throttled"] >= 1
+    assert stats["routes"]["work_item"] == stats["throttled"]
@@ -0,0 +1,29 @@
+"""Tests for the per-tool benchmark."""
+
+from benchmarks.tools import Scenario, check_calls, tool_cases
+
+
+def test_check_calls_reports_increases_only():
+    results = {
+        "items=10,links=0": {
+            "get_work_item": {"upstream_calls": 2},
+            "get_projects": {"upstream_calls": 1},
+            "get_all_teams": {"upstream_calls": 1},
+        }
+    }
+    baseline = {"items=10,links=0": {"get_work_item": 1, "get_projects": 2}}
+
+    regressions = check_calls(results, baseline)
+
+    assert regressions == [
+        "items=10,links=0 get_work_item: 2 upstream calls, baseline 1"
+    ]
+
+
+def test_tool_cases_cover_registered_tools():
+    from mcp_azure_devops.server import mcp
+
+    cases = tool_cases(Scenario(10, 0), "attachment.txt")
+
+    registered = {tool.name for tool in mcp._tool_manager.list_tools()}
+    assert registered <= set(cases)
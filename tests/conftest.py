@@ -0,0 +1,45 @@
+"""
+Shared test fixtures.
+"""
+
+import pytest
+
+from mcp_azure_devops.features.projects.catalog import clear_project_catalogs
+from mcp_azure_devops.features.teams.catalog import clear_team_catalogs
+from mcp_azure_devops.features.teams.iterations import (
+    clear_iteration_indexes,
+)
+from mcp_azure_devops.features.teams.members import clear_project_members
+from mcp_azure_devops.features.work_items.cache import clear_caches
+from mcp_azure_devops.features.work_items.classification import (
+    clear_classification_trees,
+)
+from mcp_azure_devops.features.work_items.identities import clear_identities
+from mcp_azure_devops.features.work_items.metadata import (
+    clear_process_metadata,
+)
+from mcp_azure_devops.features.work_items.templates import clear_templates
+
+
+@pytest.fixture(autouse=True)
+def _clear_work_item_caches():
+    """Keep cached server-side state from leaking between tests."""
+    clear_caches()
+    clear_team_catalogs()
+    clear_project_members()
+    clear_iteration_indexes()
+    clear_classification_trees()
+    clear_process_metadata()
+    clear_project_catalogs()
+    clear_templates()
+    clear_identities()
+    yield
+    clear_caches()
+    clear_team_catalogs()
+    clear_project_members()
+    clear_iteration_indexes()
+    clear_classification_trees()
+    clear_process_metadata()
+    clear_project_catalogs()
+    clear_templates()
+    clear_identities()
@@ -0,0 +1,41 @@
+from mcp_azure_devops.features.diagnostics.tools import (
+    _get_server_metrics_impl,
+)
+from mcp_azure_devops.utils import metrics
+from mcp_azure_devops.utils.metrics import MetricsRegistry
+
+
+def test_get_server_metrics_impl_reset(monkeypatch):
+    """Test that metrics can be cleared after they are read."""
+    registry = MetricsRegistry()
+    monkeypatch.setattr(metrics, "_registry", registry)
+    monkeypatch.delenv("AZURE_DEVOPS_METRICS_TOOL", raising=False)
+    monkeypatch.delenv("AZURE_DEVOPS_MCP_TRANSPORT", raising=False)
+    registry.record_tool_call("get_projects", 0.1, 2, 50, 1)
+
+    result = _get_server_metrics_impl(reset=True)
+
+    assert "| get_projects | 1 |" in result
+    assert "Metrics have been reset." in result
+    assert registry.snapshot()["tools"] == {}
+
+
+def test_metrics_are_for_operators_on_http_servers(monkeypatch):
+    """Test that shared servers only expose metrics when allowed."""
+    registry = MetricsRegistry()
+    monkeypatch.setattr(metrics, "_registry", registry)
+    monkeypatch.delenv("AZURE_DEVOPS_METRICS_TOOL", raising=False)
+    monkeypatch.setenv("AZURE_DEVOPS_MCP_TRANSPORT", "streamable-http")
+    registry.record_tool_call("get_projects", 0.1, 2, 50, 1)
+
+    result = _get_server_metrics_impl(reset=True)
+
+    assert result.startswith("Error: Server metrics are disabled")
+    assert "get_projects" in registry.snapshot()["tools"]
+
+    monkeypatch.setenv("AZURE_DEVOPS_METRICS_TOOL", "true")
+    assert "| get_projects | 1 |" in _get_server_metrics_impl()
+
+    monkeypatch.setenv("AZURE_DEVOPS_MCP_TRANSPORT", "stdio")
+    monkeypatch.setenv("AZURE_DEVOPS_METRICS_TOOL", "false")
+    assert _get_server_metrics_impl().startswith("Error:")
@@ -0,0 +1,253 @@
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from mcp_azure_devops.features.inventory.tools import (
+    _get_organization_inventory_impl,
+)
+
+PROCESS = {"templateTypeId": "agile-id", "templateName": "Agile"}
+
+
+def _project(name):
+    return SimpleNamespace(id=f"{name}-id", name=name, description=None)
+
+
+def _clients():
+    core_client = MagicMock()
+    core_client.get_projects.return_value = [
+        _project("Fabrikam"),
+        _project("Contoso"),
+        _project("Archive"),
+    ]
+    core_client.get_project.side_effect = (
+        lambda project_id, include_capabilities: SimpleNamespace(
+            id=project_id,
+            name=project_id[: -len("-id")],
+            capabilities={"processTemplate": PROCESS},
+        )
+    )
+    core_client.get_all_teams.return_value = [
+        SimpleNamespace(
+            id=f"{project}-team",
+            name=f"{project} Team",
+            project_id=f"{project}-id",
+            project_name=project,
+        )
+        for project in ("Fabrikam", "Contoso", "Archive")
+    ]
+
+    work_client = MagicMock()
+    work_client.get_team_field_values.side_effect = lambda team_context: (
+        SimpleNamespace(
+            default_value=f"{team_context.project}\\Area",
+            values=[
+                SimpleNamespace(
+                    value=f"{team_context.project}\\Area",
+                    include_children=True,
+                )
+            ],
+        )
+    )
+    work_client.get_team_iterations.return_value = [
+        SimpleNamespace(
+            name="Sprint 1",
+            path="Sprint 1",
+            attributes=SimpleNamespace(
+                start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                finish_date=datetime(2024, 1, 12, tzinfo=timezone.utc),
+            ),
+        )
+    ]
+
+    process_client = MagicMock()
+    process_client.get_process_work_item_types.return_value = [
+        SimpleNamespace(
+            name="Bug",
+            reference_name="Agile.Bug",
+            states=[SimpleNamespace(name="New"), SimpleNamespace(name="Done")],
+        )
+    ]
+    process_client.get_all_work_item_type_fields.return_value = [
+        SimpleNamespace(
+            name="Title",
+            reference_name="System.Title",
+            type="string",
+            required=True,
+        )
+    ]
+    return core_client, work_client, process_client
+
+
+def test_inventory_describes_shared_processes_once():
+    """Test a full crawl of the selected projects."""
+    core_client, work_client, process_client = _clients()
+
+    result = _get_organization_inventory_impl(
+        core_client,
+        work_client,
+        process_client,
+        projects=["fabrikam", "Contoso-id", "Missing"],
+    )
+    snapshot = json.loads(result)
+
+    assert [p["name"] for p in snapshot["projects"]] == [
+        "Fabrikam",
+        "Contoso",
+    ]
+    assert snapshot["projects"][0]["process_id"] == "agile-id"
+    assert snapshot["projects"][0]["teams"] == [
+        {
+            "name": "Fabrikam Team",
+            "id": "Fabrikam-team",
+            "default_area_path": "Fabrikam-id\\Area",
+            "area_paths": [
+                {"path": "Fabrikam-id\\Area", "include_children": True}
+            ],
+            "iterations": [
+                {
+                    "path": "Sprint 1",
+                    "start": "2024-01-01",
+                    "finish": "2024-01-12",
+                }
+            ],
+        }
+    ]
+    assert snapshot["processes"] == [
+        {
+            "id": "agile-id",
+            "name": "Agile",
+            "projects": ["Fabrikam", "Contoso"],
+            "work_item_types": [
+                {
+                    "name": "Bug",
+                    "reference_name": "Agile.Bug",
+                    "states": ["New", "Done"],
+                    "fields": [
+                        {
+                            "name": "Title",
+                            "reference_name": "System.Title",
+                            "type": "string",
+                            "required": True,
+                        }
+                    ],
+                }
+            ],
+        }
+    ]
+    assert snapshot["errors"] == ["Project 'Missing' not found"]
+    process_client.get_process_work_item_types.assert_called_once()
+    process_client.get_all_work_item_type_fields.assert_called_once()
+
+
+def test_inventory_depth_limits_the_crawl():
+    """Test that shallow crawls skip teams and process metadata."""
+    core_client, work_client, process_client = _clients()
+
+    snapshot = json.loads(
+        _get_organization_inventory_impl(
+            core_client, work_client, process_client, depth="projects"
+        )
+    )
+    invalid = _get_organization_inventory_impl(
+        core_client, work_client, process_client, depth="everything"
+    )
+
+    assert len(snapshot["projects"]) == 3
+    assert "teams" not in snapshot["projects"][0]
+    assert "work_item_types" not in snapshot["processes"][0]
+    core_client.get_all_teams.assert_not_called()
+    process_client.get_process_work_item_types.assert_not_called()
+    assert invalid.startswith("Error: Unknown inventory depth 'everything'")
+
+
+def test_inventory_records_failures_and_continues():
+    """Test that one failing team does not abort the crawl."""
+    core_client, work_client, process_client = _clients()
+    field_values = work_client.get_team_field_values.side_effect
+
+    def get_team_field_values(team_context):
+        if team_context.project == "Contoso-id":
+            raise Exception("Access denied")
+        return field_values(team_context)
+
+    work_client.get_team_field_values.side_effect = get_team_field_values
+
+    snapshot = json.loads(
+        _get_organization_inventory_impl(
+            core_client, work_client, process_client, depth="teams"
+        )
+    )
+
+    assert snapshot["projects"][1]["teams"] == [
+        {"name": "Contoso Team", "id": "Contoso-team"}
+    ]
+    assert snapshot["projects"][2]["teams"][0]["area_paths"]
+    assert snapshot["errors"] == [
+        "Team 'Contoso Team' of 'Contoso': Access denied"
+    ]
+
+
+def test_inventory_written_to_a_file(tmp_path, monkeypatch):
+    """Test that writing to a file returns only a summary."""
+    monkeypatch.setenv("AZURE_DEVOPS_INVENTORY_DIR", str(tmp_path))
+    core_client, work_client, process_client = _clients()
+
+    result = _get_organization_inventory_impl(
+        core_client,
+        work_client,
+        process_client,
+        projects=["Fabrikam"],
+        output_path="out/inventory.json",
+    )
+
+    assert result.endswith(
+        "Projects: 1\nTeams: 1\nProcesses: 1\nWork item types: 1"
+    )
+    path = tmp_path / "out" / "inventory.json"
+    assert json.loads(path.read_text())["projects"][0]["name"] == "Fabrikam"
+
+
+def test_inventory_files_stay_in_the_inventory_directory(
+    tmp_path, monkeypatch
+):
+    """Test that paths outside the inventory directory are rejected."""
+    root = tmp_path / "inventories"
+    monkeypatch.setenv("AZURE_DEVOPS_INVENTORY_DIR", str(root))
+    core_client, work_client, process_client = _clients()
+
+    for output_path in (
+        "../escaped.json",
+        "nested/../../escaped.json",
+        str(tmp_path / "escaped.json"),
+        "/etc/escaped.json",
+    ):
+        result = _get_organization_inventory_impl(
+            core_client,
+            work_client,
+            process_client,
+            projects=["Fabrikam"],
+            output_path=output_path,
+        )
+        assert result.startswith("Error: output_path"), result
+    assert not (tmp_path / "escaped.json").exists()
+
+
+def test_inventory_files_disabled_over_http(tmp_path, monkeypatch):
+    """Test that HTTP servers write no files unless configured to."""
+    monkeypatch.delenv("AZURE_DEVOPS_INVENTORY_DIR", raising=False)
+    monkeypatch.setenv("AZURE_DEVOPS_MCP_TRANSPORT", "streamable-http")
+    monkeypatch.chdir(tmp_path)
+    core_client, work_client, process_client = _clients()
+
+    result = _get_organization_inventory_impl(
+        core_client,
+        work_client,
+        process_client,
+        projects=["Fabrikam"],
+        output_path="inventory.json",
+    )
+
+    assert "disabled on this server" in result
+    assert not (tmp_path / "inventory.json").exists()
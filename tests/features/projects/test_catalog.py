@@ -0,0 +1,101 @@
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from mcp_azure_devops.features.projects import catalog
+from mcp_azure_devops.features.projects.catalog import (
+    get_project_catalog,
+    get_project_process,
+)
+from mcp_azure_devops.features.projects.tools import _get_projects_impl
+
+
+def _project(index):
+    return SimpleNamespace(
+        id=f"project-{index}", name=f"Project {index}", description=None
+    )
+
+
+def _paged_client(projects):
+    """Client serving projects in pages, recording the tokens sent."""
+    client = MagicMock()
+    client.tokens = []
+    lock = threading.Lock()
+
+    def get_projects(state_filter=None, top=None, continuation_token=None):
+        with lock:
+            client.tokens.append(continuation_token)
+        assert top is not None
+        start = continuation_token or 0
+        return projects[start : start + top]
+
+    client.get_projects.side_effect = get_projects
+    return client
+
+
+def test_catalog_follows_continuation_tokens():
+    """Test that every page is fetched, not just the first."""
+    projects = [_project(index) for index in range(25)]
+    client = _paged_client(projects)
+
+    result = catalog._fetch_projects(client, None, page_size=10)
+
+    assert [project.id for project in result] == [
+        project.id for project in projects
+    ]
+    # Each token is the number of projects already returned
+    assert {None, 10, 20} <= set(client.tokens)
+
+
+def test_catalog_indexes_names_and_ids():
+    """Test lookups by name or ID regardless of case."""
+    client = _paged_client([_project(1), _project(2)])
+
+    projects = get_project_catalog(client)
+    get_project_catalog(client)
+
+    assert client.get_projects.call_count == 1
+    assert projects.id_of("project 2") == "project-2"
+    assert projects.name_of("PROJECT-1") == "Project 1"
+    assert projects.find("Project 3") is None
+
+
+def test_project_process_is_fetched_once_per_project():
+    """Test that a project's details are shared by its name and ID."""
+    client = _paged_client([_project(1)])
+    client.get_project.return_value = SimpleNamespace(
+        id="project-1",
+        name="Project 1",
+        capabilities={
+            "processTemplate": {
+                "templateTypeId": "agile-id",
+                "templateName": "Agile",
+            }
+        },
+    )
+
+    first = get_project_process(client, "Project 1")
+    second = get_project_process(client, "project-1")
+
+    assert (
+        first
+        == second
+        == {
+            "templateTypeId": "agile-id",
+            "templateName": "Agile",
+        }
+    )
+    client.get_project.assert_called_once_with(
+        "Project 1", include_capabilities=True
+    )
+
+
+def test_get_projects_impl_limits_what_is_shown():
+    """Test that top trims the cached listing."""
+    client = _paged_client([_project(index) for index in range(3)])
+
+    result = _get_projects_impl(client, top=2)
+
+    assert "# Project: Project 1" in result
+    assert "# Project: Project 2" not in result
+    assert result.endswith("Showing 2 of 3 projects.")
@@ -2,6 +2,7 @@ from unittest.mock import MagicMock
 
 from azure.devops.v7_1.core.models import TeamProjectReference
 
+from mcp_azure_devops.features.projects.catalog import PROJECT_PAGE_SIZE
 from mcp_azure_devops.features.projects.tools import _get_projects_impl
 
 
@@ -75,7 +76,9 @@ def test_get_projects_impl_with_filters():
 
     # Check that the filter parameters were passed to the client
     mock_client.get_projects.assert_called_with(
-        state_filter="wellFormed", top=5
+        state_filter="wellFormed",
+        top=PROJECT_PAGE_SIZE,
+        continuation_token=None,
     )
 
     # Check result contains the filtered project
@@ -0,0 +1,121 @@
+import threading
+from unittest.mock import MagicMock
+
+from azure.devops.v7_1.core.models import WebApiTeam
+
+from mcp_azure_devops.features.teams import catalog
+from mcp_azure_devops.features.teams.catalog import (
+    TeamCatalog,
+    get_team_catalog,
+    resolve_team,
+)
+from mcp_azure_devops.features.teams.tools import _get_all_teams_impl
+
+
+def _team(index, project="Project A"):
+    return WebApiTeam(
+        id=f"team-{index}",
+        name=f"Team {index}",
+        project_name=project,
+        project_id=f"{project.lower().replace(' ', '-')}-id",
+    )
+
+
+def _paged_client(teams):
+    """Client serving teams in pages, recording the requested offsets."""
+    client = MagicMock()
+    client.skips = []
+    lock = threading.Lock()
+
+    def get_all_teams(mine=None, top=None, skip=None):
+        assert top is not None and skip is not None
+        with lock:
+            client.skips.append(skip)
+        return teams[skip : skip + top]
+
+    client.get_all_teams.side_effect = get_all_teams
+    return client
+
+
+def test_catalog_fetches_every_page():
+    """Test that pages are fetched until one comes back short."""
+    teams = [_team(index) for index in range(25)]
+    client = _paged_client(teams)
+
+    result = catalog._fetch_teams(client, False, page_size=10, workers=2)
+
+    assert [team.id for team in result] == [team.id for team in teams]
+    assert sorted(client.skips) == [0, 10, 20]
+
+
+def test_catalog_stops_after_the_first_short_page():
+    """Test that a listing fitting one page takes one request."""
+    client = _paged_client([_team(1), _team(2)])
+
+    result = catalog._fetch_teams(client, False, page_size=10)
+
+    assert len(result) == 2
+    assert client.skips == [0]
+
+
+def test_catalog_is_cached():
+    """Test that later listings are answered from the cached catalog."""
+    client = _paged_client([_team(1), _team(2)])
+
+    first = _get_all_teams_impl(client)
+    second = _get_all_teams_impl(client, top=1, skip=1)
+
+    assert "# Team: Team 1" in first
+    assert second.startswith("# Team: Team 2")
+    assert client.get_all_teams.call_count == 1
+
+
+def test_get_all_teams_filters_by_project():
+    """Test listing the teams of one project."""
+    client = _paged_client(
+        [_team(1), _team(2, "Project B"), _team(3), _team(4)]
+    )
+
+    result = _get_all_teams_impl(client, project="project a", top=2)
+
+    assert "# Team: Team 1" in result
+    assert "# Team: Team 3" in result
+    assert "Team 2" not in result
+    assert "Showing teams 1-2 of 3; use skip to see more." in result
+
+
+def test_find_tells_apart_teams_of_the_same_name():
+    """Test lookups by ID, by name and by name within a project."""
+    team_a = _team(1)
+    team_b = WebApiTeam(
+        id="team-b", name="Team 1", project_name="Project B", project_id="b"
+    )
+    team_catalog = TeamCatalog([team_a, team_b])
+
+    assert team_catalog.find("TEAM-1") is team_a
+    assert team_catalog.find("team 1") is None
+    assert team_catalog.find("team 1", "project b") is team_b
+    assert team_catalog.find("team-b", "Project A") is None
+    assert team_catalog.in_project("b") == [team_b]
+
+
+def test_resolve_team_uses_only_the_cached_catalog():
+    """Test that names resolve to IDs once the catalog is cached."""
+    client = _paged_client([_team(1)])
+
+    assert resolve_team(client, "Project A", "team 1") == (
+        "Project A",
+        "team 1",
+    )
+    client.get_all_teams.assert_not_called()
+
+    get_team_catalog(client)
+
+    assert resolve_team(client, "Project A", "team 1") == (
+        "project-a-id",
+        "team-1",
+    )
+    assert resolve_team(client, "Project A", "Other") == (
+        "Project A",
+        "Other",
+    )
@@ -0,0 +1,125 @@
+from datetime import date, datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from azure.devops.v7_1.work.models import (
+    TeamIterationAttributes,
+    TeamSettingsIteration,
+)
+
+from mcp_azure_devops.features.teams.iterations import (
+    ITERATION_INDEX_TTL,
+    IterationIndex,
+    is_iteration_shortcut,
+    resolve_iteration_shortcut,
+)
+
+
+def _iteration(name, start, finish):
+    return TeamSettingsIteration(
+        name=name,
+        path=f"Project\\{name}",
+        attributes=TeamIterationAttributes(
+            start_date=datetime(*start, tzinfo=timezone.utc),
+            finish_date=datetime(*finish, tzinfo=timezone.utc),
+        ),
+    )
+
+
+SPRINTS = [
+    _iteration("Sprint 2", (2024, 1, 15), (2024, 1, 26)),
+    _iteration("Sprint 1", (2024, 1, 1), (2024, 1, 12)),
+    _iteration("Sprint 3", (2024, 1, 29), (2024, 2, 9)),
+    TeamSettingsIteration(name="Backlog", path="Project"),
+]
+
+
+def _name(iteration):
+    assert iteration is not None
+    return iteration.name
+
+
+def test_relative_iterations_during_a_sprint():
+    """Test current, next and previous while a sprint runs."""
+    index = IterationIndex(SPRINTS)
+    today = date(2024, 1, 26)
+
+    assert _name(index.current(today)) == "Sprint 2"
+    assert _name(index.relative(1, today)) == "Sprint 3"
+    assert _name(index.relative(-1, today)) == "Sprint 1"
+    assert index.relative(2, today) is None
+    assert len(index.iterations) == 4
+
+
+def test_relative_iterations_between_sprints():
+    """Test that a weekend between sprints has no current iteration."""
+    index = IterationIndex(SPRINTS)
+    today = date(2024, 1, 27)
+
+    assert index.current(today) is None
+    assert _name(index.relative(1, today)) == "Sprint 3"
+    assert _name(index.relative(-1, today)) == "Sprint 2"
+
+
+def test_index_expires_at_the_next_boundary():
+    """Test that the index lives until the current sprint finishes."""
+    index = IterationIndex(SPRINTS)
+
+    # Sprint 2 finishes at the end of January 26th
+    assert index.seconds_valid(
+        datetime(2024, 1, 26, 23, 0, tzinfo=timezone.utc)
+    ) == pytest.approx(3600)
+    # Between sprints it lives until the next one starts
+    assert index.seconds_valid(
+        datetime(2024, 1, 28, 23, 30, tzinfo=timezone.utc)
+    ) == pytest.approx(1800)
+    assert (
+        index.seconds_valid(datetime(2024, 1, 2, tzinfo=timezone.utc))
+        == ITERATION_INDEX_TTL
+    )
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("@current", True),
+        ("@Next", True),
+        ("@CurrentIteration - 1", True),
+        ("@CurrentIteration('[Project]\\Web')", True),
+        ("Project\\Sprint 1", False),
+        ("@today", False),
+        (None, False),
+    ],
+)
+def test_is_iteration_shortcut(value, expected):
+    """Test which iteration path values are shortcuts."""
+    assert is_iteration_shortcut(value) is expected
+
+
+def test_resolve_shortcuts_share_one_fetch(monkeypatch):
+    """Test that shortcuts for a team are resolved from one fetch."""
+    from mcp_azure_devops.features.teams import iterations
+
+    monkeypatch.setattr(iterations, "_today", lambda: date(2024, 1, 16))
+    client = MagicMock()
+    client.get_team_iterations.return_value = SPRINTS
+
+    assert (
+        resolve_iteration_shortcut(client, "Project", "@current")
+        == "Project\\Sprint 2"
+    )
+    assert (
+        resolve_iteration_shortcut(client, "project", "@CurrentIteration + 1")
+        == "Project\\Sprint 3"
+    )
+    client.get_team_iterations.assert_called_once()
+
+    resolve_iteration_shortcut(
+        client, "Project", "@previous('[Project]\\Web')"
+    )
+    team_context = client.get_team_iterations.call_args.kwargs["team_context"]
+    assert team_context.team == "Web"
+
+    client.get_team_iterations.return_value = []
+    with pytest.raises(ValueError, match="No iteration matches @next"):
+        resolve_iteration_shortcut(client, "Other", "@next")
@@ -0,0 +1,102 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from mcp_azure_devops.features.teams.catalog import get_team_catalog
+from mcp_azure_devops.features.teams.tools import _get_project_members_impl
+
+
+def _identity(name):
+    return SimpleNamespace(
+        id=f"{name.lower()}-id",
+        display_name=name,
+        unique_name=f"{name.lower()}@example.com",
+    )
+
+
+def _client(rosters):
+    """Client serving the given team rosters for project "P"."""
+    client = MagicMock()
+    teams = [
+        SimpleNamespace(
+            id=f"{name}-id", name=name, project_name="P", project_id="p-id"
+        )
+        for name in rosters
+    ]
+    client.get_teams.side_effect = lambda project_id, top, skip: teams[
+        skip : skip + top
+    ]
+    client.get_all_teams.side_effect = lambda mine, top, skip: teams[
+        skip : skip + top
+    ]
+
+    def get_members(project_id, team_id, top, skip):
+        roster = rosters[team_id[: -len("-id")]]
+        return roster[skip : skip + top]
+
+    client.get_team_members_with_extended_properties.side_effect = get_members
+    return client
+
+
+def _member(name, admin=False):
+    return SimpleNamespace(identity=_identity(name), is_team_admin=admin)
+
+
+def test_project_members_are_deduplicated_across_teams():
+    """Test that each identity appears once with all of its teams."""
+    client = _client(
+        {
+            "Web": [_member("Bob", admin=True), _member("alice")],
+            "Api": [_member("Bob")],
+        }
+    )
+
+    result = _get_project_members_impl(client, "P")
+
+    assert "2 members across 2 teams" in result
+    assert (
+        "| alice | alice@example.com | alice-id | Web |\n"
+        "| Bob | bob@example.com | bob-id | Web (admin), Api |"
+    ) in result
+    assert client.get_team_members_with_extended_properties.call_count == 2
+
+
+def test_project_members_are_cached():
+    """Test that a repeated call makes no requests."""
+    client = _client({"Web": [_member("Alice")]})
+
+    _get_project_members_impl(client, "P")
+    result = _get_project_members_impl(client, "p")
+
+    assert "| Alice |" in result
+    assert client.get_teams.call_count == 1
+    assert client.get_team_members_with_extended_properties.call_count == 1
+
+
+def test_project_members_use_the_cached_team_catalog():
+    """Test that teams come from the team catalog when it is cached."""
+    client = _client({"Web": [_member("Alice")]})
+    get_team_catalog(client)
+
+    result = _get_project_members_impl(client, "P")
+
+    assert "| Alice |" in result
+    client.get_teams.assert_not_called()
+
+
+def test_project_members_without_teams():
+    """Test a project without teams."""
+    client = _client({})
+
+    result = _get_project_members_impl(client, "P")
+
+    assert result == "No teams found in project P."
+
+
+def test_project_members_error():
+    """Test error handling in project members retrieval."""
+    client = MagicMock()
+    client.get_teams.side_effect = Exception("Test error")
+
+    result = _get_project_members_impl(client, "P")
+
+    assert result == "Error retrieving project members: Test error"
@@ -1,3 +1,4 @@
+from datetime import date, datetime, time, timedelta, timezone
 from unittest.mock import MagicMock
 
 from azure.devops.v7_1.core.models import IdentityRef, TeamMember, WebApiTeam
@@ -7,6 +8,7 @@ from azure.devops.v7_1.work.models import (
     TeamSettingsIteration,
 )
 
+from mcp_azure_devops.features.teams.catalog import TEAM_PAGE_SIZE
 from mcp_azure_devops.features.teams.tools import (
     _get_all_teams_impl,
     _get_team_area_paths_impl,
@@ -86,8 +88,10 @@ def test_get_all_teams_impl_with_filters():
         mock_client, user_is_member_of=True, top=5, skip=0
     )
 
-    # Check that the filter parameters were passed to the client
-    mock_client.get_all_teams.assert_called_with(mine=True, top=5, skip=0)
+    # Check that the filter was passed to the client and teams were paged
+    mock_client.get_all_teams.assert_called_with(
+        mine=True, top=TEAM_PAGE_SIZE, skip=0
+    )
 
     # Check result contains the filtered team
     assert "# Team: Filtered Team" in result
@@ -273,35 +277,41 @@ def test_get_team_iterations_impl_error():
 
 
 def test_get_team_iterations_impl_with_current_parameter():
-    """Test getting team iterations with current parameter."""
+    """Test that the current iteration is picked from the cached index."""
     mock_client = MagicMock()
 
-    # Mock iteration results
-    mock_iteration = MagicMock(spec=TeamSettingsIteration)
-    mock_iteration.name = "Current Sprint"
-
-    mock_client.get_team_iterations.return_value = [mock_iteration]
+    today = date.today()
+    iterations = []
+    for name, start in [
+        ("Past Sprint", today - timedelta(days=20)),
+        ("Current Sprint", today - timedelta(days=3)),
+        ("Next Sprint", today + timedelta(days=11)),
+    ]:
+        iteration = MagicMock(spec=TeamSettingsIteration)
+        iteration.name = name
+        iteration.attributes = TeamIterationAttributes(
+            start_date=datetime.combine(start, time(), timezone.utc),
+            finish_date=datetime.combine(
+                start + timedelta(days=10), time(), timezone.utc
+            ),
+        )
+        iterations.append(iteration)
+
+    mock_client.get_team_iterations.return_value = iterations
 
     result = _get_team_iterations_impl(
         mock_client, "Project", "Team", current=True
     )
+    again = _get_team_iterations_impl(
+        mock_client, "Project", "Team", current=True
+    )
+
+    # The full list is fetched once and the current one chosen locally
+    mock_client.get_team_iterations.assert_called_once()
+    assert "timeframe" not in mock_client.get_team_iterations.call_args.kwargs
 
-    # Using a more flexible approach to check the timeframe parameter
-    # Store the call arguments
-    call_args_list = mock_client.get_team_iterations.call_args_list
-    assert len(call_args_list) > 0
-
-    # Get the most recent call
-    args, kwargs = call_args_list[-1]
-
-    # Check that the timeframe is 'Current' by any means possible
-    # Option 1: Check kwargs directly
-    if "timeframe" in kwargs:
-        assert kwargs["timeframe"] == "Current"
-    # Option 2: Just verify 'Current' is somewhere in the call arguments
-    else:
-        call_str = str(mock_client.get_team_iterations.call_args)
-        assert "Current" in call_str
-
-    # Check result contains the current iteration
-    assert "# Iteration: Current Sprint" in result
+    # Check result contains only the current iteration
+    assert result.startswith("# Iteration: Current Sprint")
+    assert "Past Sprint" not in result
+    assert "Next Sprint" not in result
+    assert again == result
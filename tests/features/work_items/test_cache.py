@@ -0,0 +1,122 @@
+"""Tests for the work item query result cache."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_azure_devops.features.work_items.cache import (
+    _MACRO_PERIOD_SECONDS,
+    _query_ttl,
+    cache_query_ids,
+    get_cached_query_ids,
+    invalidate_work_items,
+    normalize_wiql,
+)
+from mcp_azure_devops.features.work_items.tools.create import (
+    _update_work_item_impl,
+)
+
+
+def test_normalize_wiql_folds_whitespace_and_case():
+    """Test that equivalent queries share a cache key."""
+    first = "SELECT [System.Id]\n  FROM WorkItems WHERE [System.State] = 'X'"
+    second = "select [system.id] from workitems where [system.state] = 'x'"
+
+    assert normalize_wiql(first) == normalize_wiql(second)
+
+
+def test_normalize_wiql_keeps_whitespace_inside_literals():
+    """Test that string literals are not collapsed."""
+    normalized = normalize_wiql("WHERE [System.Title] = 'a   b'")
+
+    assert normalized == "where [system.title] = 'a   b'"
+
+
+def test_cache_is_keyed_by_top():
+    """Test that results are cached per top value."""
+    cache_query_ids("SELECT * FROM WorkItems", 10, [1, 2])
+
+    assert get_cached_query_ids("select *  from workitems", 10) == [1, 2]
+    assert get_cached_query_ids("SELECT * FROM WorkItems", 20) is None
+
+
+def test_ttl_is_configurable(monkeypatch):
+    """Test that a zero TTL disables caching."""
+    monkeypatch.setenv("AZURE_DEVOPS_QUERY_CACHE_TTL", "0")
+    cache_query_ids("SELECT * FROM WorkItems", 10, [1])
+
+    assert get_cached_query_ids("SELECT * FROM WorkItems", 10) is None
+
+
+def test_date_macros_bound_the_ttl(monkeypatch):
+    """Test that @Today results expire at the next period boundary."""
+    monkeypatch.setenv("AZURE_DEVOPS_QUERY_CACHE_TTL", "3600")
+    boundary = _MACRO_PERIOD_SECONDS * 1000
+
+    assert _query_ttl("where [x] = @today", now=boundary - 5) == 5
+    assert _query_ttl("where [x] = @currentiteration", now=boundary) == (
+        _MACRO_PERIOD_SECONDS
+    )
+    assert _query_ttl("where [x] = 1", now=boundary - 5) == 3600
+
+
+def test_invalidate_drops_entries_with_changed_ids():
+    """Test that writes invalidate only the results containing the IDs."""
+    cache_query_ids("query a", 10, [1, 2])
+    cache_query_ids("query b", 10, [3])
+
+    invalidate_work_items([2])
+
+    assert get_cached_query_ids("query a", 10) is None
+    assert get_cached_query_ids("query b", 10) == [3]
+
+    invalidate_work_items()
+
+    assert get_cached_query_ids("query b", 10) is None
+
+
+def test_cache_is_partitioned_by_organization():
+    """Test that organizations never see each other's results."""
+    contoso = "https://dev.azure.com/contoso"
+    fabrikam = "https://dev.azure.com/fabrikam"
+    cache_query_ids("query", 10, [1], contoso)
+    cache_query_ids("query", 10, [2], fabrikam)
+
+    assert get_cached_query_ids("query", 10, contoso) == [1]
+    assert get_cached_query_ids("query", 10, fabrikam) == [2]
+
+    invalidate_work_items(organization=contoso)
+
+    assert get_cached_query_ids("query", 10, contoso) is None
+    assert get_cached_query_ids("query", 10, fabrikam) == [2]
+
+
+def test_cache_is_partitioned_by_tenant():
+    """Test that users never see results cached for another PAT."""
+    organization = "https://dev.azure.com/contoso"
+    cache_query_ids("query", 10, [1, 2], organization, "alice")
+
+    assert get_cached_query_ids("query", 10, organization, "alice") == [1, 2]
+    assert get_cached_query_ids("query", 10, organization, "bob") is None
+
+    # A write by anyone invalidates everyone's results
+    invalidate_work_items([2], organization)
+
+    assert get_cached_query_ids("query", 10, organization, "alice") is None
+
+
+def test_updates_invalidate_only_after_they_succeed():
+    """Test that a rejected update keeps cached results containing it."""
+    wit_client = MagicMock()
+    wit_client.update_work_item.side_effect = Exception("Rule error")
+    cache_query_ids("query", 10, [7])
+
+    with pytest.raises(Exception, match="Rule error"):
+        _update_work_item_impl(7, {"System.Title": "New"}, wit_client)
+
+    assert get_cached_query_ids("query", 10) == [7]
+
+    wit_client.update_work_item.side_effect = None
+    _update_work_item_impl(7, {"System.Title": "New"}, wit_client)
+
+    assert get_cached_query_ids("query", 10) is None
@@ -0,0 +1,153 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_azure_devops.features.work_items.classification import (
+    ClassificationTree,
+    get_classification_tree,
+)
+from mcp_azure_devops.features.work_items.tools.classification import (
+    _get_classification_paths_impl,
+)
+from mcp_azure_devops.features.work_items.tools.create import (
+    _validate_classification_paths,
+)
+
+
+def _node(name, *children):
+    return SimpleNamespace(name=name, children=list(children) or None)
+
+
+AREAS = _node(
+    "Fabrikam",
+    _node("Web", _node("Checkout"), _node("Search")),
+    _node("Website"),
+    _node("Mobile"),
+)
+
+
+def test_canonical_paths_ignore_case():
+    """Test exact lookups regardless of case and separators."""
+    tree = ClassificationTree(AREAS)
+
+    assert tree.canonical("fabrikam\\web\\CHECKOUT") == (
+        "Fabrikam\\Web\\Checkout"
+    )
+    assert tree.canonical("\\Fabrikam\\Mobile\\") == "Fabrikam\\Mobile"
+    assert tree.canonical("Fabrikam\\Desktop") is None
+    assert tree.canonical("Contoso\\Web") is None
+
+
+def test_under_and_expand():
+    """Test subtree enumeration and prefix expansion."""
+    tree = ClassificationTree(AREAS)
+
+    assert tree.under("Fabrikam\\Web") == [
+        "Fabrikam\\Web",
+        "Fabrikam\\Web\\Checkout",
+        "Fabrikam\\Web\\Search",
+    ]
+    assert tree.expand("Fabrikam\\we") == [
+        "Fabrikam\\Web",
+        "Fabrikam\\Web\\Checkout",
+        "Fabrikam\\Web\\Search",
+        "Fabrikam\\Website",
+    ]
+    assert tree.expand("Fabrikam\\Web\\") == tree.under("Fabrikam\\Web")
+    assert len(tree.under()) == 6
+
+
+def test_suggestions_for_missing_paths():
+    """Test that suggestions come from the closest existing node."""
+    tree = ClassificationTree(AREAS)
+
+    assert tree.suggestions("Fabrikam\\Mob") == ["Fabrikam\\Mobile"]
+    assert tree.suggestions("Fabrikam\\Web\\Cart", limit=2) == [
+        "Fabrikam\\Web\\Checkout",
+        "Fabrikam\\Web\\Search",
+    ]
+
+
+def test_tree_is_fetched_once_per_structure():
+    """Test that trees are cached per project and structure group."""
+    client = MagicMock()
+    client.get_classification_node.return_value = AREAS
+
+    get_classification_tree(client, "Fabrikam", "area")
+    get_classification_tree(client, "fabrikam", "Area")
+    get_classification_tree(client, "Fabrikam", "iteration")
+
+    assert client.get_classification_node.call_count == 2
+    assert client.get_classification_node.call_args.args[1] == "iterations"
+    with pytest.raises(ValueError, match="Unknown classification"):
+        get_classification_tree(client, "Fabrikam", "sprint")
+
+
+def test_get_classification_paths_impl():
+    """Test listing paths under a node."""
+    client = MagicMock()
+    client.get_classification_node.return_value = AREAS
+
+    result = _get_classification_paths_impl(
+        client, "Fabrikam", under="fabrikam\\web"
+    )
+    missing = _get_classification_paths_impl(
+        client, "Fabrikam", under="Fabrikam\\Desktop"
+    )
+
+    assert result == (
+        "# Area Paths: Fabrikam\n"
+        "- Fabrikam\\Web\n"
+        "- Fabrikam\\Web\\Checkout\n"
+        "- Fabrikam\\Web\\Search"
+    )
+    assert missing.startswith("Error: Area path 'Fabrikam\\Desktop'")
+
+
+def test_validate_classification_paths():
+    """Test that every bad path is reported before anything is sent."""
+    client = MagicMock()
+    client.get_classification_node.side_effect = lambda project, group, **_: (
+        AREAS if group == "areas" else _node("Fabrikam", _node("Sprint 1"))
+    )
+
+    fields = {
+        "System.AreaPath": "fabrikam\\web",
+        "System.IterationPath": "Fabrikam\\Sprint 1",
+    }
+    _validate_classification_paths(fields, "Fabrikam", client)
+    assert fields["System.AreaPath"] == "Fabrikam\\Web"
+
+    fields = {
+        "System.AreaPath": "Fabrikam\\Mob",
+        "System.IterationPath": "Fabrikam\\Sprint 2",
+    }
+    with pytest.raises(ValueError) as error:
+        _validate_classification_paths(fields, "Fabrikam", client)
+    assert str(error.value) == (
+        "Area path 'Fabrikam\\Mob' does not exist; did you mean "
+        "Fabrikam\\Mobile\n"
+        "Iteration path 'Fabrikam\\Sprint 2' does not exist; did you mean "
+        "Fabrikam\\Sprint 1"
+    )
+    client.create_work_item.assert_not_called()
+
+
+def test_new_paths_are_found_after_a_refresh():
+    """Test that a node added after the tree was cached is accepted."""
+    client = MagicMock()
+    client.get_classification_node.return_value = AREAS
+    get_classification_tree(client, "Fabrikam", "area")
+
+    client.get_classification_node.return_value = _node(
+        "Fabrikam", _node("Web"), _node("Desktop")
+    )
+    fields = {"System.AreaPath": "fabrikam\\desktop"}
+    _validate_classification_paths(fields, "Fabrikam", client)
+
+    assert fields["System.AreaPath"] == "Fabrikam\\Desktop"
+    assert client.get_classification_node.call_count == 2
+    # The refreshed tree is cached for the next write
+    _validate_classification_paths(fields, "Fabrikam", client)
+    assert client.get_classification_node.call_count == 2
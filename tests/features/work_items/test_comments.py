@@ -101,7 +101,9 @@ def test_get_project_for_work_item_success():
     result = _get_project_for_work_item(123, mock_client)
 
     assert result == "MyProject"
-    mock_client.get_work_item.assert_called_once_with(123)
+    mock_client.get_work_item.assert_called_once_with(
+        123, fields=["System.TeamProject"]
+    )
 
 
 def test_get_project_for_work_item_no_project_field():
@@ -198,7 +200,9 @@ def test_get_work_item_comments_impl_without_project():
 
     assert "## Comment by Test User on 2023-01-12" in result
     assert "Auto-detected project comment" in result
-    mock_client.get_work_item.assert_called_once_with(123)
+    mock_client.get_work_item.assert_called_once_with(
+        123, fields=["System.TeamProject"]
+    )
     mock_client.get_comments.assert_called_once_with(
         project="AutoProject", work_item_id=123
     )
@@ -283,7 +287,9 @@ def test_add_work_item_comment_impl_without_project():
 
     assert "Comment added successfully." in result
     assert "## Comment by Current User on 2023-02-01" in result
-    mock_client.get_work_item.assert_called_once_with(123)
+    mock_client.get_work_item.assert_called_once_with(
+        123, fields=["System.TeamProject"]
+    )
 
 
 def test_add_work_item_comment_impl_project_not_found():
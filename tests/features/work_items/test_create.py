@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock, patch
 
+import pytest
 from azure.devops.v7_1.work_item_tracking.models import WorkItem
 
 from mcp_azure_devops.features.work_items.tools.create import (
@@ -11,6 +12,7 @@ from mcp_azure_devops.features.work_items.tools.create import (
     _find_tested_by_relation_index,
     _get_organization_url,
     _prepare_standard_fields,
+    _resolve_iteration_path,
     _update_work_item_impl,
 )
 
@@ -63,6 +65,47 @@ def test_get_organization_url(mock_os):
     assert url == ""
 
 
+def test_links_point_into_the_client_organization(monkeypatch):
+    """Test that links use the organization of the client, not the default."""
+    monkeypatch.setenv(
+        "AZURE_DEVOPS_ORGANIZATION_URL", "https://dev.azure.com/contoso"
+    )
+    mock_client = MagicMock()
+    mock_client.config.base_url = "https://dev.azure.com/Fabrikam/"
+    mock_work_item = MagicMock(spec=WorkItem)
+    mock_work_item.id = 123
+    mock_work_item.fields = {"System.Title": "Test Bug"}
+    mock_client.create_work_item.return_value = mock_work_item
+    mock_client.update_work_item.return_value = mock_work_item
+
+    assert _get_organization_url(mock_client) == (
+        "https://dev.azure.com/Fabrikam"
+    )
+    assert _get_organization_url() == "https://dev.azure.com/contoso"
+
+    _create_work_item_impl(
+        fields={"System.Title": "Test Bug"},
+        project="Test Project",
+        work_item_type="Bug",
+        wit_client=mock_client,
+        parent_id=456,
+        related_ids=[789],
+    )
+    _add_link_to_work_item_impl(
+        123, 456, "System.LinkTypes.Related", mock_client
+    )
+
+    urls = [
+        call.kwargs["document"][0].value["url"]
+        for call in mock_client.update_work_item.call_args_list
+    ]
+    assert urls == [
+        "https://dev.azure.com/Fabrikam/_apis/wit/workItems/456",
+        "https://dev.azure.com/Fabrikam/_apis/wit/workItems/789",
+        "https://dev.azure.com/Fabrikam/_apis/wit/workItems/456",
+    ]
+
+
 def test_build_link_document():
     """Test building link document for work item relationships."""
     target_id = 123
@@ -360,6 +403,36 @@ def test_prepare_standard_fields():
     assert "System.Description" not in fields
 
 
+def test_resolve_iteration_path():
+    """Test that iteration shortcuts are replaced with iteration paths."""
+    fields = {"System.IterationPath": "@current"}
+    with patch(
+        "mcp_azure_devops.features.work_items.tools.create."
+        "resolve_iteration_shortcut",
+        return_value="Project\\Sprint 2",
+    ) as mock_resolve, patch(
+        "mcp_azure_devops.features.work_items.tools.create.get_work_client"
+    ):
+        _resolve_iteration_path(fields, "Project")
+
+        # Plain paths are left alone
+        plain = {"System.IterationPath": "Project\\Sprint 1"}
+        _resolve_iteration_path(plain, "Project")
+
+    assert fields["System.IterationPath"] == "Project\\Sprint 2"
+    assert plain["System.IterationPath"] == "Project\\Sprint 1"
+    mock_resolve.assert_called_once()
+    assert mock_resolve.call_args.args[1:] == ("Project", "@current", None)
+
+
+def test_resolve_iteration_path_requires_project():
+    """Test that a shortcut cannot be resolved without a project."""
+    fields = {"System.IterationPath": "@next"}
+
+    with pytest.raises(ValueError, match="A project is required"):
+        _resolve_iteration_path(fields, None)
+
+
 def test_ensure_system_prefix():
     """Test ensuring field names have proper prefix."""
     # Test with already prefixed fields
@@ -0,0 +1,66 @@
+"""Tests for work item formatting."""
+
+from unittest.mock import MagicMock, patch
+
+from azure.devops.v7_1.work_item_tracking.models import WorkItem
+
+from mcp_azure_devops.features.work_items.formatting import format_work_item
+
+
+def _work_item(fields, item_id=1, rev=1):
+    work_item = MagicMock(spec=WorkItem)
+    work_item.id = item_id
+    work_item.rev = rev
+    work_item.fields = fields
+    work_item.relations = None
+    return work_item
+
+
+def test_html_fields_are_reduced_to_text():
+    """Test that HTML fields are rendered as compact text."""
+    work_item = _work_item(
+        {
+            "System.Title": "Bug",
+            "System.Description": '<div style="color:red"><p>Broken</p></div>',
+            "Microsoft.VSTS.TCM.ReproSteps": "<ol><li>Open</li></ol>",
+        }
+    )
+
+    result = format_work_item(work_item)
+
+    assert "- **System.Description**: Broken" in result
+    assert "- **Microsoft.VSTS.TCM.ReproSteps**: 1. Open" in result
+    assert "style" not in result
+
+
+def test_other_fields_keep_their_value():
+    """Test that non-HTML fields are not converted."""
+    work_item = _work_item({"Custom.Markup": "<b>raw</b>"})
+
+    result = format_work_item(work_item)
+
+    assert "- **Custom.Markup**: <b>raw</b>" in result
+
+
+def test_html_field_cap_is_configurable(monkeypatch):
+    """Test the per-field character cap."""
+    monkeypatch.setenv("AZURE_DEVOPS_HTML_FIELD_MAX_CHARS", "10")
+    work_item = _work_item(
+        {"System.Description": "<p>" + "a" * 50 + "</p>"}, item_id=2
+    )
+
+    result = format_work_item(work_item)
+
+    assert "- **System.Description**: aaaaaaaaaa … [truncated]" in result
+
+
+def test_conversion_is_memoized_per_revision():
+    """Test that a revision's field is only converted once."""
+    html = "<p>Memoized</p>"
+    target = "mcp_azure_devops.features.work_items.formatting.html_to_text"
+    with patch(target, return_value="Memoized") as convert:
+        format_work_item(_work_item({"System.Description": html}, 3, 1))
+        format_work_item(_work_item({"System.Description": html}, 3, 1))
+        format_work_item(_work_item({"System.Description": html}, 3, 2))
+
+    assert convert.call_count == 2
@@ -0,0 +1,149 @@
+"""Tests for work item history operations."""
+
+from unittest.mock import MagicMock
+
+from azure.devops.v7_1.work_item_tracking.models import (
+    IdentityReference,
+    WorkItemFieldUpdate,
+    WorkItemRelation,
+    WorkItemRelationUpdates,
+    WorkItemUpdate,
+)
+
+from mcp_azure_devops.features.work_items.tools.history import (
+    _get_work_item_history_impl,
+)
+
+
+def _update(rev, changed_date, fields=None, relations=None):
+    all_fields = {
+        "System.Rev": WorkItemFieldUpdate(old_value=rev - 1, new_value=rev),
+        "System.ChangedDate": WorkItemFieldUpdate(new_value=changed_date),
+    }
+    all_fields.update(
+        {
+            name: WorkItemFieldUpdate(old_value=old, new_value=new)
+            for name, (old, new) in (fields or {}).items()
+        }
+    )
+    return WorkItemUpdate(
+        rev=rev,
+        fields=all_fields,
+        relations=relations,
+        revised_by=IdentityReference(display_name="Jane Doe"),
+    )
+
+
+def _client(updates):
+    mock_client = MagicMock()
+
+    def get_updates(item_id, project=None, top=None, skip=None):
+        assert top is not None and skip is not None
+        return updates[skip : skip + top]
+
+    mock_client.get_updates.side_effect = get_updates
+    return mock_client
+
+
+def test_history_lists_field_changes():
+    """Test that each revision becomes a compact change record."""
+    mock_client = _client(
+        [
+            _update(
+                1, "2024-01-01T10:00:00Z", {"System.State": (None, "New")}
+            ),
+            _update(
+                2,
+                "2024-01-02T10:00:00Z",
+                {
+                    "System.State": ("New", "Active"),
+                    "System.Description": (None, "<p>Some <b>text</b></p>"),
+                },
+            ),
+        ]
+    )
+
+    result = _get_work_item_history_impl(1, mock_client)
+
+    assert "# History of Work Item 1" in result
+    assert "- Rev 1 · 2024-01-01T10:00:00+00:00 · Jane Doe" in result
+    assert "  - System.State: (empty) → New" in result
+    assert "  - System.State: New → Active" in result
+    assert "  - System.Description: (empty) → Some **text**" in result
+    assert "System.Rev" not in result
+    assert "System.ChangedDate" not in result
+
+
+def test_history_filters_by_since_and_fields():
+    """Test the since and fields filters."""
+    mock_client = _client(
+        [
+            _update(
+                1, "2024-01-01T10:00:00Z", {"System.State": (None, "New")}
+            ),
+            _update(
+                2,
+                "2024-01-03T10:00:00Z",
+                {
+                    "System.State": ("New", "Active"),
+                    "System.Title": ("a", "b"),
+                },
+            ),
+        ]
+    )
+
+    result = _get_work_item_history_impl(
+        1, mock_client, since="2024-01-02", fields=["System.State"]
+    )
+
+    assert "Rev 1" not in result
+    assert "  - System.State: New → Active" in result
+    assert "System.Title" not in result
+
+
+def test_history_pages_lazily_and_keeps_latest_records():
+    """Test paging through many updates with bounded output."""
+    updates = [
+        _update(
+            rev,
+            f"2024-01-01T00:{rev // 60:02d}:{rev % 60:02d}Z",
+            {"Microsoft.VSTS.Scheduling.RemainingWork": (rev - 1, rev)},
+        )
+        for rev in range(1, 451)
+    ]
+    mock_client = _client(updates)
+
+    result = _get_work_item_history_impl(1, mock_client, max_records=10)
+
+    assert mock_client.get_updates.call_count == 3
+    assert "Rev 450 " in result
+    assert "Rev 440 " not in result
+    assert "440 earlier changes omitted" in result
+
+
+def test_history_reports_link_changes():
+    """Test that relation updates are included."""
+    relations = WorkItemRelationUpdates(
+        added=[
+            WorkItemRelation(
+                rel="System.LinkTypes.Related",
+                url="https://dev.azure.com/org/_apis/wit/workItems/2",
+            )
+        ]
+    )
+    mock_client = _client(
+        [_update(1, "2024-01-01T10:00:00Z", relations=relations)]
+    )
+
+    result = _get_work_item_history_impl(1, mock_client)
+
+    assert "  - Link added: System.LinkTypes.Related" in result
+
+
+def test_history_without_changes():
+    """Test a work item without matching changes."""
+    mock_client = _client([])
+
+    result = _get_work_item_history_impl(1, mock_client)
+
+    assert result == "No matching changes found for work item 1."
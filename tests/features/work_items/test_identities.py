@@ -0,0 +1,155 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_azure_devops.features.work_items.identities import (
+    clear_identities,
+    resolve_identities,
+    resolve_identity,
+)
+from mcp_azure_devops.features.work_items.tools.create import (
+    _preflight_check,
+)
+
+
+def _identity(name, email, active=True):
+    return SimpleNamespace(
+        provider_display_name=name,
+        custom_display_name=None,
+        is_active=active,
+        properties={"Account": {"$type": "System.String", "$value": email}},
+    )
+
+
+def _directory(people):
+    """Identity client searching display names by prefix, emails exactly."""
+    identity_client = MagicMock()
+
+    def read_identities(search_filter=None, filter_value=None):
+        assert search_filter == "General"
+        assert filter_value is not None
+        key = filter_value.casefold()
+        return [
+            _identity(name, email)
+            for name, email in people
+            if name.casefold().startswith(key) or email.casefold() == key
+        ]
+
+    identity_client.read_identities.side_effect = read_identities
+    return identity_client
+
+
+def test_many_items_for_few_people_cost_one_lookup_each():
+    people = [(f"User {i}", f"user{i}@example.com") for i in range(10)]
+    identity_client = _directory(people)
+    values = [f"User{i % 10}@Example.com" for i in range(100)]
+
+    resolved = resolve_identities(identity_client, values)
+
+    assert resolved["User3@Example.com"] == "User 3 <user3@example.com>"
+    assert identity_client.read_identities.call_count == 10
+
+    # A warm cache needs no lookups at all
+    resolve_identities(identity_client, values)
+    assert identity_client.read_identities.call_count == 10
+
+
+def test_exact_matches_win_and_unique_values_are_not_looked_up():
+    identity_client = _directory(
+        [("User 1", "user1@example.com"), ("User 10", "user10@example.com")]
+    )
+
+    assert (
+        resolve_identity(identity_client, "User 1")
+        == "User 1 <user1@example.com>"
+    )
+    assert (
+        resolve_identity(identity_client, "Someone <someone@example.com>")
+        == "Someone <someone@example.com>"
+    )
+    assert identity_client.read_identities.call_count == 1
+
+
+def test_ambiguous_and_unknown_values_are_reported_and_cached():
+    identity_client = _directory(
+        [
+            ("Alex Kim", "alex.kim@example.com"),
+            ("Alex Kim", "akim@example.com"),
+        ]
+    )
+
+    for _ in range(2):
+        with pytest.raises(ValueError) as error:
+            resolve_identities(identity_client, ["alex kim", "Nobody"])
+        assert "'alex kim' matches several identities" in str(error.value)
+        assert "akim@example.com" in str(error.value)
+        assert "No identity matches 'Nobody'" in str(error.value)
+
+    # Misses are cached as well as matches
+    assert identity_client.read_identities.call_count == 2
+
+
+def test_partial_matches_are_suggested_not_assigned():
+    identity_client = _directory([("Anne Smith", "anne@example.com")])
+
+    with pytest.raises(ValueError) as error:
+        resolve_identity(identity_client, "Ann")
+
+    assert str(error.value) == (
+        "No identity matches 'Ann' exactly; did you mean "
+        "Anne Smith <anne@example.com>?"
+    )
+    assert (
+        resolve_identity(identity_client, "anne@example.com")
+        == "Anne Smith <anne@example.com>"
+    )
+
+
+def test_failed_lookups_are_left_to_the_server():
+    identity_client = MagicMock()
+    identity_client.read_identities.side_effect = Exception("unavailable")
+
+    assert resolve_identity(identity_client, "Alex") == "Alex"
+    resolve_identity(identity_client, "Alex")
+    assert identity_client.read_identities.call_count == 2
+
+
+def test_preflight_check_resolves_the_assignee():
+    identity_client = _directory([("Alex Kim", "alex.kim@example.com")])
+    fields = {"System.Title": "Fix", "System.AssignedTo": "alex kim"}
+
+    with patch(
+        "mcp_azure_devops.features.work_items.tools.create"
+        ".get_identity_client",
+        return_value=identity_client,
+    ):
+        _preflight_check(fields, None, None, MagicMock())
+        with pytest.raises(ValueError, match="No identity matches 'Sam'"):
+            _preflight_check(
+                {"System.AssignedTo": "Sam"}, None, None, MagicMock()
+            )
+
+    assert fields["System.AssignedTo"] == "Alex Kim <alex.kim@example.com>"
+
+
+def test_me_resolves_to_the_requesting_identity():
+    """Test that @Me is the caller, looked up once, not a name search."""
+    identity_client = MagicMock()
+    identity_client.get_self.return_value = SimpleNamespace(
+        display_name="Alex Kim", account_name="alex.kim@example.com"
+    )
+
+    for value in ("@Me", "@me"):
+        assert (
+            resolve_identity(identity_client, value)
+            == "Alex Kim <alex.kim@example.com>"
+        )
+    identity_client.get_self.assert_called_once()
+    identity_client.read_identities.assert_not_called()
+
+    # Without the identities API @Me is left to the server
+    clear_identities()
+    identity_client = MagicMock()
+    identity_client.get_self.side_effect = Exception("unavailable")
+    assert resolve_identity(identity_client, "@Me") == "@Me"
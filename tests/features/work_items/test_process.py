@@ -250,6 +250,36 @@ def test_list_processes_impl(mock_get_process_client):
     assert "No" in result  # For is_default=False
 
 
+@patch(
+    "mcp_azure_devops.features.work_items.tools.process.get_work_item_tracking_process_client"
+)
+def test_list_processes_impl_process_info(mock_get_process_client):
+    """Test listing processes returned as ProcessInfo models."""
+    # Arrange
+    from azure.devops.v7_1.work_item_tracking_process.models import (
+        ProcessInfo,
+    )
+
+    mock_process_client = MagicMock()
+    mock_get_process_client.return_value = mock_process_client
+    mock_process_client.get_list_of_processes.return_value = [
+        ProcessInfo(
+            name="Agile",
+            type_id="process-id-123",
+            reference_name="Agile",
+            description="Agile process template",
+            is_default=True,
+        )
+    ]
+
+    # Act
+    result = _list_processes_impl()
+
+    # Assert
+    assert "| Agile | process-id-123 |" in result
+    assert "| Yes |" in result
+
+
 @patch(
     "mcp_azure_devops.features.work_items.tools.process.get_work_item_tracking_process_client"
 )
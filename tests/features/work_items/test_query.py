@@ -1,15 +1,26 @@
 """Comprehensive unit tests for work_items query operations."""
 
+from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
+import pytest
 from azure.devops.v7_1.work_item_tracking.models import (
     WorkItem,
     WorkItemReference,
 )
 
 from mcp_azure_devops.features.work_items.tools.query import (
+    DEFAULT_DELTA_FIELDS,
+    PARTITION_WORKERS,
+    WIQL_RESULT_LIMIT,
+    _add_wiql_condition,
+    _query_work_items_changed_since_impl,
     _query_work_items_impl,
 )
+from mcp_azure_devops.features.work_items.tools.read import (
+    _continue_work_items_impl,
+)
+from mcp_azure_devops.utils import azure_client
 
 
 class TestQueryWorkItemsImpl:
@@ -335,3 +346,337 @@ class TestQueryWorkItemsImpl:
         parts = result.split("\n\n")
         # Should have 2 work items
         assert len(parts) == 2
+
+
+def _fake_get_work_items(ids, **kwargs):
+    """Return a titled mock work item for every requested ID."""
+    items = []
+    for item_id in ids:
+        item = MagicMock(spec=WorkItem)
+        item.id = item_id
+        item.fields = {"System.Title": f"Item {item_id}"}
+        items.append(item)
+    return items
+
+
+class TestQueryResponseBudget:
+    """Test suite for response budgets and continuation cursors."""
+
+    @staticmethod
+    def _client_with_items(count):
+        mock_client = MagicMock()
+        mock_query_result = MagicMock()
+        mock_query_result.work_items = [
+            MagicMock(spec=WorkItemReference, id=str(i))
+            for i in range(1, count + 1)
+        ]
+        mock_client.query_by_wiql.return_value = mock_query_result
+
+        mock_client.get_work_items.side_effect = _fake_get_work_items
+        return mock_client
+
+    def test_max_items_stops_rendering_and_returns_cursor(self):
+        """Test that max_items limits the page and offers a cursor."""
+        mock_client = self._client_with_items(5)
+
+        result = _query_work_items_impl(
+            "SELECT * FROM WorkItems", 10, mock_client, max_items=2
+        )
+
+        assert "# Work Item 1" in result
+        assert "# Work Item 2" in result
+        assert "# Work Item 3" not in result
+        assert "3 more not shown" in result
+        assert 'continue_work_items with cursor "' in result
+        # Only the IDs needed for the first page are fetched
+        assert mock_client.get_work_items.call_args[1]["ids"] == [1, 2]
+
+    def test_max_chars_limits_response_size(self):
+        """Test that max_chars stops before the budget is exceeded."""
+        mock_client = self._client_with_items(5)
+        single = _query_work_items_impl(
+            "SELECT * FROM WorkItems", 1, self._client_with_items(1)
+        )
+
+        result = _query_work_items_impl(
+            "SELECT * FROM WorkItems",
+            10,
+            mock_client,
+            max_chars=len(single) * 2 + 2,
+        )
+
+        assert "# Work Item 2" in result
+        assert "# Work Item 3" not in result
+
+    def test_cursor_resumes_without_reexecuting_query(self):
+        """Test that the cursor resumes from the remaining IDs."""
+        mock_client = self._client_with_items(3)
+        first_page = _query_work_items_impl(
+            "SELECT * FROM WorkItems", 10, mock_client, max_items=2
+        )
+        cursor = first_page.split('cursor "')[1].split('"')[0]
+
+        second_page = _continue_work_items_impl(cursor, mock_client)
+
+        assert "# Work Item 3" in second_page
+        assert "# Work Item 1" not in second_page
+        assert "cursor" not in second_page
+        mock_client.query_by_wiql.assert_called_once()
+
+    def test_cursor_is_bound_to_its_tenant(self):
+        """Test that another user's client cannot resume a cursor."""
+        mock_client = self._client_with_items(3)
+        azure_client._tenants[mock_client.config.credentials] = "owner"
+        first_page = _query_work_items_impl(
+            "SELECT * FROM WorkItems", 10, mock_client, max_items=2
+        )
+        cursor = first_page.split('cursor "')[1].split('"')[0]
+        other_client = self._client_with_items(3)
+        azure_client._tenants[other_client.config.credentials] = "other"
+
+        result = _continue_work_items_impl(cursor, other_client)
+
+        assert "unknown or has expired" in result
+        other_client.get_work_items.assert_not_called()
+
+    def test_unknown_cursor(self):
+        """Test that an unknown cursor returns an error message."""
+        result = _continue_work_items_impl("missing", MagicMock())
+
+        assert "unknown or has expired" in result
+
+
+class TestQueryResultCache:
+    """Test suite for caching of WIQL results."""
+
+    def test_repeated_query_skips_wiql_call(self):
+        """Test that an equivalent query reuses the cached IDs."""
+        mock_client = TestQueryResponseBudget._client_with_items(2)
+
+        _query_work_items_impl("SELECT * FROM WorkItems", 10, mock_client)
+        result = _query_work_items_impl(
+            "select *\n  from workitems", 10, mock_client
+        )
+
+        assert "# Work Item 2" in result
+        mock_client.query_by_wiql.assert_called_once()
+        assert mock_client.get_work_items.call_count == 2
+
+
+HIGHEST_ID_QUERY = (
+    "SELECT [System.Id] FROM WorkItems ORDER BY [System.Id] DESC"
+)
+
+
+class TestQueryPartitioning:
+    """Test suite for queries exceeding the WIQL result limit."""
+
+    def test_add_condition_wraps_existing_where_clause(self):
+        """Test that the added condition is ANDed with the original one."""
+        query = (
+            "SELECT [System.Id] FROM WorkItems "
+            "WHERE [System.Title] = 'order by' OR [System.State] = 'New' "
+            "ORDER BY [System.Id]"
+        )
+
+        result = _add_wiql_condition(query, "[System.Id] < 10")
+
+        assert result == (
+            "SELECT [System.Id] FROM WorkItems "
+            "WHERE ([System.Title] = 'order by' OR [System.State] = 'New') "
+            "AND [System.Id] < 10 ORDER BY [System.Id]"
+        )
+
+    def test_add_condition_without_where_clause(self):
+        """Test that a WHERE clause is added when missing."""
+        result = _add_wiql_condition(
+            "SELECT [System.Id] FROM WorkItems", "[System.Id] < 10"
+        )
+
+        assert result == (
+            "SELECT [System.Id] FROM WorkItems WHERE [System.Id] < 10"
+        )
+
+    @staticmethod
+    def _oversized_client(highest_id):
+        """Mock a client whose unpartitioned queries exceed the limit."""
+        mock_client = MagicMock()
+
+        def query_by_wiql(wiql, top=None):
+            result = MagicMock()
+            if wiql.query == HIGHEST_ID_QUERY:
+                ids = [highest_id]
+            elif "WHERE" not in wiql.query:
+                raise Exception(
+                    "VS402337: The number of work items returned exceeds "
+                    "the size limit of 20000."
+                )
+            else:
+                start = int(wiql.query.split(">= ")[1].split(" ")[0])
+                ids = [start, start + 1]
+                if "DESC" in wiql.query:
+                    ids.reverse()
+            result.work_items = [
+                MagicMock(spec=WorkItemReference, id=str(i)) for i in ids
+            ]
+            return result
+
+        mock_client.query_by_wiql.side_effect = query_by_wiql
+        mock_client.get_work_items.side_effect = _fake_get_work_items
+        return mock_client
+
+    def test_limit_error_falls_back_to_id_partitions(self):
+        """Test that an oversized query is re-run in System.Id ranges."""
+        mock_client = self._oversized_client(WIQL_RESULT_LIMIT * 2 + 5)
+
+        result = _query_work_items_impl(
+            "SELECT [System.Id] FROM WorkItems", 100000, mock_client
+        )
+
+        # One failed query, one for the highest ID and three partitions
+        assert mock_client.query_by_wiql.call_count == 5
+        expected = [1, 2, 20001, 20002, 40001, 40002]
+        for item_id in expected:
+            assert f"# Work Item {item_id}" in result
+        fetched = mock_client.get_work_items.call_args[1]["ids"]
+        assert fetched == expected
+
+    def test_partitions_stop_at_top_and_keep_descending_id_order(self):
+        """Test that later ranges are skipped once top results are found."""
+        ranges = PARTITION_WORKERS + 2
+        mock_client = self._oversized_client(WIQL_RESULT_LIMIT * ranges)
+
+        _query_work_items_impl(
+            "SELECT [System.Id], [System.Title] FROM WorkItems "
+            "ORDER BY [System.Id] DESC",
+            3,
+            mock_client,
+        )
+
+        # One failed query, one for the highest ID and a single batch
+        assert mock_client.query_by_wiql.call_count == 2 + PARTITION_WORKERS
+        top_start = WIQL_RESULT_LIMIT * (ranges - 1) + 1
+        fetched = mock_client.get_work_items.call_args[1]["ids"]
+        assert fetched == [
+            top_start + 1,
+            top_start,
+            top_start - WIQL_RESULT_LIMIT + 1,
+        ]
+
+    def test_other_orderings_are_not_partitioned(self):
+        """Test that an ORDER BY the ranges cannot keep is refused."""
+        mock_client = self._oversized_client(WIQL_RESULT_LIMIT * 3)
+
+        with pytest.raises(ValueError, match="ORDER BY \\[System.Title\\]"):
+            _query_work_items_impl(
+                "SELECT [System.Id] FROM WorkItems ORDER BY [System.Title]",
+                10,
+                mock_client,
+            )
+
+        mock_client.query_by_wiql.assert_called_once()
+
+    def test_other_errors_are_raised(self):
+        """Test that unrelated query errors are not swallowed."""
+        mock_client = MagicMock()
+        mock_client.query_by_wiql.side_effect = Exception("Syntax error")
+
+        try:
+            _query_work_items_impl("SELECT", 10, mock_client)
+        except Exception as e:
+            assert str(e) == "Syntax error"
+        else:
+            raise AssertionError("Expected the query error to propagate")
+
+
+class TestQueryWorkItemsChangedSince:
+    """Test suite for delta queries."""
+
+    QUERY = "SELECT [System.Id] FROM WorkItems WHERE [System.State] = 'Active'"
+
+    @staticmethod
+    def _client(matching, changed, as_of):
+        """Mock a client whose query matches and changes the given IDs."""
+        mock_client = MagicMock()
+
+        def query_by_wiql(wiql, time_precision=None, top=None):
+            ids = changed if "ChangedDate" in wiql.query else matching
+            result = MagicMock()
+            result.as_of = as_of
+            result.work_items = [
+                MagicMock(spec=WorkItemReference, id=str(i)) for i in ids
+            ]
+            return result
+
+        mock_client.query_by_wiql.side_effect = query_by_wiql
+        mock_client.get_work_items.side_effect = _fake_get_work_items
+        return mock_client
+
+    def test_initial_sync_returns_everything_and_watermark(self):
+        """Test that a call without watermark returns all matches."""
+        as_of = datetime(2024, 5, 1, 12, 0, 0, 123000, timezone.utc)
+        mock_client = self._client([1, 2], [], as_of)
+
+        result = _query_work_items_changed_since_impl(
+            self.QUERY, None, mock_client
+        )
+
+        assert "New Watermark: 2024-05-01T12:00:00.123Z" in result
+        assert "Changed: 2" in result
+        assert "Removed" not in result
+        assert "# Work Item 1" in result
+        mock_client.query_by_wiql.assert_called_once()
+        call_kwargs = mock_client.get_work_items.call_args[1]
+        assert call_kwargs["fields"] == DEFAULT_DELTA_FIELDS
+        assert "expand" not in call_kwargs
+
+    def test_delta_returns_changed_and_removed_ids(self):
+        """Test that a follow-up call only fetches changed items."""
+        first_as_of = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+        first = _query_work_items_changed_since_impl(
+            self.QUERY, None, self._client([1, 2, 3], [], first_as_of)
+        )
+        watermark = first.split("New Watermark: ")[1].split("\n")[0]
+
+        second_as_of = datetime(2024, 5, 1, 12, 5, tzinfo=timezone.utc)
+        mock_client = self._client([1, 3, 4], [3, 4], second_as_of)
+        result = _query_work_items_changed_since_impl(
+            self.QUERY, watermark, mock_client, fields=["System.Title"]
+        )
+
+        changed_query = mock_client.query_by_wiql.call_args_list[0][0][0]
+        assert (
+            "[System.ChangedDate] > '2024-05-01T12:00:00.000Z'"
+            in changed_query.query
+        )
+        assert "New Watermark: 2024-05-01T12:05:00.000Z" in result
+        assert "Changed: 2" in result
+        assert "Removed: 2" in result
+        assert mock_client.get_work_items.call_args[1]["ids"] == [3, 4]
+        assert mock_client.get_work_items.call_args[1]["fields"] == [
+            "System.Title"
+        ]
+
+    def test_unknown_watermark_reports_removed_as_unknown(self):
+        """Test a watermark the server holds no snapshot for."""
+        as_of = datetime(2024, 5, 2, tzinfo=timezone.utc)
+        mock_client = self._client([1], [], as_of)
+
+        result = _query_work_items_changed_since_impl(
+            self.QUERY, "2024-05-01T00:00:00Z", mock_client
+        )
+
+        assert "Changed: 0" in result
+        assert "Removed: unknown" in result
+        mock_client.get_work_items.assert_not_called()
+
+    def test_invalid_watermark(self):
+        """Test that an invalid watermark is rejected before any call."""
+        mock_client = MagicMock()
+
+        result = _query_work_items_changed_since_impl(
+            self.QUERY, "yesterday", mock_client
+        )
+
+        assert "Invalid watermark" in result
+        mock_client.query_by_wiql.assert_not_called()
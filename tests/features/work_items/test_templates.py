@@ -1,12 +1,18 @@
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 from azure.devops.v7_1.work_item_tracking.models import WorkItemTemplate
 
+from mcp_azure_devops.features.work_items.tools.create import (
+    _create_work_item_from_template_impl,
+)
 from mcp_azure_devops.features.work_items.tools.templates import (
     _get_work_item_template_impl,
     _get_work_item_templates_impl,
 )
 
+CREATE = "mcp_azure_devops.features.work_items.tools.create"
+
 
 def test_get_work_item_templates_impl_with_templates():
     """Test retrieving work item templates."""
@@ -145,3 +151,126 @@ def test_get_work_item_template_impl_error_handling():
 
     # Assert
     assert "Error retrieving template 'template1': Test error" in result
+
+
+def test_templates_are_cached_per_team_context():
+    """Test that listings and templates are fetched once per team."""
+    mock_client = MagicMock()
+    mock_client.get_templates.return_value = []
+    mock_client.get_template.return_value = MagicMock(spec=WorkItemTemplate)
+
+    for team_context in (
+        {"project": "TestProject", "team": "TestTeam"},
+        {"project": "testproject", "team": "TESTTEAM"},
+    ):
+        _get_work_item_templates_impl(team_context, "Bug", mock_client)
+        _get_work_item_template_impl(team_context, "template1", mock_client)
+    _get_work_item_templates_impl(
+        {"project": "TestProject", "team": "Other"}, "Bug", mock_client
+    )
+
+    assert mock_client.get_templates.call_count == 2
+    mock_client.get_template.assert_called_once()
+
+
+def test_create_work_item_from_template_impl(monkeypatch):
+    """Test that template fields and overrides go into one create."""
+    monkeypatch.setenv(
+        "AZURE_DEVOPS_ORGANIZATION_URL", "https://dev.azure.com/contoso"
+    )
+    mock_client = MagicMock()
+    # The parent lives in the organization of the client, not the default
+    mock_client.config.base_url = "https://dev.azure.com/fabrikam"
+    mock_template = MagicMock(spec=WorkItemTemplate)
+    mock_template.work_item_type_name = "Bug"
+    mock_template.fields = {
+        "System.Title": "[Bug] ",
+        "Microsoft.VSTS.Common.Priority": 2,
+        "System.Tags": "triage",
+    }
+    mock_client.get_template.return_value = mock_template
+
+    _create_work_item_from_template_impl(
+        {"project": "TestProject", "team": "TestTeam"},
+        "template1",
+        mock_client,
+        overrides={"title": "[Bug] Login fails", "priority": 1},
+        parent_id=7,
+    )
+
+    mock_client.create_work_item.assert_called_once()
+    mock_client.update_work_item.assert_not_called()
+    kwargs = mock_client.create_work_item.call_args.kwargs
+    assert kwargs["project"] == "TestProject"
+    assert kwargs["type"] == "Bug"
+    assert [(op.path, op.value) for op in kwargs["document"]] == [
+        ("/fields/System.Title", "[Bug] Login fails"),
+        ("/fields/Microsoft.VSTS.Common.Priority", 1),
+        ("/fields/System.Tags", "triage"),
+        (
+            "/relations/-",
+            {
+                "rel": "System.LinkTypes.Hierarchy-Reverse",
+                "url": "https://dev.azure.com/fabrikam/_apis/wit/workItems/7",
+            },
+        ),
+    ]
+
+
+def test_create_work_item_from_missing_template():
+    """Test that nothing is created from an unknown template."""
+    mock_client = MagicMock()
+    mock_client.get_template.return_value = None
+
+    result = _create_work_item_from_template_impl(
+        {"project": "TestProject", "team": "TestTeam"},
+        "missing",
+        mock_client,
+    )
+
+    assert result == "Template with ID 'missing' not found."
+    mock_client.create_work_item.assert_not_called()
+
+
+def test_template_macros_resolve_for_the_caller_and_team():
+    """Test @Me and iteration shortcuts in a team's template."""
+    mock_client = MagicMock()
+    mock_template = MagicMock(spec=WorkItemTemplate)
+    mock_template.work_item_type_name = "Bug"
+    mock_template.fields = {
+        "System.Title": "[Bug] ",
+        "System.AssignedTo": "@Me",
+        "System.IterationPath": "@CurrentIteration",
+    }
+    mock_client.get_template.return_value = mock_template
+    mock_client.get_classification_node.side_effect = Exception("Offline")
+    identity_client = MagicMock()
+    identity_client.get_self.return_value = SimpleNamespace(
+        display_name="Alex Kim", account_name="alex.kim@example.com"
+    )
+
+    with (
+        patch(f"{CREATE}.get_identity_client", return_value=identity_client),
+        patch(f"{CREATE}.get_work_client"),
+        patch(
+            f"{CREATE}.resolve_iteration_shortcut",
+            return_value="TestProject\\Sprint 3",
+        ) as resolve_shortcut,
+    ):
+        _create_work_item_from_template_impl(
+            {"project": "TestProject", "team": "TestTeam"},
+            "template1",
+            mock_client,
+        )
+
+    assert resolve_shortcut.call_args.args[1:] == (
+        "TestProject",
+        "@CurrentIteration",
+        "TestTeam",
+    )
+    document = mock_client.create_work_item.call_args.kwargs["document"]
+    assert {op.path: op.value for op in document} == {
+        "/fields/System.Title": "[Bug] ",
+        "/fields/System.AssignedTo": "Alex Kim <alex.kim@example.com>",
+        "/fields/System.IterationPath": "TestProject\\Sprint 3",
+    }
@@ -0,0 +1,276 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_azure_devops.features.work_items.tools.create import (
+    _preflight_check,
+    _update_target,
+)
+from mcp_azure_devops.features.work_items.validation import (
+    find_field_problems,
+)
+
+
+def _field(reference, name, field_type, required=False):
+    return SimpleNamespace(
+        reference_name=reference,
+        name=name,
+        type=field_type,
+        required=required,
+        read_only=False,
+        default_value=None,
+    )
+
+
+def _clients():
+    core_client = MagicMock()
+    core_client.get_project.return_value = SimpleNamespace(
+        id="project-id",
+        name="Fabrikam",
+        capabilities={"processTemplate": {"templateTypeId": "agile-id"}},
+    )
+
+    process_client = MagicMock()
+    process_client.get_process_work_item_types.return_value = [
+        SimpleNamespace(
+            name="Bug",
+            reference_name="Agile.Bug",
+            states=[
+                SimpleNamespace(name="New"),
+                SimpleNamespace(name="Active"),
+            ],
+        )
+    ]
+    process_client.get_all_work_item_type_fields.return_value = [
+        _field("System.Title", "Title", "string", required=True),
+        _field("System.State", "State", "string", required=True),
+        _field("Custom.Team", "Team", "picklistString", required=True),
+        _field("Microsoft.VSTS.Common.Priority", "Priority", "integer"),
+        _field("Custom.DueDate", "Due Date", "dateTime"),
+    ]
+
+    wit_client = MagicMock()
+    wit_client.get_work_item_type_fields_with_references.return_value = [
+        SimpleNamespace(
+            reference_name="Custom.Team", allowed_values=["Web", "Mobile"]
+        ),
+        SimpleNamespace(
+            reference_name="Microsoft.VSTS.Common.Priority",
+            allowed_values=[1, 2, 3, 4],
+        ),
+        SimpleNamespace(reference_name="System.Title", allowed_values=[]),
+    ]
+    return wit_client, core_client, process_client
+
+
+def test_valid_fields_are_canonicalized():
+    """Test that valid values pass and take the server's spelling."""
+    wit_client, core_client, process_client = _clients()
+    fields = {
+        "System.Title": "Login fails",
+        "System.State": "active",
+        "Custom.Team": "web",
+        "Microsoft.VSTS.Common.Priority": "2",
+        "Custom.DueDate": "2024-03-01T12:00:00Z",
+    }
+
+    problems = find_field_problems(
+        fields, "Fabrikam", "bug", wit_client, core_client, process_client
+    )
+
+    assert problems == []
+    assert fields["System.State"] == "Active"
+    assert fields["Custom.Team"] == "Web"
+
+
+def test_every_problem_is_reported_at_once():
+    """Test required fields, allowed values, types and states together."""
+    wit_client, core_client, process_client = _clients()
+    fields = {
+        "System.State": "Closed",
+        "Microsoft.VSTS.Common.Priority": "7",
+        "Custom.DueDate": "next week",
+    }
+
+    problems = find_field_problems(
+        fields, "Fabrikam", "Bug", wit_client, core_client, process_client
+    )
+
+    assert problems == [
+        "Field 'Title' (System.Title) is required",
+        "Value 'Closed' is not allowed for field 'State' (System.State); "
+        "expected one of New, Active",
+        "Field 'Team' (Custom.Team) is required",
+        "Value '7' is not allowed for field 'Priority' "
+        "(Microsoft.VSTS.Common.Priority); expected one of 1, 2, 3, 4",
+        "Field 'Due Date' (Custom.DueDate) expects an ISO 8601 date and "
+        "time, got 'next week'",
+    ]
+
+
+def test_fields_may_be_given_by_friendly_name():
+    """Test that friendly names are checked like reference names."""
+    wit_client, core_client, process_client = _clients()
+    fields = {"Title": "Login fails", "team": "mobile", "Priority": "7"}
+
+    problems = find_field_problems(
+        fields, "Fabrikam", "Bug", wit_client, core_client, process_client
+    )
+
+    assert problems == [
+        "Value '7' is not allowed for field 'Priority' "
+        "(Microsoft.VSTS.Common.Priority); expected one of 1, 2, 3, 4"
+    ]
+    assert fields["team"] == "Mobile"
+
+
+@pytest.mark.parametrize(
+    "due_date",
+    [
+        "2024-01-15T10:00:00.1234567Z",
+        "2024-01-15T10:00:00.12Z",
+        "2024-01-15T10:00:00+0000",
+        "2024-01-15",
+    ],
+)
+def test_date_times_the_server_accepts_pass(due_date):
+    """Test ISO 8601 forms that Python 3.10 cannot parse natively."""
+    wit_client, core_client, process_client = _clients()
+
+    assert (
+        find_field_problems(
+            {"Custom.DueDate": due_date},
+            "Fabrikam",
+            "Bug",
+            wit_client,
+            core_client,
+            process_client,
+            creating=False,
+        )
+        == []
+    )
+
+
+def test_updates_only_check_the_fields_they_change():
+    """Test that updates need not repeat required fields."""
+    wit_client, core_client, process_client = _clients()
+
+    assert (
+        find_field_problems(
+            {"Microsoft.VSTS.Common.Priority": 1},
+            "Fabrikam",
+            "Bug",
+            wit_client,
+            core_client,
+            process_client,
+            creating=False,
+        )
+        == []
+    )
+    assert find_field_problems(
+        {"System.Title": ""},
+        "Fabrikam",
+        "Bug",
+        wit_client,
+        core_client,
+        process_client,
+        creating=False,
+    ) == ["Field 'Title' (System.Title) is required"]
+
+
+def test_metadata_is_fetched_once():
+    """Test that repeated checks are answered from the caches."""
+    wit_client, core_client, process_client = _clients()
+
+    for _ in range(3):
+        find_field_problems(
+            {"System.Title": "Item", "Custom.Team": "Web"},
+            "Fabrikam",
+            "Bug",
+            wit_client,
+            core_client,
+            process_client,
+        )
+
+    core_client.get_project.assert_called_once()
+    process_client.get_process_work_item_types.assert_called_once()
+    process_client.get_all_work_item_type_fields.assert_called_once()
+    wit_client.get_work_item_type_fields_with_references.assert_called_once()
+
+
+def test_unknown_type_and_unavailable_metadata():
+    """Test unknown types are reported and fetch failures ignored."""
+    wit_client, core_client, process_client = _clients()
+
+    assert find_field_problems(
+        {}, "Fabrikam", "Epic", wit_client, core_client, process_client
+    ) == [
+        "Work item type 'Epic' does not exist in project Fabrikam; "
+        "expected one of Bug"
+    ]
+
+    core_client.get_project.side_effect = Exception("Access denied")
+    assert (
+        find_field_problems(
+            {}, "Contoso", "Bug", wit_client, core_client, process_client
+        )
+        == []
+    )
+
+
+def test_preflight_check_raises_before_sending():
+    """Test that the create path stops on any problem."""
+    wit_client, core_client, process_client = _clients()
+    wit_client.get_classification_node.side_effect = Exception("Offline")
+
+    with (
+        patch(
+            "mcp_azure_devops.features.work_items.tools.create."
+            "get_core_client",
+            return_value=core_client,
+        ),
+        patch(
+            "mcp_azure_devops.features.work_items.tools.create."
+            "get_work_item_tracking_process_client",
+            return_value=process_client,
+        ),
+        pytest.raises(ValueError, match="Custom.Team"),
+    ):
+        _preflight_check(
+            {"System.Title": "Item"}, "Fabrikam", "Bug", wit_client
+        )
+    wit_client.create_work_item.assert_not_called()
+
+
+def test_updates_without_a_type_are_checked_against_the_work_item():
+    """Test that the work item's own type is read once and cached."""
+    wit_client, core_client, process_client = _clients()
+    wit_client.get_work_item.return_value = SimpleNamespace(
+        fields={"System.TeamProject": "Fabrikam", "System.WorkItemType": "Bug"}
+    )
+    fields = {"Microsoft.VSTS.Common.Priority": "7"}
+
+    for _ in range(2):
+        target = _update_target(5, fields, None, None, wit_client)
+        assert target == ("Fabrikam", "Bug")
+    wit_client.get_work_item.assert_called_once_with(
+        5, fields=["System.TeamProject", "System.WorkItemType"]
+    )
+    assert find_field_problems(
+        fields,
+        "Fabrikam",
+        "Bug",
+        wit_client,
+        core_client,
+        process_client,
+        creating=False,
+    ) == [
+        "Value '7' is not allowed for field 'Priority' "
+        "(Microsoft.VSTS.Common.Priority); expected one of 1, 2, 3, 4"
+    ]
+
+    # A type set by the update is what the values must suit
+    assert _update_target(
+        5, {"System.WorkItemType": "Task"}, None, None, wit_client
+    ) == ("Fabrikam", "Task")
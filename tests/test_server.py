@@ -2,12 +2,20 @@
 Tests for the Azure DevOps MCP Server.
 """
 
+import os
+import threading
+from typing import Any, Sequence, Tuple, cast
+
 import pytest
+from mcp.server.fastmcp import FastMCP
 from mcp.shared.memory import (
     create_connected_server_and_client_session as client_session,
 )
+from mcp.types import TextContent
 
+from mcp_azure_devops import server
 from mcp_azure_devops.server import mcp
+from mcp_azure_devops.utils import profiling
 
 
 # Mark all tests with anyio for async testing
@@ -32,3 +40,93 @@ async def test_server_initialization():
         assert capabilities.prompts is not None
         assert capabilities.resources is not None
         assert capabilities.tools is not None
+
+
+@pytest.fixture
+def environ(monkeypatch):
+    """Isolate the environment variables the command line exports."""
+    environ = {
+        key: value
+        for key, value in os.environ.items()
+        if key not in server._ENVIRONMENT_OPTIONS.values()
+    }
+    monkeypatch.setattr(os, "environ", environ)
+    monkeypatch.setattr(profiling, "_settings", None)
+    return environ
+
+
+def test_parse_args_defaults_to_stdio(environ):
+    """Test that the server runs over stdio unless told otherwise."""
+    args = server._parse_args([])
+
+    assert args.transport == "stdio"
+    assert args.workers == 1
+    assert args.stateless is None
+
+
+def test_parse_args_workers_imply_stateless(environ):
+    """Test that several workers serve stateless streamable HTTP."""
+    args = server._parse_args(
+        ["--transport", "streamable-http", "--workers", "4"]
+    )
+
+    assert args.stateless is True
+    assert environ["FASTMCP_STATELESS_HTTP"] == "true"
+    assert environ["AZURE_DEVOPS_MCP_TRANSPORT"] == "streamable-http"
+
+
+def test_parse_args_exports_credential_source(environ):
+    """Test that workers get the credential source of the command line."""
+    server._parse_args(
+        ["--transport", "streamable-http", "--credentials", "request"]
+    )
+
+    assert environ["AZURE_DEVOPS_CREDENTIALS"] == "request"
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--workers", "2"],
+        ["--transport", "sse", "--workers", "2"],
+        ["--transport", "streamable-http", "--workers", "0"],
+        ["--profile-tools", "get_projects", "--profile-rate", "2"],
+    ],
+)
+def test_parse_args_rejects_invalid_options(environ, argv):
+    """Test that invalid option combinations exit with an error."""
+    with pytest.raises(SystemExit):
+        server._parse_args(argv)
+
+
+def test_parse_args_exports_profiling_options(environ):
+    """Test that profiling options reach worker processes."""
+    server._parse_args(
+        ["--profile-tools", "get_projects", "--profile-rate", "0.5"]
+    )
+
+    assert environ["AZURE_DEVOPS_PROFILE_TOOLS"] == "get_projects"
+    assert environ["AZURE_DEVOPS_PROFILE_RATE"] == "0.5"
+    assert profiling._settings is not None
+    assert profiling._settings.rate == 0.5
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_threaded_tools_run_off_the_event_loop(monkeypatch):
+    """Test that HTTP serving runs synchronous tools in worker threads."""
+    test_mcp = FastMCP("test")
+
+    @test_mcp.tool()
+    def thread_name() -> str:
+        return threading.current_thread().name
+
+    monkeypatch.setattr(server, "mcp", test_mcp)
+    server.run_tools_in_threads()
+    server.run_tools_in_threads()
+
+    result = await test_mcp.call_tool("thread_name", {})
+
+    # Content blocks come back paired with the structured output
+    content, _ = cast(Tuple[Sequence[TextContent], Any], result)
+    assert content[0].text != threading.current_thread().name
@@ -0,0 +1,3 @@
+"""
+Tests for Azure DevOps MCP utilities.
+"""
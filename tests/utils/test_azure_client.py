@@ -0,0 +1,272 @@
+"""Tests for Azure DevOps connection helpers."""
+
+import base64
+import json
+from types import SimpleNamespace
+from typing import cast
+from unittest.mock import MagicMock
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.server.lowlevel.server import request_ctx
+from mcp.server.session import ServerSession
+from mcp.shared.context import RequestContext
+from starlette.datastructures import Headers
+from starlette.requests import Request
+from starlette.testclient import TestClient
+
+from mcp_azure_devops.utils import azure_client
+from mcp_azure_devops.utils.azure_client import (
+    get_client_organization,
+    get_client_tenant,
+    get_connection,
+    get_credentials,
+    get_organization_url,
+    get_request_credentials,
+)
+from mcp_azure_devops.utils.cache import TTLCache
+
+
+@pytest.fixture(autouse=True)
+def environment(monkeypatch):
+    monkeypatch.setenv(
+        "AZURE_DEVOPS_ORGANIZATION_URL", "https://dev.azure.com/contoso"
+    )
+    monkeypatch.setenv("AZURE_DEVOPS_PAT", "default-pat")
+    monkeypatch.delenv("AZURE_DEVOPS_ORGANIZATIONS", raising=False)
+    monkeypatch.delenv("AZURE_DEVOPS_CREDENTIALS", raising=False)
+    monkeypatch.delenv("AZURE_DEVOPS_MCP_TRANSPORT", raising=False)
+    monkeypatch.setattr(azure_client, "_connections", TTLCache(ttl=60))
+
+
+@pytest.fixture
+def request_headers():
+    """Handle code as if it ran for an HTTP request with these headers."""
+    tokens = []
+
+    def send(headers):
+        request = Request({"type": "http", "headers": Headers(headers).raw})
+        context = RequestContext(
+            request_id=1,
+            meta=None,
+            session=cast(ServerSession, MagicMock()),
+            lifespan_context=None,
+            request=request,
+        )
+        tokens.append(request_ctx.set(context))
+
+    yield send
+    for token in reversed(tokens):
+        request_ctx.reset(token)
+
+
+def test_organization_url_defaults_to_configured_organization():
+    """Test that tools without an organization use the default one."""
+    assert get_organization_url() == "https://dev.azure.com/contoso"
+    assert get_organization_url("Contoso") == "https://dev.azure.com/contoso"
+
+
+def test_organization_names_resolve_to_configured_urls(monkeypatch):
+    """Test that names match configured servers before Azure DevOps."""
+    monkeypatch.setenv(
+        "AZURE_DEVOPS_ORGANIZATIONS",
+        "https://tfs.example.com/tfs/Legacy/, https://dev.azure.com/other,"
+        "https://northwind.visualstudio.com",
+    )
+
+    assert get_organization_url("legacy") == (
+        "https://tfs.example.com/tfs/Legacy"
+    )
+    assert get_organization_url("fabrikam") == (
+        "https://dev.azure.com/fabrikam"
+    )
+    assert get_organization_url("northwind") == (
+        "https://northwind.visualstudio.com"
+    )
+    assert get_organization_url("https://dev.azure.com/other/") == (
+        "https://dev.azure.com/other"
+    )
+
+
+@pytest.mark.parametrize(
+    "organization", ["https://attacker.example.com/contoso", "a/b", "-x"]
+)
+def test_unknown_urls_and_invalid_names_are_rejected(organization):
+    """Test that a PAT is only sent to configured or valid organizations."""
+    with pytest.raises(ValueError):
+        get_organization_url(organization)
+
+
+def test_credentials_prefer_organization_pat(monkeypatch):
+    """Test that AZURE_DEVOPS_PAT_<NAME> overrides the default PAT."""
+    monkeypatch.setenv("AZURE_DEVOPS_PAT_FABRIKAM_EU", "fabrikam-pat")
+
+    assert get_credentials("fabrikam-eu") == (
+        "fabrikam-pat",
+        "https://dev.azure.com/fabrikam-eu",
+    )
+    assert get_credentials() == (
+        "default-pat",
+        "https://dev.azure.com/contoso",
+    )
+
+
+def test_connections_are_pooled_per_organization():
+    """Test that each organization gets one reused connection."""
+    contoso = get_connection()
+    fabrikam = get_connection("fabrikam")
+
+    assert get_connection("contoso") is contoso
+    assert get_connection("fabrikam") is fabrikam
+    assert fabrikam is not contoso
+    assert fabrikam is not None
+    assert fabrikam.base_url == "https://dev.azure.com/fabrikam"
+
+
+def test_connection_without_credentials(monkeypatch):
+    """Test that no connection is made without a PAT."""
+    monkeypatch.delenv("AZURE_DEVOPS_PAT")
+
+    assert get_connection() is None
+
+
+def test_client_organization():
+    """Test the cache partition key of a client."""
+    client = SimpleNamespace(normalized_url="https://dev.azure.com/contoso")
+
+    assert get_client_organization(client) == "https://dev.azure.com/contoso"
+    assert get_client_organization(object()) == ""
+
+
+def test_request_credentials_from_headers(request_headers):
+    """Test the PAT and organization headers of a request."""
+    assert get_request_credentials() == (None, None)
+
+    request_headers(
+        {"x-azure-devops-pat": "user-pat", "X-Azure-DevOps-Organization": "f"}
+    )
+    assert get_request_credentials() == ("user-pat", "f")
+
+    basic = base64.b64encode(b"user@example.com:basic-pat").decode()
+    request_headers({"Authorization": f"Basic {basic}"})
+    assert get_request_credentials() == ("basic-pat", None)
+
+    request_headers({"Authorization": "Basic not-base64!"})
+    assert get_request_credentials() == (None, None)
+
+
+def test_request_credentials_over_streamable_http():
+    """Test that a tool reads the headers of a real HTTP request."""
+    server = FastMCP("test", stateless_http=True, json_response=True)
+
+    @server.tool()
+    def credentials() -> str:
+        return json.dumps(get_request_credentials())
+
+    with TestClient(
+        server.streamable_http_app(), base_url="http://localhost:8000"
+    ) as client:
+        response = client.post(
+            "/mcp",
+            headers={
+                "Accept": "application/json, text/event-stream",
+                "X-Azure-DevOps-PAT": "user-pat",
+                "X-Azure-DevOps-Organization": "fabrikam",
+            },
+            json={
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "tools/call",
+                "params": {"name": "credentials", "arguments": {}},
+            },
+        )
+
+    result = response.json()["result"]
+    assert not result["isError"]
+    assert json.loads(result["content"][0]["text"]) == ["user-pat", "fabrikam"]
+
+
+def test_request_credentials_take_precedence(request_headers):
+    """Test that each request acts with the PAT it was sent with."""
+    request_headers(
+        {
+            "X-Azure-DevOps-PAT": "user-pat",
+            "X-Azure-DevOps-Organization": "fabrikam",
+        }
+    )
+
+    assert get_credentials() == ("user-pat", "https://dev.azure.com/fabrikam")
+    assert get_credentials("contoso") == (
+        "user-pat",
+        "https://dev.azure.com/contoso",
+    )
+
+
+def test_request_credential_source(monkeypatch, request_headers):
+    """Test that a shared server can refuse to fall back to its own PAT."""
+    monkeypatch.setenv("AZURE_DEVOPS_CREDENTIALS", "request")
+    request_headers({})
+
+    assert get_credentials() == (None, "https://dev.azure.com/contoso")
+    assert get_connection() is None
+
+
+@pytest.mark.parametrize("transport", ["streamable-http", "sse"])
+def test_http_servers_require_request_credentials(
+    monkeypatch, request_headers, transport
+):
+    """Test that HTTP callers without a PAT never get the server's own."""
+    monkeypatch.setenv("AZURE_DEVOPS_MCP_TRANSPORT", transport)
+    request_headers({"X-Azure-DevOps-Organization": "fabrikam"})
+
+    assert get_credentials() == (None, "https://dev.azure.com/fabrikam")
+    assert get_connection() is None
+
+    # The fallback remains available when the operator opts in
+    monkeypatch.setenv("AZURE_DEVOPS_CREDENTIALS", "any")
+    assert get_credentials()[0] == "default-pat"
+
+
+def test_environment_credential_source(monkeypatch, request_headers):
+    """Test that request headers can be ignored."""
+    monkeypatch.setenv("AZURE_DEVOPS_CREDENTIALS", "environment")
+    request_headers({"X-Azure-DevOps-PAT": "user-pat"})
+
+    assert get_credentials()[0] == "default-pat"
+
+
+def test_connections_are_pooled_per_tenant(request_headers):
+    """Test that users never share a connection or a tenant."""
+    default = get_connection()
+    request_headers({"X-Azure-DevOps-PAT": "user-pat"})
+    user = get_connection()
+
+    assert user is not default
+    assert get_connection() is user
+    assert default is not None and user is not None
+    # Clients share the credentials object of their connection
+    default_client = SimpleNamespace(
+        config=SimpleNamespace(credentials=default._creds)
+    )
+    user_client = SimpleNamespace(
+        config=SimpleNamespace(credentials=user._creds)
+    )
+    assert get_client_tenant(user_client) != get_client_tenant(default_client)
+    assert "user-pat" not in get_client_tenant(user_client)
+    assert get_client_tenant(object()) == ""
+
+
+def test_idle_connections_are_dropped(monkeypatch):
+    """Test that unused connections are evicted from the pool."""
+    now = [0.0]
+    monkeypatch.setattr(
+        azure_client, "_connections", TTLCache(ttl=10, clock=lambda: now[0])
+    )
+    first = get_connection()
+    now[0] = 8
+    assert get_connection() is first
+    now[0] = 16
+    assert get_connection() is first
+
+    now[0] = 30
+    assert get_connection() is not first
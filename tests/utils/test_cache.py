@@ -0,0 +1,77 @@
+"""Tests for the in-memory TTL cache."""
+
+from mcp_azure_devops.utils.cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    """Test that entries disappear once their TTL has passed."""
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, clock=clock)
+    cache.set("key", "value")
+
+    clock.now = 9.9
+    assert cache.get("key") == "value"
+    clock.now = 10
+    assert cache.get("key") is None
+
+
+def test_per_entry_ttl_override():
+    """Test that set() can shorten the lifetime of a single entry."""
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, clock=clock)
+    cache.set("short", 1, ttl=1)
+    cache.set("long", 2)
+
+    clock.now = 2
+    assert "short" not in cache
+    assert "long" in cache
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Test that the cache respects max_entries."""
+    cache = TTLCache(ttl=10, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert len(cache) == 2
+
+
+def test_get_or_set_computes_once():
+    """Test that get_or_set only calls the factory on a miss."""
+    cache = TTLCache(ttl=10)
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return "value"
+
+    assert cache.get_or_set("key", factory) == "value"
+    assert cache.get_or_set("key", factory) == "value"
+    assert len(calls) == 1
+
+
+def test_prune_removes_expired_entries():
+    """Test that pruning drops expired entries without a lookup."""
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, clock=clock)
+    cache.set("old", 1)
+    clock.now = 5
+    cache.set("new", 2)
+
+    clock.now = 12
+    assert cache.prune() == 1
+    assert list(cache._entries) == ["new"]
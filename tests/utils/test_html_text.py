@@ -0,0 +1,62 @@
+"""Tests for HTML to compact text conversion."""
+
+from mcp_azure_devops.utils.html_text import (
+    TRUNCATION_MARKER,
+    html_to_text,
+    looks_like_html,
+)
+
+
+def test_plain_text_is_unchanged():
+    """Test that text without tags is returned as-is."""
+    text = "Line one\nLine two with 5 < 6"
+
+    assert not looks_like_html(text)
+    assert html_to_text(text) == text
+
+
+def test_styles_and_inline_images_are_dropped():
+    """Test that styles and base64 image data do not reach the output."""
+    html = (
+        "<style>p { color: red; }</style>"
+        '<div style="font-family: Segoe UI"><p>Steps</p>'
+        '<img src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUg" '
+        'alt="screenshot"></div>'
+    )
+
+    result = html_to_text(html)
+
+    assert result == "Steps\n\n[screenshot]"
+
+
+def test_structure_is_kept_as_markdown():
+    """Test headings, lists, emphasis, links and tables."""
+    html = (
+        "<h2>Repro</h2><ol><li>Open <b>Settings</b></li>"
+        "<li>Click <a href='https://example.com'>here</a></li></ol>"
+        "<ul><li>note</li></ul>"
+        "<table><tr><th>A</th><th>B</th></tr><tr><td>1</td><td>2</td></tr>"
+        "</table>"
+    )
+
+    result = html_to_text(html)
+
+    assert "## Repro" in result
+    assert "1. Open **Settings**" in result
+    assert "2. Click [here](https://example.com)" in result
+    assert "- note" in result
+    assert "| A | B |\n| 1 | 2 |" in result
+
+
+def test_entities_and_whitespace():
+    """Test that entities are decoded and whitespace collapsed."""
+    result = html_to_text("<div>a  &amp;\n   b<br>c&nbsp;d</div>")
+
+    assert result == "a & b\nc d"
+
+
+def test_max_chars_truncates_output():
+    """Test that the output is capped and marked as truncated."""
+    result = html_to_text("<p>" + "x" * 20000 + "</p>", max_chars=100)
+
+    assert result == "x" * 100 + TRUNCATION_MARKER
@@ -0,0 +1,182 @@
+"""Tests for tool and upstream call metrics."""
+
+import pytest
+
+from mcp_azure_devops.utils import metrics
+from mcp_azure_devops.utils.metrics import (
+    ERROR_RESPONSE,
+    Histogram,
+    MetricsRegistry,
+    format_metrics,
+    instrument_tool,
+)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = MetricsRegistry()
+    monkeypatch.setattr(metrics, "_registry", registry)
+    return registry
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    """Test that quantiles are estimated from bucket counts."""
+    histogram = Histogram(buckets=(0.1, 0.2, 0.4))
+    for value in (0.05, 0.15, 0.15, 0.3):
+        histogram.observe(value)
+
+    assert histogram.quantile(0.5) == pytest.approx(0.15)
+    assert histogram.quantile(1.0) == pytest.approx(0.3)
+    assert histogram.cumulative() == [
+        ("0.1", 1),
+        ("0.2", 3),
+        ("0.4", 4),
+        ("+Inf", 4),
+    ]
+
+
+def test_histogram_single_sample_is_exact():
+    """Test that estimates are clamped to the observed range."""
+    histogram = Histogram()
+    histogram.observe(0.042)
+
+    assert histogram.quantile(0.5) == pytest.approx(0.042)
+    assert histogram.quantile(0.99) == pytest.approx(0.042)
+
+
+def test_instrumented_tool_records_calls_and_errors(registry):
+    """Test that tool calls, error responses and exceptions are counted."""
+
+    def tool(id: int) -> str:
+        if id < 0:
+            raise ValueError("negative")
+        if id == 0:
+            return "Error: not found"
+        return "# Work Item"
+
+    wrapped = instrument_tool("get_work_item", tool)
+    assert wrapped(id=1) == "# Work Item"
+    assert wrapped(id=0) == "Error: not found"
+    with pytest.raises(ValueError):
+        wrapped(id=-1)
+
+    stats = registry.snapshot()["tools"]["get_work_item"]
+    assert stats["calls"] == 3
+    assert stats["errors"] == {ERROR_RESPONSE: 1, "ValueError": 1}
+    assert stats["request_bytes"] == len('{"id": 1}{"id": 0}{"id": -1}')
+    assert stats["response_bytes"] == len("# Work Item") + len(
+        "Error: not found"
+    )
+
+
+def test_upstream_calls_are_attributed_to_the_running_tool(registry):
+    """Test that requests made during a tool call are counted for it."""
+
+    def tool() -> str:
+        calls = metrics._tool_calls.get()
+        assert calls is not None
+        calls.extend(["GET wit/workItems", "POST wit/wiql"])
+        return "ok"
+
+    instrument_tool("query_work_items", tool)()
+
+    stats = registry.snapshot()["tools"]["query_work_items"]
+    assert stats["upstream_calls"] == 2
+    assert metrics._tool_calls.get() is None
+
+
+def test_prometheus_rendering(registry):
+    """Test the text exposition format of recorded metrics."""
+    registry.record_upstream_call(
+        'GET wit/"quoted"', 0.02, 10, 300, "AzureDevOpsServiceError"
+    )
+
+    text = registry.render_prometheus()
+
+    assert (
+        'azure_devops_request_calls_total{endpoint="GET wit/\\"quoted\\""} 1'
+        in text
+    )
+    assert (
+        'azure_devops_request_errors_total{endpoint="GET wit/\\"quoted\\"",'
+        'error_type="AzureDevOpsServiceError"} 1'
+    ) in text
+    assert "# TYPE azure_devops_request_duration_seconds histogram" in text
+    assert (
+        'azure_devops_request_response_bytes_total{endpoint="GET wit/'
+        '\\"quoted\\""} 300'
+    ) in text
+    assert text.endswith("\n")
+
+
+def test_format_metrics_tables(registry):
+    """Test the markdown summary returned by get_server_metrics."""
+    registry.record_tool_call("get_projects", 0.1, 2, 50, 1)
+    registry.record_upstream_call("GET core/projects", 0.08, 0, 400)
+
+    result = format_metrics(registry.snapshot())
+
+    assert "## Tools" in result
+    assert "| get_projects | 1 | 0 | 100.0 |" in result
+    assert "| GET core/projects | 1 | 0 | 80.0 |" in result
+    assert "## Errors" not in result
+
+
+def test_format_metrics_empty(registry):
+    """Test the summary before anything was recorded."""
+    result = format_metrics(registry.snapshot())
+
+    assert "No tool calls recorded yet." in result
+    assert "No Azure DevOps requests recorded yet." in result
+
+
+def test_metrics_path(monkeypatch):
+    """Test that the Prometheus endpoint is opt-in."""
+    monkeypatch.delenv("AZURE_DEVOPS_METRICS_PATH", raising=False)
+    assert metrics.get_metrics_path() is None
+
+    monkeypatch.setenv("AZURE_DEVOPS_METRICS_PATH", "metrics")
+    assert metrics.get_metrics_path() == "/metrics"
+
+
+def test_metrics_endpoint_without_custom_routes(monkeypatch, caplog):
+    """Test that an mcp without custom routes starts without the endpoint."""
+    monkeypatch.setenv("AZURE_DEVOPS_METRICS_PATH", "/metrics")
+
+    metrics.register_metrics_endpoint(object())
+
+    assert "requires mcp 1.10.0 or later" in caplog.text
+
+
+def test_sdk_requests_are_labelled_and_attributed(registry):
+    """Test SDK instrumentation against the mock Azure DevOps service."""
+    from azure.devops.connection import Connection
+    from azure.devops.exceptions import AzureDevOpsServiceError
+    from msrest.authentication import BasicAuthentication
+
+    from benchmarks.mock_devops import MockAzureDevOps, MockSettings
+
+    metrics.instrument_sdk()
+    with MockAzureDevOps(MockSettings(projects=1, work_items=5)) as service:
+        connection = Connection(
+            base_url=service.url, creds=BasicAuthentication("", "pat")
+        )
+        client = connection.clients_v7_1.get_work_item_tracking_client()
+
+        def tool() -> str:
+            client.get_work_items([1, 2])
+            try:
+                client.get_work_item(999)
+            except AzureDevOpsServiceError:
+                return "Error: not found"
+            return "found"
+
+        instrument_tool("get_work_item", tool)()
+
+    snapshot = registry.snapshot()
+    endpoint = snapshot["endpoints"]["GET wit/workItems"]
+    assert endpoint["calls"] == 2
+    assert endpoint["errors"] == {"AzureDevOpsServiceError": 1}
+    assert endpoint["response_bytes"] > 0
+    assert "OPTIONS _apis" in snapshot["endpoints"]
+    assert snapshot["tools"]["get_work_item"]["upstream_calls"] >= 2
@@ -0,0 +1,103 @@
+"""Tests for on-demand tool profiling."""
+
+import pstats
+import time
+
+import pytest
+
+from mcp_azure_devops.utils import profiling
+from mcp_azure_devops.utils.profiling import (
+    ProfileSettings,
+    configure_profiling,
+    profile_tool,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_profiling(monkeypatch):
+    for name in ("TOOLS", "DIR", "RATE", "MODE", "INTERVAL_MS"):
+        monkeypatch.delenv(f"AZURE_DEVOPS_PROFILE_{name}", raising=False)
+    monkeypatch.setattr(profiling, "_settings", None)
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(100))
+
+
+def test_profiling_is_off_by_default():
+    """Test that no tool is profiled unless selected."""
+    assert configure_profiling() is None
+    with profile_tool("get_work_item"):
+        pass
+
+
+def test_configure_from_environment(monkeypatch, tmp_path):
+    """Test that settings are read from the environment."""
+    monkeypatch.setenv("AZURE_DEVOPS_PROFILE_TOOLS", "get_work_item, *")
+    monkeypatch.setenv("AZURE_DEVOPS_PROFILE_DIR", str(tmp_path))
+    monkeypatch.setenv("AZURE_DEVOPS_PROFILE_RATE", "0.25")
+    monkeypatch.setenv("AZURE_DEVOPS_PROFILE_MODE", "Sampling")
+
+    settings = configure_profiling()
+
+    assert settings is not None
+    assert settings.tools == {"get_work_item", "*"}
+    assert settings.directory == tmp_path
+    assert settings.rate == 0.25
+    assert settings.mode == "sampling"
+
+
+def test_arguments_override_environment(monkeypatch, tmp_path):
+    """Test that command-line values take precedence."""
+    monkeypatch.setenv("AZURE_DEVOPS_PROFILE_TOOLS", "get_projects")
+
+    settings = configure_profiling(
+        "get_work_item", str(tmp_path), 1.0, "deterministic"
+    )
+
+    assert settings is not None
+    assert settings.tools == {"get_work_item"}
+    assert settings.mode == "deterministic"
+
+
+def test_invalid_settings_are_rejected(tmp_path):
+    """Test validation of the mode and rate."""
+    with pytest.raises(ValueError):
+        ProfileSettings({"*"}, tmp_path, mode="tracing")
+    with pytest.raises(ValueError):
+        ProfileSettings({"*"}, tmp_path, rate=1.5)
+
+
+def test_selection_by_name_and_rate(tmp_path):
+    """Test that only selected tools at the sampling rate are profiled."""
+    settings = ProfileSettings({"get_work_item"}, tmp_path)
+    assert settings.selects("get_work_item")
+    assert not settings.selects("get_projects")
+
+    never = ProfileSettings({"*"}, tmp_path, rate=0.0)
+    assert not never.selects("get_projects")
+
+
+def test_profile_writes_pstats_and_collapsed_stacks(tmp_path):
+    """Test that a profiled call writes both profile formats."""
+    settings = configure_profiling("get_work_item", str(tmp_path), mode="both")
+    assert settings is not None
+    settings.interval_ms = 1
+
+    with profile_tool("get_work_item"):
+        _busy(0.05)
+    with profile_tool("get_projects"):
+        _busy(0.01)
+
+    (stats_file,) = tmp_path.glob("get_work_item-*.pstats")
+    (collapsed_file,) = tmp_path.glob("get_work_item-*.collapsed")
+    functions = pstats.Stats(str(stats_file)).get_stats_profile().func_profiles
+    assert "_busy" in functions
+    lines = collapsed_file.read_text().splitlines()
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert "test_profiling:_busy" in stack
+    assert int(count) > 0
+    assert not list(tmp_path.glob("get_projects-*"))
@@ -0,0 +1,148 @@
+"""Tests for optional OpenTelemetry tracing."""
+
+import contextlib
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_azure_devops.utils import metrics, tracing
+from mcp_azure_devops.utils.metrics import MetricsRegistry, instrument_tool
+
+
+class FakeSpan:
+    def __init__(self, name, kind, attributes):
+        self.name = name
+        self.kind = kind
+        self.attributes = dict(attributes)
+        self.status = None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def set_status(self, status):
+        self.status = status
+
+
+class FakeTracer:
+    """Records spans in the order they are started."""
+
+    def __init__(self):
+        self.spans = []
+
+    @contextlib.contextmanager
+    def start_as_current_span(self, name, kind=None, attributes=None):
+        span = FakeSpan(name, kind, attributes or {})
+        self.spans.append(span)
+        yield span
+
+
+@pytest.fixture
+def tracer(monkeypatch):
+    pytest.importorskip("opentelemetry.trace")
+    tracer = FakeTracer()
+    monkeypatch.setattr(tracing, "_tracer", tracer)
+    monkeypatch.setattr(metrics, "_registry", MetricsRegistry())
+    return tracer
+
+
+def test_disabled_tracing_is_a_no_op(monkeypatch):
+    """Test that no spans are opened when tracing is not configured."""
+    monkeypatch.setattr(tracing, "_tracer", None)
+
+    with tracing.tool_span("get_work_item", {"id": 1}) as span:
+        assert span is None
+    tracing.end_tool_span(None, 1, 10)
+    tracing.record_cache_lookup("query", True)
+    assert not tracing.tracing_enabled()
+
+
+def test_configure_without_sdk_stays_disabled(monkeypatch, caplog):
+    """Test that a missing OpenTelemetry SDK only logs a warning."""
+    monkeypatch.setattr(tracing, "_tracer", None)
+    monkeypatch.setenv("AZURE_DEVOPS_TRACING", "file")
+    monkeypatch.setitem(sys.modules, "opentelemetry.sdk", None)
+
+    assert tracing.configure_tracing() is False
+    assert "Tracing disabled" in caplog.text
+
+
+def test_configure_unset_stays_disabled(monkeypatch):
+    """Test that tracing is off by default."""
+    monkeypatch.setattr(tracing, "_tracer", None)
+    monkeypatch.delenv("AZURE_DEVOPS_TRACING", raising=False)
+
+    assert tracing.configure_tracing() is False
+
+
+def test_tool_call_attributes_collect_work_item_ids():
+    """Test that work item IDs are taken from the ID arguments."""
+    attributes = tracing.tool_call_attributes(
+        "add_parent_child_link",
+        {"parent_id": 1, "child_id": "2", "project": "P", "top": 5},
+    )
+
+    assert attributes == {
+        "mcp.tool.name": "add_parent_child_link",
+        "azure_devops.work_item.ids": [1, 2],
+        "azure_devops.batch_size": 2,
+    }
+
+
+def test_request_attributes_batch_and_single_ids():
+    """Test that work item IDs are parsed from request URLs."""
+    batch = SimpleNamespace(
+        method="GET",
+        url="https://dev.azure.com/org/_apis/wit/workitems?ids=1%2C2%2C3",
+    )
+    single = SimpleNamespace(
+        method="PATCH",
+        url="https://dev.azure.com/org/P/_apis/wit/workItems/42?x=1",
+    )
+
+    batch_attributes = tracing.request_attributes("GET wit/workItems", batch)
+    single_attributes = tracing.request_attributes(
+        "PATCH wit/workItems", single
+    )
+
+    assert batch_attributes["azure_devops.work_item.ids"] == [1, 2, 3]
+    assert batch_attributes["azure_devops.batch_size"] == 3
+    assert single_attributes["azure_devops.work_item.ids"] == [42]
+    assert single_attributes["http.request.method"] == "PATCH"
+
+
+def test_tool_span_records_outcome(tracer):
+    """Test the span of a tool call that reports an error."""
+
+    def tool(id: int) -> str:
+        calls = metrics._tool_calls.get()
+        assert calls is not None
+        calls.append("GET wit/workItems")
+        return "Error: Work item 9 not found\nDetails"
+
+    instrument_tool("get_work_item", tool)(id=9)
+
+    (span,) = tracer.spans
+    assert span.name == "tools/call get_work_item"
+    assert span.attributes["azure_devops.work_item.ids"] == [9]
+    assert span.attributes["azure_devops.upstream_calls"] == 1
+    assert span.status.description == "Error: Work item 9 not found"
+
+
+def test_request_span_records_retries(tracer):
+    """Test the span of an SDK request that was retried."""
+    history = (object(), object())
+    response = SimpleNamespace(
+        status_code=200,
+        raw=SimpleNamespace(retries=SimpleNamespace(history=history)),
+    )
+    request = SimpleNamespace(
+        method="GET", url="https://dev.azure.com/org/_apis/projects"
+    )
+
+    with tracing.request_span("GET core/projects", request) as span:
+        tracing.end_request_span(span, response, 0, 120)
+
+    assert span.attributes["azure_devops.retry_count"] == 2
+    assert span.attributes["http.response.status_code"] == 200
+    assert span.attributes["http.response.body.size"] == 120